@@ -11,6 +11,7 @@ v3.2 Update: Now includes transactional ledger support for asset-level analysis.
 """
 
 from .api import run
+from .occupancy import OccupancyProfile
 from .orchestrator import AnalysisContext, CashFlowOrchestrator
 from .registry import get_scenario_for_model, register_scenario
 from .results import AssetAnalysisResult
@@ -22,6 +23,7 @@ __all__ = [
     # Core orchestration
     "AnalysisContext",
     "CashFlowOrchestrator",
+    "OccupancyProfile",
     # Results
     "AssetAnalysisResult",
     # Scenario pattern
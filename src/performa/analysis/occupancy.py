@@ -0,0 +1,153 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Property occupancy derived from lease intervals.
+
+The orchestrator builds one `OccupancyProfile` per analysis before any model
+is computed and stores it on the `AnalysisContext`, so recovery gross-ups,
+occupancy-adjusted expenses and vacancy calculations share it instead of
+recomputing occupancy from the leases.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from performa.core.primitives import LeaseStatusEnum
+
+if TYPE_CHECKING:
+    from performa.core.base import LeaseBase
+
+
+@dataclass(frozen=True)
+class OccupancyProfile:
+    """
+    Occupied area by period, in total and per lease status.
+
+    Built with a difference-array sweep over the leases' start and end month
+    ordinals: each lease adds its area (times its multiplicity) at its first
+    month and removes it after its last, and a cumulative sum gives the
+    occupied area of every period. Periods outside the analysis timeline are
+    ignored.
+
+    Attributes:
+        period_index: Monthly periods of the analysis timeline
+        net_rentable_area: Property NRA used for occupancy rates
+        occupied_area: Occupied area per period
+        occupied_area_by_status: Occupied area per period for each lease status
+    """
+
+    period_index: pd.PeriodIndex
+    net_rentable_area: float
+    occupied_area: np.ndarray
+    occupied_area_by_status: Dict[LeaseStatusEnum, np.ndarray]
+
+    @classmethod
+    def from_leases(
+        cls,
+        leases: Iterable["LeaseBase"],
+        period_index: pd.PeriodIndex,
+        net_rentable_area: float,
+    ) -> "OccupancyProfile":
+        """
+        Build the profile of the leases in place over `period_index`.
+
+        Args:
+            leases: Leases with absolute timelines
+            period_index: Monthly analysis periods
+            net_rentable_area: Property NRA
+
+        Returns:
+            OccupancyProfile over `period_index`
+        """
+        leases = list(leases)
+        n = len(period_index)
+        first_ord = period_index[0].ordinal if n else 0
+
+        starts = np.array(
+            [lease.timeline.start_date.ordinal for lease in leases], dtype=np.int64
+        )
+        durations = np.array(
+            [lease.timeline.duration_months for lease in leases], dtype=np.int64
+        )
+        areas = np.array(
+            [lease.area * lease.multiplicity for lease in leases], dtype=np.float64
+        )
+        statuses = [LeaseStatusEnum(lease.status) for lease in leases]
+
+        # Difference array positions: +area at the first month, -area after the last
+        first = np.clip(starts - first_ord, 0, n)
+        stop = np.clip(starts + durations - first_ord, 0, n)
+
+        # Leases entirely outside the analysis contribute nothing
+        overlaps = first < stop
+
+        def sweep(mask: np.ndarray) -> np.ndarray:
+            selected = mask & overlaps
+            weights = areas[selected]
+            diff = np.bincount(first[selected], weights, minlength=n + 1) - np.bincount(
+                stop[selected], weights, minlength=n + 1
+            )
+            # Lease counts are exact: vacant periods are exactly 0, not residue
+            active = np.bincount(first[selected], minlength=n + 1) - np.bincount(
+                stop[selected], minlength=n + 1
+            )
+            return np.where(np.cumsum(active)[:n] > 0, np.cumsum(diff)[:n], 0.0)
+
+        status_codes = np.array([status.value for status in statuses], dtype=object)
+        by_status = {
+            status: sweep(status_codes == status.value)
+            for status in dict.fromkeys(statuses)
+        }
+        return cls(
+            period_index=period_index,
+            net_rentable_area=net_rentable_area,
+            occupied_area=sweep(np.ones(len(leases), dtype=bool)),
+            occupied_area_by_status=by_status,
+        )
+
+    @property
+    def statuses(self) -> List[LeaseStatusEnum]:
+        """Lease statuses present in the profile."""
+        return list(self.occupied_area_by_status)
+
+    def _rate(self, area: np.ndarray) -> pd.Series:
+        if self.net_rentable_area > 0:
+            return pd.Series(area / self.net_rentable_area, index=self.period_index)
+        return pd.Series(0.0, index=self.period_index)
+
+    def occupied_area_series(self) -> pd.Series:
+        """Occupied area by period."""
+        return pd.Series(self.occupied_area, index=self.period_index)
+
+    def occupancy_rate(self) -> pd.Series:
+        """Occupied share of the NRA by period (0 when the NRA is not positive)."""
+        return self._rate(self.occupied_area)
+
+    def vacancy_rate(self) -> pd.Series:
+        """Physical vacancy (1 - occupancy rate), floored at 0."""
+        return (1.0 - self.occupancy_rate()).clip(lower=0.0)
+
+    def by_status(self, rates: bool = False) -> pd.DataFrame:
+        """
+        Occupied area, or occupancy rate with `rates=True`, per lease status.
+
+        Returns:
+            DataFrame indexed by period with one column per lease status
+        """
+        return pd.DataFrame(
+            {
+                status: (
+                    self._rate(area)
+                    if rates
+                    else pd.Series(area, index=self.period_index)
+                )
+                for status, area in self.occupied_area_by_status.items()
+            },
+            index=self.period_index,
+        )
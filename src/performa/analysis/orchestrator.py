@@ -25,23 +25,33 @@ Overview of flow:
 4) Phase 2: compute dependent models and update aggregates incrementally
 5) Final aggregation: create summary views from the ledger
 
+Phase 1 models can optionally be computed in a thread or process pool
+(`CalculationSettings.phase1_executor`); their ledger writes are still
+applied in model order. Leases whose type provides a cohort engine can be
+projected together as one array (`CalculationSettings.lease_engine`).
+
 The orchestrator writes results to the ledger as models execute, ensuring a
 single source of truth for reporting and downstream metrics.
 """
 
 from __future__ import annotations
 
+import copy
 import logging
+import os
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from graphlib import CycleError, TopologicalSorter
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, Tuple, Union
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 
 from performa.core.base import LeaseBase
 from performa.core.ledger import Ledger, LedgerQueries, SeriesMetadata
+from performa.core.ledger.queries import ACCUMULABLE_AGGREGATE_LINES
 from performa.core.primitives import (
     CashFlowCategoryEnum,
     OrchestrationPass,
@@ -51,6 +61,8 @@ from performa.core.primitives import (
     UponExpirationEnum,
 )
 
+from .occupancy import OccupancyProfile
+
 if TYPE_CHECKING:
     from performa.core.base import (
         LeaseBase,
@@ -68,6 +80,61 @@ logger = logging.getLogger(__name__)
 # Short alias for cleaner code
 AggKeys = UnleveredAggregateLineKey
 
+# Lease expiration behaviours projected with project_future_cash_flows
+_ROLLOVER_EXPIRATIONS = (
+    UponExpirationEnum.RENEW,
+    UponExpirationEnum.MARKET,
+    UponExpirationEnum.VACATE,
+    UponExpirationEnum.OPTION,
+    UponExpirationEnum.REABSORB,
+)
+
+
+def _projects_rollovers(model: "CashFlowModel") -> bool:
+    """Whether a model is a lease projected with project_future_cash_flows."""
+    return (
+        isinstance(model, LeaseBase)
+        and hasattr(model, "rollover_profile")
+        and bool(model.rollover_profile)
+        and model.upon_expiration in _ROLLOVER_EXPIRATIONS
+    )
+
+
+def _multiplicity(model: "CashFlowModel") -> int:
+    """Number of units a model stands for (1 unless it is a weighted model)."""
+    multiplicity = getattr(model, "multiplicity", 1)
+    return multiplicity if isinstance(multiplicity, int) else 1
+
+
+def _compute_model_cash_flows(
+    model: "CashFlowModel", context: "AnalysisContext"
+) -> Any:
+    """
+    Compute one model's cash flows (Series or dict of component Series).
+
+    Leases with a rollover profile are projected with
+    `project_future_cash_flows` to include renewals; everything else uses
+    `compute_cf`. Module-level so process pools can pickle it.
+    """
+    if _projects_rollovers(model):
+        logger.debug(
+            f"Using project_future_cash_flows for lease {model.name} with rollover profile"
+        )
+        future_df = model.project_future_cash_flows(context=context)
+
+        # Convert DataFrame back to the dict format expected by aggregation
+        return {column: future_df[column] for column in future_df.columns}
+
+    return model.compute_cf(context=context)
+
+
+def _compute_in_worker(
+    model: "CashFlowModel", context: "AnalysisContext"
+) -> Tuple[Any, bool]:
+    """Pool task: a model's cash flows and whether it set itself as current_lease."""
+    result = _compute_model_cash_flows(model, context)
+    return result, context.current_lease is model
+
 
 @dataclass
 class AnalysisContext:
@@ -138,6 +205,12 @@ class AnalysisContext:
             "description": "UUID/key -> computed cash flow mapping populated during orchestration"
         },
     )
+    occupancy: Optional[OccupancyProfile] = field(
+        default=None,
+        metadata={
+            "description": "Occupied area by period and lease status, built once per run"
+        },
+    )
     occupancy_rate_series: Optional["pd.Series"] = field(
         default=None,
         metadata={
@@ -167,6 +240,70 @@ class AnalysisContext:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class AggregateAccumulator:
+    """
+    Running totals of aggregate lines over the analysis periods.
+
+    Seeded from the ledger aggregates once before Phase 2, then updated in
+    memory as each dependent model's signed series is written, so dependent
+    models read current aggregates without a ledger flush and query per
+    model. Only lines in `ACCUMULABLE_AGGREGATE_LINES` can be tracked.
+    """
+
+    period_index: pd.PeriodIndex
+    totals: Dict[UnleveredAggregateLineKey, np.ndarray]
+
+    @classmethod
+    def from_lookups(
+        cls,
+        keys: Set[UnleveredAggregateLineKey],
+        lookups: Dict[Union[UUID, str], Any],
+        period_index: pd.PeriodIndex,
+    ) -> "AggregateAccumulator":
+        """Seed totals from aggregate series resolved from the ledger."""
+        totals = {}
+        for key in keys:
+            series = lookups.get(key.value)
+            totals[key] = (
+                series.reindex(period_index, fill_value=0.0).to_numpy(
+                    dtype="float64", copy=True
+                )
+                if series is not None
+                else np.zeros(len(period_index))
+            )
+        return cls(period_index=period_index, totals=totals)
+
+    def add(
+        self, series: pd.Series, metadata: SeriesMetadata
+    ) -> Set[UnleveredAggregateLineKey]:
+        """
+        Add one signed ledger series to the lines it contributes to.
+
+        Returns:
+            Tracked lines whose totals changed
+        """
+        if not self.totals:
+            return set()
+        if not series.index.equals(self.period_index):
+            series = series.reindex(self.period_index, fill_value=0.0)
+        amounts = series.to_numpy(dtype="float64")
+        masks = LedgerQueries.aggregate_line_masks(
+            metadata.category, metadata.subcategory, amounts
+        )
+        updated = set()
+        for key, mask in masks.items():
+            total = self.totals.get(key)
+            if total is not None:
+                total += np.where(mask, amounts, 0.0)
+                updated.add(key)
+        return updated
+
+    def series(self, key: UnleveredAggregateLineKey) -> pd.Series:
+        """Current total of one line (a copy)."""
+        return pd.Series(self.totals[key].copy(), index=self.period_index)
+
+
 @dataclass
 class CashFlowOrchestrator:
     # --- Configuration ---
@@ -175,6 +312,11 @@ class CashFlowOrchestrator:
 
     # --- Internal State ---
     model_map: Dict[UUID, "CashFlowModel"] = field(init=False)
+    # Phase 2 aggregate totals; None while models write without tracking
+    _accumulator: Optional[AggregateAccumulator] = field(init=False, default=None)
+    _updated_aggregates: Set[UnleveredAggregateLineKey] = field(
+        init=False, default_factory=set
+    )
 
     # --- Results (populated by execute()) ---
     summary_df: Optional[pd.DataFrame] = field(init=False, default=None)
@@ -249,7 +391,10 @@ class CashFlowOrchestrator:
 
             # Calculate occupancy once for all models to use
             # This can be done early since it only depends on static lease attributes
-            self.context.occupancy_rate_series = self._calculate_occupancy_series()
+            self.context.occupancy = self._calculate_occupancy_profile()
+            self.context.occupancy_rate_series = (
+                self.context.occupancy.occupancy_rate()
+            )
             occupancy_periods = len(self.context.occupancy_rate_series)
             avg_occupancy = self.context.occupancy_rate_series.mean()
 
@@ -279,6 +424,9 @@ class CashFlowOrchestrator:
                 )
 
             self._compute_model_subset(independent_models)
+            # Strategic flush: Phase 1 rows must be queryable by the intermediate
+            # aggregation (Phase 2 then updates aggregates in memory)
+            self.context.ledger.flush()
 
             phase1_time = time.time() - phase1_start
             logger.info(
@@ -313,6 +461,15 @@ class CashFlowOrchestrator:
                     keys=needed_keys,
                 )
 
+            # Keep the needed lines current in memory during Phase 2 when every
+            # one of them can be accumulated from the written series
+            if needed_keys <= ACCUMULABLE_AGGREGATE_LINES:
+                self._accumulator = AggregateAccumulator.from_lookups(
+                    needed_keys,
+                    self.context.resolved_lookups,
+                    self.context.timeline.period_index,
+                )
+
         intermediate_time = time.time() - intermediate_start
         logger.info(f"Intermediate Phase completed in {intermediate_time:.3f}s")
 
@@ -345,7 +502,10 @@ class CashFlowOrchestrator:
                 )
                 logger.debug(f"    - {model.name} → references [{ref_name}]")
 
-            self._compute_model_subset(dependent_models)
+            try:
+                self._compute_model_subset(dependent_models)
+            finally:
+                self._accumulator = None
 
             phase2_time = time.time() - phase2_start
             logger.info(
@@ -408,58 +568,6 @@ class CashFlowOrchestrator:
 
         logger.info("Analysis ready for consumption via summary_df and detailed_df")
 
-    def _to_period_series(self, series: Any) -> pd.Series:
-        """
-        Convert series with date index to PeriodIndex.
-
-        VECTORIZED IMPLEMENTATION: Replaces individual loops with bulk pandas operations
-        for significant performance improvement (eliminates ~0.113s bottleneck).
-
-        Args:
-            series: Input series (may be pd.Series or other type)
-
-        Returns:
-            Series with PeriodIndex matching timeline
-        """
-        # Handle edge case: timeline has no periods
-        if self.context.timeline.period_index.empty:
-            return pd.Series(dtype=float)
-
-        # Handle case where series is not a Series (defensive)
-        if not isinstance(series, pd.Series):
-            return pd.Series(0.0, index=self.context.timeline.period_index)
-
-        # Handle empty series
-        if series.empty:
-            return pd.Series(0.0, index=self.context.timeline.period_index)
-
-        # Convert all dates to periods at once
-        try:
-            # Convert entire index to periods in one operation (vectorized)
-            period_index = series.index.to_period(freq="M")
-
-            # Create series with period index
-            period_series = pd.Series(series.values, index=period_index)
-
-            # Reindex to match timeline (handles missing periods with 0.0)
-            result = period_series.reindex(
-                self.context.timeline.period_index, fill_value=0.0
-            )
-
-            return result
-
-        except (AttributeError, TypeError):
-            # Fallback for non-standard index types
-            # Still vectorized but handles edge cases
-            periods = pd.PeriodIndex([
-                pd.Period(date, freq="M") for date in series.index
-            ])
-            period_series = pd.Series(series.values, index=periods)
-            result = period_series.reindex(
-                self.context.timeline.period_index, fill_value=0.0
-            )
-            return result
-
     def _update_aggregates_from_ledger(
         self,
         ledger: Ledger,
@@ -536,24 +644,24 @@ class CashFlowOrchestrator:
             # Create queries once (performance optimization)
             queries = LedgerQueries(ledger)
 
-            # Map aggregate keys to query methods (using aliased enum)
-            aggregate_mappings = {
-                AggKeys.GROSS_POTENTIAL_RENT: queries.gpr,
-                AggKeys.POTENTIAL_GROSS_REVENUE: queries.pgr,
-                AggKeys.TENANT_REVENUE: queries.tenant_revenue,
-                AggKeys.GENERAL_VACANCY_LOSS: queries.vacancy_loss,
-                AggKeys.MISCELLANEOUS_INCOME: queries.misc_income,
-                AggKeys.RENTAL_ABATEMENT: queries.rental_abatement,
-                AggKeys.CREDIT_LOSS: queries.credit_loss,
-                AggKeys.EXPENSE_REIMBURSEMENTS: queries.expense_reimbursements,
-                AggKeys.EFFECTIVE_GROSS_INCOME: queries.egi,
-                AggKeys.TOTAL_OPERATING_EXPENSES: queries.opex,
-                AggKeys.NET_OPERATING_INCOME: queries.noi,
-                AggKeys.TOTAL_CAPITAL_EXPENDITURES: queries.capex,
-                AggKeys.TOTAL_TENANT_IMPROVEMENTS: queries.ti,
-                AggKeys.TOTAL_LEASING_COMMISSIONS: queries.lc,
-                AggKeys.UNLEVERED_CASH_FLOW: queries.project_cash_flow,
-            }
+            # Aggregate keys computed from the ledger (using aliased enum)
+            aggregate_keys = [
+                AggKeys.GROSS_POTENTIAL_RENT,
+                AggKeys.POTENTIAL_GROSS_REVENUE,
+                AggKeys.TENANT_REVENUE,
+                AggKeys.GENERAL_VACANCY_LOSS,
+                AggKeys.MISCELLANEOUS_INCOME,
+                AggKeys.RENTAL_ABATEMENT,
+                AggKeys.CREDIT_LOSS,
+                AggKeys.EXPENSE_REIMBURSEMENTS,
+                AggKeys.EFFECTIVE_GROSS_INCOME,
+                AggKeys.TOTAL_OPERATING_EXPENSES,
+                AggKeys.NET_OPERATING_INCOME,
+                AggKeys.TOTAL_CAPITAL_EXPENDITURES,
+                AggKeys.TOTAL_TENANT_IMPROVEMENTS,
+                AggKeys.TOTAL_LEASING_COMMISSIONS,
+                AggKeys.UNLEVERED_CASH_FLOW,
+            ]
 
             # Special cases that need zero values (not yet tracked in ledger)
             zero_series = pd.Series(0.0, index=self.context.timeline.period_index)
@@ -562,21 +670,22 @@ class CashFlowOrchestrator:
                 AggKeys.ROLLOVER_VACANCY_LOSS: zero_series,
             }
 
-            # If a subset of keys requested, filter mappings
+            # If a subset of keys requested, filter keys
             if keys is not None:
-                aggregate_mappings = {
-                    k: v for k, v in aggregate_mappings.items() if k in keys
-                }
-
-            # Update requested aggregates
-            for key, query_method in aggregate_mappings.items():
-                try:
-                    result = query_method()
-                    self.context.resolved_lookups[key.value] = self._to_period_series(
-                        result
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to compute {key.value}: {e}. Using zeros.")
+                aggregate_keys = [k for k in aggregate_keys if k in keys]
+
+            # Update requested aggregates from a single multi-aggregate scan
+            try:
+                bundle = queries.aggregate_bundle(
+                    aggregate_keys, index=self.context.timeline.period_index
+                )
+                for key in aggregate_keys:
+                    self.context.resolved_lookups[key.value] = bundle[
+                        key.value
+                    ].rename(None)
+            except Exception as e:
+                logger.warning(f"Failed to compute aggregates: {e}. Using zeros.")
+                for key in aggregate_keys:
                     self.context.resolved_lookups[key.value] = pd.Series(
                         0.0, index=self.context.timeline.period_index
                     )
@@ -587,7 +696,7 @@ class CashFlowOrchestrator:
 
             # Update cache after recompute with computed series (include special cases)
             cache: Dict[str, pd.Series] = {}
-            for k in aggregate_mappings.keys():
+            for k in aggregate_keys:
                 cache[k.value] = self.context.resolved_lookups[k.value]
             for k in special_cases.keys():
                 cache[k.value] = self.context.resolved_lookups[k.value]
@@ -596,7 +705,7 @@ class CashFlowOrchestrator:
             self.context.aggregate_cache_keys = requested_keys
 
             logger.debug(
-                f"Updated {len(aggregate_mappings) + len(special_cases)} aggregates from ledger ({phase_name} phase)"
+                f"Updated {len(aggregate_keys) + len(special_cases)} aggregates from ledger ({phase_name} phase)"
             )
 
     def get_series_with_metadata(
@@ -632,6 +741,8 @@ class CashFlowOrchestrator:
         for lookup_key, result in self.context.resolved_lookups.items():
             if isinstance(lookup_key, UUID):
                 model = self.model_map[lookup_key]
+                # Results of weighted models are per unit
+                weight = _multiplicity(model)
 
                 # Determine pass number from model's calculation pass
                 pass_num = (
@@ -652,7 +763,8 @@ class CashFlowOrchestrator:
                                 pass_num=pass_num,
                                 deal_id=deal_id,
                             )
-                            pairs.append((series, metadata))
+                            scaled = series * weight if weight > 1 else series
+                            pairs.append((scaled, metadata))
 
                 elif isinstance(result, pd.Series):  # Simple series
                     if result is not None and not result.empty:
@@ -665,27 +777,20 @@ class CashFlowOrchestrator:
                             pass_num=pass_num,
                             deal_id=deal_id,
                         )
-                        pairs.append((result, metadata))
+                        pairs.append(
+                            (result * weight if weight > 1 else result, metadata)
+                        )
 
         return pairs
 
-    # --- CRITICAL METHOD 2: _calculate_occupancy_series() ---
-    def _calculate_occupancy_series(self) -> pd.Series:
-        """Calculates the property-wide occupancy rate for each period."""
-        total_occupied_area = pd.Series(0.0, index=self.context.timeline.period_index)
-        lease_models = [m for m in self.models if isinstance(m, LeaseBase)]
-
-        for lease in lease_models:
-            lease_area_series = pd.Series(lease.area, index=lease.timeline.period_index)
-            total_occupied_area = total_occupied_area.add(
-                lease_area_series, fill_value=0.0
-            )
-
-        nra = self.context.property_data.net_rentable_area
-        if nra > 0:
-            return total_occupied_area / nra
-        else:
-            return pd.Series(0.0, index=self.context.timeline.period_index)
+    # --- CRITICAL METHOD 2: _calculate_occupancy_profile() ---
+    def _calculate_occupancy_profile(self) -> OccupancyProfile:
+        """Calculates the property-wide occupancy of each period from the leases."""
+        return OccupancyProfile.from_leases(
+            (m for m in self.models if isinstance(m, LeaseBase)),
+            self.context.timeline.period_index,
+            self.context.property_data.net_rentable_area,
+        )
 
     def _compute_model_subset(self, model_subset: List["CashFlowModel"]) -> None:
         """Builds dependency graph and computes a subset of models in order."""
@@ -725,35 +830,29 @@ class CashFlowOrchestrator:
             )
             raise
 
-        for model_uid in sorted_uids:
-            model = self.model_map[model_uid]
-
-            # For leases with rollover profiles, use project_future_cash_flows to handle renewals
-            if (
-                isinstance(model, LeaseBase)
-                and hasattr(model, "rollover_profile")
-                and model.rollover_profile
-                and model.upon_expiration
-                in [
-                    UponExpirationEnum.RENEW,
-                    UponExpirationEnum.MARKET,
-                    UponExpirationEnum.VACATE,
-                    UponExpirationEnum.OPTION,
-                    UponExpirationEnum.REABSORB,
-                ]
-            ):
-                logger.debug(
-                    f"Using project_future_cash_flows for lease {model.name} with rollover profile"
-                )
-                future_df = model.project_future_cash_flows(context=self.context)
-
-                # Convert DataFrame back to the dict format expected by aggregation
-                result = {}
-                for column in future_df.columns:
-                    result[column] = future_df[column]
-
+        sorted_models = [self.model_map[uid] for uid in sorted_uids]
+        independent = all(
+            m.calculation_pass == OrchestrationPass.INDEPENDENT_MODELS
+            for m in sorted_models
+        )
+        if independent and self.context.settings.calculation.lease_engine == "cohort":
+            runs = self._cohort_runs(sorted_models)
+        else:
+            runs = [(None, sorted_models)]
+
+        executor = self.context.settings.calculation.phase1_executor
+        for engine, run_models in runs:
+            if engine is not None:
+                self._compute_cohort(engine, run_models)
+            elif executor != "serial" and len(run_models) > 1 and independent:
+                self._compute_independent_in_pool(run_models, executor)
             else:
-                result = model.compute_cf(context=self.context)
+                self._compute_in_order(run_models)
+
+    def _compute_in_order(self, models: List["CashFlowModel"]) -> None:
+        """Computes models one at a time, refreshing aggregates in Phase 2."""
+        for model in models:
+            result = _compute_model_cash_flows(model, self.context)
 
             self.context.resolved_lookups[model.uid] = result
 
@@ -762,31 +861,247 @@ class CashFlowOrchestrator:
 
             # Update aggregates after each model in Phase 2 to ensure dependent models
             # have access to fresh aggregate data from previously processed models.
-            # IMPORTANT: Flush buffered writes so queries see newly added transactions.
             if model.calculation_pass == OrchestrationPass.DEPENDENT_MODELS:
-                # Ensure visibility of buffered transactions
-                self.context.ledger.flush()
-                # Update only needed aggregates for remaining dependent models
-                remaining_needed: Set[UnleveredAggregateLineKey] = set()
-                # Recompute list of remaining dependent models from context
-                remaining_models = [
-                    m
-                    for m in self.models
-                    if m.calculation_pass == OrchestrationPass.DEPENDENT_MODELS
-                ]
-                for rem in remaining_models:
-                    if rem.uid == model.uid:
-                        continue
-                    if getattr(rem, "reference", None) and isinstance(
-                        rem.reference, UnleveredAggregateLineKey
-                    ):
-                        remaining_needed.add(rem.reference)
-                if remaining_needed:
-                    self._update_aggregates_from_ledger(
-                        self.context.ledger,
-                        "intermediate",
-                        keys=remaining_needed,
+                if self._accumulator is not None:
+                    self._publish_accumulated_aggregates()
+                else:
+                    self._refresh_aggregates_from_ledger(model)
+
+    def _publish_accumulated_aggregates(self) -> None:
+        """Expose accumulator lines changed by the last model to later models."""
+        for key in self._updated_aggregates:
+            self.context.resolved_lookups[key.value] = self._accumulator.series(key)
+        self._updated_aggregates.clear()
+
+    def _refresh_aggregates_from_ledger(self, model: "CashFlowModel") -> None:
+        """
+        Re-query the aggregates remaining dependent models need from the ledger.
+
+        Used when a needed line cannot be accumulated in memory (e.g. TI/LC).
+        """
+        # IMPORTANT: Flush buffered writes so queries see newly added transactions.
+        self.context.ledger.flush()
+        # Update only needed aggregates for remaining dependent models
+        remaining_needed: Set[UnleveredAggregateLineKey] = set()
+        # Recompute list of remaining dependent models from context
+        remaining_models = [
+            m
+            for m in self.models
+            if m.calculation_pass == OrchestrationPass.DEPENDENT_MODELS
+        ]
+        for rem in remaining_models:
+            if rem.uid == model.uid:
+                continue
+            if getattr(rem, "reference", None) and isinstance(
+                rem.reference, UnleveredAggregateLineKey
+            ):
+                remaining_needed.add(rem.reference)
+        if remaining_needed:
+            self._update_aggregates_from_ledger(
+                self.context.ledger,
+                "intermediate",
+                keys=remaining_needed,
+            )
+
+    def _compute_independent_in_pool(
+        self, models: List["CashFlowModel"], executor: str
+    ) -> None:
+        """
+        Compute Phase 1 models in a thread or process pool.
+
+        Independent models only read the frozen model and the context, with
+        two exceptions that fix the order: leases read the resolved cash flows
+        of expense items (recoveries) and set `context.current_lease` for
+        their TI/LC. Models are therefore computed in runs of consecutive
+        leases and non-leases; each run is computed concurrently on copies
+        of the context, then its results are recorded and written to the
+        ledger in model order before the next run starts. The ledger thus
+        receives exactly the writes of a serial run, in the same order.
+
+        Args:
+            models: Independent models in computation order
+            executor: "thread" or "process"
+        """
+        runs: List[List["CashFlowModel"]] = []
+        for model in models:
+            is_lease = isinstance(model, LeaseBase)
+            if runs and isinstance(runs[-1][0], LeaseBase) == is_lease:
+                runs[-1].append(model)
+            else:
+                runs.append([model])
+
+        max_workers = self.context.settings.calculation.phase1_max_workers
+        pool: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers)
+            if executor == "process"
+            else ThreadPoolExecutor(max_workers=max_workers)
+        )
+        logger.info(
+            f"  Computing {len(models)} independent models in a {executor} pool "
+            f"({len(runs)} runs)"
+        )
+        with pool:
+            for run_models in runs:
+                if executor == "process":
+                    # The ledger holds a DuckDB connection; workers never write
+                    worker_context = copy.copy(self.context)
+                    worker_context.ledger = None
+                    contexts = [worker_context] * len(run_models)
+                    workers = max_workers or os.cpu_count() or 1
+                    chunksize = max(1, len(run_models) // (4 * workers))
+                else:
+                    # One shallow copy per model so current_lease is not shared
+                    contexts = [copy.copy(self.context) for _ in run_models]
+                    chunksize = 1
+                # Wait for the whole run before touching the shared context
+                outcomes = list(
+                    pool.map(
+                        _compute_in_worker, run_models, contexts, chunksize=chunksize
                     )
+                )
+                # Apply in model order, as a serial run would
+                for model, (result, is_current_lease) in zip(run_models, outcomes):
+                    if is_current_lease:
+                        self.context.current_lease = model
+                    self.context.resolved_lookups[model.uid] = result
+                    self._add_to_ledger(model, result)
+
+    @staticmethod
+    def _cohort_runs(
+        models: List["CashFlowModel"],
+    ) -> List[Tuple[Optional[type], List["CashFlowModel"]]]:
+        """
+        Split models into runs projected by a lease cohort engine or not.
+
+        Consecutive leases that a cohort engine accepts (and that share their
+        ledger classification) form one run for that engine; all other models
+        form runs with engine None. Runs keep the model order, so the ledger
+        receives its rows in the same order as a per-lease run.
+        """
+        runs: List[Tuple[Optional[type], List["CashFlowModel"]]] = []
+        previous_key = None
+        for model in models:
+            engine = None
+            if _projects_rollovers(model):
+                engine = type(model).cohort_engine()
+                if engine is not None and not engine.accepts(model):
+                    engine = None
+            key = (
+                (engine, model.category, model.subcategory)
+                if engine is not None
+                else None
+            )
+            if runs and key == previous_key:
+                runs[-1][1].append(model)
+            else:
+                runs.append((engine, [model]))
+            previous_key = key
+        return runs
+
+    def _compute_cohort(self, engine: type, leases: List["LeaseBase"]) -> None:
+        """
+        Project a run of leases with their cohort engine and write it in bulk.
+
+        Records the same `{component: Series}` results as
+        `project_future_cash_flows` and stages the same ledger rows as
+        `_add_to_ledger` would, with one `Ledger.add_series_matrix` call.
+        """
+        cohort = engine(leases)
+        values = cohort.project(self.context)
+        component = cohort.component
+        logger.info(
+            f"  Projected {len(leases)} leases with {engine.__name__} "
+            f"({values.shape[1]} periods)"
+        )
+
+        period_index = self.context.timeline.period_index
+        for lease, row in zip(leases, values):
+            self.context.resolved_lookups[lease.uid] = {
+                component: pd.Series(row, index=period_index, name=component)
+            }
+
+        # Weighted leases are scaled, or repeated once per unit; the rows above
+        # back the recorded Series, so the ledger rows are a separate array
+        item_names = [self._ledger_item_names(lease, component) for lease in leases]
+        rows = values
+        if self._scales_weighted_models():
+            multiplicity = np.array([_multiplicity(lease) for lease in leases])
+            if (multiplicity > 1).any():
+                rows = values * multiplicity[:, None]
+        else:
+            repeats = [len(names) for names in item_names]
+            if len(item_names) < sum(repeats):
+                rows = np.repeat(values, repeats, axis=0)
+
+        # Item names and source ids are given per row below
+        first = leases[0]
+        metadata = SeriesMetadata(
+            category=first.category,
+            subcategory=first.subcategory,
+            item_name=f"{first.name} - {component}",
+            source_id=first.uid,
+            asset_id=self.context.property_data.uid,
+            pass_num=first.calculation_pass.value,
+        )
+        self.context.ledger.add_series_matrix(
+            rows,
+            period_index,
+            metadata,
+            item_names=[name for names in item_names for name in names],
+            source_ids=[
+                lease.uid for lease, names in zip(leases, item_names) for _ in names
+            ],
+        )
+
+    def _scales_weighted_models(self) -> bool:
+        """Whether weighted models are written as one scaled series each."""
+        calculation = self.context.settings.calculation
+        return calculation.weighted_model_granularity == "model"
+
+    def _ledger_item_names(
+        self, model: "CashFlowModel", component: Optional[str] = None
+    ) -> List[str]:
+        """
+        Item names of the ledger series written for one model result.
+
+        One name per unit for weighted models written per unit, otherwise the
+        model name. Components of dict results are appended (" - base_rent").
+        """
+        suffix = f" - {component}" if component is not None else ""
+        multiplicity = _multiplicity(model)
+        if multiplicity == 1 or self._scales_weighted_models():
+            return [f"{model.name}{suffix}"]
+        return [f"{model.unit_name(i)}{suffix}" for i in range(multiplicity)]
+
+    def _write_series(
+        self,
+        model: "CashFlowModel",
+        series: pd.Series,
+        metadata: SeriesMetadata,
+        component: Optional[str] = None,
+    ) -> None:
+        """Write one signed model series, applying the model's multiplicity."""
+        multiplicity = _multiplicity(model)
+        if self._accumulator is not None:
+            self._updated_aggregates |= self._accumulator.add(
+                series * multiplicity if multiplicity > 1 else series, metadata
+            )
+        if multiplicity == 1:
+            self.context.ledger.add_series(series, metadata)
+        elif self._scales_weighted_models():
+            self.context.ledger.add_series(series * multiplicity, metadata)
+        else:
+            # The per-unit series is shared by every unit's rows
+            values = np.broadcast_to(
+                series.to_numpy(dtype="float64"), (multiplicity, len(series))
+            )
+            self.context.ledger.add_series_matrix(
+                values,
+                series.index,
+                metadata,
+                item_names=self._ledger_item_names(model, component),
+                source_ids=[metadata.source_id] * multiplicity,
+            )
 
     def _add_to_ledger(self, model: "CashFlowModel", result: Any) -> None:
         """Add model cash flows to ledger with metadata."""
@@ -839,7 +1154,7 @@ class CashFlowOrchestrator:
                         asset_id=self.context.property_data.uid,
                         pass_num=model.calculation_pass.value,  # Use model's actual calculation pass
                     )
-                    self.context.ledger.add_series(series_to_add, metadata)
+                    self._write_series(model, series_to_add, metadata, component)
                     logger.debug(
                         f"Added to ledger: {model.name} - {component} ({len(aligned_series)} periods)"
                     )
@@ -897,7 +1212,7 @@ class CashFlowOrchestrator:
                     asset_id=self.context.property_data.uid,
                     pass_num=model.calculation_pass.value,  # Use model's actual calculation pass
                 )
-                self.context.ledger.add_series(series_to_add, metadata)
+                self._write_series(model, series_to_add, metadata)
                 logger.debug(
                     f"Added to ledger: {model.name} ({len(aligned_result)} periods)"
                 )
@@ -949,21 +1264,41 @@ class CashFlowOrchestrator:
         # Create high-performance DuckDB-based queries
         queries = LedgerQueries(ledger)
 
-        # Build all aggregate series with proper PeriodIndex conversion
+        # Build all aggregate series aligned to the timeline in one scan
         # This replaces both the old summary_df logic AND the resolved_lookups update
-        pgr_series = self._to_period_series(queries.pgr())
-        vacancy_series = self._to_period_series(queries.vacancy_loss())
-        misc_income_series = self._to_period_series(queries.misc_income())
-        abatement_series = self._to_period_series(queries.rental_abatement())
-        credit_loss_series = self._to_period_series(queries.credit_loss())
-        reimbursements_series = self._to_period_series(queries.expense_reimbursements())
-        egi_series = self._to_period_series(queries.egi())
-        opex_series = self._to_period_series(queries.opex())
-        noi_series = self._to_period_series(queries.noi())
-        capex_series = self._to_period_series(queries.capex())
-        ti_series = self._to_period_series(queries.ti())
-        lc_series = self._to_period_series(queries.lc())
-        ucf_series = self._to_period_series(queries.project_cash_flow())
+        bundle = queries.aggregate_bundle(
+            [
+                AggKeys.POTENTIAL_GROSS_REVENUE,
+                AggKeys.GENERAL_VACANCY_LOSS,
+                AggKeys.MISCELLANEOUS_INCOME,
+                AggKeys.RENTAL_ABATEMENT,
+                AggKeys.CREDIT_LOSS,
+                AggKeys.EXPENSE_REIMBURSEMENTS,
+                AggKeys.EFFECTIVE_GROSS_INCOME,
+                AggKeys.TOTAL_OPERATING_EXPENSES,
+                AggKeys.NET_OPERATING_INCOME,
+                AggKeys.TOTAL_CAPITAL_EXPENDITURES,
+                AggKeys.TOTAL_TENANT_IMPROVEMENTS,
+                AggKeys.TOTAL_LEASING_COMMISSIONS,
+                AggKeys.UNLEVERED_CASH_FLOW,
+            ],
+            index=analysis_periods,
+        )
+        pgr_series = bundle[AggKeys.POTENTIAL_GROSS_REVENUE.value].rename(None)
+        vacancy_series = bundle[AggKeys.GENERAL_VACANCY_LOSS.value].rename(None)
+        misc_income_series = bundle[AggKeys.MISCELLANEOUS_INCOME.value].rename(None)
+        abatement_series = bundle[AggKeys.RENTAL_ABATEMENT.value].rename(None)
+        credit_loss_series = bundle[AggKeys.CREDIT_LOSS.value].rename(None)
+        reimbursements_series = bundle[AggKeys.EXPENSE_REIMBURSEMENTS.value].rename(
+            None
+        )
+        egi_series = bundle[AggKeys.EFFECTIVE_GROSS_INCOME.value].rename(None)
+        opex_series = bundle[AggKeys.TOTAL_OPERATING_EXPENSES.value].rename(None)
+        noi_series = bundle[AggKeys.NET_OPERATING_INCOME.value].rename(None)
+        capex_series = bundle[AggKeys.TOTAL_CAPITAL_EXPENDITURES.value].rename(None)
+        ti_series = bundle[AggKeys.TOTAL_TENANT_IMPROVEMENTS.value].rename(None)
+        lc_series = bundle[AggKeys.TOTAL_LEASING_COMMISSIONS.value].rename(None)
+        ucf_series = bundle[AggKeys.UNLEVERED_CASH_FLOW.value].rename(None)
 
         # Create summary DataFrame for reporting
         summary_data = {
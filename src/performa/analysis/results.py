@@ -54,6 +54,35 @@ class AssetAnalysisResult:
     scenario: "AnalysisScenarioBase"  # Full scenario with _orchestrator
     models: List["CashFlowModel"]  # Direct access to all models
 
+    @classmethod
+    def from_ledger(
+        cls,
+        ledger: Ledger,
+        property: "PropertyBaseModel",
+        timeline: Timeline,
+    ) -> "AssetAnalysisResult":
+        """
+        Rebuild results from a stored ledger without re-running the analysis.
+
+        All ledger-derived metrics are available; `scenario` is None and
+        `models` is empty because no orchestration took place.
+
+        Args:
+            ledger: Populated ledger, e.g. from `Ledger.open(path)`
+            property: Property model the ledger was produced from
+            timeline: Timeline used for the original analysis
+
+        Returns:
+            AssetAnalysisResult backed by the given ledger
+        """
+        return cls(
+            ledger=ledger,
+            property=property,
+            timeline=timeline,
+            scenario=None,
+            models=[],
+        )
+
     @property
     def get_ledger_df(self) -> pd.DataFrame:
         """
@@ -150,83 +179,44 @@ class AssetAnalysisResult:
             version built from ledger queries, ensuring consistency.
         """
         queries = self.get_ledger_queries()
+        keys = UnleveredAggregateLineKey
 
-        # Build summary from query results, converting to PeriodIndex
+        # Build summary from a single multi-aggregate query aligned to the timeline
         # Use enum values for column names to match expected test format
         # NOTE: signs are preserved according to accounting conventions:
         #   - Revenues and recoveries: positive
         #   - Losses: positive magnitudes for display (vacancy, credit, abatement)
         #   - Operating expenses: negative (cost)
-        summary_data = {
-            UnleveredAggregateLineKey.POTENTIAL_GROSS_REVENUE.value: self._to_period_series(
-                queries.pgr()
-            ),
-            UnleveredAggregateLineKey.RENTAL_ABATEMENT.value: self._to_period_series(
-                queries.rental_abatement().abs()
-            ),
-            UnleveredAggregateLineKey.MISCELLANEOUS_INCOME.value: self._to_period_series(
-                queries.misc_income()
-            ),
-            UnleveredAggregateLineKey.GENERAL_VACANCY_LOSS.value: self._to_period_series(
-                queries.vacancy_loss().abs()
-            ),
-            UnleveredAggregateLineKey.CREDIT_LOSS.value: self._to_period_series(
-                queries.credit_loss().abs()
-            ),
-            UnleveredAggregateLineKey.EXPENSE_REIMBURSEMENTS.value: self._to_period_series(
-                queries.expense_reimbursements()
-            ),
-            UnleveredAggregateLineKey.EFFECTIVE_GROSS_INCOME.value: self._to_period_series(
-                queries.egi()
-            ),
-            UnleveredAggregateLineKey.TOTAL_OPERATING_EXPENSES.value: self._to_period_series(
-                queries.opex()
-            ),
-            UnleveredAggregateLineKey.NET_OPERATING_INCOME.value: self._to_period_series(
-                queries.noi()
-            ),
-            UnleveredAggregateLineKey.TOTAL_CAPITAL_EXPENDITURES.value: self._to_period_series(
-                queries.capex().abs()
-            ),
-            UnleveredAggregateLineKey.TOTAL_TENANT_IMPROVEMENTS.value: self._to_period_series(
-                queries.ti().abs()
-            ),
-            UnleveredAggregateLineKey.TOTAL_LEASING_COMMISSIONS.value: self._to_period_series(
-                queries.lc().abs()
-            ),
-            UnleveredAggregateLineKey.UNLEVERED_CASH_FLOW.value: self._to_period_series(
-                queries.project_cash_flow()
-            ),
-        }
-
-        # Create DataFrame with PeriodIndex
-        summary_df = pd.DataFrame(summary_data, index=self.timeline.period_index)
-
-        # Fill NaN values with 0 for clean presentation
-        return summary_df.fillna(0.0)
-
-    def _to_period_series(self, series: pd.Series) -> pd.Series:
-        """
-        Convert series with date index to PeriodIndex matching timeline.
-
-        Args:
-            series: Input series with date index
+        summary_df = queries.aggregate_bundle(
+            [
+                keys.POTENTIAL_GROSS_REVENUE,
+                keys.RENTAL_ABATEMENT,
+                keys.MISCELLANEOUS_INCOME,
+                keys.GENERAL_VACANCY_LOSS,
+                keys.CREDIT_LOSS,
+                keys.EXPENSE_REIMBURSEMENTS,
+                keys.EFFECTIVE_GROSS_INCOME,
+                keys.TOTAL_OPERATING_EXPENSES,
+                keys.NET_OPERATING_INCOME,
+                keys.TOTAL_CAPITAL_EXPENDITURES,
+                keys.TOTAL_TENANT_IMPROVEMENTS,
+                keys.TOTAL_LEASING_COMMISSIONS,
+                keys.UNLEVERED_CASH_FLOW,
+            ],
+            index=self.timeline.period_index,
+        )
 
-        Returns:
-            Series with PeriodIndex matching timeline
-        """
-        # Handle empty series
-        if series.empty:
-            return pd.Series(0.0, index=self.timeline.period_index)
-
-        # Create a new series with proper PeriodIndex
-        result = pd.Series(0.0, index=self.timeline.period_index)
-        for date_val, amount in series.items():
-            # Convert date to period
-            period = pd.Period(date_val, freq="M")
-            if period in result.index:
-                result[period] = amount
-        return result
+        magnitude_columns = [
+            keys.RENTAL_ABATEMENT.value,
+            keys.GENERAL_VACANCY_LOSS.value,
+            keys.CREDIT_LOSS.value,
+            keys.TOTAL_CAPITAL_EXPENDITURES.value,
+            keys.TOTAL_TENANT_IMPROVEMENTS.value,
+            keys.TOTAL_LEASING_COMMISSIONS.value,
+        ]
+        summary_df[magnitude_columns] = summary_df[magnitude_columns].abs()
+
+        return summary_df
 
     def summary_stats(self) -> dict:
         """
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import List, Optional
 
 from dateutil.relativedelta import relativedelta
 
@@ -127,11 +127,7 @@ class ResidentialAnalysisScenario(AnalysisScenarioBase):
         # Unroll unit mix into individual leases
         if prop.unit_mix:
             for unit_spec in prop.unit_mix.unit_specs:
-                for unit_index in range(unit_spec.unit_count):
-                    lease_instance = self._create_lease_from_unit_spec(
-                        unit_spec, unit_index, context
-                    )
-                    all_models.append(lease_instance)
+                all_models.extend(self._create_leases_from_unit_spec(unit_spec, context))
 
         # Process absorption plans for vacant units
         if hasattr(prop, "absorption_plans") and prop.absorption_plans:
@@ -155,11 +151,9 @@ class ResidentialAnalysisScenario(AnalysisScenarioBase):
 
                     # Create lease models
                     for unit_spec in generated_specs:
-                        for unit_index in range(unit_spec.unit_count):
-                            lease_instance = self._create_lease_from_unit_spec(
-                                unit_spec, unit_index, context
-                            )
-                            all_models.append(lease_instance)
+                        all_models.extend(
+                            self._create_leases_from_unit_spec(unit_spec, context)
+                        )
 
                 except Exception as e:
                     # Continue on absorption plan errors
@@ -201,22 +195,51 @@ class ResidentialAnalysisScenario(AnalysisScenarioBase):
         logger.info(f"Assembly complete: {len(all_models)} total cash flow models")
         return all_models
 
+    def _create_leases_from_unit_spec(
+        self, unit_spec: ResidentialUnitSpec, context: AnalysisContext
+    ) -> List[ResidentialLease]:
+        """
+        Create the lease models of a unit specification.
+
+        One lease per unit, or with `CalculationSettings.unit_models="weighted"`
+        a single lease whose multiplicity is the spec's unit count.
+        """
+        if (
+            self.settings.calculation.unit_models == "weighted"
+            and unit_spec.unit_count > 1
+        ):
+            return [
+                self._create_lease_from_unit_spec(
+                    unit_spec, None, context, multiplicity=unit_spec.unit_count
+                )
+            ]
+        return [
+            self._create_lease_from_unit_spec(unit_spec, unit_index, context)
+            for unit_index in range(unit_spec.unit_count)
+        ]
+
     def _create_lease_from_unit_spec(
-        self, unit_spec: ResidentialUnitSpec, unit_index: int, context: AnalysisContext
+        self,
+        unit_spec: ResidentialUnitSpec,
+        unit_index: Optional[int],
+        context: AnalysisContext,
+        multiplicity: int = 1,
     ) -> ResidentialLease:
         """
         Create lease instance from unit specification.
 
         Handles progressive lease start dates for development projects
-        and injects resolved object references for performance.
+        and injects resolved object references for performance. A lease
+        standing for several units (`unit_index` None) is named after the
+        unit type only.
         """
         # CRITICAL FIX: Include lease start date in suite_id to avoid collisions
         # when multiple absorption cohorts have the same unit_type_name
+        suite_id = unit_spec.unit_type_name
         if unit_spec.lease_start_date:
-            date_suffix = unit_spec.lease_start_date.strftime("%Y%m")
-            suite_id = f"{unit_spec.unit_type_name}_{date_suffix}_{unit_index + 1:03d}"
-        else:
-            suite_id = f"{unit_spec.unit_type_name}_{unit_index + 1:03d}"
+            suite_id += f"_{unit_spec.lease_start_date.strftime('%Y%m')}"
+        if unit_index is not None:
+            suite_id += f"_{unit_index + 1:03d}"
 
         # Configure lease term from rollover profile
         lease_term_months = unit_spec.rollover_profile.term_months
@@ -245,6 +268,7 @@ class ResidentialAnalysisScenario(AnalysisScenarioBase):
             value=unit_spec.current_avg_monthly_rent,  # Same as monthly_rent for CashFlowModel
             frequency=FrequencyEnum.MONTHLY,
             rollover_profile=unit_spec.rollover_profile,
+            multiplicity=multiplicity,
         )
 
         return lease
@@ -415,7 +439,10 @@ class ResidentialAnalysisScenario(AnalysisScenarioBase):
 
         # Update lease name (immutable instance)
         post_renovation_lease = post_renovation_lease.model_copy(
-            update={"name": f"{original_lease.name} (Post-Renovation)"}
+            update={
+                "name": f"{original_lease.name} (Post-Renovation)",
+                "multiplicity": original_lease.multiplicity,
+            }
         )
 
         logger.info(
@@ -0,0 +1,219 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Vectorized rollover projection for cohorts of residential leases.
+
+`ResidentialLease.project_future_cash_flows` projects one unit at a time: a
+pandas Series for the current lease, then a speculative `ResidentialLease`
+per rollover until the analysis ends. A unit mix of a few floor plans
+repeats that work for every unit even though identical units share their
+rent and rollover dates.
+
+`ResidentialLeaseCohort` projects many leases at once into a units x periods
+rent matrix. Rollovers advance all still-active leases by one generation per
+step with array operations; the market rent and term of each generation are
+computed once per distinct (rollover profile, expiration action, start
+month) and scattered back to the leases. The matrix holds exactly the values
+the per-lease path produces, including leases set to `REABSORB`, which stop
+at their current expiration.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...core.primitives import UponExpirationEnum
+from .lease import ResidentialLease
+
+if TYPE_CHECKING:
+    from ...analysis import AnalysisContext
+    from .rollover import ResidentialRolloverLeaseTerms
+
+logger = logging.getLogger(__name__)
+
+# Same safety limit as ResidentialLease.project_future_cash_flows
+MAX_RENEWALS = 50
+
+
+class ResidentialLeaseCohort:
+    """
+    Rent projection for a group of residential leases as one NumPy matrix.
+
+    Args:
+        leases: Leases with a rollover profile, in the order their rows
+            should appear in the projected matrix
+
+    Example:
+        ```python
+        cohort = ResidentialLeaseCohort(leases)
+        rents = cohort.project(context)  # shape (len(leases), periods)
+        ```
+    """
+
+    #: Cash flow component the projected rents belong to
+    component = "base_rent"
+
+    def __init__(self, leases: List[ResidentialLease]):
+        self.leases = list(leases)
+
+    @staticmethod
+    def accepts(model) -> bool:
+        """Whether a model is projected exactly like `ResidentialLease` does."""
+        # Subclasses may override compute_cf or the rollover logic
+        return type(model) is ResidentialLease and model.rollover_profile is not None
+
+    def project(self, context: "AnalysisContext") -> np.ndarray:
+        """
+        Project current leases and their rollovers over the analysis timeline.
+
+        Args:
+            context: Analysis context (timeline and global settings)
+
+        Returns:
+            Float array of shape (leases, analysis periods) with the monthly
+            rent of every lease, identical to the `base_rent` column of
+            `project_future_cash_flows` for each lease
+        """
+        period_index = context.timeline.period_index
+        rents = np.zeros((len(self.leases), len(period_index)))
+        if not self.leases or len(period_index) == 0:
+            return rents
+
+        first_ord = period_index[0].ordinal
+        last_ord = period_index[-1].ordinal
+        months = np.arange(first_ord, last_ord + 1)
+
+        ends = np.array([lease.timeline.end_date.ordinal for lease in self.leases])
+        durations = np.array([lease.timeline.duration_months for lease in self.leases])
+        starts = ends - durations + 1
+        current_rents = np.array([lease.monthly_rent for lease in self.leases])
+        self._paint(
+            rents, np.arange(len(self.leases)), starts, ends, current_rents, months
+        )
+
+        # Leases sharing a rollover profile and expiration action roll alike
+        groups: Dict[Tuple[int, UponExpirationEnum], int] = {}
+        representatives: List[ResidentialLease] = []
+        group_of = np.empty(len(self.leases), dtype=np.int64)
+        for row, lease in enumerate(self.leases):
+            key = (id(lease.rollover_profile), lease.upon_expiration)
+            if key not in groups:
+                groups[key] = len(representatives)
+                representatives.append(lease)
+            group_of[row] = groups[key]
+        group_terms = [self._next_terms(lease) for lease in representatives]
+        downtime = np.array([
+            lease.rollover_profile.downtime_months for lease in representatives
+        ])
+        rolls = np.array([terms is not None for terms in group_terms])
+
+        active = np.flatnonzero(rolls[group_of] & (ends < last_ord))
+        renewals = 0
+        while active.size and renewals < MAX_RENEWALS:
+            next_starts = ends[active] + 1 + downtime[group_of[active]]
+            active = active[next_starts <= last_ord]
+            next_starts = next_starts[next_starts <= last_ord]
+            if not active.size:
+                break
+
+            # One rent/term calculation per distinct (group, start month)
+            keys, inverse = np.unique(
+                np.stack([group_of[active], next_starts], axis=1),
+                axis=0,
+                return_inverse=True,
+            )
+            inverse = inverse.reshape(-1)
+            key_rents = np.empty(len(keys))
+            key_terms = np.zeros(len(keys), dtype=int)
+            for k, (group, start_ord) in enumerate(keys):
+                outcome = self._rollover(
+                    representatives[group], group_terms[group], int(start_ord), context
+                )
+                if outcome is not None:
+                    key_rents[k], key_terms[k] = outcome
+
+            # Leases whose rollover failed keep the segments projected so far
+            keep = key_terms[inverse] > 0
+            active, next_starts = active[keep], next_starts[keep]
+            inverse = inverse[keep]
+            next_ends = next_starts + key_terms[inverse] - 1
+            self._paint(
+                rents, active, next_starts, next_ends, key_rents[inverse], months
+            )
+
+            ends[active] = next_ends
+            active = active[next_ends < last_ord]
+            renewals += 1
+
+        return rents
+
+    @staticmethod
+    def _paint(
+        rents: np.ndarray,
+        rows: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        values: np.ndarray,
+        months: np.ndarray,
+    ) -> None:
+        """Add each row's rent over its [start, end] months (period ordinals)."""
+        if not rows.size:
+            return
+        mask = (months >= starts[:, None]) & (months <= ends[:, None])
+        rents[rows] += np.where(mask, values[:, None], 0.0)
+
+    @staticmethod
+    def _next_terms(
+        lease: ResidentialLease,
+    ) -> Optional["ResidentialRolloverLeaseTerms"]:
+        """Terms of a lease's rollovers (None when it does not roll over)."""
+        profile = lease.rollover_profile
+        action = lease.upon_expiration
+        if action == UponExpirationEnum.RENEW:
+            return profile.renewal_terms
+        if action == UponExpirationEnum.VACATE:
+            return profile.market_terms
+        if action == UponExpirationEnum.REABSORB:
+            return None
+        # MARKET and any other action use the blended terms
+        try:
+            return profile.blend_lease_terms()
+        except Exception as e:
+            logger.warning(f"Failed to create speculative lease for {lease.name}: {e}")
+            return None
+
+    @staticmethod
+    def _rollover(
+        lease: ResidentialLease,
+        terms: "ResidentialRolloverLeaseTerms",
+        start_ord: int,
+        context: "AnalysisContext",
+    ) -> Optional[Tuple[float, int]]:
+        """
+        Rent and term of a speculative lease starting in a given month.
+
+        Returns None where the per-lease path fails to create the speculative
+        lease (an invalid rent or term), which ends that lease's rollovers.
+        """
+        profile = lease.rollover_profile
+        start_date = pd.Period(ordinal=start_ord, freq="M").start_time.date()
+        try:
+            rent = profile._calculate_rent(
+                terms=terms, as_of_date=start_date, global_settings=context.settings
+            )
+        except Exception as e:
+            logger.warning(f"Failed to create speculative lease for {lease.name}: {e}")
+            return None
+        term = terms.term_months or profile.term_months
+        if not rent > 0 or not term or term <= 0:
+            logger.warning(
+                f"Failed to create speculative lease for {lease.name}: "
+                f"invalid rent {rent} or term {term}"
+            )
+            return None
+        return rent, term
@@ -183,6 +183,13 @@ class ResidentialLease(LeaseBase):
             # Return empty DataFrame with correct index
             return pd.DataFrame(index=context.timeline.period_index)
 
+    @classmethod
+    def cohort_engine(cls) -> Optional[type]:
+        """Residential leases are projected as a rent matrix by ResidentialLeaseCohort."""
+        from .cohort import ResidentialLeaseCohort  # noqa: PLC0415
+
+        return ResidentialLeaseCohort
+
     def _create_speculative_lease_instance(
         self, context: "AnalysisContext"
     ) -> Optional["ResidentialLease"]:
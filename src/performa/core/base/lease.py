@@ -155,6 +155,19 @@ class LeaseBase(CashFlowModel, ABC):
         """
         pass
 
+    @classmethod
+    def cohort_engine(cls) -> Optional[type]:
+        """
+        Vectorized projection engine for many leases of this type, if any.
+
+        Used when `CalculationSettings.lease_engine` is "cohort". The engine
+        is constructed with a list of leases it `accepts()` and its
+        `project(context)` returns their `component` cash flows as one
+        (leases x analysis periods) array, matching
+        `project_future_cash_flows` row by row.
+        """
+        return None
+
 
 class RolloverLeaseTermsBase(Model, ABC):
     """
@@ -179,12 +179,7 @@ class VacancyLossModel(CashFlowModel):
         loss_amount = abs(reference_series * self.rate)
 
         # Ensure proper index alignment
-        result = pd.Series(0.0, index=self.timeline.period_index)
-        for period in result.index:
-            if period in loss_amount.index:
-                result[period] = loss_amount[period]
-
-        return result
+        return loss_amount.reindex(self.timeline.period_index, fill_value=0.0)
 
 
 class CreditLossModel(CashFlowModel):
@@ -244,9 +239,4 @@ class CreditLossModel(CashFlowModel):
         loss_amount = abs(reference_series * self.rate)
 
         # Ensure proper index alignment
-        result = pd.Series(0.0, index=self.timeline.period_index)
-        for period in result.index:
-            if period in loss_amount.index:
-                result[period] = loss_amount[period]
-
-        return result
+        return loss_amount.reindex(self.timeline.period_index, fill_value=0.0)
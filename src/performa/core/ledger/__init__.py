@@ -9,12 +9,16 @@ canonical backend implementation.
 """
 
 from .ledger import Ledger
+from .pool import LedgerPool
 from .queries import LedgerQueries
+from .query_analyzer import LedgerProfiler
 from .records import SeriesMetadata, TransactionRecord
 from .settings import LedgerGenerationSettings
 
 __all__ = [
     "Ledger",
+    "LedgerPool",
+    "LedgerProfiler",
     "LedgerQueries",
     "SeriesMetadata",
     "TransactionRecord",
@@ -0,0 +1,165 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Columnar append buffer for ledger inserts.
+
+This module provides the staging area used by `Ledger.add_series()`. Rows are
+written into preallocated NumPy column arrays and handed to DuckDB as a single
+Arrow table on flush, replacing the per-series DataFrame + register/INSERT
+round trip.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+
+# Column layout of the staging buffer (transaction_id is assigned by DuckDB)
+_NUMERIC_DTYPES: Dict[str, str] = {
+    "date": "datetime64[D]",
+    "amount": "float64",
+    "pass_num": "int8",
+}
+_STRING_COLUMNS = (
+    "flow_purpose",
+    "category",
+    "subcategory",
+    "item_name",
+    "source_id",
+    "asset_id",
+    "deal_id",
+    "entity_id",
+    "entity_type",
+)
+
+
+class ColumnarAppendBuffer:
+    """
+    Preallocated, growable column arrays holding rows awaiting insertion.
+
+    Each `append()` writes one series worth of rows with slice assignment:
+    per-row values (date, amount, flow purpose) are copied from arrays and
+    per-series metadata is broadcast, so no Python objects are created per
+    row. `to_arrow()` exposes the filled prefix of every column as a single
+    Arrow table that DuckDB can scan without copying.
+
+    Args:
+        capacity: Initial number of rows to preallocate. The buffer doubles
+            its capacity whenever an append would overflow it.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        self._allocate(self._capacity)
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return self._size
+
+    def append(
+        self,
+        dates: np.ndarray,
+        amounts: np.ndarray,
+        flow_purposes: np.ndarray,
+        category: str,
+        subcategory: str,
+        item_name: Union[Optional[str], np.ndarray],
+        source_id: Union[Optional[str], np.ndarray],
+        asset_id: Optional[str],
+        pass_num: int,
+        deal_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        entity_type: Optional[str] = None,
+    ) -> None:
+        """
+        Append one series worth of rows.
+
+        Args:
+            dates: Transaction dates (datetime64-compatible array)
+            amounts: Transaction amounts, same length as dates
+            flow_purposes: Flow purpose string per row, same length as dates
+            category: Category string shared by all rows
+            subcategory: Subcategory string shared by all rows
+            item_name: Item name shared by all rows, or an array with one
+                per row
+            source_id: Normalized source UUID string, shared or one per row
+            asset_id: Normalized asset UUID string
+            pass_num: Calculation pass shared by all rows
+            deal_id: Normalized deal UUID string (optional)
+            entity_id: Normalized entity UUID string (optional)
+            entity_type: Entity type shared by all rows (optional)
+        """
+        count = len(amounts)
+        if count == 0:
+            return
+
+        self._reserve(self._size + count)
+        start, end = self._size, self._size + count
+        cols = self._columns
+
+        cols["date"][start:end] = dates
+        cols["amount"][start:end] = amounts
+        cols["flow_purpose"][start:end] = flow_purposes
+        cols["pass_num"][start:end] = pass_num
+        cols["category"][start:end] = category
+        cols["subcategory"][start:end] = subcategory
+        cols["item_name"][start:end] = item_name
+        cols["source_id"][start:end] = source_id
+        cols["asset_id"][start:end] = asset_id
+        cols["deal_id"][start:end] = deal_id
+        cols["entity_id"][start:end] = entity_id
+        cols["entity_type"][start:end] = entity_type
+
+        self._size = end
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Build an Arrow table over the buffered rows.
+
+        Returns:
+            Arrow table with one column per buffered field
+        """
+        n = self._size
+        cols = self._columns
+        arrays = {
+            "date": pa.array(cols["date"][:n], type=pa.date32()),
+            "amount": pa.array(cols["amount"][:n], type=pa.float64()),
+            "pass_num": pa.array(cols["pass_num"][:n], type=pa.int8()),
+        }
+        for name in _STRING_COLUMNS:
+            arrays[name] = pa.array(cols[name][:n], type=pa.string())
+        return pa.table(arrays)
+
+    def clear(self) -> None:
+        """Discard buffered rows while keeping the allocated capacity."""
+        # Drop string references so metadata objects can be collected
+        for name in _STRING_COLUMNS:
+            self._columns[name][: self._size] = None
+        self._size = 0
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate empty column arrays of the given capacity."""
+        for name, dtype in _NUMERIC_DTYPES.items():
+            self._columns[name] = np.empty(capacity, dtype=dtype)
+        for name in _STRING_COLUMNS:
+            self._columns[name] = np.full(capacity, None, dtype=object)
+
+    def _reserve(self, required: int) -> None:
+        """Grow the column arrays geometrically to hold `required` rows."""
+        if required <= self._capacity:
+            return
+        new_capacity = self._capacity
+        while new_capacity < required:
+            new_capacity *= 2
+
+        old_columns = self._columns
+        self._columns = {}
+        self._allocate(new_capacity)
+        for name, values in old_columns.items():
+            self._columns[name][: self._size] = values[: self._size]
+        self._capacity = new_capacity
@@ -0,0 +1,138 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Shared query result cache for the transactional ledger.
+
+Every `LedgerQueries` instance built on the same `Ledger` reads and writes the
+ledger's single `QueryResultCache`, so identical queries issued by different
+consumers (orchestrator, deal passes, results objects) execute once per ledger
+version.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Normalize SQL text for use as a cache key.
+
+    Collapses all whitespace runs so that queries differing only in
+    indentation or line breaks share an entry.
+
+    Args:
+        sql: SQL statement
+
+    Returns:
+        Whitespace-normalized SQL string
+    """
+    return " ".join(sql.split())
+
+
+class QueryResultCache:
+    """
+    Size-bounded LRU cache of query results keyed by SQL and ledger version.
+
+    Keys are built with `make_key()` from the normalized SQL, the ledger
+    version at execution time and any extra hashable parameters that affect
+    the result shape (e.g. output column names). Entries from older versions
+    can never be hit again and are dropped by `invalidate()` whenever the
+    ledger changes.
+
+    Lookups and updates are guarded by a lock, so the cache can be shared by
+    queries running on several threads.
+
+    Args:
+        maxsize: Maximum number of cached results; least recently used entries
+            are evicted first. A value of 0 disables caching.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = max(int(maxsize), 0)
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(sql: str, version: int, *extra: Hashable) -> Tuple[Hashable, ...]:
+        """
+        Build a cache key from SQL text, ledger version and extra parameters.
+
+        Args:
+            sql: SQL statement (normalized before use)
+            version: Ledger version the result was computed against
+            *extra: Additional hashable parameters that distinguish results
+
+        Returns:
+            Hashable cache key
+        """
+        return (version, normalize_sql(sql), *extra)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """
+        Look up a cached result and record a hit or miss.
+
+        Args:
+            key: Key built with `make_key()`
+
+        Returns:
+            Cached result, or None when absent
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """
+        Store a result, evicting least recently used entries beyond maxsize.
+
+        Args:
+            key: Key built with `make_key()`
+            value: Result to cache
+        """
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop all cached results (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache effectiveness counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions, size, maxsize and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -13,23 +13,64 @@ the DuckDB connection for speed and consistency.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
-import secrets
+import threading
 import uuid
-from typing import Any, Dict, List, Tuple
+import weakref
+from contextlib import contextmanager, nullcontext
+from enum import Enum
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import duckdb
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..primitives.enums import enum_to_string
+from .buffer import ColumnarAppendBuffer
+from .cache import QueryResultCache
 from .mapper import FlowPurposeMapper
 from .queries import LedgerQueries
-from .query_analyzer import DuckDBQueryAnalyzer
+from .query_analyzer import DuckDBQueryAnalyzer, LedgerProfiler
 from .records import SeriesMetadata, TransactionRecord
+from .schema import (
+    CONTENT_KEY_COLUMNS,
+    FACT_COLUMNS,
+    LEDGER_COLUMNS,
+    LEDGER_ENUM_COLUMNS,
+    LEDGER_GRANULARITIES,
+    LEDGER_LAYOUTS,
+    ROLLUP_KEY_COLUMNS,
+    SERIES_COLUMNS,
+    TRANSACTION_ID_MODES,
+    arrow_to_pandas,
+    content_groups_sql,
+    enum_type_sql,
+    rollup_select_sql,
+    summary_select_sql,
+)
 
 logger = logging.getLogger(__name__)
 
+# Key/value table holding ledger state for file-backed ledgers
+METADATA_TABLE = "ledger_metadata"
+
+# Partial monthly rollup rows tolerated before the rollup is compacted
+ROLLUP_COMPACT_MIN_ROWS = 4_096
+
 
 class Ledger:
     """
@@ -41,6 +82,7 @@ class Ledger:
     improvements over DataFrame concatenation approaches.
 
     Key Performance Features:
+    - Columnar append buffer flushed to DuckDB as a single Arrow batch
     - Bulk INSERT operations instead of DataFrame concatenations
     - SQL-based aggregations instead of pandas groupby operations
     - Lazy materialization - DataFrame created only when needed
@@ -52,97 +94,361 @@ class Ledger:
 
     """
 
-    def __init__(self):
-        """Initialize the in-memory DuckDB connection and create the transactions table."""
-        self.con = duckdb.connect(database=":memory:", read_only=False)
+    def __init__(
+        self,
+        flush_threshold: int = 250_000,
+        query_cache_size: int = 512,
+        path: Optional[Union[str, os.PathLike]] = None,
+        memory_limit: Optional[str] = None,
+        temp_directory: Optional[Union[str, os.PathLike]] = None,
+        layout: str = "wide",
+        transaction_ids: str = "eager",
+        granularity: str = "full",
+        profile: bool = False,
+    ):
+        """
+        Initialize the DuckDB connection and create (or reopen) the transactions table.
+
+        Args:
+            flush_threshold: Number of buffered rows that triggers an automatic
+                flush of the append buffer while inside a transaction.
+            query_cache_size: Maximum number of query results kept in the
+                shared LRU cache used by all `LedgerQueries` on this ledger.
+            path: Optional DuckDB database file. When given, transactions and
+                ledger metadata are stored on disk; an existing ledger file is
+                reopened with its records intact instead of being recreated.
+            memory_limit: DuckDB memory limit (e.g. "2GB"). Defaults to the
+                `PERFORMA_DUCKDB_MEM` environment variable or "4GB".
+            temp_directory: Directory DuckDB spills to when a query exceeds
+                the memory limit. Defaults to the `PERFORMA_DUCKDB_TEMP_DIR`
+                environment variable, or DuckDB's own default when unset.
+            layout: Storage layout. "wide" keeps every column on each
+                transaction row. "normalized" stores per-series metadata
+                (category, subcategory, item name, ids, pass, entity) once in
+                a series dimension table and only (series_key, date, amount,
+                flow_purpose) per row; `transactions` is then a view joining
+                the two, so queries and `to_dataframe()` are unchanged.
+                Reopened file-backed ledgers keep their stored layout.
+            transaction_ids: "eager" stores a random UUID per row. "deferred"
+                stores surrogate BIGINT row ids drawn from a DuckDB sequence
+                and exposes them through `transactions` as deterministic
+                UUIDs, computed only when a read (e.g. `to_dataframe()` or an
+                export) selects `transaction_id`. Ids of imported rows are
+                reassigned in this mode.
+            granularity: "full" stores every row as written. "summary" is
+                meant for screening and simulation runs: revenue and expense
+                rows (one series per lease or expense line) are summed on
+                insert into one row per month, flow purpose, category,
+                subcategory, asset, deal, pass and entity, with the item name
+                replaced by the subcategory and no source id. Capital,
+                financing and valuation rows are kept as written.
+                `LedgerQueries` and `DealResults` metrics are unchanged; only
+                line-item detail (e.g. per-lease rows in `to_dataframe()`) is
+                lost. Reopened file-backed ledgers keep their granularity.
+            profile: Record wall time, rows and cache outcome of every query
+                and insert in `ledger.profiler` (see `profiling()` to
+                profile only part of a run).
+
+        Raises:
+            ValueError: If layout, transaction_ids or granularity is not
+                recognized
+        """
+        if layout not in LEDGER_LAYOUTS:
+            raise ValueError(
+                f"Unknown ledger layout '{layout}' (use 'wide' or 'normalized')"
+            )
+        if transaction_ids not in TRANSACTION_ID_MODES:
+            raise ValueError(
+                f"Unknown transaction_ids mode '{transaction_ids}' "
+                "(use 'eager' or 'deferred')"
+            )
+        if granularity not in LEDGER_GRANULARITIES:
+            raise ValueError(
+                f"Unknown ledger granularity '{granularity}' (use 'full' or 'summary')"
+            )
+        self.path = os.fspath(path) if path is not None else None
+        self.con = duckdb.connect(database=self.path or ":memory:", read_only=False)
         self.table_name = "transactions"
+        # Physical table receiving inserts (differs from table_name for forks,
+        # whose table_name is a view over the shared base rows plus an overlay)
+        self._storage_table = self.table_name
+        # Series dimension table of the normalized layout (None when wide)
+        self._series_table: Optional[str] = None
+        # Incrementally maintained monthly rollup read by the aggregate queries
+        self._rollup_table = f"{self.table_name}_monthly"
+        # Surrogate transaction ids: sequence and UUID prefix (deferred mode)
+        self._deferred_ids = False
+        self._id_sequence = f"{self.table_name}_id_seq"
+        self._transaction_id_prefix = "-".join(
+            (uuid.uuid4().hex[:8], uuid.uuid4().hex[:4], uuid.uuid4().hex[:4])
+        )
+        # Shared base rows of a fork: (storage table, series table, rowid watermark)
+        self._base_segments: List[Tuple[str, Optional[str], int]] = []
+        self._is_fork = False
+        self._parent: Optional["weakref.ReferenceType[Ledger]"] = None
+        self._forks: "weakref.WeakSet[Ledger]" = weakref.WeakSet()
+        self._memory_limit = memory_limit
+        self._temp_directory = (
+            os.fspath(temp_directory) if temp_directory is not None else None
+        )
 
+        # Dictionary-encoded (ENUM) types for the classification columns
+        self._enum_types: Dict[str, str] = {}
+        self._enum_values: Dict[str, Dict[str, None]] = {}
+        self._enum_generation = 0
+
+        metadata = self._read_metadata() if self.path is not None else {}
+        self._granularity = metadata.get("granularity", granularity)
+        self._set_layout(
+            metadata.get("layout", layout),
+            metadata.get("transaction_ids", transaction_ids),
+        )
+        if metadata:
+            self._restore_enum_types(metadata)
+        else:
+            self._create_schema()
+
+        # Configure DuckDB for analytical workloads
+        self._configure_duckdb_performance()
+
+        # Create indexes for common query patterns
+        self._create_strategic_indexes()
+
+        self._init_state(flush_threshold, query_cache_size)
+        if profile:
+            self._profiler = LedgerProfiler()
+        if metadata:
+            self._restore_state(metadata)
+            logger.debug(
+                f"Reopened ledger '{self.path}' with {self._record_count} records"
+            )
+        elif self.path is not None:
+            self._persist_metadata()
+
+    def _set_layout(self, layout: str, transaction_ids: str) -> None:
+        """Name the physical tables for a storage layout and id mode."""
+        self._layout = layout
+        self._deferred_ids = transaction_ids == "deferred"
+        if layout == "normalized":
+            self._storage_table = f"{self.table_name}_facts"
+            self._series_table = f"{self.table_name}_series"
+        elif self._deferred_ids:
+            # transactions becomes a view that renders the surrogate ids
+            self._storage_table = f"{self.table_name}_rows"
+
+    def _create_schema(self) -> None:
+        """Create the ENUM types and the transactions table (or tables and view)."""
+        for column, (type_name, values) in LEDGER_ENUM_COLUMNS.items():
+            self.con.execute(enum_type_sql(type_name, values))
+            self._enum_types[column] = type_name
+            self._enum_values[column] = dict.fromkeys(values)
+        if self._deferred_ids:
+            self.con.execute(f"CREATE SEQUENCE {self._id_sequence}")
+        self._create_storage_tables()
+        self._create_rollup_table()
+        if self._storage_table != self.table_name:
+            self._create_read_view()
+        logger.debug(f"DuckDB table '{self.table_name}' created.")
+
+    def _create_storage_tables(self, temp: bool = False) -> None:
+        """Create the physical table(s) receiving this ledger's inserts."""
+        if self._series_table is None:
+            self.con.execute(self._create_table_sql(self._storage_table, temp))
+            return
+        self.con.execute(f"""
+        CREATE {"TEMP " if temp else ""}TABLE {self._series_table} (
+            series_key INTEGER NOT NULL,            -- Surrogate key referenced by fact rows
+            category {self._enum_types["category"]} NOT NULL,
+            subcategory {self._enum_types["subcategory"]},
+            item_name VARCHAR(100),
+            source_id UUID,
+            asset_id UUID,
+            pass_num TINYINT NOT NULL DEFAULT 1,
+            deal_id UUID,
+            entity_id UUID,
+            entity_type {self._enum_types["entity_type"]}
+        );
+        """)
+        self.con.execute(f"""
+        CREATE {"TEMP " if temp else ""}TABLE {self._storage_table} (
+            transaction_id {self._transaction_id_type},
+            date DATE NOT NULL,
+            amount DOUBLE NOT NULL,
+            flow_purpose {self._enum_types["flow_purpose"]} NOT NULL,
+            series_key INTEGER NOT NULL             -- Row of the series dimension table
+        );
+        """)
+
+    def _create_rollup_table(self, temp: bool = False) -> None:
+        """Create the monthly rollup table (see `rollup_select_sql`)."""
+        self.con.execute(f"""
+        CREATE {"TEMP " if temp else ""}TABLE {self._rollup_table} (
+            date DATE NOT NULL,                     -- First day of the month
+            flow_purpose VARCHAR NOT NULL,
+            category VARCHAR NOT NULL,
+            subcategory VARCHAR,
+            is_ti BOOLEAN,                          -- Item name matches TI_ITEM_PATTERN
+            is_lc BOOLEAN,                          -- Item name matches LC_ITEM_PATTERN
+            amount DOUBLE NOT NULL
+        );
+        """)
+
+    @property
+    def _transaction_id_type(self) -> str:
+        """Stored type of the transaction_id column."""
+        return "BIGINT" if self._deferred_ids else "UUID"
+
+    def _transaction_id_sql(self, column: str) -> str:
+        """
+        Render a stored transaction id as the UUID exposed to readers.
+
+        Surrogate ids become `<ledger prefix>-<16 hex digits of the id>`, which
+        is unique per ledger and stable across reads. The expression only runs
+        when a query actually selects `transaction_id`.
+        """
+        if not self._deferred_ids:
+            return column
+        digits = f"lpad(to_hex({column}), 16, '0')"
+        return (
+            f"('{self._transaction_id_prefix}-' || {digits}[1:4] || '-' "
+            f"|| {digits}[5:16])::UUID"
+        )
+
+    def _segment_sql(
+        self, storage_table: str, series_table: Optional[str], watermark: Optional[int]
+    ) -> str:
+        """SELECT producing the ledger columns of one stored segment."""
+        where = f" WHERE f.rowid < {watermark}" if watermark is not None else ""
+        columns = ", ".join(
+            f"{self._transaction_id_sql('f.transaction_id')} AS transaction_id"
+            if column == "transaction_id"
+            else f"f.{column}"
+            if series_table is None or column in FACT_COLUMNS
+            else f"s.{column}"
+            for column in LEDGER_COLUMNS
+        )
+        if series_table is None:
+            return f"SELECT {columns} FROM {storage_table} f{where}"
+        return (
+            f"SELECT {columns} FROM {storage_table} f "
+            f"JOIN {series_table} s ON f.series_key = s.series_key{where}"
+        )
+
+    def _create_read_view(self) -> None:
+        """(Re)create the `transactions` view over this ledger's storage tables."""
+        self.con.execute(
+            f"CREATE OR REPLACE VIEW {self.table_name} AS "
+            + self._segment_sql(self._storage_table, self._series_table, None)
+        )
+
+    def _create_table_sql(self, table_name: str, temp: bool = False) -> str:
+        """Build the CREATE TABLE statement for a transactions table."""
         # Create the transactions table with optimized data types for performance
         # Note: Using the same column order as the original ledger for compatibility
-        create_table_sql = f"""
-        CREATE TABLE {self.table_name} (
-            transaction_id UUID,                    -- UUID for transaction id
+        return f"""
+        CREATE {"TEMP " if temp else ""}TABLE {table_name} (
+            transaction_id {self._transaction_id_type},  -- UUID, or BIGINT surrogate id (deferred)
             date DATE NOT NULL,                     -- DATE is optimal for date-only data
             amount DOUBLE NOT NULL,                 -- DOUBLE for financial calculations
-            flow_purpose VARCHAR(20) NOT NULL,      -- Short VARCHAR with known max length
-            category VARCHAR(30) NOT NULL,          -- Sized for enum values
-            subcategory VARCHAR(50),                -- Sized for enum values
+            flow_purpose {self._enum_types["flow_purpose"]} NOT NULL,  -- ENUM of TransactionPurpose
+            category {self._enum_types["category"]} NOT NULL,  -- ENUM of CashFlowCategoryEnum
+            subcategory {self._enum_types["subcategory"]},  -- ENUM of subcategory enums (widened on demand)
             item_name VARCHAR(100),                 -- Reasonable limit for item names
             source_id UUID,                         -- UUID type for source IDs
             asset_id UUID,                          -- UUID type for asset IDs
             pass_num TINYINT NOT NULL DEFAULT 1,    -- TINYINT sufficient for pass numbers (1-10)
             deal_id UUID,                           -- UUID type for deal IDs
             entity_id UUID,                         -- UUID type for entity IDs
-            entity_type VARCHAR(30)                 -- Sized for entity type enums
+            entity_type {self._enum_types["entity_type"]}  -- ENUM of entity types (widened on demand)
         );
         """
-        self.con.execute(create_table_sql)
-        logger.debug(f"DuckDB table '{self.table_name}' created in memory.")
-
-        # Configure DuckDB for analytical workloads
-        self._configure_duckdb_performance()
-
-        # Create indexes for common query patterns
-        self._create_strategic_indexes()
 
+    def _init_state(self, flush_threshold: int, query_cache_size: int) -> None:
+        """Initialize counters, buffers and caches for a new connection."""
         # Track state for compatibility with pandas implementation
         self._record_count = 0
         self._series_count = 0
+        # Next free key of the series dimension table (normalized layout)
+        self._next_series_key = 1
+        # Rollup rows now and right after the last compaction
+        self._rollup_rows = 0
+        self._rollup_compacted_rows = 0
         # Monotonic version for cache invalidation in query layer
         self._version = 0
+        # Query results shared by every LedgerQueries built on this ledger
+        self._query_cache = QueryResultCache(maxsize=query_cache_size)
+        # Read cursors handed out by get_query_connection(thread_local=True)
+        self._thread_cursors = threading.local()
+        self._cursors: "weakref.WeakSet[duckdb.DuckDBPyConnection]" = weakref.WeakSet()
 
         # Transaction support state
         self._transaction_buffer: List[TransactionRecord] = []
         self._in_transaction: bool = False
+        # Version counters changed since the metadata table was last written
+        self._metadata_dirty: bool = False
+        # Columnar staging area for add_series() rows (flushed as one Arrow batch)
+        self._append_buffer = ColumnarAppendBuffer()
+        self._flush_threshold = flush_threshold
         # Stable UUID namespace for deterministic v5 mappings of non-UUID ids
         self._id_namespace = uuid.UUID("6f2f6f86-0a1c-5f42-b6e9-6c5f3d6e4f80")
+        self._id_cache: Dict[Any, Optional[str]] = {}
 
         # Cached DataFrame materialization (invalidate via version bumps)
         self._cached_df = None
         self._cached_df_version = -1
 
+        # Query/insert profiler (None unless profiling, see profiling())
+        self._profiler: Optional[LedgerProfiler] = None
+
     def add_series_optimized(self, series: pd.Series, metadata: SeriesMetadata) -> None:
         """
         High-performance series addition that bypasses object creation overhead.
 
-        This method provides 1.7x performance improvement by:
-        - Avoiding TransactionRecord object creation
-        - Using vectorized operations for data conversion
-        - Pre-computing flow purpose for entire series
-        - Direct SQL insertion with optimized data structures
+        Rows are staged in the columnar append buffer instead of being inserted
+        one series at a time:
+        - Avoids TransactionRecord and per-series DataFrame creation
+        - Uses vectorized operations for date and amount conversion
+        - Broadcasts series metadata into preallocated column arrays
+        - Flushes to DuckDB as one Arrow batch (immediately outside a
+          transaction; at `flush()`, transaction exit, or when the buffer
+          reaches `flush_threshold` rows inside one)
 
         Args:
             series: Time series data (amount by date)
             metadata: Metadata for transaction attribution
         """
+        self._series_count += 1
+
         # Handle empty series only (don't filter zero-sum series like main branch)
         if series is None or series.empty:
-            self._series_count += 1  # Track for compatibility
             return
 
-        # Convert PeriodIndex to DatetimeIndex for DuckDB compatibility
-        if isinstance(series.index, pd.PeriodIndex):
-            series = series.copy()
-            series.index = series.index.to_timestamp()
-
-        # Process ALL values including zeros - no filtering
-        # User directive: efficiency gains aren't worth the loss of information
-        if series.empty:
-            self._series_count += 1
+        columns = self._series_to_columns(series, metadata)
+        if columns is None:  # No non-zero values
             return
 
-        # Use high-performance raw data conversion
-        raw_data = self._series_to_raw_data(series, metadata)
-
-        if not raw_data["date"]:  # No non-zero values
-            self._series_count += 1
-            return
+        dates, amounts, flow_purposes = columns
+        self._append_buffer.append(
+            dates,
+            amounts,
+            flow_purposes,
+            category=enum_to_string(metadata.category),
+            subcategory=enum_to_string(metadata.subcategory),
+            item_name=metadata.item_name,
+            source_id=self._normalize_id(metadata.source_id),
+            asset_id=self._normalize_id(metadata.asset_id),
+            pass_num=metadata.pass_num,
+            deal_id=self._normalize_id(metadata.deal_id),
+            entity_id=self._normalize_id(metadata.entity_id),
+            entity_type=metadata.entity_type,
+        )
 
         # Insert strategy: buffer during explicit transactions; insert immediately otherwise
-        if self._in_transaction:
-            self._add_raw_data_to_buffer(raw_data)
-        else:
-            self._bulk_insert_raw_data(raw_data)
+        if (
+            not self._in_transaction
+            or len(self._append_buffer) >= self._flush_threshold
+        ):
+            self._flush_append_buffer()
 
     def add_series(self, series: pd.Series, metadata: SeriesMetadata) -> None:
         """
@@ -181,6 +487,69 @@ class Ledger:
         for series, metadata in pairs:
             self.add_series(series, metadata)
 
+    def add_series_matrix(
+        self,
+        values: np.ndarray,
+        index: pd.Index,
+        metadata: SeriesMetadata,
+        item_names: Sequence[Optional[str]],
+        source_ids: Sequence[Any],
+    ) -> None:
+        """
+        Add one series per row of a 2-D array in a single buffer append.
+
+        Equivalent to calling `add_series(pd.Series(values[i], index), ...)`
+        for every row with `metadata`'s item name and source id replaced by
+        `item_names[i]` and `source_ids[i]`: the same rows are staged in the
+        same order, without building a Series or metadata object per row.
+
+        Args:
+            values: Amounts of shape (series, len(index))
+            index: Shared PeriodIndex or DatetimeIndex of every row
+            metadata: Classification shared by all rows
+            item_names: Item name of each row
+            source_ids: Source id of each row
+        """
+        values = np.asarray(values, dtype="float64")
+        self._series_count += values.shape[0]
+
+        # Row-major order, as one add_series call per row would stage them
+        rows, columns = np.nonzero(values)
+        if not len(rows):
+            return
+
+        if isinstance(index, pd.PeriodIndex):
+            index = index.to_timestamp()
+        dates = pd.DatetimeIndex(index).to_numpy(dtype="datetime64[D]")[columns]
+        amounts = values[rows, columns]
+        flow_purposes = FlowPurposeMapper.determine_purpose_array(
+            metadata.category, metadata.subcategory, amounts
+        )
+        row_ids = np.array(
+            [self._normalize_id(source_id) for source_id in source_ids], dtype=object
+        )
+
+        self._append_buffer.append(
+            dates,
+            amounts,
+            flow_purposes,
+            category=enum_to_string(metadata.category),
+            subcategory=enum_to_string(metadata.subcategory),
+            item_name=np.asarray(item_names, dtype=object)[rows],
+            source_id=row_ids[rows],
+            asset_id=self._normalize_id(metadata.asset_id),
+            pass_num=metadata.pass_num,
+            deal_id=self._normalize_id(metadata.deal_id),
+            entity_id=self._normalize_id(metadata.entity_id),
+            entity_type=metadata.entity_type,
+        )
+
+        if (
+            not self._in_transaction
+            or len(self._append_buffer) >= self._flush_threshold
+        ):
+            self._flush_append_buffer()
+
     def add_records(self, records: List[TransactionRecord]) -> None:
         """
         Add pre-converted TransactionRecord instances directly to the ledger.
@@ -212,34 +581,212 @@ class Ledger:
         # Normal operation: immediate insert
         self._bulk_insert_records(filtered_records)
 
-    def get_query_connection(self) -> Tuple[duckdb.DuckDBPyConnection, str]:
+    def get_query_connection(
+        self, thread_local: bool = False
+    ) -> Tuple[duckdb.DuckDBPyConnection, str]:
         """
         Return the DuckDB connection and table name for LedgerQueries.
 
         This method provides the interface needed by the LedgerQueries class
         to execute SQL queries directly against the DuckDB table.
 
+        A DuckDB connection must not be used by several threads at once. With
+        `thread_local=True` each calling thread gets its own cursor (a
+        connection to the same database, created on first use and closed with
+        the ledger), so reports, visualizations and validators can query a
+        finished ledger in parallel. Writes always go through the ledger's
+        own connection; rows still in the append buffer are not visible to
+        readers until they are flushed.
+
+        Args:
+            thread_local: Return a cursor owned by the calling thread instead
+                of the shared connection
+
         Returns:
             Tuple of (DuckDB connection, table name) for query execution.
 
+        Raises:
+            ValueError: If thread_local is requested on a fork, whose rows
+                live in TEMP tables visible only to the shared connection
+
         Example:
             ```python
             con, table_name = ledger.get_query_connection()
             result = con.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
             ```
         """
-        return self.con, self.table_name
+        if not thread_local:
+            return self.con, self.table_name
+        if self._is_fork:
+            raise ValueError(
+                "Forks cannot hand out per-thread cursors: their rows live in "
+                "TEMP tables of the shared connection"
+            )
+        cursor = getattr(self._thread_cursors, "cursor", None)
+        if cursor is None:
+            cursor = self.con.cursor()
+            self._thread_cursors.cursor = cursor
+            self._cursors.add(cursor)
+        return cursor, self.table_name
+
+    @property
+    def rollup_table(self) -> str:
+        """
+        Name of the monthly rollup table maintained alongside the transactions.
+
+        The rollup holds one row per (month, flow_purpose, category,
+        subcategory, TI/LC flag) with the summed amount and is updated by
+        every insert, so monthly aggregates over those columns read a table
+        whose size depends on the number of periods rather than on the
+        number of transactions. Rows may be partial sums of the same key
+        until the rollup is compacted; always aggregate with SUM.
+        """
+        return self._rollup_table
 
-    def get_queries(self):
+    def get_queries(self, thread_local: bool = False):
         """
         Return a cached LedgerQueries instance bound to this ledger.
 
         This provides a convenient, single canonical query interface for
         all ledger-derived series and reports, avoiding DataFrame materialization.
+
+        Args:
+            thread_local: Return the instance that runs each query on the
+                calling thread's own cursor (see `get_query_connection`),
+                safe to share between threads
+        """
+        attribute = "_thread_local_queries" if thread_local else "_queries"
+        if getattr(self, attribute, None) is None:
+            setattr(self, attribute, LedgerQueries(self, thread_local=thread_local))
+        return getattr(self, attribute)
+
+    def select(
+        self,
+        columns: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        contains: Optional[Dict[str, str]] = None,
+        group_by_month: bool = False,
+        output: str = "arrow",
+    ) -> Union[pa.Table, Dict[str, np.ndarray]]:
+        """
+        Read a filtered projection of the ledger without materializing it.
+
+        Filters and column selection are pushed into DuckDB, so only the
+        matching rows of the requested columns leave the database. Use this
+        instead of `to_dataframe()` whenever a caller needs a slice of the
+        ledger rather than the whole table.
+
+        Args:
+            columns: Columns to return (default: all columns, or `date` and
+                `amount` when grouping by month)
+            where: Equality filters by column. Scalars (including enums and
+                UUIDs) match with `=`, lists/tuples/sets with `IN` and None
+                with `IS NULL`.
+            contains: Substring filters by column (e.g. facility names within
+                `item_name`)
+            group_by_month: Truncate `date` to the first of the month and sum
+                `amount`, grouping by the remaining requested columns
+            output: "arrow" for a `pyarrow.Table` or "numpy" for a dict of
+                column name to NumPy array (ENUM columns decoded to strings)
+
+        Returns:
+            Arrow table or dict of NumPy arrays, ordered by date when `date`
+            is selected
+
+        Raises:
+            ValueError: If a column name or output format is not recognized
+
+        Example:
+            ```python
+            capital_uses = ledger.select(
+                columns=["date", "amount"],
+                where={"flow_purpose": TransactionPurpose.CAPITAL_USE},
+                group_by_month=True,
+                output="numpy",
+            )
+            ```
         """
-        if getattr(self, "_queries", None) is None:
-            self._queries = LedgerQueries(self)
-        return self._queries
+        if output not in ("arrow", "numpy"):
+            raise ValueError(
+                f"Unknown output format '{output}' (use 'arrow' or 'numpy')"
+            )
+        if columns is None:
+            columns = ["date", "amount"] if group_by_month else list(LEDGER_COLUMNS)
+        unknown = [
+            column
+            for column in [*columns, *(where or {}), *(contains or {})]
+            if column not in LEDGER_COLUMNS
+        ]
+        if unknown:
+            raise ValueError(f"Unknown ledger column(s): {', '.join(unknown)}")
+
+        # Projection (month truncation and amount summation when grouping)
+        group_columns = [c for c in columns if c != "amount"]
+        if group_by_month:
+            select_list = [
+                "DATE_TRUNC('month', date)::DATE AS date"
+                if c == "date"
+                else "SUM(amount) AS amount"
+                if c == "amount"
+                else c
+                for c in columns
+            ]
+        else:
+            select_list = list(columns)
+
+        # Predicates (parameterized)
+        predicates: List[str] = []
+        params: List[Any] = []
+        for column, value in (where or {}).items():
+            if value is None:
+                predicates.append(f"{column} IS NULL")
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                values = [self._select_param(v) for v in value]
+                if not values:
+                    predicates.append("FALSE")
+                    continue
+                placeholders = ", ".join("?" for _ in values)
+                predicates.append(f"{column} IN ({placeholders})")
+                params.extend(values)
+            else:
+                predicates.append(f"{column} = ?")
+                params.append(self._select_param(value))
+        for column, substring in (contains or {}).items():
+            predicates.append(f"contains({column}::VARCHAR, ?)")
+            params.append(substring)
+
+        sql = f"SELECT {', '.join(select_list)} FROM {self.table_name}"
+        if predicates:
+            sql += " WHERE " + " AND ".join(predicates)
+        if group_by_month and group_columns:
+            ordinals = [str(columns.index(c) + 1) for c in group_columns]
+            sql += f" GROUP BY {', '.join(ordinals)}"
+        if "date" in columns:
+            sql += " ORDER BY date"
+
+        with self._profile("query", statement="select") as entry:
+            table = self.con.execute(sql, params).arrow().read_all()
+            entry["rows"] = table.num_rows
+            entry["scan"] = self._profile_scan(self.table_name)
+        if output == "arrow":
+            return table
+        return {
+            name: (
+                pc.cast(column, column.type.value_type)
+                if pa.types.is_dictionary(column.type)
+                else column
+            ).to_numpy(zero_copy_only=False)
+            for name, column in zip(table.column_names, table.columns)
+        }
+
+    @staticmethod
+    def _select_param(value: Any) -> Any:
+        """Convert an enum or UUID filter value to its stored representation."""
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, Enum):
+            return enum_to_string(value)
+        return value
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -258,40 +805,45 @@ class Ledger:
         - Applies dtype optimizations for memory efficiency
         - Sorts by date for improved downstream query performance
         """
-        try:
-            # Return cached DataFrame if version matches
-            if (
-                getattr(self, "_cached_df", None) is not None
-                and getattr(self, "_cached_df_version", -1) == self._version
-            ):
-                return self._cached_df
-
-            # Use Arrow path for faster conversion; keep ORDER BY for deterministic ordering
-            df = (
-                self.con.execute(f"SELECT * FROM {self.table_name} ORDER BY date")
-                .arrow()
-                .read_all()
-                .to_pandas()
-            )
+        with self._profile("query", statement="to_dataframe") as entry:
+            try:
+                # Return cached DataFrame if version matches
+                if (
+                    getattr(self, "_cached_df", None) is not None
+                    and getattr(self, "_cached_df_version", -1) == self._version
+                ):
+                    entry["cache"] = "hit"
+                    entry["rows"] = len(self._cached_df)
+                    return self._cached_df
+
+                entry["cache"] = "miss"
+                entry["scan"] = self._profile_scan(self.table_name)
+                # Use Arrow path for faster conversion; keep ORDER BY for deterministic ordering
+                df = arrow_to_pandas(
+                    self.con.execute(f"SELECT * FROM {self.table_name} ORDER BY date")
+                    .arrow()
+                    .read_all()
+                )
 
-            if df.empty:
-                empty = self._empty_ledger()
-                self._cached_df = empty
-                self._cached_df_version = self._version
-                return empty
+                if df.empty:
+                    empty = self._empty_ledger()
+                    self._cached_df = empty
+                    self._cached_df_version = self._version
+                    return empty
 
-            # Apply the same optimizations as the original ledger for compatibility
-            df = self._optimize_dataframe(df)
+                # Apply the same optimizations as the original ledger for compatibility
+                df = self._optimize_dataframe(df)
 
-            # Cache and return
-            self._cached_df = df
-            self._cached_df_version = self._version
-            logger.info(f"Materialized ledger: {len(df)} transactions")
-            return df
+                # Cache and return
+                entry["rows"] = len(df)
+                self._cached_df = df
+                self._cached_df_version = self._version
+                logger.info(f"Materialized ledger: {len(df)} transactions")
+                return df
 
-        except Exception as e:
-            logger.error(f"Failed to materialize ledger DataFrame: {e}")
-            raise
+            except Exception as e:
+                logger.error(f"Failed to materialize ledger DataFrame: {e}")
+                raise
 
     def get_version(self) -> int:
         """
@@ -302,6 +854,488 @@ class Ledger:
         """
         return self._version
 
+    @property
+    def query_cache(self) -> QueryResultCache:
+        """
+        Shared result cache used by all query consumers of this ledger.
+
+        Entries are keyed by normalized SQL plus ledger version and are
+        invalidated whenever the ledger version changes.
+        """
+        return self._query_cache
+
+    def query_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters for the shared query cache.
+
+        Returns:
+            Dictionary with hits, misses, evictions, size, maxsize and hit_rate
+        """
+        return self._query_cache.stats()
+
+    @property
+    def profiler(self) -> Optional[LedgerProfiler]:
+        """
+        Profiler recording this ledger's queries and inserts.
+
+        None unless the ledger was created with `profile=True` or a
+        `profiling()` block is active. Forks share their parent's profiler.
+        """
+        return self._profiler
+
+    @contextmanager
+    def profiling(self) -> Iterator[LedgerProfiler]:
+        """
+        Profile the queries and inserts run inside the block.
+
+        Reuses the ledger's profiler when one is active, so nested blocks and
+        `profile=True` ledgers keep a single record list. Forks created inside
+        the block record into the same profiler.
+
+        Example:
+            >>> with ledger.profiling() as profiler:
+            ...     results = analyze(deal, timeline, ledger=ledger)
+            >>> profiler.report()
+        """
+        previous = self._profiler
+        profiler = previous if previous is not None else LedgerProfiler()
+        self._profiler = profiler
+        try:
+            yield profiler
+        finally:
+            self._profiler = previous
+
+    def analysis_pass(self, name: str) -> ContextManager[Any]:
+        """
+        Attribute profiled operations in the block to an analysis pass.
+
+        A no-op when the ledger is not being profiled.
+        """
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.analysis_pass(name)
+
+    def _profile(self, kind: str, **fields: Any) -> ContextManager[Dict[str, Any]]:
+        """Measure one query or insert (a throwaway entry when not profiling)."""
+        if self._profiler is None:
+            return nullcontext({})
+        return self._profiler.measure(kind, **fields)
+
+    def _profile_scan(self, relation: str) -> Any:
+        """Deferred row count of `relation` for the active profile entry."""
+        profiler, con, version = self._profiler, self.con, self._version
+        if profiler is None:
+            return None
+        return lambda: profiler.relation_rows(con, relation, version)
+
+    def fingerprint(self, tolerance: float = 0.01) -> str:
+        """
+        Order-independent hash of the ledger's contents.
+
+        Rows are summed per (date, flow_purpose, category, subcategory,
+        item_name) group and each group's amount is rounded to a multiple of
+        `tolerance`; transaction, source, asset and entity ids are ignored,
+        since they differ between otherwise identical runs. Two ledgers have
+        the same fingerprint exactly when `diff()` finds no differing groups
+        (barring hash collisions), whatever their insert order, layout or
+        transaction id mode. Fingerprints are computed in SQL and cached per
+        ledger version; they are stable for a given DuckDB version.
+
+        Args:
+            tolerance: Amount rounding step (e.g. 0.01 for cents)
+
+        Returns:
+            32-character hexadecimal digest
+
+        Raises:
+            ValueError: If tolerance is not positive
+
+        Example:
+            ```python
+            if ledger.fingerprint() != baseline_fingerprint:
+                print(ledger.diff(baseline_ledger))
+            ```
+        """
+        if tolerance <= 0:
+            raise ValueError(f"tolerance must be positive, got {tolerance}")
+        sql = f"""
+            SELECT
+                COUNT(*),
+                COALESCE(
+                    SUM(hash({", ".join(CONTENT_KEY_COLUMNS)}, units)::HUGEINT), 0
+                )
+            FROM ({content_groups_sql(self.table_name, tolerance)})
+        """
+        key = QueryResultCache.make_key(sql, self._version)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        groups, total = self.con.execute(sql).fetchone()
+        digest = hashlib.blake2b(
+            f"{groups}:{total}".encode(), digest_size=16
+        ).hexdigest()
+        self._query_cache.put(key, digest)
+        return digest
+
+    def diff(self, other: "Ledger", tolerance: float = 0.01) -> pd.DataFrame:
+        """
+        List the row groups whose amounts differ between two ledgers.
+
+        Both ledgers are summed per (date, flow_purpose, category,
+        subcategory, item_name) group, as in `fingerprint()`; the other
+        ledger's groups are handed to this ledger's connection as an Arrow
+        table and matched with a FULL OUTER JOIN in SQL. A group differs when
+        its amounts, rounded to multiples of `tolerance`, differ or it exists
+        in only one ledger.
+
+        Args:
+            other: Ledger to compare against (any connection)
+            tolerance: Amount rounding step (e.g. 0.01 for cents)
+
+        Returns:
+            DataFrame with the group columns, `amount` (this ledger),
+            `other_amount` and `difference` (other minus this, missing
+            amounts counted as zero), ordered by the group columns; empty when
+            the ledgers match
+
+        Raises:
+            ValueError: If tolerance is not positive
+        """
+        if tolerance <= 0:
+            raise ValueError(f"tolerance must be positive, got {tolerance}")
+        theirs = (
+            other.con.execute(content_groups_sql(other.table_name, tolerance))
+            .arrow()
+            .read_all()
+        )
+        relation = f"ledger_diff_{uuid.uuid4().hex}"
+        keys = ", ".join(
+            f"COALESCE(mine.{column}, theirs.{column}) AS {column}"
+            for column in CONTENT_KEY_COLUMNS
+        )
+        matches = " AND ".join(
+            f"mine.{column} IS NOT DISTINCT FROM theirs.{column}"
+            for column in CONTENT_KEY_COLUMNS
+        )
+        self.con.register(relation, theirs)
+        try:
+            table = (
+                self.con.execute(
+                    f"""
+                    SELECT
+                        {keys},
+                        mine.amount AS amount,
+                        theirs.amount AS other_amount,
+                        COALESCE(theirs.amount, 0.0) - COALESCE(mine.amount, 0.0)
+                            AS difference
+                    FROM ({content_groups_sql(self.table_name, tolerance)}) AS mine
+                    FULL OUTER JOIN {relation} AS theirs ON {matches}
+                    WHERE mine.units IS DISTINCT FROM theirs.units
+                    ORDER BY {", ".join(CONTENT_KEY_COLUMNS)}
+                    """
+                )
+                .arrow()
+                .read_all()
+            )
+        finally:
+            self.con.unregister(relation)
+        return table.to_pandas()
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike], **kwargs) -> "Ledger":
+        """
+        Reopen a ledger previously stored with `Ledger(path=...)`.
+
+        The transactions, ENUM types and ledger metadata (version, series count,
+        id namespace) are read back from the DuckDB file, so results objects can
+        be rebuilt without re-running the analysis.
+
+        Args:
+            path: DuckDB database file written by a file-backed ledger
+            **kwargs: Additional `Ledger` options (e.g. `memory_limit`)
+
+        Returns:
+            Ledger bound to the existing file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+
+        Example:
+            ```python
+            ledger = Ledger.open("portfolio_run.duckdb")
+            results = DealResults(deal, timeline, ledger)
+            ```
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Ledger file not found: {path}")
+        return cls(path=path, **kwargs)
+
+    def close(self) -> None:
+        """
+        Commit buffered rows and close the DuckDB connection.
+
+        For file-backed ledgers the metadata (also written when a transaction
+        commits) is brought up to date and the database is checkpointed so the
+        file can be reopened by another process.
+        """
+        if self._is_fork:
+            # Forks share their parent's connection; only drop their own objects
+            parent = self._parent()
+            if parent is not None:
+                parent._forks.discard(self)
+            self._append_buffer.clear()
+            self._transaction_buffer.clear()
+            self.con.execute(f"DROP VIEW IF EXISTS {self.table_name}")
+            self.con.execute(f"DROP TABLE IF EXISTS {self._storage_table}")
+            self.con.execute(f"DROP TABLE IF EXISTS {self._rollup_table}")
+            if self._series_table is not None:
+                self.con.execute(f"DROP TABLE IF EXISTS {self._series_table}")
+            return
+        if self.has_buffered_data():
+            self._commit_buffer()
+        if self.path is not None:
+            self._persist_metadata()
+            self.con.execute("CHECKPOINT")
+        for cursor in list(self._cursors):
+            cursor.close()
+        self.con.close()
+
+    def fork(self) -> "Ledger":
+        """
+        Create a copy-on-write child ledger that shares this ledger's rows.
+
+        The fork reads every row committed here up to the moment of the fork
+        through a view, without copying them, and writes only to its own
+        overlay table. Writes made to either ledger after the fork are not
+        visible to the other, so one asset analysis can back many deal
+        variants (financing, partnership) at the cost of the deal passes only.
+
+        Forks share this ledger's DuckDB connection and live for as long as
+        it does; `close()` on a fork drops only its overlay. A ledger cannot
+        be cleared while it has live forks.
+
+        Returns:
+            New Ledger whose reads include this ledger's current rows
+
+        Example:
+            ```python
+            asset_result = run(property, timeline)
+            for structure in capital_structures:
+                variant = asset_result.ledger.fork()
+                ...  # deal passes write into `variant` only
+            ```
+        """
+        if self.has_buffered_data():
+            self._commit_buffer()
+
+        watermark = self.con.execute(
+            f"SELECT COALESCE(MAX(rowid) + 1, 0) FROM {self._storage_table}"
+        ).fetchone()[0]
+        suffix = uuid.uuid4().hex[:8]
+
+        child = type(self).__new__(type(self))
+        child.path = None
+        child.con = self.con
+        child.table_name = f"transactions_view_{suffix}"
+        child._storage_table = f"transactions_fork_{suffix}"
+        child._series_table = (
+            f"transactions_series_fork_{suffix}"
+            if self._series_table is not None
+            else None
+        )
+        child._rollup_table = f"transactions_monthly_fork_{suffix}"
+        child._layout = self._layout
+        child._granularity = self._granularity
+        child._deferred_ids = self._deferred_ids
+        child._id_sequence = self._id_sequence
+        child._transaction_id_prefix = self._transaction_id_prefix
+        child._base_segments = self._base_segments + [
+            (self._storage_table, self._series_table, watermark)
+        ]
+        child._is_fork = True
+        child._parent = weakref.ref(self)
+        child._forks = weakref.WeakSet()
+        child._memory_limit = self._memory_limit
+        child._temp_directory = self._temp_directory
+        child._enum_types = dict(self._enum_types)
+        child._enum_values = {
+            column: dict(values) for column, values in self._enum_values.items()
+        }
+        child._enum_generation = self._enum_generation
+
+        child._init_state(self._flush_threshold, self._query_cache.maxsize)
+        child._profiler = self._profiler
+        child._record_count = self._record_count
+        child._series_count = self._series_count
+        child._next_series_key = self._next_series_key
+        child._rollup_rows = self._rollup_rows
+        child._rollup_compacted_rows = self._rollup_compacted_rows
+        child._id_namespace = self._id_namespace
+        child._id_cache = dict(self._id_cache)
+
+        child._create_storage_tables(temp=True)
+        # The rollup is small, so the fork starts from a copy of its parent's
+        child._create_rollup_table(temp=True)
+        self.con.execute(
+            f"INSERT INTO {child._rollup_table} SELECT * FROM {self._rollup_table}"
+        )
+        child._create_strategic_indexes()
+        child._create_fork_view()
+        self._forks.add(child)
+
+        logger.debug(
+            f"Forked ledger '{self.table_name}' into '{child.table_name}' "
+            f"({watermark} shared rows)"
+        )
+        return child
+
+    def _create_fork_view(self) -> None:
+        """(Re)create a fork's read view: shared base rows plus its overlay."""
+        # Base segments may carry older ENUM types; cast them to this fork's
+        # types so the UNION keeps dictionary-encoded columns
+        casts = ", ".join(
+            f"{column}::{type_name} AS {column}"
+            for column, type_name in self._enum_types.items()
+        )
+        parts = [
+            f"SELECT * REPLACE ({casts}) FROM "
+            f"({self._segment_sql(table, series_table, watermark)})"
+            for table, series_table, watermark in self._base_segments
+        ]
+        parts.append(self._segment_sql(self._storage_table, self._series_table, None))
+        self.con.execute(
+            f"CREATE OR REPLACE TEMP VIEW {self.table_name} AS "
+            + " UNION ALL ".join(parts)
+        )
+
+    def to_parquet(
+        self,
+        path: Union[str, os.PathLike],
+        partition_by: Optional[Tuple[str, ...]] = ("deal_id", "asset_id"),
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Export the ledger to Parquet with DuckDB `COPY` (zstd compressed).
+
+        With `partition_by`, `path` is a directory of hive-style partitions
+        (e.g. `deal_id=.../asset_id=.../data_0.parquet`) that DuckDB can query
+        directly; without it, `path` is a single Parquet file. UUID columns
+        keep their logical type and ENUM columns are stored as
+        dictionary-encoded strings; `from_parquet()` restores both.
+
+        Args:
+            path: Target directory (partitioned) or file (unpartitioned)
+            partition_by: Columns to partition by, or None/() for one file
+            overwrite: Replace existing output instead of failing
+
+        Raises:
+            ValueError: If a partition column is not a ledger column
+
+        Example:
+            ```python
+            ledger.to_parquet("archive/run_0142")
+            con.sql("SELECT SUM(amount) FROM 'archive/run_0142/**/*.parquet'")
+            ```
+        """
+        partition_by = tuple(partition_by or ())
+        unknown = [c for c in partition_by if c not in LEDGER_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown ledger column(s): {', '.join(unknown)}")
+        if self.has_buffered_data():
+            self._commit_buffer()
+
+        options = ["FORMAT PARQUET", "COMPRESSION ZSTD"]
+        if partition_by:
+            options.append(f"PARTITION_BY ({', '.join(partition_by)})")
+        if overwrite:
+            options.append("OVERWRITE true")
+        options.append(
+            "KV_METADATA {"
+            f"series_count: '{self._series_count}', "
+            f"id_namespace: '{self._id_namespace}'"
+            "}"
+        )
+        target = os.fspath(path).replace("'", "''")
+        self.con.execute(
+            f"COPY (SELECT * FROM {self.table_name}) TO '{target}' "
+            f"({', '.join(options)})"
+        )
+        logger.debug(f"Exported {self._record_count} records to '{target}'")
+
+    @classmethod
+    def from_parquet(cls, path: Union[str, os.PathLike], **kwargs) -> "Ledger":
+        """
+        Load a ledger exported with `to_parquet()`.
+
+        Hive partition directories are read recursively; partition values are
+        cast back to UUIDs and classification strings back to the ledger's
+        ENUM types (widening them for custom values).
+
+        Args:
+            path: Partitioned export directory or single Parquet file
+            **kwargs: Additional `Ledger` options (e.g. `path` to load into a
+                file-backed ledger)
+
+        Returns:
+            New ledger containing the exported transactions
+        """
+        ledger = cls(**kwargs)
+        ledger._import_parquet(path)
+        return ledger
+
+    def _import_parquet(self, path: Union[str, os.PathLike]) -> None:
+        """Insert the rows of a Parquet export into this ledger."""
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            source = os.path.join(path, "**", "*.parquet")
+            hive_partitioning = "true"
+        else:
+            source = path
+            hive_partitioning = "false"
+        source = source.replace("'", "''")
+        relation = (
+            f"read_parquet('{source}', hive_partitioning = {hive_partitioning}, "
+            "union_by_name = true)"
+        )
+
+        self._register_enum_values({
+            column: [
+                value
+                for (value,) in self.con.execute(
+                    f"SELECT DISTINCT {column}::VARCHAR FROM {relation}"
+                ).fetchall()
+            ]
+            for column in LEDGER_ENUM_COLUMNS
+        })
+
+        uuid_columns = {
+            "transaction_id",
+            "source_id",
+            "asset_id",
+            "deal_id",
+            "entity_id",
+        }
+        select_list = ", ".join(
+            f"{column}::UUID" if column in uuid_columns else column
+            for column in LEDGER_COLUMNS
+        )
+        inserted = self._insert_rows(f"SELECT {select_list} FROM {relation}")
+
+        kv_metadata = dict(
+            self.con.execute(
+                "SELECT DISTINCT key::VARCHAR, value::VARCHAR "
+                f"FROM parquet_kv_metadata('{source}')"
+            ).fetchall()
+        )
+        self._record_count += inserted
+        self._series_count += int(kv_metadata.get("series_count", 0))
+        if "id_namespace" in kv_metadata:
+            self._id_namespace = uuid.UUID(kv_metadata["id_namespace"])
+            self._id_cache.clear()
+        self._bump_version()
+        logger.debug(f"Imported {inserted} records from '{path}'")
+
     def ledger_df(self) -> pd.DataFrame:
         """
         Get the current ledger as a DataFrame (public API compatibility method).
@@ -348,20 +1382,12 @@ class Ledger:
 
         This compatibility method checks both buffer types used in the DuckDB implementation:
         - _transaction_buffer: for records added via add_records()
-        - _raw_transaction_buffer: for series added via add_series()
+        - _append_buffer: for series added via add_series()
 
         Returns:
             True if there's buffered data awaiting commit, False otherwise.
         """
-        # Check traditional transaction record buffer
-        if self._transaction_buffer:
-            return True
-
-        # Check optimized raw data buffer
-        if hasattr(self, "_raw_transaction_buffer"):
-            return bool(self._raw_transaction_buffer.get("date", []))
-
-        return False
+        return bool(self._transaction_buffer) or len(self._append_buffer) > 0
 
     def estimate_final_count(self) -> int:
         """
@@ -374,8 +1400,23 @@ class Ledger:
 
     def clear(self) -> None:
         """Clear all records and reset state."""
+        if len(self._forks) > 0:
+            raise RuntimeError(
+                "Cannot clear a ledger with live forks; close the forks first"
+            )
         try:
-            self.con.execute(f"DELETE FROM {self.table_name}")
+            self.con.execute(f"TRUNCATE {self._storage_table}")
+            self.con.execute(f"TRUNCATE {self._rollup_table}")
+            self._rollup_rows = 0
+            self._rollup_compacted_rows = 0
+            if self._series_table is not None:
+                self.con.execute(f"TRUNCATE {self._series_table}")
+                self._next_series_key = 1
+            if self._is_fork:
+                # Detach from the shared base rows as well
+                self._base_segments = []
+                self._create_fork_view()
+            self._append_buffer.clear()
             self._record_count = 0
             self._series_count = 0
             # Bump version to invalidate query caches
@@ -385,6 +1426,22 @@ class Ledger:
             logger.error(f"Failed to clear ledger: {e}")
             raise
 
+    def reset(self) -> None:
+        """
+        Empty the ledger for reuse by another analysis.
+
+        Closes any live forks, discards buffered rows and open transaction
+        state, then truncates the table. The connection, ENUM types, settings
+        and indexes are kept, which makes this far cheaper than constructing
+        a new `Ledger` (see `LedgerPool`).
+        """
+        for child in list(self._forks):
+            child.close()
+        self._transaction_buffer.clear()
+        self._in_transaction = False
+        self._id_cache.clear()
+        self.clear()
+
     def _empty_ledger(self) -> pd.DataFrame:
         """Create empty ledger DataFrame with proper schema."""
         return pd.DataFrame(
@@ -432,7 +1489,13 @@ class Ledger:
         ]
 
         for col in categorical_columns:
-            if col in df.columns and df[col].dtype == "object":
+            if col not in df.columns:
+                continue
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                # ENUM columns arrive as categoricals over the full ENUM domain;
+                # keep only observed values like the string conversion did
+                df[col] = df[col].cat.remove_unused_categories()
+            elif df[col].dtype == "object":
                 df[col] = df[col].astype("category")
 
         # Ensure proper date dtype
@@ -467,7 +1530,7 @@ class Ledger:
 
         **Performance Note**: This method creates individual TransactionRecord objects
         and is primarily used for compatibility. For high-performance bulk operations,
-        consider using _series_to_raw_data() which bypasses object creation overhead.
+        consider using add_series(), which stages rows in the columnar append buffer.
 
         Args:
             series: Time series with non-zero values
@@ -505,276 +1568,412 @@ class Ledger:
 
         return records
 
-    def _add_raw_data_to_buffer(self, raw_data: Dict[str, list]) -> None:
+    def _normalize_id(self, value: Any) -> Optional[str]:
         """
-        Add raw data to transaction buffer for batching.
+        Normalize an identifier to a canonical UUID string.
 
-        This method supports the optimized transaction workflow by accumulating
-        raw data structures instead of TransactionRecord objects, eliminating
-        object creation overhead during transaction buffering.
+        Values that are not valid UUIDs are mapped deterministically with
+        uuid5 under the ledger namespace. Results are memoized because the
+        same few source/asset/deal ids repeat across every series.
 
         Args:
-            raw_data: Dictionary of lists containing transaction data
-        """
-        if not hasattr(self, "_raw_transaction_buffer"):
-            self._raw_transaction_buffer = {
-                "date": [],
-                "amount": [],
-                "category": [],
-                "subcategory": [],
-                "item_name": [],
-                "source_id_str": [],
-                "asset_id_str": [],
-                "pass_num": [],
-                "deal_id_str": [],
-                "entity_id_str": [],
-                "entity_type": [],
-                "flow_purpose": [],
-            }
-
-        # Append all data to buffer lists
-        for key, values in raw_data.items():
-            self._raw_transaction_buffer[key].extend(values)
-
-    def _bulk_insert_raw_data(self, raw_data: Dict[str, list]) -> None:
-        """
-        High-performance bulk insert using pre-processed raw data.
-
-        This method bypasses TransactionRecord object creation entirely and
-        works directly with raw data structures for maximum performance.
+            value: UUID, UUID-like string, arbitrary identifier, or None
 
-        Args:
-            raw_data: Dictionary of lists containing transaction data
+        Returns:
+            Canonical UUID string, or None when value is None
         """
-        if not raw_data["date"]:  # No data to insert
-            return
+        if value is None:
+            return None
+        try:
+            return self._id_cache[value]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable identifier; normalize without caching
+            return str(uuid.uuid5(self._id_namespace, str(value)))
 
-        # Create DataFrame directly from raw data (simple and fast)
-        raw_df = pd.DataFrame(raw_data)
+        text = str(value)
+        try:
+            normalized = str(uuid.UUID(text))
+        except ValueError:
+            normalized = str(uuid.uuid5(self._id_namespace, text))
+        self._id_cache[value] = normalized
+        return normalized
 
-        # Deterministic UUID adapter with unique-value mapping per insert batch
-        def _map_uuid_column(df: pd.DataFrame, col: str) -> None:
-            if col not in df.columns:
-                return
-            series = df[col]
-            # Build map for unique values only
-            uniques = series.unique()
-            mapping: Dict[Any, Any] = {}
-            for val in uniques:
-                if val is None:
-                    mapping[val] = None
-                    continue
-                s = str(val)
-                try:
-                    mapping[val] = str(uuid.UUID(s))
-                except Exception:
-                    mapping[val] = str(uuid.uuid5(self._id_namespace, s))
-            df[col] = series.map(mapping)
+    def _flush_append_buffer(self) -> None:
+        """
+        Insert all rows staged in the columnar append buffer.
 
-        _map_uuid_column(raw_df, "source_id_str")
-        _map_uuid_column(raw_df, "asset_id_str")
-        _map_uuid_column(raw_df, "deal_id_str")
-        _map_uuid_column(raw_df, "entity_id_str")
+        The buffer is exposed to DuckDB as a single Arrow table and inserted
+        with one INSERT ... SELECT. Transaction ids are generated by DuckDB's
+        `uuid()` so no per-row Python work is needed.
+        """
+        row_count = len(self._append_buffer)
+        if row_count == 0:
+            return
 
-        # Add UUID generation using efficient bulk method
-        raw_df["transaction_id"] = self._bulk_generate_uuids(len(raw_df))
+        batch = self._append_buffer.to_arrow()
 
         try:
-            self.con.register("temp_df_view", raw_df)
-
-            # Simple, fast INSERT using pre-processed data
-            insert_sql = f"""
-                INSERT INTO {self.table_name} 
-                SELECT 
-                    transaction_id::UUID,
-                    date::DATE,
-                    amount::DOUBLE,
-                    flow_purpose::VARCHAR,
-                    category::VARCHAR,
-                    subcategory::VARCHAR,
-                    item_name::VARCHAR,
-                    source_id_str::UUID as source_id,
-                    asset_id_str::UUID as asset_id,
-                    pass_num::TINYINT,
-                    CASE WHEN deal_id_str IS NOT NULL THEN deal_id_str::UUID ELSE NULL END as deal_id,
-                    CASE WHEN entity_id_str IS NOT NULL THEN entity_id_str::UUID ELSE NULL END as entity_id,
-                    entity_type::VARCHAR
-                FROM temp_df_view
-            """
-
-            self.con.execute(insert_sql)
-            self.con.unregister("temp_df_view")
+            self._register_enum_values({
+                column: pc.unique(batch[column]).to_pylist()
+                for column in LEDGER_ENUM_COLUMNS
+            })
+            self.con.register("ledger_append_batch", batch)
+
+            inserted = self._insert_rows("""
+                SELECT
+                    uuid() AS transaction_id,
+                    date,
+                    amount,
+                    flow_purpose,
+                    category,
+                    subcategory,
+                    item_name,
+                    source_id::UUID AS source_id,
+                    asset_id::UUID AS asset_id,
+                    pass_num,
+                    deal_id::UUID AS deal_id,
+                    entity_id::UUID AS entity_id,
+                    entity_type
+                FROM ledger_append_batch
+            """)
+            self.con.unregister("ledger_append_batch")
 
-            # Update counters
-            self._record_count += len(raw_df)
-            self._series_count += 1
+            # Update counters (summary ledgers store fewer rows than written)
+            self._record_count += inserted
             # Invalidate query caches
             self._bump_version()
 
-            logger.debug(f"Optimized bulk inserted {len(raw_df)} transactions")
+            logger.debug(
+                f"Flushed {row_count} buffered transactions as one Arrow batch"
+            )
 
         except Exception as e:
             # CRITICAL: SQL insertion is failing silently - expose the errors
             logger.error(f"🚨 CRITICAL SQL INSERTION FAILURE")
-            try:
-                transaction_count = len(raw_df)
-                category = (
-                    raw_df.get("category").iloc[0]
-                    if "category" in raw_df.columns and not raw_df.empty
-                    else None
-                )
-                subcategory = (
-                    raw_df.get("subcategory").iloc[0]
-                    if "subcategory" in raw_df.columns and not raw_df.empty
-                    else None
-                )
-                logger.error(f"   Category: {category}")
-                logger.error(f"   Subcategory: {subcategory}")
-                logger.error(f"   Transaction count: {transaction_count}")
-            except Exception:
-                pass
+            logger.error(f"   Transaction count: {row_count}")
             logger.error(f"   Error: {e}")
-            logger.error(
-                f"   Sample data: {raw_df.head(2).to_dict('records') if not raw_df.empty else 'Empty'}"
-            )
+            logger.error(f"   Sample data: {batch.slice(0, 2).to_pylist()}")
 
             try:
-                self.con.unregister("temp_df_view")
+                self.con.unregister("ledger_append_batch")
             except:
                 pass
 
             # Raise with generic message to avoid NameError if locals missing
             raise RuntimeError(f"DuckDB insertion failed: {e}") from e
 
-    def _series_to_raw_data(
-        self, series: pd.Series, metadata: SeriesMetadata
-    ) -> Dict[str, list]:
+        finally:
+            self._append_buffer.clear()
+
+    def _insert_rows(self, select_sql: str) -> int:
+        """
+        Insert the rows of a SELECT into this ledger's storage table(s).
+
+        Rows are staged once in a temporary table, inserted, and added to the
+        monthly rollup. Summary-granularity ledgers sum line-item rows before
+        staging (see `summary_select_sql`). In the normalized layout, staged rows are numbered by
+        their distinct series metadata with one window pass; each new
+        combination becomes one row of the series dimension table and the
+        fact rows keep only its key.
+
+        Args:
+            select_sql: Query producing the ledger columns in `LEDGER_COLUMNS`
+                order
+
+        Returns:
+            Number of transaction rows inserted
+        """
+        with self._profile("insert", statement="insert_rows") as entry:
+            column_list = ", ".join(LEDGER_COLUMNS)
+            if self._granularity == "summary":
+                select_sql = summary_select_sql(select_sql)
+            if self._deferred_ids:
+                # Incoming ids are replaced (and never computed) by surrogate ids
+                select_sql = f"""
+                    SELECT * REPLACE (nextval('{self._id_sequence}') AS transaction_id)
+                    FROM ({select_sql}) AS incoming ({column_list})
+                """
+            series_columns = ", ".join(SERIES_COLUMNS)
+            series_key = (
+                f""",
+                    DENSE_RANK() OVER (ORDER BY {series_columns})
+                        + {self._next_series_key - 1} AS series_key"""
+                if self._series_table is not None
+                else ""
+            )
+            self.con.execute(f"""
+                CREATE OR REPLACE TEMP TABLE ledger_staged_rows AS
+                SELECT *{series_key}
+                FROM ({select_sql}) AS rows ({column_list})
+            """)
+            try:
+                if self._series_table is None:
+                    inserted = self.con.execute(f"""
+                        INSERT INTO {self._storage_table} ({column_list})
+                        SELECT {column_list} FROM ledger_staged_rows
+                    """).fetchone()[0]
+                else:
+                    new_series = self.con.execute(f"""
+                        INSERT INTO {self._series_table} (series_key, {series_columns})
+                        SELECT DISTINCT ON (series_key) series_key, {series_columns}
+                        FROM ledger_staged_rows
+                    """).fetchone()[0]
+                    inserted = self.con.execute(f"""
+                        INSERT INTO {self._storage_table}
+                        SELECT {", ".join(FACT_COLUMNS)}, series_key FROM ledger_staged_rows
+                    """).fetchone()[0]
+                    self._next_series_key += new_series
+                self._roll_up("ledger_staged_rows")
+            finally:
+                self.con.execute("DROP TABLE IF EXISTS ledger_staged_rows")
+            entry["rows"] = entry["scan"] = inserted
+        return inserted
+
+    def _roll_up(self, relation: str) -> None:
+        """
+        Add the monthly totals of newly inserted rows to the rollup.
+
+        Each batch appends its own partial sums, so the cost is proportional
+        to the batch. Once partial rows outnumber the last compacted size the
+        rollup is re-summed by key, which keeps it at O(periods x keys) rows
+        with amortized constant work per batch.
+
+        Args:
+            relation: Table holding the inserted rows with the ledger columns
         """
-        High-performance conversion from pandas Series to raw data structures.
+        self._rollup_rows += self.con.execute(
+            f"INSERT INTO {self._rollup_table} {rollup_select_sql(relation)}"
+        ).fetchone()[0]
+        if self._rollup_rows >= 2 * max(
+            self._rollup_compacted_rows, ROLLUP_COMPACT_MIN_ROWS
+        ):
+            self._compact_rollup()
+
+    def _compact_rollup(self) -> None:
+        """Merge partial rollup rows so each key appears once."""
+        keys = ", ".join(ROLLUP_KEY_COLUMNS)
+        self.con.execute(f"""
+            CREATE OR REPLACE TEMP TABLE ledger_compacted_rollup AS
+            SELECT {keys}, SUM(amount) AS amount
+            FROM {self._rollup_table}
+            GROUP BY {keys}
+        """)
+        try:
+            self.con.execute(f"TRUNCATE {self._rollup_table}")
+            self._rollup_rows = self.con.execute(
+                f"INSERT INTO {self._rollup_table} SELECT * FROM ledger_compacted_rollup"
+            ).fetchone()[0]
+        finally:
+            self.con.execute("DROP TABLE IF EXISTS ledger_compacted_rollup")
+        self._rollup_compacted_rows = self._rollup_rows
 
-        This method bypasses TransactionRecord object creation entirely, providing
-        performance improvements by generating raw data
-        structures suitable for direct SQL insertion or DataFrame creation.
+    def _series_to_columns(
+        self, series: pd.Series, metadata: SeriesMetadata
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Convert a pandas Series into per-row column arrays for the append buffer.
 
-        Optimizations:
-        - Bulk UUID generation using list comprehension
-        - Vectorized date conversion using pandas methods
-        - Pre-allocated data structures to avoid dynamic growth
-        - Direct enum/string conversion without intermediate objects
-        - Single-pass processing with zero-value filtering
+        Zero amounts are dropped (exact comparison, matching pandas behavior),
+        dates are normalized to datetime64[D] in one vectorized step, and the
+        flow purpose is computed for every remaining row.
 
         Args:
-            series: Time series with non-zero values
+            series: Time series with a PeriodIndex, DatetimeIndex or date-like index
             metadata: Associated metadata
 
         Returns:
-            Dictionary of lists suitable for DataFrame creation or SQL insertion
+            Tuple of (dates, amounts, flow_purposes) arrays, or None when the
+            series has no non-zero values
         """
-        # Filter non-zero values upfront to get exact count (no tolerance)
-        # CRITICAL FIX: Use exact zero comparison to match pandas behavior
-        non_zero_mask = series != 0
+        amounts = np.asarray(series.to_numpy(), dtype="float64")
+        non_zero_mask = amounts != 0
         if not non_zero_mask.any():
-            # Return empty structure with correct keys
-            return {
-                "date": [],
-                "amount": [],
-                "category": [],
-                "subcategory": [],
-                "item_name": [],
-                "source_id_str": [],
-                "asset_id_str": [],
-                "pass_num": [],
-                "deal_id_str": [],
-                "entity_id_str": [],
-                "entity_type": [],
-            }
-
-        # Extract non-zero values and indices
-        filtered_series = series[non_zero_mask]
-        dates = filtered_series.index
-        amounts = filtered_series.values
-        count = len(filtered_series)
-
-        # CRITICAL FIX: Calculate flow_purpose per transaction like working main branch
-        # The previous "optimization" was incorrect - each transaction needs individual flow purpose
-        flow_purposes = []
-        for amount in amounts:
-            purpose = FlowPurposeMapper.determine_purpose_with_subcategory(
-                metadata.category, metadata.subcategory, amount
-            )
-            flow_purposes.append(enum_to_string(purpose))
+            return None
 
-        # Bulk operations - pre-allocate everything
-        return {
-            "date": [d.date() if hasattr(d, "date") else d for d in dates],
-            "amount": amounts.tolist(),  # numpy to list conversion is fast
-            "category": [enum_to_string(metadata.category)] * count,
-            "subcategory": [enum_to_string(metadata.subcategory)] * count,
-            "item_name": [metadata.item_name] * count,
-            "source_id_str": [str(metadata.source_id)] * count,
-            "asset_id_str": [str(metadata.asset_id)] * count,
-            "pass_num": [metadata.pass_num] * count,
-            "deal_id_str": [str(metadata.deal_id) if metadata.deal_id else None]
-            * count,
-            "entity_id_str": [str(metadata.entity_id) if metadata.entity_id else None]
-            * count,
-            "entity_type": [metadata.entity_type] * count,
-            # Per-transaction flow_purpose (matches working main branch logic)
-            "flow_purpose": flow_purposes,
-        }
+        # Convert PeriodIndex to DatetimeIndex for DuckDB compatibility
+        index = series.index
+        if isinstance(index, pd.PeriodIndex):
+            index = index.to_timestamp()
+        dates = pd.DatetimeIndex(index).to_numpy(dtype="datetime64[D]")
 
-    @staticmethod
-    def _bulk_generate_uuids(count: int) -> List[str]:
+        amounts = amounts[non_zero_mask]
+        dates = dates[non_zero_mask]
+
+        # Flow purpose depends on each amount's sign, so classify per transaction
+        flow_purposes = FlowPurposeMapper.determine_purpose_array(
+            metadata.category, metadata.subcategory, amounts
+        )
+
+        return dates, amounts, flow_purposes
+
+    def _register_enum_values(self, column_values: Dict[str, Any]) -> None:
         """
-        High-performance bulk UUID generation.
+        Make sure every value about to be inserted exists in its ENUM type.
+
+        Classification columns are stored as DuckDB ENUMs. When a batch carries
+        a value outside the current ENUM (e.g. a custom subcategory string),
+        the column is migrated to a new, wider ENUM type that keeps all
+        existing members in order, so existing codes remain valid.
+
+        Args:
+            column_values: Mapping of ENUM column name to the distinct values
+                in the batch being inserted (None entries are ignored)
+        """
+        for column, values in column_values.items():
+            known = self._enum_values[column]
+            missing = [
+                str(value)
+                for value in values
+                if value is not None and pd.notna(value) and str(value) not in known
+            ]
+            if missing:
+                self._widen_enum_column(column, missing)
 
-        Generates UUIDs in bulk using optimized random byte generation,
-        providing performance improvement over individual uuid4() calls.
+    def _widen_enum_column(self, column: str, new_values: List[str]) -> None:
+        """
+        Replace a column's ENUM type with one that also contains new_values.
 
-        Performance characteristics:
-        - Faster than individual uuid.uuid4() calls for large batches
-        - Uses cryptographically secure random bytes
-        - Maintains full UUID uniqueness guarantees
-        - Memory efficient with single allocation
+        DuckDB cannot alter a column referenced by an index, so the strategic
+        indexes are dropped around the type change and recreated afterwards.
 
         Args:
-            count: Number of UUIDs to generate
+            column: ENUM column to widen
+            new_values: Values to append to the ENUM
+        """
+        values = self._enum_values[column]
+        values.update(dict.fromkeys(new_values))
 
-        Returns:
-            List of UUID strings ready for database insertion
+        type_name = self._next_enum_type_name(column)
+        self.con.execute(enum_type_sql(type_name, values))
 
-        Example:
-            >>> uuids = Ledger._bulk_generate_uuids(1000)
-            >>> len(uuids)
-            1000
-            >>> all(len(uid) == 36 for uid in uuids)  # Standard UUID format
-            True
-        """
-        if count <= 0:
-            return []
-
-        # Generate random bytes in bulk (much faster than individual calls)
-        random_bytes = secrets.token_bytes(count * 16)
-
-        # Convert to UUID strings in bulk
-        uuids = []
-        for i in range(count):
-            # Extract 16 bytes for this UUID
-            start_idx = i * 16
-            uuid_bytes = random_bytes[start_idx : start_idx + 16]
-
-            # Create UUID4 from bytes (set version and variant bits)
-            uuid_int = int.from_bytes(uuid_bytes, "big")
-            # Set version (4 bits at position 12-15 from right)
-            uuid_int = (uuid_int & ~(0xF << 76)) | (4 << 76)
-            # Set variant (2 bits at position 62-63 from right)
-            uuid_int = (uuid_int & ~(0x3 << 62)) | (0x2 << 62)
-
-            # Convert to UUID and string
-            uuid_obj = uuid.UUID(int=uuid_int)
-            uuids.append(str(uuid_obj))
-
-        return uuids
+        table = (
+            self._series_table
+            if self._series_table is not None and column in SERIES_COLUMNS
+            else self._storage_table
+        )
+        indexes = self.con.execute(
+            "SELECT index_name FROM duckdb_indexes() WHERE table_name = ?",
+            [table],
+        ).fetchall()
+        for (index_name,) in indexes:
+            self.con.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+        self.con.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} SET DATA TYPE {type_name}"
+        )
+        self._enum_types[column] = type_name
+        self._create_strategic_indexes()
+        if self._is_fork:
+            self._create_fork_view()
+        elif self._storage_table != self.table_name:
+            self._create_read_view()
+        if self.path is not None:
+            self._persist_metadata()
+
+        logger.debug(f"Widened {column} ENUM with {len(new_values)} new value(s)")
+
+    def _next_enum_type_name(self, column: str) -> str:
+        """
+        Return an unused name for the next generation of a column's ENUM type.
+
+        Forks share the connection's type catalog with their parent, so
+        generations are advanced past any name already taken.
+        """
+        base_name = LEDGER_ENUM_COLUMNS[column][0]
+        existing = {
+            name
+            for (name,) in self.con.execute(
+                "SELECT type_name FROM duckdb_types()"
+            ).fetchall()
+        }
+        while True:
+            self._enum_generation += 1
+            type_name = f"{base_name}_{self._enum_generation}"
+            if type_name not in existing:
+                return type_name
+
+    def _read_metadata(self) -> Dict[str, str]:
+        """Read stored ledger metadata, or an empty dict for a new database."""
+        exists = self.con.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?",
+            [METADATA_TABLE],
+        ).fetchone()[0]
+        if not exists:
+            return {}
+        return dict(
+            self.con.execute(f"SELECT key, value FROM {METADATA_TABLE}").fetchall()
+        )
+
+    def _persist_metadata(self) -> None:
+        """Write ledger state needed to reopen a file-backed ledger."""
+        self._metadata_dirty = False
+        metadata = {
+            "version": self._version,
+            "series_count": self._series_count,
+            "id_namespace": self._id_namespace,
+            "enum_generation": self._enum_generation,
+            "layout": self._layout,
+            "granularity": self._granularity,
+            "transaction_ids": "deferred" if self._deferred_ids else "eager",
+            "transaction_id_prefix": self._transaction_id_prefix,
+            **{
+                f"enum_type.{column}": type_name
+                for column, type_name in self._enum_types.items()
+            },
+        }
+        self.con.execute(
+            f"CREATE TABLE IF NOT EXISTS {METADATA_TABLE} (key VARCHAR, value VARCHAR)"
+        )
+        self.con.execute(f"DELETE FROM {METADATA_TABLE}")
+        self.con.executemany(
+            f"INSERT INTO {METADATA_TABLE} VALUES (?, ?)",
+            [[key, str(value)] for key, value in metadata.items()],
+        )
+
+    def _restore_enum_types(self, metadata: Dict[str, str]) -> None:
+        """Load the current (possibly widened) ENUM types of a reopened ledger."""
+        self._enum_generation = int(metadata["enum_generation"])
+        for column in LEDGER_ENUM_COLUMNS:
+            type_name = metadata[f"enum_type.{column}"]
+            values = self.con.execute(
+                f"SELECT unnest(enum_range(NULL::{type_name}))"
+            ).fetchall()
+            self._enum_types[column] = type_name
+            self._enum_values[column] = dict.fromkeys(value for (value,) in values)
+
+    def _restore_state(self, metadata: Dict[str, str]) -> None:
+        """Restore counters and id namespace of a reopened ledger."""
+        self._record_count = self.con.execute(
+            f"SELECT COUNT(*) FROM {self.table_name}"
+        ).fetchone()[0]
+        self._series_count = int(metadata["series_count"])
+        self._version = int(metadata["version"])
+        self._id_namespace = uuid.UUID(metadata["id_namespace"])
+        self._transaction_id_prefix = metadata.get(
+            "transaction_id_prefix", self._transaction_id_prefix
+        )
+        if self._series_table is not None:
+            self._next_series_key = (
+                self.con.execute(
+                    f"SELECT COALESCE(MAX(series_key), 0) + 1 FROM {self._series_table}"
+                ).fetchone()[0]
+            )
+        has_rollup = self.con.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?",
+            [self._rollup_table],
+        ).fetchone()[0]
+        if not has_rollup:
+            # Ledger files written before the rollup existed
+            self._create_rollup_table()
+            self.con.execute(
+                f"INSERT INTO {self._rollup_table} "
+                + rollup_select_sql(self.table_name)
+            )
+        self._rollup_rows = self.con.execute(
+            f"SELECT COUNT(*) FROM {self._rollup_table}"
+        ).fetchone()[0]
+        self._rollup_compacted_rows = self._rollup_rows
 
     def _configure_duckdb_performance(self) -> None:
         """
@@ -804,10 +2003,18 @@ class Ledger:
                 pass
             try:
                 # Set memory limit to a reasonable high watermark (adjustable by env)
-                mem_limit = os.getenv("PERFORMA_DUCKDB_MEM", "4GB")
+                mem_limit = self._memory_limit or os.getenv(
+                    "PERFORMA_DUCKDB_MEM", "4GB"
+                )
                 self.con.execute(f"SET memory_limit = '{mem_limit}'")
             except Exception:
                 pass
+            # Spill location for queries that exceed the memory limit
+            temp_directory = self._temp_directory or os.getenv(
+                "PERFORMA_DUCKDB_TEMP_DIR"
+            )
+            if temp_directory:
+                self.con.execute("SET temp_directory = ?", [temp_directory])
 
             # Optimize for analytical queries over transactional consistency
             self.con.execute("SET checkpoint_threshold = '1GB'")
@@ -844,36 +2051,53 @@ class Ledger:
         - Time-based aggregations (GROUP BY date)
         - Category-based filtering (WHERE category = ...)
         - Combined date/category queries (common in financial analysis)
+
+        In the normalized layout, row-level columns are indexed on the fact
+        table and classification columns on the series dimension table.
         """
         try:
+            if self._series_table is not None:
+                for table, columns in (
+                    (self._storage_table, "date"),
+                    (self._storage_table, "flow_purpose"),
+                    (self._series_table, "category"),
+                    (self._series_table, "asset_id"),
+                ):
+                    self.con.execute(f"""
+                        CREATE INDEX IF NOT EXISTS idx_{table}_{columns}
+                        ON {table}({columns})
+                    """)
+                logger.debug("Strategic indexes created successfully")
+                return
+
             # Primary index on date column - critical for time-series queries
             self.con.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_{self.table_name}_date 
-                ON {self.table_name}(date)
+                CREATE INDEX IF NOT EXISTS idx_{self._storage_table}_date 
+                ON {self._storage_table}(date)
             """)
 
             # Index on category for filtering operations
             self.con.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_{self.table_name}_category 
-                ON {self.table_name}(category)
+                CREATE INDEX IF NOT EXISTS idx_{self._storage_table}_category 
+                ON {self._storage_table}(category)
             """)
 
             # Compound index for date/category combinations (most common query pattern)
             self.con.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_{self.table_name}_date_category 
-                ON {self.table_name}(date, category)
+                CREATE INDEX IF NOT EXISTS idx_{self._storage_table}_date_category 
+                ON {self._storage_table}(date, category)
             """)
 
             # Index on flow_purpose for Operating/Investing/Financing breakdowns
             self.con.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_{self.table_name}_flow_purpose 
-                ON {self.table_name}(flow_purpose)
+                CREATE INDEX IF NOT EXISTS idx_{self._storage_table}_flow_purpose 
+                ON {self._storage_table}(flow_purpose)
             """)
 
             # Compound index for asset-based queries
             self.con.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_{self.table_name}_asset_date 
-                ON {self.table_name}(asset_id, date)
+                CREATE INDEX IF NOT EXISTS idx_{self._storage_table}_asset_date 
+                ON {self._storage_table}(asset_id, date)
             """)
 
             logger.debug("Strategic indexes created successfully")
@@ -894,7 +2118,7 @@ class Ledger:
         - Minimal DataFrame with raw data only (no UUID/enum conversion in Python)
         - SQL-native UUID generation via uuid() function
         - SQL-native type casting (amount::DOUBLE, etc.)
-        - SQL-native flow purpose mapping via CASE statement
+        - Vectorized flow purpose mapping (same rules as add_series)
 
         Args:
             records: List of transaction records to insert
@@ -904,22 +2128,26 @@ class Ledger:
 
         # Create minimal raw DataFrame - avoid expensive Python processing
         raw_data = FlowPurposeMapper.generate_optimized_raw_data(records)
+        raw_data["flow_purpose"] = FlowPurposeMapper.determine_purpose_arrays(
+            raw_data["category"], raw_data["subcategory"], raw_data["amount"]
+        )
         raw_df = pd.DataFrame(raw_data)
 
         try:
+            self._register_enum_values({
+                column: raw_df[column].unique() for column in LEDGER_ENUM_COLUMNS
+            })
+
             # Register minimal DataFrame for SQL processing
             self.con.register("raw_ledger_data", raw_df)
 
             # Single SQL INSERT with all transformations in DuckDB's vectorized engine
-            flow_purpose_sql = FlowPurposeMapper.generate_sql_flow_purpose_case()
-
-            insert_sql = f"""
-                INSERT INTO {self.table_name} 
+            inserted = self._insert_rows("""
                 SELECT 
                     uuid() as transaction_id,                       -- DuckDB UUID generation
                     date::DATE as date,                            -- DuckDB type casting
                     amount::DOUBLE as amount,                      -- DuckDB type casting  
-                    ({flow_purpose_sql}) as flow_purpose,          -- DuckDB flow purpose mapping
+                    flow_purpose::VARCHAR as flow_purpose,
                     category::VARCHAR as category,
                     subcategory::VARCHAR as subcategory,
                     item_name::VARCHAR as item_name,
@@ -930,15 +2158,13 @@ class Ledger:
                     CASE WHEN entity_id_str IS NOT NULL THEN entity_id_str::UUID ELSE NULL END as entity_id,
                     entity_type::VARCHAR as entity_type
                 FROM raw_ledger_data
-            """
-
-            self.con.execute(insert_sql)
+            """)
 
             # Cleanup
             self.con.unregister("raw_ledger_data")
 
             # Update counters
-            self._record_count += len(raw_df)
+            self._record_count += inserted
             logger.debug(f"SQL-native bulk inserted {len(raw_df)} transaction records")
             # Invalidate query caches
             self._bump_version()
@@ -966,18 +2192,23 @@ class Ledger:
         if not records:
             return
 
+        # Classify with the same vectorized rules as add_series and commit paths
+        categories = [enum_to_string(record.category) for record in records]
+        subcategories = [enum_to_string(record.subcategory) for record in records]
+        amounts = np.array([float(record.amount) for record in records])
+
         # Convert TransactionRecord instances to DataFrame with optimized types
         data = {
             "transaction_id": [
                 str(record.transaction_id) for record in records
             ],  # UUID as string
             "date": [record.date for record in records],
-            "amount": [
-                float(record.amount) for record in records
-            ],  # Ensure DOUBLE type
-            "flow_purpose": [enum_to_string(record.flow_purpose) for record in records],
-            "category": [enum_to_string(record.category) for record in records],
-            "subcategory": [enum_to_string(record.subcategory) for record in records],
+            "amount": amounts,  # Ensure DOUBLE type
+            "flow_purpose": FlowPurposeMapper.determine_purpose_arrays(
+                categories, subcategories, amounts
+            ),
+            "category": categories,
+            "subcategory": subcategories,
             "item_name": [record.item_name for record in records],
             "source_id": [
                 str(record.source_id) for record in records
@@ -999,13 +2230,14 @@ class Ledger:
         temp_df = pd.DataFrame(data)
 
         try:
+            self._register_enum_values({
+                column: temp_df[column].unique() for column in LEDGER_ENUM_COLUMNS
+            })
             self.con.register("temp_df_view", temp_df)
-            self.con.execute(
-                f"INSERT INTO {self.table_name} SELECT * FROM temp_df_view"
-            )
+            inserted = self._insert_rows("SELECT * FROM temp_df_view")
             self.con.unregister("temp_df_view")
 
-            self._record_count += len(temp_df)
+            self._record_count += inserted
             logger.debug(f"Bulk inserted {len(temp_df)} transaction records")
             # Invalidate query caches
             self._bump_version()
@@ -1064,25 +2296,13 @@ class Ledger:
         Uses SQL-native optimization by default with automatic fallback to
         standard method if SQL-native operations fail.
         """
-        # Handle optimized raw data buffer (highest performance)
-        if (
-            hasattr(self, "_raw_transaction_buffer")
-            and self._raw_transaction_buffer["date"]
-        ):
+        # Handle columnar append buffer (highest performance)
+        if len(self._append_buffer) > 0:
             try:
-                self._bulk_insert_raw_data(self._raw_transaction_buffer)
-
-                # Clear the raw buffer
-                for key in self._raw_transaction_buffer:
-                    self._raw_transaction_buffer[key].clear()
-
-                logger.debug(f"Committed optimized raw data buffer to DuckDB")
-
+                self._flush_append_buffer()
+                logger.debug(f"Committed columnar append buffer to DuckDB")
             except Exception as e:
-                logger.error(f"Failed to commit raw data buffer: {e}")
-                # Clear the buffer to prevent memory buildup
-                for key in self._raw_transaction_buffer:
-                    self._raw_transaction_buffer[key].clear()
+                logger.error(f"Failed to commit append buffer: {e}")
                 raise
 
         # Handle traditional TransactionRecord buffer (fallback compatibility)
@@ -1102,11 +2322,15 @@ class Ledger:
             logger.debug(f"Committed transaction buffer to DuckDB")
 
     def _bump_version(self) -> None:
-        """Increment the ledger version counter and invalidate cached DataFrame."""
+        """Increment the ledger version counter and invalidate cached results."""
         self._version += 1
+        if hasattr(self, "_query_cache"):
+            self._query_cache.invalidate()
         if hasattr(self, "_cached_df"):
             self._cached_df = None
             self._cached_df_version = -1
+        # Written at transaction commit and on close(), not per write
+        self._metadata_dirty = True
 
     def _rollback_transaction(self) -> None:
         """
@@ -1118,10 +2342,8 @@ class Ledger:
         # Clear traditional transaction record buffer
         self._transaction_buffer.clear()
 
-        # Clear optimized raw data buffer if it exists
-        if hasattr(self, "_raw_transaction_buffer"):
-            for key in self._raw_transaction_buffer:
-                self._raw_transaction_buffer[key].clear()
+        # Clear columnar append buffer
+        self._append_buffer.clear()
 
         logger.debug("Rolled back all transaction buffers")
 
@@ -1234,6 +2456,8 @@ class LedgerTransaction:
             if exc_type is None:
                 # Normal completion - commit the buffer
                 self._ledger._commit_buffer()
+                if self._ledger.path is not None and self._ledger._metadata_dirty:
+                    self._ledger._persist_metadata()
                 logger.debug("Committed DuckDB ledger transaction successfully")
             else:
                 # Exception occurred - clear all buffers without committing
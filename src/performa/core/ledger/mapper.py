@@ -10,7 +10,9 @@ principles and the existing Performa categorization system.
 """
 
 from functools import lru_cache
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Union
+
+import numpy as np
 
 if TYPE_CHECKING:
     from .records import TransactionRecord
@@ -243,29 +245,104 @@ class FlowPurposeMapper:
         return purpose == TransactionPurpose.FINANCING_SERVICE
 
     @staticmethod
-    def generate_sql_flow_purpose_case() -> str:
+    @lru_cache(maxsize=None)
+    def purpose_lookup_table(category: Any, subcategory: Any) -> np.ndarray:
+        """
+        Precompute flow purposes for a category/subcategory pair by amount sign.
+
+        Every classification rule depends on the amount only through its sign,
+        so the scalar mapper is evaluated once for a negative, zero and positive
+        amount and the results are cached per pair.
+
+        Args:
+            category: Primary transaction category
+            subcategory: Secondary categorization
+
+        Returns:
+            Read-only array of three flow purpose codes (TransactionPurpose
+            values) indexed by sign: 0 = negative, 1 = zero, 2 = positive
+        """
+        table = np.array(
+            [
+                FlowPurposeMapper.determine_purpose_with_subcategory(
+                    category, subcategory, amount
+                ).value
+                for amount in (-1.0, 0.0, 1.0)
+            ],
+            dtype=object,
+        )
+        table.setflags(write=False)
+        return table
+
+    @staticmethod
+    def determine_purpose_array(
+        category: CashFlowCategoryEnum,
+        subcategory: Union[
+            CapitalSubcategoryEnum,
+            CapExCategoryEnum,
+            ExpenseSubcategoryEnum,
+            RevenueSubcategoryEnum,
+            ValuationSubcategoryEnum,
+        ],
+        amounts: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Vectorized purpose determination for many amounts sharing one category.
+
+        Equivalent to calling `determine_purpose_with_subcategory` for every
+        amount, but classifies the whole array with two sign masks and a
+        lookup into `purpose_lookup_table`.
+
+        Args:
+            category: Primary transaction category
+            subcategory: Secondary categorization
+            amounts: Transaction amounts
+
+        Returns:
+            Object array of flow purpose codes (TransactionPurpose values),
+            same shape as amounts
+        """
+        amounts = np.asarray(amounts, dtype="float64")
+        # NaN compares False on both masks and maps to the zero slot, matching
+        # the scalar comparisons
+        sign_index = np.ones(amounts.shape, dtype=np.intp)
+        sign_index[amounts < 0] = 0
+        sign_index[amounts > 0] = 2
+        table = FlowPurposeMapper.purpose_lookup_table(category, subcategory)
+        return table.take(sign_index)
+
+    @staticmethod
+    def determine_purpose_arrays(
+        categories: Sequence[Any],
+        subcategories: Sequence[Any],
+        amounts: np.ndarray,
+    ) -> np.ndarray:
         """
-        Generate SQL CASE statement for flow purpose mapping.
+        Vectorized purpose determination for rows with mixed categories.
 
-        This allows DuckDB to handle flow purpose calculation natively
-        instead of expensive Python enum processing, providing
-        performance improvements for bulk operations.
+        Rows are grouped by category/subcategory pair and each group is
+        classified with `determine_purpose_array`.
+
+        Args:
+            categories: Category per row
+            subcategories: Subcategory per row
+            amounts: Transaction amount per row
 
         Returns:
-            SQL CASE statement string for flow purpose determination
+            Object array of flow purpose codes, one per row
         """
-        return """
-        CASE 
-            WHEN category = 'Revenue' THEN 'Operating'
-            WHEN category = 'Expense' THEN 'Operating'
-            WHEN category = 'Capital' AND amount < 0 THEN 'Capital Use'
-            WHEN category = 'Capital' AND amount >= 0 THEN 'Capital Source' 
-            WHEN category = 'Financing' AND amount < 0 THEN 'Financing Service'
-            WHEN category = 'Financing' AND amount >= 0 THEN 'Capital Source'
-            WHEN category = 'Valuation' THEN 'Valuation'
-            ELSE 'Operating'
-        END
-        """.strip()
+        amounts = np.asarray(amounts, dtype="float64")
+        groups: Dict[Any, List[int]] = {}
+        for row, key in enumerate(zip(categories, subcategories)):
+            groups.setdefault(key, []).append(row)
+
+        purposes = np.empty(len(amounts), dtype=object)
+        for (category, subcategory), rows in groups.items():
+            row_idx = np.asarray(rows, dtype=np.intp)
+            purposes[row_idx] = FlowPurposeMapper.determine_purpose_array(
+                category, subcategory, amounts[row_idx]
+            )
+        return purposes
 
     @staticmethod
     def generate_optimized_raw_data(
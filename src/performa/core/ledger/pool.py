@@ -0,0 +1,203 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Bounded pool of reusable in-memory ledgers.
+
+Constructing a `Ledger` opens a DuckDB connection, creates the ENUM types and
+transactions table, applies the performance settings and builds the strategic
+indexes. For batch runs over many small deals that setup dominates the
+analysis itself, so `LedgerPool` keeps initialized ledgers around and hands
+them out again after a cheap `Ledger.reset()` (TRUNCATE plus version bump).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, Optional
+
+from .ledger import Ledger
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+
+class LedgerPool:
+    """
+    Size-bounded pool of pre-initialized, in-memory ledgers.
+
+    Ledgers are created lazily up to `size`; `acquire()` returns an idle
+    ledger when one is available and blocks otherwise. `release()` empties
+    the ledger with `Ledger.reset()`, which keeps the connection, settings,
+    ENUM types and indexes, and bumps the version so query results cached
+    for the previous analysis can never be returned for the next one.
+
+    Args:
+        size: Maximum number of ledgers (and DuckDB connections) owned by
+            the pool
+        **ledger_kwargs: Options passed to every `Ledger` the pool creates
+            (e.g. `query_cache_size`, `memory_limit`)
+
+    Raises:
+        ValueError: If size is not positive or `path` is given (pooled
+            ledgers are in-memory only)
+
+    Example:
+        ```python
+        pool = LedgerPool(size=4)
+        for deal in deals:
+            with pool.ledger() as ledger:
+                results = analyze(deal, timeline, ledger=ledger)
+                irrs.append(results.levered_irr)
+        pool.close()
+        ```
+    """
+
+    def __init__(self, size: int = 4, **ledger_kwargs: Any):
+        if size < 1:
+            raise ValueError(f"Pool size must be positive, got {size}")
+        if ledger_kwargs.get("path") is not None:
+            raise ValueError("LedgerPool only manages in-memory ledgers")
+        self.size = size
+        self._ledger_kwargs = ledger_kwargs
+        self._idle: Deque[Ledger] = deque()
+        self._in_use: Dict[int, Ledger] = {}
+        self._created = 0
+        self._reuses = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None) -> Ledger:
+        """
+        Take an empty ledger from the pool.
+
+        Args:
+            timeout: Seconds to wait for a ledger when all `size` ledgers are
+                in use (None waits indefinitely)
+
+        Returns:
+            Empty ledger owned by the caller until `release()`
+
+        Raises:
+            RuntimeError: If the pool has been closed
+            TimeoutError: If no ledger became available within timeout
+        """
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("LedgerPool is closed")
+                if self._idle:
+                    ledger = self._idle.popleft()
+                    self._reuses += 1
+                    break
+                if self._created < self.size:
+                    # Reserve the slot, then build the ledger outside the lock
+                    self._created += 1
+                    ledger = None
+                    break
+                if not self._available.wait(timeout):
+                    raise TimeoutError(
+                        f"No ledger available in pool of size {self.size}"
+                    )
+
+        if ledger is None:
+            try:
+                ledger = Ledger(**self._ledger_kwargs)
+            except Exception:
+                with self._available:
+                    self._created -= 1
+                    self._available.notify()
+                raise
+            logger.debug(f"LedgerPool created ledger {self._created}/{self.size}")
+
+        with self._available:
+            self._in_use[id(ledger)] = ledger
+        return ledger
+
+    def release(self, ledger: Ledger) -> None:
+        """
+        Reset a ledger and return it to the pool.
+
+        Args:
+            ledger: Ledger previously returned by `acquire()`
+
+        Raises:
+            ValueError: If the ledger was not acquired from this pool
+        """
+        with self._available:
+            if self._in_use.pop(id(ledger), None) is None:
+                raise ValueError("Ledger was not acquired from this pool")
+
+        try:
+            ledger.reset()
+        except Exception as e:
+            # A ledger that cannot be reset is discarded; its slot is freed
+            logger.warning(f"Discarding pooled ledger that failed to reset: {e}")
+            ledger.con.close()
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            return
+
+        with self._available:
+            if self._closed:
+                ledger.con.close()
+                return
+            self._idle.append(ledger)
+            self._available.notify()
+
+    @contextmanager
+    def ledger(self, timeout: Optional[float] = None) -> Iterator[Ledger]:
+        """
+        Context manager that acquires a ledger and releases it on exit.
+
+        Args:
+            timeout: Seconds to wait for a ledger (see `acquire()`)
+
+        Yields:
+            Empty ledger for the duration of the block
+        """
+        ledger = self.acquire(timeout=timeout)
+        try:
+            yield ledger
+        finally:
+            self.release(ledger)
+
+    def close(self) -> None:
+        """
+        Close idle ledgers and refuse further acquisitions.
+
+        Ledgers still in use are closed when they are released.
+        """
+        with self._available:
+            self._closed = True
+            while self._idle:
+                self._idle.popleft().con.close()
+            self._available.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return pool usage counters.
+
+        Returns:
+            Dictionary with size, created, idle, in_use and reuses
+        """
+        with self._available:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "reuses": self._reuses,
+            }
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -10,15 +10,36 @@ and returned as pandas objects with consistent time indexing.
 
 Features:
 - SQL-optimized aggregations for financial calculations
+- Monthly aggregates read the ledger's incrementally maintained rollup, so
+  their cost depends on the number of periods, not transactions
 - Consistent API used throughout the codebase
 - Monthly PeriodIndex outputs for time series
+- Read-only NumPy arrays aligned to a timeline (`LedgerQueries.arrays`) for
+  callers that index results by period position
+- Timeline-bound instances (`LedgerQueries(ledger, timeline=...)`) join every
+  monthly result onto a calendar table in SQL, returning zero-filled series on
+  the timeline's own index
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from contextlib import nullcontext
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 
 from ..primitives.enums import (
@@ -28,11 +49,33 @@ from ..primitives.enums import (
     FinancingSubcategoryEnum,
     RevenueSubcategoryEnum,
     TransactionPurpose,
+    UnleveredAggregateLineKey,
     ValuationSubcategoryEnum,
     enum_to_string,
 )
+from .cache import QueryResultCache
+from .mapper import FlowPurposeMapper
+from .query_analyzer import LedgerProfiler
+from .schema import arrow_to_pandas, rollup_select_sql
+from .statements import (
+    MONTHLY_CAPEX,
+    MONTHLY_DEBT_BALANCE_CHANGE,
+    MONTHLY_ENTITY_SUM,
+    MONTHLY_SUBCATEGORY_SUM,
+    MONTHLY_SUM,
+    SUBCATEGORY_SUM,
+    VALUATION_AT,
+    ParameterizedStatement,
+    calendar_join_sql,
+    calendar_statement,
+    calendar_table,
+    execute_statement,
+)
 
 if TYPE_CHECKING:
+    import duckdb
+
+    from ..primitives.timeline import Timeline
     from .ledger import Ledger
 
 ################################################################################
@@ -143,6 +186,33 @@ ALL_CAPITAL_USE_SUBCATEGORIES = (
     + [CapitalSubcategoryEnum.OTHER]
 )
 
+# Capital subcategories excluded from capital expenditures (not recurring capex)
+CAPEX_EXCLUDED_SUBCATEGORIES = [
+    CapitalSubcategoryEnum.PURCHASE_PRICE,
+    CapitalSubcategoryEnum.CLOSING_COSTS,
+    CapitalSubcategoryEnum.TRANSACTION_COSTS,
+    CapitalSubcategoryEnum.OTHER,
+]
+
+# Aggregate lines selected by category, subcategory and flow purpose only
+# (see LedgerQueries.aggregate_line_masks); TI/LC/CapEx also read item names
+ACCUMULABLE_AGGREGATE_LINES = frozenset(
+    {
+        UnleveredAggregateLineKey.GROSS_POTENTIAL_RENT,
+        UnleveredAggregateLineKey.POTENTIAL_GROSS_REVENUE,
+        UnleveredAggregateLineKey.TENANT_REVENUE,
+        UnleveredAggregateLineKey.RENTAL_ABATEMENT,
+        UnleveredAggregateLineKey.MISCELLANEOUS_INCOME,
+        UnleveredAggregateLineKey.GENERAL_VACANCY_LOSS,
+        UnleveredAggregateLineKey.CREDIT_LOSS,
+        UnleveredAggregateLineKey.EXPENSE_REIMBURSEMENTS,
+        UnleveredAggregateLineKey.EFFECTIVE_GROSS_INCOME,
+        UnleveredAggregateLineKey.TOTAL_OPERATING_EXPENSES,
+        UnleveredAggregateLineKey.NET_OPERATING_INCOME,
+        UnleveredAggregateLineKey.UNLEVERED_CASH_FLOW,
+    }
+)
+
 # === EXPENSE SUBCATEGORY GROUPINGS ===
 
 # Operating expenses [NEGATIVE AMOUNTS]
@@ -181,6 +251,58 @@ ALL_VALUATION_SUBCATEGORIES = [
     ValuationSubcategoryEnum.BROKER_OPINION,  # Broker opinions
 ]
 
+# Monthly metrics available as NumPy arrays via LedgerQueries.arrays(): the
+# methods answered by a single monthly aggregate query
+ARRAY_METRICS = frozenset(
+    {
+        "pgr",
+        "gpr",
+        "tenant_revenue",
+        "vacancy_loss",
+        "egi",
+        "opex",
+        "noi",
+        "capex",
+        "ti",
+        "lc",
+        "total_uses",
+        "total_sources",
+        "debt_draws",
+        "debt_service",
+        "recurring_debt_service",
+        "sweep_deposits",
+        "sweep_prepayments",
+        "equity_contributions",
+        "equity_distributions",
+        "gp_distributions",
+        "lp_distributions",
+        "rental_abatement",
+        "credit_loss",
+        "misc_income",
+        "expense_reimbursements",
+        "revenue",
+        "operational_cash_flow",
+        "equity_partner_flows",
+        "construction_draws",
+    }
+)
+
+
+
+def _monthly_index(index: Union[pd.PeriodIndex, "Timeline"]) -> pd.PeriodIndex:
+    """
+    Validate a contiguous monthly PeriodIndex (or a Timeline's period index).
+
+    Raises:
+        ValueError: If the index is not a contiguous monthly PeriodIndex
+    """
+    index = getattr(index, "period_index", index)
+    if not isinstance(index, pd.PeriodIndex) or index.freqstr != "M":
+        raise ValueError("index must be a monthly PeriodIndex or a Timeline")
+    if len(index) and index[-1].ordinal - index[0].ordinal != len(index) - 1:
+        raise ValueError("index must be contiguous (one entry per month)")
+    return index
+
 
 ################################################################################
 # DUCKDB LEDGER QUERIES
@@ -234,20 +356,61 @@ class LedgerQueries:  # noqa: PLR0904
                schema (date, amount, category, subcategory, flow_purpose, etc.)
     """
 
-    def __init__(self, ledger: "Ledger"):
+    def __init__(
+        self,
+        ledger: "Ledger",
+        thread_local: bool = False,
+        timeline: Optional[Union[pd.PeriodIndex, "Timeline"]] = None,
+    ):
         """
         Initialize with a DuckDB-backed ledger.
 
         Args:
             ledger: Ledger instance that provides get_query_connection()
+            thread_local: Run every query on the calling thread's own cursor
+                (`ledger.get_query_connection(thread_local=True)`), so one
+                instance can be shared by threads querying a finished ledger
+            timeline: Optional Timeline or contiguous monthly PeriodIndex.
+                Monthly results are then joined onto a calendar table of its
+                months in SQL: every series is indexed by exactly these
+                months, zero-filled, with no pandas reindexing. Defaults to
+                each result's own first..last month range.
+
+        Raises:
+            ValueError: If the timeline is not a contiguous monthly index
         """
         # Require a DuckDB-backed Ledger
-        self.con, self.table_name = ledger.get_query_connection()
+        self._con, self.table_name = (
+            ledger.get_query_connection(thread_local=True)
+            if thread_local
+            else ledger.get_query_connection()
+        )
         self._ledger = ledger
-        self._cache_version = (
-            ledger.get_version() if hasattr(ledger, "get_version") else -1
+        self._thread_local = thread_local
+        # Months every monthly result is aligned to (None: the result's own range)
+        self.index = None if timeline is None else _monthly_index(timeline)
+        # Per-thread call state (see arrays())
+        self._local = threading.local()
+        # Monthly aggregates read the ledger's incrementally maintained rollup
+        # (see Ledger.rollup_table); other ledgers are rolled up on the fly
+        rollup_table = getattr(ledger, "rollup_table", None)
+        self.rollup_table = (
+            rollup_table
+            if isinstance(rollup_table, str)
+            else f"({rollup_select_sql(self.table_name)})"
         )
-        self._series_cache = {}
+        # Results are cached on the ledger so every query consumer shares them
+        cache = getattr(ledger, "query_cache", None)
+        if not isinstance(cache, QueryResultCache):
+            cache = QueryResultCache()
+        self._cache = cache
+
+    @property
+    def con(self) -> "duckdb.DuckDBPyConnection":
+        """Connection queries run on (the calling thread's cursor if thread-local)."""
+        if self._thread_local:
+            return self._ledger.get_query_connection(thread_local=True)[0]
+        return self._con
 
     @property
     def ledger(self) -> pd.DataFrame:
@@ -271,9 +434,9 @@ class LedgerQueries:  # noqa: PLR0904
         """
         Execute a SQL query and format the result as a pandas Series.
 
-        This is the core helper method that converts DuckDB query results into
-        the pandas Series format expected by existing code. Handles empty results,
-        date conversion, and monthly resampling.
+        Used by the few queries not expressed as parameterized statements (see
+        `_statement_to_series`). Handles empty results, date conversion, and
+        monthly resampling.
 
         Args:
             sql: SQL query to execute
@@ -284,54 +447,274 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Pandas Series with PeriodIndex (monthly frequency) and float values
         """
-        try:
-            # Versioned cache: invalidate on ledger version change
-            current_version = (
-                self._ledger.get_version()
-                if hasattr(self._ledger, "get_version")
-                else -1
+        calendar = self._calendar()
+        if calendar is not None:
+            sql = calendar_join_sql(sql, calendar, (value_col,), date_col=date_col)
+            date_col = "month"
+        return self._cached_series(
+            self._cache_key(sql, date_col, value_col, series_name),
+            lambda: self._sql_table(sql),
+            date_col,
+            value_col,
+            series_name,
+        )
+
+    def _statement_to_series(
+        self,
+        statement: ParameterizedStatement,
+        arguments: Sequence[Any],
+        series_name: str,
+        relation: Optional[str] = None,
+        value_col: str = "total",
+    ) -> pd.Series:
+        """
+        Execute a parameterized (month, total) statement as a monthly Series.
+
+        The result is cached under the statement name, relation and arguments,
+        so equivalent calls share an entry regardless of how they were built.
+
+        Args:
+            statement: Statement producing `month` and `value_col` columns
+            arguments: Statement arguments (hashable)
+            series_name: Name for the resulting Series
+            relation: Relation to read (defaults to the monthly rollup)
+            value_col: Column holding the monthly values
+
+        Returns:
+            Pandas Series with PeriodIndex (monthly frequency) and float values
+        """
+        relation = relation or self.rollup_table
+        arguments = tuple(arguments)
+        calendar = self._calendar()
+        if calendar is not None:
+            statement = calendar_statement(statement, calendar, (value_col,))
+        return self._cached_series(
+            self._cache_key(statement.name, relation, arguments, series_name),
+            lambda: self._statement_table(statement, arguments, relation),
+            "month",
+            value_col,
+            series_name,
+        )
+
+    def _statement_table(
+        self,
+        statement: ParameterizedStatement,
+        arguments: Sequence[Any],
+        relation: Optional[str] = None,
+    ):
+        """Execute a statement and return its result as an Arrow table."""
+        relation = relation or self.rollup_table
+        with self._profile(statement=statement.name) as entry:
+            entry["scan"] = self._profile_scan(relation)
+            return (
+                execute_statement(self.con, statement, relation, arguments)
+                .arrow()
+                .read_all()
             )
-            if current_version != self._cache_version:
-                self._series_cache.clear()
-                self._cache_version = current_version
 
-            cache_key = (sql, date_col, value_col, series_name)
-            cached = self._series_cache.get(cache_key)
-            if cached is not None:
-                return cached.copy()
+    def _sql_table(self, sql: str):
+        """Execute ad hoc SQL over the ledger table and return an Arrow table."""
+        with self._profile(statement="sql") as entry:
+            entry["scan"] = self._profile_scan(self.table_name)
+            return self.con.execute(sql).arrow().read_all()
+
+    def _profile(self, **fields: Any) -> ContextManager[Dict[str, Any]]:
+        """Measure a query with the ledger's profiler, if it is profiling."""
+        profiler = getattr(self._ledger, "profiler", None)
+        if not isinstance(profiler, LedgerProfiler):
+            return nullcontext({})
+        return profiler.measure("query", **fields)
+
+    def _profile_scan(self, relation: str) -> Optional[Callable[[], int]]:
+        """Deferred row count of `relation` for the active profile entry."""
+        profiler = getattr(self._ledger, "profiler", None)
+        if not isinstance(profiler, LedgerProfiler):
+            return None
+        con, version = self.con, self._ledger.get_version()
+        return lambda: profiler.relation_rows(con, relation, version)
+
+    def _monthly_sum(
+        self,
+        series_name: str,
+        *,
+        purposes: Optional[Iterable] = None,
+        excluded_purposes: Optional[Iterable] = None,
+        categories: Optional[Iterable] = None,
+        subcategories: Optional[Iterable] = None,
+        excluded_subcategories: Optional[Iterable] = None,
+        is_ti: Optional[bool] = None,
+        is_lc: Optional[bool] = None,
+    ) -> pd.Series:
+        """
+        Monthly SUM(amount) of the rollup rows matching the given filters.
 
-            reader = self.con.execute(sql).arrow()
-            tbl = reader.read_all()
-            if tbl.num_rows == 0:
-                return pd.Series(dtype="float64", name=series_name)
+        Filters left as None are not applied. Enum members and strings are
+        accepted interchangeably.
 
-            # Extract columns directly to pandas without building an intermediate DataFrame
-            dates = pd.to_datetime(tbl[date_col].to_pandas(date_as_object=False))
-            values = tbl[value_col].to_pandas()
+        Returns:
+            Pandas Series with PeriodIndex (monthly frequency) and float values
+        """
+        return self._statement_to_series(
+            MONTHLY_SUM,
+            (
+                self._names(purposes),
+                self._names(excluded_purposes),
+                self._names(categories),
+                self._names(subcategories),
+                self._names(excluded_subcategories),
+                is_ti,
+                is_lc,
+            ),
+            series_name,
+        )
 
-            # Build Series and ensure month aggregation (DATE_TRUNC already monthly)
-            series = pd.Series(values.values, index=dates.values)
+    def _calendar(self) -> Optional[str]:
+        """
+        Calendar table the current query is joined onto, if any.
 
-            # Convert to PeriodIndex for compatibility with existing code expectations
-            series.index = pd.PeriodIndex(series.index, freq="M")
+        None unless the instance is timeline-bound; `arrays()` windows place
+        months by ordinal instead (see `_cached_array`).
+        """
+        if self.index is None:
+            return None
+        if getattr(self._local, "array_window", None) is not None:
+            return None
+        start = self.index[0].ordinal if len(self.index) else 0
+        return calendar_table(self.con, start, len(self.index))
 
-            # Reindex to full monthly range between first and last month (fill gaps with zeros)
-            if len(series.index) > 0:
-                full_range = pd.period_range(
-                    series.index.min(), series.index.max(), freq="M"
-                )
-                series = series.reindex(full_range, fill_value=0.0)
+    @staticmethod
+    def _names(values: Optional[Iterable]) -> Optional[Tuple[str, ...]]:
+        """Statement argument for a list of enum members or strings."""
+        if values is None:
+            return None
+        return tuple(enum_to_string(value) for value in values)
 
-            if series_name:
-                series.name = series_name
+    def _cached_series(
+        self,
+        cache_key: tuple,
+        fetch: Callable[[], Any],
+        date_col: str,
+        value_col: str,
+        series_name: Optional[str],
+    ) -> pd.Series:
+        """
+        Return a cached monthly Series, or fetch and convert the Arrow result.
 
-            # Store in cache and return
-            self._series_cache[cache_key] = series
-            return series.copy()
+        Args:
+            cache_key: Key built with `_cache_key()`
+            fetch: Callable returning the Arrow table on a cache miss
+            date_col: Column name containing date values
+            value_col: Column name containing numeric values
+            series_name: Name for the resulting Series
 
-        except Exception as e:
-            # Return empty series on any error to maintain compatibility
-            return pd.Series(dtype="float64", name=series_name)
+        Returns:
+            Pandas Series with PeriodIndex (monthly frequency) and float values
+        """
+        with self._profile() as entry:
+            if getattr(self._local, "array_window", None) is not None:
+                return self._cached_array(cache_key, fetch, date_col, value_col)
+
+            try:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    entry["cache"] = "hit"
+                    entry["rows"] = len(cached)
+                    return cached.copy()
+
+                entry["cache"] = "miss"
+                tbl = fetch()
+                entry["rows"] = tbl.num_rows
+                if self.index is not None:
+                    # One row per timeline month, already zero-filled in SQL
+                    series = pd.Series(
+                        tbl[value_col].to_numpy(),
+                        index=self.index,
+                        dtype="float64",
+                        name=series_name,
+                    )
+                    self._cache.put(cache_key, series)
+                    return series.copy()
+
+                if tbl.num_rows == 0:
+                    return pd.Series(dtype="float64", name=series_name)
+
+                # Extract columns directly to pandas without building an intermediate DataFrame
+                dates = pd.to_datetime(tbl[date_col].to_pandas(date_as_object=False))
+                values = tbl[value_col].to_pandas()
+
+                # Build Series and ensure month aggregation (DATE_TRUNC already monthly)
+                series = pd.Series(values.values, index=dates.values)
+
+                # Convert to PeriodIndex for compatibility with existing code expectations
+                series.index = pd.PeriodIndex(series.index, freq="M")
+
+                # Reindex to full monthly range between first and last month (fill gaps with zeros)
+                if len(series.index) > 0:
+                    full_range = pd.period_range(
+                        series.index.min(), series.index.max(), freq="M"
+                    )
+                    series = series.reindex(full_range, fill_value=0.0)
+
+                if series_name:
+                    series.name = series_name
+
+                # Store in cache and return
+                self._cache.put(cache_key, series)
+                return series.copy()
+
+            except Exception as e:
+                # Return empty series on any error to maintain compatibility
+                return pd.Series(dtype="float64", name=series_name)
+
+    def _cached_array(
+        self,
+        cache_key: tuple,
+        fetch: Callable[[], Any],
+        date_col: str,
+        value_col: str,
+    ) -> np.ndarray:
+        """
+        Return a cached monthly array for the current `arrays()` window.
+
+        Months are placed by subtracting the window's first month ordinal from
+        each result month's ordinal, without building a pandas index. The
+        cached array is read-only and returned as is.
+        """
+        start, length = self._local.array_window
+        key = cache_key + ("array", start, length)
+        with self._profile() as entry:
+            cached = self._cache.get(key)
+            entry["cache"] = "miss" if cached is None else "hit"
+            if cached is not None:
+                return cached
+
+            values = np.zeros(length, dtype="float64")
+            try:
+                tbl = fetch()
+                if tbl.num_rows > 0:
+                    months = (
+                        tbl[date_col]
+                        .to_numpy()
+                        .astype("datetime64[M]")
+                        .astype("int64")
+                    )
+                    positions = months - start
+                    inside = (positions >= 0) & (positions < length)
+                    values[positions[inside]] = tbl[value_col].to_numpy()[inside]
+            except Exception:
+                # Same fallback as the Series path: no data
+                values[:] = 0.0
+            values.flags.writeable = False
+
+            self._cache.put(key, values)
+            return values
+
+    def _cache_key(self, sql: str, *extra) -> tuple:
+        """Build a shared-cache key for `sql` at the current ledger version."""
+        version = (
+            self._ledger.get_version() if hasattr(self._ledger, "get_version") else -1
+        )
+        return QueryResultCache.make_key(sql, version, *extra)
 
     def _subcategory_in_clause(self, subcategories: list) -> str:
         """
@@ -351,6 +734,73 @@ class LedgerQueries:  # noqa: PLR0904
         quoted_subcategories = [f"'{sub}'" for sub in string_values]
         return f"({', '.join(quoted_subcategories)})"
 
+    def arrays(
+        self,
+        metrics: Iterable[str],
+        index: Union[pd.PeriodIndex, "Timeline"],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Monthly metrics as NumPy arrays aligned to a timeline.
+
+        Low-overhead alternative to the Series methods for callers that look
+        values up by period position (funding cascades, covenant loops).
+        Element `i` of each array is the metric for `index[i]`; months without
+        transactions are zero and months outside the index are dropped. Results
+        are cached like the Series methods and returned as read-only arrays
+        (not copies), so callers must not modify them in place.
+
+        Args:
+            metrics: Names of query methods listed in `ARRAY_METRICS`
+                (e.g. "noi", "debt_service")
+            index: Contiguous monthly PeriodIndex, or a Timeline
+
+        Returns:
+            Dict mapping each metric name to a float64 array of len(index)
+
+        Raises:
+            ValueError: If a metric is not available as an array or the index
+                is not a contiguous monthly PeriodIndex
+
+        Example:
+            ```python
+            arrays = queries.arrays(["noi", "debt_service"], timeline)
+            for i, period in enumerate(timeline.period_index):
+                excess = arrays["noi"][i] + arrays["debt_service"][i]
+            ```
+        """
+        metrics = list(metrics)
+        unknown = [metric for metric in metrics if metric not in ARRAY_METRICS]
+        if unknown:
+            raise ValueError(
+                f"Metrics not available as arrays: {unknown}. "
+                f"Supported: {sorted(ARRAY_METRICS)}"
+            )
+
+        index = _monthly_index(index)
+        start = index[0].ordinal if len(index) else 0
+
+        # (first month ordinal, length) while collecting results
+        self._local.array_window = (start, len(index))
+        try:
+            return {metric: getattr(self, metric)() for metric in metrics}
+        finally:
+            self._local.array_window = None
+
+    def array(
+        self, metric: str, index: Union[pd.PeriodIndex, "Timeline"]
+    ) -> np.ndarray:
+        """
+        One monthly metric as a read-only NumPy array; see `arrays()`.
+
+        Args:
+            metric: Name of a query method listed in `ARRAY_METRICS`
+            index: Contiguous monthly PeriodIndex, or a Timeline
+
+        Returns:
+            Float64 array of len(index)
+        """
+        return self.arrays([metric], index)[metric]
+
     # === Core Operating Metrics ===
 
     def pgr(self) -> pd.Series:
@@ -363,24 +813,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of potential gross revenue by period
         """
-        # Pure SQL implementation - NO PANDAS FALLBACK
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) as period,
-                SUM(amount) as total
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-                AND subcategory IN (
-                    '{enum_to_string(RevenueSubcategoryEnum.LEASE)}',
-                    '{enum_to_string(RevenueSubcategoryEnum.MISC)}',
-                    '{enum_to_string(RevenueSubcategoryEnum.RECOVERY)}'
-                )
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Potential Gross Revenue"
+        return self._monthly_sum(
+            "Potential Gross Revenue",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
+            subcategories=GROSS_REVENUE_SUBCATEGORIES,
         )
 
     def gpr(self) -> pd.Series:
@@ -392,20 +829,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of gross potential rent by period
         """
-        # Pure SQL implementation - NO PANDAS
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) as period,
-                SUM(amount) as total
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-                AND subcategory = '{enum_to_string(RevenueSubcategoryEnum.LEASE)}'
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Gross Potential Revenue"
+        return self._monthly_sum(
+            "Gross Potential Revenue",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
+            subcategories=[RevenueSubcategoryEnum.LEASE],
         )
 
     def tenant_revenue(self) -> pd.Series:
@@ -419,19 +847,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of tenant revenue by period
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-                AND subcategory IN {self._subcategory_in_clause(TENANT_REVENUE_SUBCATEGORIES)}
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Tenant Revenue"
+        return self._monthly_sum(
+            "Tenant Revenue",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
+            subcategories=TENANT_REVENUE_SUBCATEGORIES,
         )
 
     def vacancy_loss(self) -> pd.Series:
@@ -441,19 +861,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of vacancy losses by period (typically negative values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = '{enum_to_string(TransactionPurpose.OPERATING)}'
-                AND category = '{enum_to_string(CashFlowCategoryEnum.REVENUE)}'
-                AND subcategory = '{enum_to_string(RevenueSubcategoryEnum.VACANCY_LOSS)}'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Vacancy Loss"
+        return self._monthly_sum(
+            "Vacancy Loss",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
+            subcategories=[RevenueSubcategoryEnum.VACANCY_LOSS],
         )
 
     def egi(self) -> pd.Series:
@@ -466,18 +878,10 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of effective gross income by period
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Effective Gross Income"
+        return self._monthly_sum(
+            "Effective Gross Income",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
         )
 
     def opex(self) -> pd.Series:
@@ -487,19 +891,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of operating expenses by period (negative values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE category = '{enum_to_string(CashFlowCategoryEnum.EXPENSE)}'
-                AND subcategory = '{enum_to_string(ExpenseSubcategoryEnum.OPEX)}'
-                AND flow_purpose != '{enum_to_string(TransactionPurpose.VALUATION)}'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Operating Expenses"
+        return self._monthly_sum(
+            "Operating Expenses",
+            excluded_purposes=[TransactionPurpose.VALUATION],
+            categories=[CashFlowCategoryEnum.EXPENSE],
+            subcategories=OPERATING_EXPENSE_SUBCATEGORIES,
         )
 
     def noi(self) -> pd.Series:
@@ -511,18 +907,9 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of net operating income by period
         """
-        # Pure SQL implementation - NO PANDAS
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) as period,
-                SUM(amount) as total
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Net Operating Income"
+        return self._monthly_sum(
+            "Net Operating Income",
+            purposes=[TransactionPurpose.OPERATING],
         )
 
     def capex(self) -> pd.Series:
@@ -535,27 +922,16 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of capital expenditures by period (negative values)
         """
-        # Pure SQL implementation - NO PANDAS FALLBACKS
-        # Tiger Team Pattern: Use regexp_matches() for pattern exclusion
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE (
-                category = '{enum_to_string(CashFlowCategoryEnum.CAPITAL)}'
-                OR (
-                    category = '{enum_to_string(CashFlowCategoryEnum.EXPENSE)}'
-                    AND subcategory = '{enum_to_string(ExpenseSubcategoryEnum.CAPEX)}'
-                )
-            )
-            AND NOT regexp_matches(item_name, '^TI\\b|\\bTI\\b|Tenant Improvement|^LC\\b|\\bLC\\b|Leasing Commission', 'i')
-            AND subcategory NOT IN ('Purchase Price', 'Closing Costs', 'Transaction Costs', 'Other')
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Capital Expenditures"
+        # TI/LC rows are flagged by item_name pattern when rolled up (is_ti/is_lc)
+        return self._statement_to_series(
+            MONTHLY_CAPEX,
+            (
+                enum_to_string(CashFlowCategoryEnum.CAPITAL),
+                enum_to_string(CashFlowCategoryEnum.EXPENSE),
+                enum_to_string(ExpenseSubcategoryEnum.CAPEX),
+                self._names(CAPEX_EXCLUDED_SUBCATEGORIES),
+            ),
+            "Capital Expenditures",
         )
 
     def ti(self) -> pd.Series:
@@ -568,20 +944,8 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of tenant improvements by period (negative values)
         """
-        # Pure SQL implementation - NO PANDAS FALLBACKS
-        # Tiger Team Pattern: Use regexp_matches() for precise pattern matching
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE regexp_matches(item_name, '^TI\\b|\\bTI\\b|Tenant Improvement', 'i')
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Tenant Improvements"
-        )
+        # is_ti: item_name pattern match evaluated once at insert time
+        return self._monthly_sum("Tenant Improvements", is_ti=True)
 
     def lc(self) -> pd.Series:
         """
@@ -593,20 +957,306 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of leasing commissions by period (negative values)
         """
-        # Pure SQL implementation - NO PANDAS FALLBACKS
-        # Tiger Team Pattern: Use regexp_matches() for precise pattern matching
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE regexp_matches(item_name, '^LC\\b|\\bLC\\b|Leasing Commission', 'i')
-            GROUP BY period
-            
+        # is_lc: item_name pattern match evaluated once at insert time
+        return self._monthly_sum("Leasing Commissions", is_lc=True)
+
+    # === Multi-Aggregate Queries ===
+
+    def _aggregate_line_expressions(self) -> Dict[UnleveredAggregateLineKey, str]:
         """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Leasing Commissions"
+        Conditional-aggregation expressions for the unlevered aggregate lines.
+
+        Each expression applies the same filter as the corresponding single-line
+        method (pgr(), noi(), capex(), project_cash_flow(), ...) so that
+        aggregate_bundle() returns identical values from one rollup scan.
+        Keep these in sync with those methods.
+
+        Returns:
+            Mapping of aggregate key to SQL aggregate expression
+        """
+        operating = f"flow_purpose = '{enum_to_string(TransactionPurpose.OPERATING)}'"
+        operating_revenue = (
+            f"{operating} AND category = '{enum_to_string(CashFlowCategoryEnum.REVENUE)}'"
+        )
+
+        def revenue_subcategory(*subcategories) -> str:
+            return f"{operating_revenue} AND subcategory IN {self._subcategory_in_clause(list(subcategories))}"
+
+        capex_filter = f"""(
+                category = '{enum_to_string(CashFlowCategoryEnum.CAPITAL)}'
+                OR (
+                    category = '{enum_to_string(CashFlowCategoryEnum.EXPENSE)}'
+                    AND subcategory = '{enum_to_string(ExpenseSubcategoryEnum.CAPEX)}'
+                )
+            )
+            AND NOT (is_ti OR is_lc)
+            AND subcategory NOT IN {self._subcategory_in_clause(CAPEX_EXCLUDED_SUBCATEGORIES)}"""
+        opex_filter = (
+            f"category = '{enum_to_string(CashFlowCategoryEnum.EXPENSE)}'"
+            f" AND subcategory = '{enum_to_string(ExpenseSubcategoryEnum.OPEX)}'"
+            f" AND flow_purpose != '{enum_to_string(TransactionPurpose.VALUATION)}'"
+        )
+        capital_use = (
+            f"flow_purpose = '{enum_to_string(TransactionPurpose.CAPITAL_USE)}'"
+        )
+        disposition = f"""flow_purpose = '{enum_to_string(TransactionPurpose.CAPITAL_SOURCE)}'
+              AND subcategory NOT IN (
+                  '{enum_to_string(FinancingSubcategoryEnum.LOAN_PROCEEDS)}',
+                  '{enum_to_string(FinancingSubcategoryEnum.EQUITY_CONTRIBUTION)}',
+                  '{enum_to_string(FinancingSubcategoryEnum.REFINANCING_PROCEEDS)}'
+              )"""
+
+        def total(condition: str) -> str:
+            return f"SUM(amount) FILTER (WHERE {condition})"
+
+        keys = UnleveredAggregateLineKey
+        return {
+            keys.GROSS_POTENTIAL_RENT: total(
+                revenue_subcategory(RevenueSubcategoryEnum.LEASE)
+            ),
+            keys.POTENTIAL_GROSS_REVENUE: total(
+                revenue_subcategory(*GROSS_REVENUE_SUBCATEGORIES)
+            ),
+            keys.TENANT_REVENUE: total(
+                revenue_subcategory(*TENANT_REVENUE_SUBCATEGORIES)
+            ),
+            keys.RENTAL_ABATEMENT: total(
+                revenue_subcategory(RevenueSubcategoryEnum.ABATEMENT)
+            ),
+            keys.MISCELLANEOUS_INCOME: total(
+                revenue_subcategory(RevenueSubcategoryEnum.MISC)
+            ),
+            keys.GENERAL_VACANCY_LOSS: total(
+                revenue_subcategory(RevenueSubcategoryEnum.VACANCY_LOSS)
+            ),
+            keys.CREDIT_LOSS: total(
+                revenue_subcategory(RevenueSubcategoryEnum.CREDIT_LOSS)
+            ),
+            keys.EXPENSE_REIMBURSEMENTS: total(
+                revenue_subcategory(RevenueSubcategoryEnum.RECOVERY)
+            ),
+            keys.EFFECTIVE_GROSS_INCOME: total(operating_revenue),
+            keys.TOTAL_OPERATING_EXPENSES: total(opex_filter),
+            keys.NET_OPERATING_INCOME: total(operating),
+            keys.TOTAL_TENANT_IMPROVEMENTS: total("is_ti"),
+            keys.TOTAL_LEASING_COMMISSIONS: total("is_lc"),
+            keys.TOTAL_CAPITAL_EXPENDITURES: total(capex_filter),
+            # Same composition as project_cash_flow(): operations + (uses + proceeds)
+            keys.UNLEVERED_CASH_FLOW: (
+                f"COALESCE({total(operating)}, 0)"
+                f" + (COALESCE({total(capital_use)}, 0)"
+                f" + COALESCE({total(disposition)}, 0))"
+            ),
+        }
+
+    @staticmethod
+    def aggregate_line_masks(
+        category: Any, subcategory: Any, amounts: np.ndarray
+    ) -> Dict[UnleveredAggregateLineKey, np.ndarray]:
+        """
+        Rows of one series that each accumulable aggregate line sums.
+
+        Python counterpart of `_aggregate_line_expressions()` for the lines in
+        `ACCUMULABLE_AGGREGATE_LINES`, whose filters only read a row's
+        category, subcategory and flow purpose (TI, LC and CapEx also depend
+        on the item name). It lets callers keep running aggregate totals for
+        series as they are written, without querying the ledger. Keep the two
+        in sync.
+
+        Args:
+            category: Category of the series
+            subcategory: Subcategory of the series
+            amounts: Signed amounts as written to the ledger
+
+        Returns:
+            Mapping of aggregate key to boolean row mask; lines the series
+            never contributes to are omitted
+        """
+        amounts = np.asarray(amounts, dtype="float64")
+        purposes = FlowPurposeMapper.determine_purpose_array(
+            category, subcategory, amounts
+        )
+        category, subcategory = enum_to_string(category), enum_to_string(subcategory)
+
+        def purpose(value: TransactionPurpose) -> np.ndarray:
+            return purposes == enum_to_string(value)
+
+        operating = purpose(TransactionPurpose.OPERATING)
+        lines: Dict[UnleveredAggregateLineKey, np.ndarray] = {}
+        keys = UnleveredAggregateLineKey
+        if operating.any():
+            lines[keys.NET_OPERATING_INCOME] = operating
+        if category == enum_to_string(CashFlowCategoryEnum.REVENUE) and operating.any():
+            lines[keys.EFFECTIVE_GROSS_INCOME] = operating
+            for key, subcategories in (
+                (keys.GROSS_POTENTIAL_RENT, [RevenueSubcategoryEnum.LEASE]),
+                (keys.POTENTIAL_GROSS_REVENUE, GROSS_REVENUE_SUBCATEGORIES),
+                (keys.TENANT_REVENUE, TENANT_REVENUE_SUBCATEGORIES),
+                (keys.RENTAL_ABATEMENT, [RevenueSubcategoryEnum.ABATEMENT]),
+                (keys.MISCELLANEOUS_INCOME, [RevenueSubcategoryEnum.MISC]),
+                (keys.GENERAL_VACANCY_LOSS, [RevenueSubcategoryEnum.VACANCY_LOSS]),
+                (keys.CREDIT_LOSS, [RevenueSubcategoryEnum.CREDIT_LOSS]),
+                (keys.EXPENSE_REIMBURSEMENTS, [RevenueSubcategoryEnum.RECOVERY]),
+            ):
+                if subcategory in {enum_to_string(sub) for sub in subcategories}:
+                    lines[key] = operating
+        if category == enum_to_string(
+            CashFlowCategoryEnum.EXPENSE
+        ) and subcategory == enum_to_string(ExpenseSubcategoryEnum.OPEX):
+            lines[keys.TOTAL_OPERATING_EXPENSES] = ~purpose(
+                TransactionPurpose.VALUATION
+            )
+        # Same composition as project_cash_flow(): operations + (uses + proceeds)
+        cash_flow = operating | purpose(TransactionPurpose.CAPITAL_USE)
+        if subcategory not in {
+            enum_to_string(FinancingSubcategoryEnum.LOAN_PROCEEDS),
+            enum_to_string(FinancingSubcategoryEnum.EQUITY_CONTRIBUTION),
+            enum_to_string(FinancingSubcategoryEnum.REFINANCING_PROCEEDS),
+        }:
+            cash_flow |= purpose(TransactionPurpose.CAPITAL_SOURCE)
+        if cash_flow.any():
+            lines[keys.UNLEVERED_CASH_FLOW] = cash_flow
+        return {key: mask for key, mask in lines.items() if mask.any()}
+
+    def _aggregate_lines_statement(
+        self, expressions: Dict[UnleveredAggregateLineKey, str]
+    ) -> ParameterizedStatement:
+        """
+        Statement computing every tracked aggregate line by month.
+
+        All lines are computed on each execution: the rollup is small, and a
+        single statement (and result-cache entry) serves every subset
+        of keys requested through `aggregate_bundle()`.
+        """
+        select_list = ",\n                ".join(
+            f'{expression} AS "{key.name}"'
+            for key, expression in expressions.items()
         )
+        return ParameterizedStatement(
+            name="aggregate_lines",
+            template=f"""
+                SELECT
+                    DATE_TRUNC('month', date) AS month,
+                    {select_list}
+                FROM {{relation}}
+                GROUP BY month
+                ORDER BY month
+            """,
+            parameters=(),
+        )
+
+    def aggregate_bundle(
+        self,
+        keys: Optional[Iterable[UnleveredAggregateLineKey]] = None,
+        index: Optional[pd.PeriodIndex] = None,
+    ) -> pd.DataFrame:
+        """
+        Compute several unlevered aggregate lines in a single rollup scan.
+
+        Builds one conditional-aggregation query (`SUM(amount) FILTER (...)`
+        per line) grouped by month, instead of running one query and one
+        reindex per line. Values match the single-line methods (`pgr()`,
+        `noi()`, `capex()`, `project_cash_flow()`, ...).
+
+        Args:
+            keys: Aggregate lines to compute (defaults to all
+                UnleveredAggregateLineKey members). Lines not tracked in the
+                ledger (downtime/rollover vacancy) are returned as zeros.
+            index: Optional monthly PeriodIndex to align the result to (e.g. the
+                analysis timeline). Defaults to the instance's timeline, whose
+                calendar table is joined in SQL, or else the ledger's month
+                range.
+
+        Returns:
+            DataFrame indexed by monthly Period with one float column per key,
+            named by the key's value; missing months are filled with zeros
+
+        Example:
+            ```python
+            bundle = queries.aggregate_bundle(
+                [UnleveredAggregateLineKey.NET_OPERATING_INCOME,
+                 UnleveredAggregateLineKey.UNLEVERED_CASH_FLOW],
+                index=timeline.period_index,
+            )
+            noi = bundle[UnleveredAggregateLineKey.NET_OPERATING_INCOME.value]
+            ```
+        """
+        keys = list(
+            dict.fromkeys(keys if keys is not None else UnleveredAggregateLineKey)
+        )
+        columns = [key.value for key in keys]
+
+        expressions = self._aggregate_line_expressions()
+        tracked = [key for key in keys if key in expressions]
+        statement = self._aggregate_lines_statement(expressions)
+        calendar = self._calendar() if index is None else None
+        if calendar is not None:
+            index = self.index
+            statement = calendar_statement(
+                statement, calendar, [key.name for key in expressions]
+            )
+
+        cache_key = self._cache_key(
+            statement.name,
+            self.rollup_table,
+            "aggregate_bundle",
+            tuple(columns),
+            None if index is None else tuple(index),
+        )
+        with self._profile() as entry:
+            cached = self._cache.get(cache_key)
+            entry["cache"] = "miss" if cached is None else "hit"
+            if cached is not None:
+                return cached.copy()
+
+            if calendar is not None:
+                # One row per timeline month, already zero-filled in SQL
+                tbl = self._statement_table(statement, ()) if tracked else None
+                bundle = pd.DataFrame(
+                    {
+                        key.value: tbl[key.name].to_numpy() if key in tracked else 0.0
+                        for key in keys
+                    },
+                    index=index,
+                    dtype="float64",
+                )
+                entry["rows"] = len(bundle)
+                self._cache.put(cache_key, bundle)
+                return bundle.copy()
+
+            month_values = pd.DataFrame(columns=[key.value for key in tracked])
+            if tracked:
+                tbl = self._statement_table(statement, ())
+                if tbl.num_rows > 0:
+                    months = pd.PeriodIndex(
+                        pd.to_datetime(tbl["month"].to_pandas(date_as_object=False)),
+                        freq="M",
+                    )
+                    month_values = pd.DataFrame(
+                        {
+                            key.value: tbl[key.name].to_numpy(zero_copy_only=False)
+                            for key in tracked
+                        },
+                        index=months,
+                    )
+
+            if index is None:
+                if len(month_values.index) > 0:
+                    index = pd.period_range(
+                        month_values.index.min(), month_values.index.max(), freq="M"
+                    )
+                else:
+                    index = pd.PeriodIndex([], freq="M")
+
+            bundle = (
+                month_values.reindex(index=index, columns=columns)
+                .astype("float64")
+                .fillna(0.0)
+            )
+
+            entry["rows"] = len(bundle)
+            self._cache.put(cache_key, bundle)
+            return bundle.copy()
 
     # NOTE: No `ucf()` method by design. Use
     # - operational_cash_flow() for NOI − CapEx − TI − LC (operations only)
@@ -619,17 +1269,9 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of total capital uses by period (negative values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Capital Use'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Total Capital Uses"
+        return self._monthly_sum(
+            "Total Capital Uses",
+            purposes=[TransactionPurpose.CAPITAL_USE],
         )
 
     def total_sources(self) -> pd.Series:
@@ -639,17 +1281,9 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of total capital sources by period (positive values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Capital Source'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Total Capital Sources"
+        return self._monthly_sum(
+            "Total Capital Sources",
+            purposes=[TransactionPurpose.CAPITAL_SOURCE],
         )
 
     def uses_breakdown(self) -> pd.DataFrame:
@@ -659,32 +1293,7 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             DataFrame with capital expenditures organized by subcategory and time period
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                subcategory,
-                SUM(amount) AS amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Capital Use'
-            GROUP BY month, subcategory
-            ORDER BY month, subcategory
-        """
-
-        tbl = self.con.execute(sql).arrow().read_all()
-        if tbl.num_rows == 0:
-            return pd.DataFrame()
-
-        months = pd.PeriodIndex(
-            pd.to_datetime(tbl["month"].to_pandas(date_as_object=False)), freq="M"
-        )
-        subcats = tbl["subcategory"].to_pandas()
-        amounts = tbl["amount"].to_pandas()
-
-        df = pd.DataFrame({"month": months, "subcategory": subcats, "amount": amounts})
-        pivoted = df.pivot(
-            index="month", columns="subcategory", values="amount"
-        ).fillna(0.0)
-        return pivoted
+        return self._subcategory_breakdown(TransactionPurpose.CAPITAL_USE)
 
     def sources_breakdown(self) -> pd.DataFrame:
         """
@@ -693,20 +1302,24 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             DataFrame with capital funding sources organized by subcategory and time period
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                subcategory,
-                SUM(amount) AS amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Capital Source'
-            GROUP BY month, subcategory
-            ORDER BY month, subcategory
+        return self._subcategory_breakdown(TransactionPurpose.CAPITAL_SOURCE)
+
+    def _subcategory_breakdown(self, purpose: TransactionPurpose) -> pd.DataFrame:
         """
+        Monthly totals per subcategory for one flow purpose, pivoted wide.
 
-        tbl = self.con.execute(sql).arrow().read_all()
+        Timeline-bound instances join the calendar table in SQL, so every
+        timeline month has a row (zeros where nothing was recorded).
+        """
+        statement = MONTHLY_SUBCATEGORY_SUM
+        calendar = self._calendar()
+        if calendar is not None:
+            statement = calendar_statement(
+                statement, calendar, ("amount",), keys=("subcategory",)
+            )
+        tbl = self._statement_table(statement, (enum_to_string(purpose),))
         if tbl.num_rows == 0:
-            return pd.DataFrame()
+            return pd.DataFrame(index=self.index) if calendar else pd.DataFrame()
 
         months = pd.PeriodIndex(
             pd.to_datetime(tbl["month"].to_pandas(date_as_object=False)), freq="M"
@@ -727,17 +1340,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of debt proceeds by period (positive values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE category = 'Financing'
-                AND subcategory IN {self._subcategory_in_clause(DEBT_FUNDING_SUBCATEGORIES)}
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(sql, "month", "total_amount", "Debt Draws")
+        return self._monthly_sum(
+            "Debt Draws",
+            categories=[CashFlowCategoryEnum.FINANCING],
+            subcategories=DEBT_FUNDING_SUBCATEGORIES,
+        )
 
     def debt_service(self) -> pd.Series:
         """
@@ -764,18 +1371,11 @@ class LedgerQueries:  # noqa: PLR0904
         See Also:
             - QUERY_DEFINITIONS.md Section 7 for canonical definition
         """
-        # Pure SQL implementation - NO PANDAS FALLBACKS
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE category = '{enum_to_string(CashFlowCategoryEnum.FINANCING)}'
-              AND subcategory IN {self._subcategory_in_clause(ALL_DEBT_OUTFLOWS_SUBCATEGORIES)}
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(sql, "period", "total", "Debt Service")
+        return self._monthly_sum(
+            "Debt Service",
+            categories=[CashFlowCategoryEnum.FINANCING],
+            subcategories=ALL_DEBT_OUTFLOWS_SUBCATEGORIES,
+        )
 
     def recurring_debt_service(self) -> pd.Series:
         """
@@ -819,19 +1419,10 @@ class LedgerQueries:  # noqa: PLR0904
             debt_total = queries.debt_service()  # Includes payoffs
             ```
         """
-        # Pure SQL implementation - uses DEBT_SERVICE_SUBCATEGORIES only
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE category = '{enum_to_string(CashFlowCategoryEnum.FINANCING)}'
-              AND subcategory IN {self._subcategory_in_clause(DEBT_SERVICE_SUBCATEGORIES)}
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Recurring Debt Service"
+        return self._monthly_sum(
+            "Recurring Debt Service",
+            categories=[CashFlowCategoryEnum.FINANCING],
+            subcategories=DEBT_SERVICE_SUBCATEGORIES,
         )
 
     def sweep_deposits(self) -> pd.Series:
@@ -861,17 +1452,11 @@ class LedgerQueries:  # noqa: PLR0904
             - PartnershipAnalyzer: Uses this to prevent double-distribution
             - CashSweep: Posts these transactions via covenant processing
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE category = '{enum_to_string(CashFlowCategoryEnum.FINANCING)}'
-              AND subcategory = '{enum_to_string(FinancingSubcategoryEnum.CASH_SWEEP_DEPOSIT)}'
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(sql, "period", "total", "Sweep Deposits")
+        return self._monthly_sum(
+            "Sweep Deposits",
+            categories=[CashFlowCategoryEnum.FINANCING],
+            subcategories=[FinancingSubcategoryEnum.CASH_SWEEP_DEPOSIT],
+        )
 
     def sweep_prepayments(self) -> pd.Series:
         """
@@ -900,18 +1485,10 @@ class LedgerQueries:  # noqa: PLR0904
             - PartnershipAnalyzer: Uses this to prevent double-distribution
             - CashSweep: Posts these transactions via covenant processing
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE category = '{enum_to_string(CashFlowCategoryEnum.FINANCING)}'
-              AND subcategory = '{enum_to_string(FinancingSubcategoryEnum.SWEEP_PREPAYMENT)}'
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Sweep Prepayments"
+        return self._monthly_sum(
+            "Sweep Prepayments",
+            categories=[CashFlowCategoryEnum.FINANCING],
+            subcategories=[FinancingSubcategoryEnum.SWEEP_PREPAYMENT],
         )
 
     def equity_contributions(self) -> pd.Series:
@@ -923,19 +1500,10 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of equity contributions by period (positive values)
         """
-        # Pure SQL implementation - NO PANDAS FALLBACKS
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE category = '{enum_to_string(CashFlowCategoryEnum.FINANCING)}'
-              AND subcategory = '{enum_to_string(FinancingSubcategoryEnum.EQUITY_CONTRIBUTION)}'
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Equity Contributions"
+        return self._monthly_sum(
+            "Equity Contributions",
+            categories=[CashFlowCategoryEnum.FINANCING],
+            subcategories=[FinancingSubcategoryEnum.EQUITY_CONTRIBUTION],
         )
 
     def equity_distributions(self) -> pd.Series:
@@ -948,18 +1516,10 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of equity distributions by period (negative values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE category = '{enum_to_string(CashFlowCategoryEnum.FINANCING)}'
-              AND subcategory = '{enum_to_string(FinancingSubcategoryEnum.EQUITY_DISTRIBUTION)}'
-            GROUP BY period
-            
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Equity Distributions"
+        return self._monthly_sum(
+            "Equity Distributions",
+            categories=[CashFlowCategoryEnum.FINANCING],
+            subcategories=[FinancingSubcategoryEnum.EQUITY_DISTRIBUTION],
         )
 
     # NOTE: Prefetch methods removed for clarity; individual queries are cached per ledger version
@@ -992,7 +1552,7 @@ class LedgerQueries:  # noqa: PLR0904
         """
         con = self._ledger.get_query_connection()
         sql = f"""
-            SELECT DISTINCT entity_id, entity_type
+            SELECT DISTINCT entity_id, entity_type::VARCHAR AS entity_type
             FROM {self.table_name}
             WHERE entity_type IN ('GP','LP')
         """
@@ -1013,19 +1573,16 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of partner cash flows by period
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE entity_id = '{partner_id}'
-                AND category = 'Financing'
-                AND subcategory IN {self._subcategory_in_clause(EQUITY_PARTNER_SUBCATEGORIES)}
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Partner Flows"
+        return self._statement_to_series(
+            MONTHLY_ENTITY_SUM,
+            (
+                str(partner_id),
+                None,
+                enum_to_string(CashFlowCategoryEnum.FINANCING),
+                self._names(EQUITY_PARTNER_SUBCATEGORIES),
+            ),
+            "Partner Flows",
+            relation=self.table_name,
         )
 
     def gp_distributions(self) -> pd.Series:
@@ -1035,19 +1592,19 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of GP distributions by period (negative values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE category = 'Financing'
-                AND subcategory IN ('Equity Distribution', 'Promote')
-                AND entity_type = 'GP'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "GP Distributions"
+        return self._statement_to_series(
+            MONTHLY_ENTITY_SUM,
+            (
+                None,
+                ("GP",),
+                enum_to_string(CashFlowCategoryEnum.FINANCING),
+                self._names([
+                        FinancingSubcategoryEnum.EQUITY_DISTRIBUTION,
+                        FinancingSubcategoryEnum.PROMOTE,
+                    ]),
+            ),
+            "GP Distributions",
+            relation=self.table_name,
         )
 
     def lp_distributions(self) -> pd.Series:
@@ -1057,19 +1614,19 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of LP distributions by period (negative values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE category = 'Financing'
-                AND subcategory IN ('Equity Distribution', 'Preferred Return')
-                AND entity_type = 'LP'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "LP Distributions"
+        return self._statement_to_series(
+            MONTHLY_ENTITY_SUM,
+            (
+                None,
+                ("LP",),
+                enum_to_string(CashFlowCategoryEnum.FINANCING),
+                self._names([
+                        FinancingSubcategoryEnum.EQUITY_DISTRIBUTION,
+                        FinancingSubcategoryEnum.PREFERRED_RETURN,
+                    ]),
+            ),
+            "LP Distributions",
+            relation=self.table_name,
         )
 
     def rental_abatement(self) -> pd.Series:
@@ -1079,19 +1636,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of rental abatements by period (negative values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-                AND subcategory = 'Abatement'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Rental Abatement"
+        return self._monthly_sum(
+            "Rental Abatement",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
+            subcategories=[RevenueSubcategoryEnum.ABATEMENT],
         )
 
     def credit_loss(self) -> pd.Series:
@@ -1101,19 +1650,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of credit losses by period (negative values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-                AND subcategory = 'Credit Loss'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Credit Loss"
+        return self._monthly_sum(
+            "Credit Loss",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
+            subcategories=[RevenueSubcategoryEnum.CREDIT_LOSS],
         )
 
     def misc_income(self) -> pd.Series:
@@ -1123,19 +1664,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of miscellaneous income by period (positive values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-                AND subcategory = 'Miscellaneous'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Miscellaneous Income"
+        return self._monthly_sum(
+            "Miscellaneous Income",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
+            subcategories=[RevenueSubcategoryEnum.MISC],
         )
 
     def expense_reimbursements(self) -> pd.Series:
@@ -1145,19 +1678,11 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of expense reimbursements by period (positive values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-                AND subcategory = 'Recovery'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Expense Reimbursements"
+        return self._monthly_sum(
+            "Expense Reimbursements",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
+            subcategories=[RevenueSubcategoryEnum.RECOVERY],
         )
 
     def revenue(self) -> pd.Series:
@@ -1167,18 +1692,10 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of total revenue by period
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Operating'
-                AND category = 'Revenue'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Total Revenue"
+        return self._monthly_sum(
+            "Total Revenue",
+            purposes=[TransactionPurpose.OPERATING],
+            categories=[CashFlowCategoryEnum.REVENUE],
         )
 
     # === Complex Analysis Methods ===
@@ -1196,17 +1713,11 @@ class LedgerQueries:  # noqa: PLR0904
         # Convert Period to date string for SQL
         date_str = date.to_timestamp().strftime("%Y-%m-%d")
 
-        sql = f"""
-            SELECT amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Valuation'
-                AND DATE_TRUNC('month', date) = DATE_TRUNC('month', DATE '{date_str}')
-                AND category = 'Valuation'
-            ORDER BY date DESC
-            LIMIT 1
-        """
-
-        result = self.con.execute(sql).fetchone()
+        with self._profile(statement=VALUATION_AT.name) as entry:
+            entry["scan"] = self._profile_scan(self.table_name)
+            result = execute_statement(
+                self.con, VALUATION_AT, self.table_name, (date_str,)
+            ).fetchone()
         return float(result[0]) if result else 0.0
 
     def asset_valuations(self) -> pd.Series:
@@ -1240,23 +1751,15 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Series of capital uses by subcategory
         """
-        date_filter = ""
+        date_str = None
         if as_of_date:
             date_str = as_of_date.to_timestamp().strftime("%Y-%m-%d")
-            date_filter = f"AND date <= DATE '{date_str}'"
-
-        sql = f"""
-            SELECT 
-                subcategory,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Capital Use'
-                {date_filter}
-            GROUP BY subcategory
-            
-        """
 
-        tbl = self.con.execute(sql).arrow().read_all()
+        tbl = self._statement_table(
+            SUBCATEGORY_SUM,
+            (enum_to_string(TransactionPurpose.CAPITAL_USE), date_str),
+            relation=self.table_name,
+        )
         if tbl.num_rows == 0:
             return pd.Series(dtype="float64", name="Capital Uses by Category")
 
@@ -1276,23 +1779,15 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Series of capital sources by subcategory
         """
-        date_filter = ""
+        date_str = None
         if as_of_date:
             date_str = as_of_date.to_timestamp().strftime("%Y-%m-%d")
-            date_filter = f"AND date <= DATE '{date_str}'"
-
-        sql = f"""
-            SELECT 
-                subcategory,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE flow_purpose = 'Capital Source'
-                {date_filter}
-            GROUP BY subcategory
-            
-        """
 
-        tbl = self.con.execute(sql).arrow().read_all()
+        tbl = self._statement_table(
+            SUBCATEGORY_SUM,
+            (enum_to_string(TransactionPurpose.CAPITAL_SOURCE), date_str),
+            relation=self.table_name,
+        )
         if tbl.num_rows == 0:
             return pd.Series(dtype="float64", name="Capital Sources by Category")
 
@@ -1356,17 +1851,9 @@ class LedgerQueries:  # noqa: PLR0904
             avg_monthly_ocf = ocf.mean()
             ```
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE flow_purpose = '{enum_to_string(TransactionPurpose.OPERATING)}'
-            GROUP BY period
-            ORDER BY period
-        """
-        return self._execute_query_to_series(
-            sql, "period", "total", "Operational Cash Flow"
+        return self._monthly_sum(
+            "Operational Cash Flow",
+            purposes=[TransactionPurpose.OPERATING],
         )
 
     def project_cash_flow(self) -> pd.Series:
@@ -1414,37 +1901,18 @@ class LedgerQueries:  # noqa: PLR0904
         # Get operational cash flows using corrected SQL methods
         operational_cf = self.operational_cash_flow()
 
-        # Get capital uses using pure SQL
-        capital_uses_sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE flow_purpose = '{enum_to_string(TransactionPurpose.CAPITAL_USE)}'
-            GROUP BY period
-            
-        """
-        capital_uses = self._execute_query_to_series(
-            capital_uses_sql, "period", "total", "Capital Uses"
+        # Capital uses and disposition proceeds (excluding financing sources)
+        capital_uses = self._monthly_sum(
+            "Capital Uses", purposes=[TransactionPurpose.CAPITAL_USE]
         )
-
-        # Get disposition proceeds using pure SQL (exclude financing sources)
-        disposition_sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS period,
-                SUM(amount) AS total
-            FROM {self.table_name}
-            WHERE flow_purpose = '{enum_to_string(TransactionPurpose.CAPITAL_SOURCE)}'
-              AND subcategory NOT IN (
-                  '{enum_to_string(FinancingSubcategoryEnum.LOAN_PROCEEDS)}',
-                  '{enum_to_string(FinancingSubcategoryEnum.EQUITY_CONTRIBUTION)}',
-                  '{enum_to_string(FinancingSubcategoryEnum.REFINANCING_PROCEEDS)}'
-              )
-            GROUP BY period
-            
-        """
-        disposition_proceeds = self._execute_query_to_series(
-            disposition_sql, "period", "total", "Disposition Proceeds"
+        disposition_proceeds = self._monthly_sum(
+            "Disposition Proceeds",
+            purposes=[TransactionPurpose.CAPITAL_SOURCE],
+            excluded_subcategories=[
+                FinancingSubcategoryEnum.LOAN_PROCEEDS,
+                FinancingSubcategoryEnum.EQUITY_CONTRIBUTION,
+                FinancingSubcategoryEnum.REFINANCING_PROCEEDS,
+            ],
         )
 
         # Combine capital flows using pandas arithmetic (tiger team approved)
@@ -1532,21 +2000,21 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of cumulative debt balance by period
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(CASE 
-                    WHEN subcategory IN {self._subcategory_in_clause(DEBT_INCREASE_SUBCATEGORIES)} THEN amount
-                    WHEN subcategory IN {self._subcategory_in_clause(DEBT_DECREASE_SUBCATEGORIES)} THEN -amount
-                    ELSE 0 
-                END) AS balance_change
-            FROM {self.table_name}
-            WHERE category = 'Financing'
-            GROUP BY month
-            ORDER BY month
-        """
-
-        tbl = self.con.execute(sql).arrow().read_all()
+        arguments = (
+            enum_to_string(CashFlowCategoryEnum.FINANCING),
+            self._names(DEBT_INCREASE_SUBCATEGORIES),
+            self._names(DEBT_DECREASE_SUBCATEGORIES),
+        )
+        if self.index is not None:
+            # Zero-filled monthly changes, so the balance carries across gaps
+            return self._statement_to_series(
+                MONTHLY_DEBT_BALANCE_CHANGE,
+                arguments,
+                "Debt Balance",
+                value_col="balance_change",
+            ).cumsum()
+
+        tbl = self._statement_table(MONTHLY_DEBT_BALANCE_CHANGE, arguments)
         if tbl.num_rows == 0:
             return pd.Series(dtype="float64", name="Debt Balance")
 
@@ -1566,18 +2034,10 @@ class LedgerQueries:  # noqa: PLR0904
         Returns:
             Time series of construction draws by period (positive values)
         """
-        sql = f"""
-            SELECT 
-                DATE_TRUNC('month', date) AS month,
-                SUM(amount) AS total_amount
-            FROM {self.table_name}
-            WHERE category = 'Financing'
-                AND subcategory = 'Construction Draw'
-            GROUP BY month
-            
-        """
-        return self._execute_query_to_series(
-            sql, "month", "total_amount", "Construction Draws"
+        return self._monthly_sum(
+            "Construction Draws",
+            categories=[CashFlowCategoryEnum.FINANCING],
+            subcategories=["Construction Draw"],
         )
 
     def cumulative_construction_draws(self) -> pd.Series:
@@ -1609,11 +2069,11 @@ class LedgerQueries:  # noqa: PLR0904
             ORDER BY date
         """
 
-        tbl = self.con.execute(sql).arrow().read_all()
+        tbl = self._sql_table(sql)
         if tbl.num_rows == 0:
             return pd.DataFrame()
 
         dates = pd.to_datetime(tbl["date"].to_pandas(date_as_object=False))
-        df = tbl.to_pandas()
+        df = arrow_to_pandas(tbl)
         df["date"] = dates
         return df
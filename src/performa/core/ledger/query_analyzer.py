@@ -5,18 +5,25 @@
 DuckDB Query Performance Analysis Utilities.
 
 This module provides utilities for analyzing and optimizing DuckDB queries
-using EXPLAIN ANALYZE and performance profiling capabilities.
+using EXPLAIN ANALYZE and performance profiling capabilities, plus the
+`LedgerProfiler` behind `Ledger(profile=True)`, which times every query and
+insert a ledger runs during an analysis.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import re
+import sys
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import duckdb
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -336,3 +343,220 @@ class DuckDBQueryAnalyzer:
             logger.info("DuckDB profiling disabled")
         except Exception as e:
             logger.warning(f"Could not disable profiling: {e}")
+
+
+# Analysis passes labelled by DealCalculator.run (see Ledger.analysis_pass)
+ANALYSIS_PASSES: Tuple[str, ...] = (
+    "asset",
+    "acquisition",
+    "valuation",
+    "debt",
+    "disposition",
+    "cash_flow",
+    "partnership",
+)
+
+# Frames in these directories are ledger internals when attributing a query
+_LEDGER_PACKAGE = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_CONTEXTLIB = os.path.dirname(os.path.abspath(contextmanager.__code__.co_filename))
+
+
+def _calling_method(frame: Any) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Attribute a ledger operation to the method a caller invoked.
+
+    Walks up from `frame` through the ledger package and returns the
+    outermost public ledger method on the stack (e.g. "LedgerQueries.noi"),
+    or the outermost ledger frame if none is public, plus the function
+    outside the package that called it ("module.qualname").
+    """
+    method = fallback = None
+    while frame is not None:
+        code = frame.f_code
+        filename = os.path.abspath(code.co_filename)
+        if filename.startswith(_LEDGER_PACKAGE):
+            name = getattr(code, "co_qualname", code.co_name)
+            if not name.startswith("LedgerProfiler."):
+                fallback = name
+                if not code.co_name.startswith("_"):
+                    method = name
+        elif os.path.dirname(filename) != _CONTEXTLIB and fallback is not None:
+            module = frame.f_globals.get("__name__", "?")
+            qualname = getattr(code, "co_qualname", code.co_name)
+            return method or fallback, f"{module}.{qualname}"
+        frame = frame.f_back
+    return method or fallback, None
+
+
+class LedgerProfiler:
+    """
+    Records wall time, rows and cache outcome of ledger queries and inserts.
+
+    Enabled with `Ledger(profile=True)` or temporarily with
+    `ledger.profiling()`. Each record is attributed to the public ledger
+    method that was called (e.g. `LedgerQueries.noi`, `Ledger.add_series`),
+    the function that called it, and the analysis pass running at the time
+    (labelled by `DealCalculator.run` through `Ledger.analysis_pass`).
+    `rows_scanned` is the size of the table or rollup a query reads (DuckDB
+    scans ledger relations without indexes), counted once per ledger version
+    outside the timed region.
+
+    Nested operations (e.g. the rollup maintenance within an insert, or the
+    statement run on a result-cache miss) are folded into the outermost one.
+
+    Example:
+        ```python
+        ledger = Ledger(profile=True)
+        results = analyze(deal, timeline, ledger=ledger)
+        results.levered_irr
+        print(ledger.profiler.report().head(10))
+        ```
+    """
+
+    COLUMNS: Tuple[str, ...] = (
+        "kind",
+        "method",
+        "caller",
+        "analysis_pass",
+        "statement",
+        "wall_ms",
+        "rows",
+        "rows_scanned",
+        "cache",
+    )
+
+    def __init__(self) -> None:
+        self._records: List[Tuple[Any, ...]] = []
+        self._lock = threading.Lock()
+        # Per-thread analysis pass and active measurement
+        self._local = threading.local()
+        # Rows per (relation, ledger version), so each size is counted once
+        self._relation_rows: Dict[Tuple[Any, ...], int] = {}
+
+    @contextmanager
+    def analysis_pass(self, name: str) -> Iterator[None]:
+        """Attribute operations on this thread to an analysis pass."""
+        previous = getattr(self._local, "analysis_pass", None)
+        self._local.analysis_pass = name
+        try:
+            yield
+        finally:
+            self._local.analysis_pass = previous
+
+    @contextmanager
+    def measure(self, kind: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time one ledger operation.
+
+        Yields a dict the caller fills in: `rows` (rows returned or
+        inserted), `cache` ("hit" or "miss"), `statement` (statement name)
+        and `scan` (callable returning rows scanned, run after timing).
+        Within an active measurement (e.g. the flush a query triggers) no
+        record is added; the inner entry only fills the outer entry's unset
+        fields.
+
+        Args:
+            kind: "query" or "insert"
+            **fields: Initial entry fields
+        """
+        active = getattr(self._local, "entry", None)
+        if active is not None:
+            inner: Dict[str, Any] = dict(fields)
+            try:
+                yield inner
+            finally:
+                for key, value in inner.items():
+                    if active.get(key) is None:
+                        active[key] = value
+            return
+
+        entry: Dict[str, Any] = dict(fields)
+        self._local.entry = entry
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            wall_ms = (time.perf_counter() - start) * 1000.0
+            self._local.entry = None
+            method, caller = _calling_method(sys._getframe(1))
+            scan = entry.get("scan")
+            record = (
+                kind,
+                method,
+                caller,
+                getattr(self._local, "analysis_pass", None),
+                entry.get("statement"),
+                wall_ms,
+                entry.get("rows"),
+                scan() if callable(scan) else scan,
+                entry.get("cache"),
+            )
+            with self._lock:
+                self._records.append(record)
+
+    def relation_rows(
+        self, con: duckdb.DuckDBPyConnection, relation: str, version: int
+    ) -> int:
+        """Row count of a relation at a ledger version (memoized)."""
+        key = (id(con), relation, version)
+        rows = self._relation_rows.get(key)
+        if rows is None:
+            rows = con.execute(f"SELECT COUNT(*) FROM {relation}").fetchone()[0]
+            self._relation_rows[key] = rows
+        return rows
+
+    def records(self) -> pd.DataFrame:
+        """
+        Every recorded operation, in order.
+
+        Returns:
+            DataFrame with the `COLUMNS` columns, one row per operation
+        """
+        with self._lock:
+            records = list(self._records)
+        return pd.DataFrame(records, columns=list(self.COLUMNS))
+
+    def report(
+        self, by: Union[str, Sequence[str]] = ("analysis_pass", "method")
+    ) -> pd.DataFrame:
+        """
+        Operations grouped and summed, slowest groups first.
+
+        Args:
+            by: Record column(s) to group by (e.g. "method", "caller",
+                ("analysis_pass", "statement"))
+
+        Returns:
+            DataFrame indexed by the group columns with calls, total_ms,
+            mean_ms, max_ms, rows, rows_scanned, cache_hits and cache_misses
+
+        Raises:
+            ValueError: If a group column is not a record column
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        unknown = [column for column in by if column not in self.COLUMNS]
+        if unknown:
+            raise ValueError(
+                f"Unknown profile column(s): {', '.join(unknown)} "
+                f"(use {', '.join(self.COLUMNS)})"
+            )
+        records = self.records()
+        records["cache_hits"] = records["cache"] == "hit"
+        records["cache_misses"] = records["cache"] == "miss"
+        report = records.groupby(by, dropna=False, sort=False).agg(
+            calls=("wall_ms", "size"),
+            total_ms=("wall_ms", "sum"),
+            mean_ms=("wall_ms", "mean"),
+            max_ms=("wall_ms", "max"),
+            rows=("rows", "sum"),
+            rows_scanned=("rows_scanned", "sum"),
+            cache_hits=("cache_hits", "sum"),
+            cache_misses=("cache_misses", "sum"),
+        )
+        return report.sort_values("total_ms", ascending=False)
+
+    def reset(self) -> None:
+        """Discard all records."""
+        with self._lock:
+            self._records.clear()
+            self._relation_rows.clear()
@@ -0,0 +1,322 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Dictionary-encoded column types for the ledger transactions table.
+
+The low-cardinality classification columns (`flow_purpose`, `category`,
+`subcategory`, `entity_type`) are stored as DuckDB ENUM types whose values are
+derived from the Performa enums. Filters compare small integer codes instead
+of strings, and results arrive through Arrow as dictionary arrays that pandas
+reads directly as categoricals.
+
+Subcategories and entity types are open vocabularies (models may use plain
+strings), so the ledger widens a column's ENUM type when an unseen value is
+inserted; see `Ledger._register_enum_values`.
+
+The module also defines the shape of the monthly rollup table the ledger
+maintains alongside its transactions (see `rollup_select_sql`) and the
+aggregation applied on insert by summary-granularity ledgers
+(see `summary_select_sql`).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from performa.core.primitives import (
+    CapExCategoryEnum,
+    CapitalSubcategoryEnum,
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    FinancingSubcategoryEnum,
+    RevenueSubcategoryEnum,
+    TransactionPurpose,
+    ValuationSubcategoryEnum,
+)
+
+
+def _unique_values(*enums) -> Tuple[str, ...]:
+    """Collect enum values in declaration order without duplicates."""
+    values: Dict[str, None] = {}
+    for enum_cls in enums:
+        for member in enum_cls:
+            values.setdefault(member.value, None)
+    return tuple(values)
+
+
+# Entity types written by the deal analysis layer (partner kinds plus the
+# combined/single-owner markers used for partnership-level flows)
+ENTITY_TYPE_VALUES: Tuple[str, ...] = (
+    "GP",
+    "LP",
+    "Third Party",
+    "GP,LP",
+    "SingleOwner",
+)
+
+# Columns of the transactions table in declaration order
+LEDGER_COLUMNS: Tuple[str, ...] = (
+    "transaction_id",
+    "date",
+    "amount",
+    "flow_purpose",
+    "category",
+    "subcategory",
+    "item_name",
+    "source_id",
+    "asset_id",
+    "pass_num",
+    "deal_id",
+    "entity_id",
+    "entity_type",
+)
+
+# Normalized layout: per-row columns kept in the slim fact table ...
+FACT_COLUMNS: Tuple[str, ...] = ("transaction_id", "date", "amount", "flow_purpose")
+
+# ... and per-series columns stored once per row of the series dimension table
+SERIES_COLUMNS: Tuple[str, ...] = tuple(
+    column for column in LEDGER_COLUMNS if column not in FACT_COLUMNS
+)
+
+# Storage layouts accepted by `Ledger(layout=...)`
+LEDGER_LAYOUTS: Tuple[str, ...] = ("wide", "normalized")
+
+# Transaction id modes accepted by `Ledger(transaction_ids=...)`
+TRANSACTION_ID_MODES: Tuple[str, ...] = ("eager", "deferred")
+
+# Row granularities accepted by `Ledger(granularity=...)`
+LEDGER_GRANULARITIES: Tuple[str, ...] = ("full", "summary")
+
+# Categories written per line item (one series per lease or expense line);
+# summary-granularity ledgers store their monthly totals instead
+SUMMARY_CATEGORIES: Tuple[str, ...] = ("Revenue", "Expense")
+
+# Item-name patterns that classify tenant improvement and leasing commission rows
+TI_ITEM_PATTERN = r"^TI\b|\bTI\b|Tenant Improvement"
+LC_ITEM_PATTERN = r"^LC\b|\bLC\b|Leasing Commission"
+
+# Monthly rollup: one row per (month, classification) with the summed amount.
+# `date` holds the first day of the month so monthly queries read it unchanged.
+ROLLUP_KEY_COLUMNS: Tuple[str, ...] = (
+    "date",
+    "flow_purpose",
+    "category",
+    "subcategory",
+    "is_ti",
+    "is_lc",
+)
+
+# Columns identifying a group of rows for `Ledger.fingerprint()` and
+# `Ledger.diff()`; ids and pass numbers are left out (they vary between runs)
+CONTENT_KEY_COLUMNS: Tuple[str, ...] = (
+    "date",
+    "flow_purpose",
+    "category",
+    "subcategory",
+    "item_name",
+)
+
+# Column -> (ENUM type name, initial values)
+LEDGER_ENUM_COLUMNS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "flow_purpose": ("flow_purpose_enum", _unique_values(TransactionPurpose)),
+    "category": ("category_enum", _unique_values(CashFlowCategoryEnum)),
+    "subcategory": (
+        "subcategory_enum",
+        _unique_values(
+            CapitalSubcategoryEnum,
+            CapExCategoryEnum,
+            ExpenseSubcategoryEnum,
+            FinancingSubcategoryEnum,
+            RevenueSubcategoryEnum,
+            ValuationSubcategoryEnum,
+        ),
+    ),
+    "entity_type": ("entity_type_enum", ENTITY_TYPE_VALUES),
+}
+
+
+def enum_type_sql(type_name: str, values: Iterable[str]) -> str:
+    """
+    Build a CREATE TYPE statement for a DuckDB ENUM.
+
+    Args:
+        type_name: Name of the ENUM type to create
+        values: ENUM members in order
+
+    Returns:
+        SQL statement string
+    """
+    members = ", ".join("'" + value.replace("'", "''") + "'" for value in values)
+    return f"CREATE TYPE {type_name} AS ENUM ({members})"
+
+
+def rollup_select_sql(relation: str) -> str:
+    """
+    Build a SELECT summing ledger rows into monthly rollup rows.
+
+    Classification columns are stored as VARCHAR so the rollup never needs
+    ENUM widening; `is_ti`/`is_lc` carry the item-name classification used by
+    the TI, LC and CapEx queries (NULL when the item name is NULL, like the
+    regular expressions they replace).
+
+    Args:
+        relation: Table, view or parenthesized query with the ledger columns
+
+    Returns:
+        SQL producing the `ROLLUP_KEY_COLUMNS` followed by `amount`
+    """
+    return f"""
+        SELECT
+            DATE_TRUNC('month', date)::DATE AS date,
+            flow_purpose::VARCHAR AS flow_purpose,
+            category::VARCHAR AS category,
+            subcategory::VARCHAR AS subcategory,
+            regexp_matches(item_name, '{TI_ITEM_PATTERN}', 'i') AS is_ti,
+            regexp_matches(item_name, '{LC_ITEM_PATTERN}', 'i') AS is_lc,
+            SUM(amount) AS amount
+        FROM {relation}
+        GROUP BY ALL
+    """
+
+
+def content_groups_sql(relation: str, tolerance: float) -> str:
+    """
+    Build a SELECT summing ledger rows per `CONTENT_KEY_COLUMNS` group.
+
+    Classification columns are cast to VARCHAR, so ledgers whose ENUM types
+    were widened in a different order still compare equal. Each group's
+    amount is also returned as a count of `tolerance` units (`units`), which
+    is what fingerprints hash and diffs compare.
+
+    Args:
+        relation: Table, view or parenthesized query with the ledger columns
+        tolerance: Amount rounding step (positive)
+
+    Returns:
+        SQL producing the `CONTENT_KEY_COLUMNS` followed by `amount` and
+        `units`
+    """
+    return f"""
+        SELECT
+            date,
+            flow_purpose::VARCHAR AS flow_purpose,
+            category::VARCHAR AS category,
+            subcategory::VARCHAR AS subcategory,
+            item_name,
+            SUM(amount) AS amount,
+            CAST(ROUND(SUM(amount) / {float(tolerance)!r}) AS BIGINT) AS units
+        FROM {relation}
+        GROUP BY ALL
+    """
+
+
+def summary_select_sql(select_sql: str) -> str:
+    """
+    Wrap an insert SELECT so per-line-item rows arrive as monthly totals.
+
+    Rows in `SUMMARY_CATEGORIES` are summed into one row per (month,
+    flow_purpose, category, subcategory, asset, deal, pass, entity). Their
+    item name is replaced by the subcategory (or category) label, unless that
+    would change the TI/LC classification derived from the name, and their
+    source id is dropped. Rows of other categories (capital, financing,
+    valuation) pass through unchanged, since deal logic reads them by item
+    name (e.g. facility names).
+
+    Args:
+        select_sql: Query producing the ledger columns in `LEDGER_COLUMNS` order
+
+    Returns:
+        SQL producing the same columns with the line items summarized
+    """
+    columns = ", ".join(LEDGER_COLUMNS)
+    categories = ", ".join(f"'{category}'" for category in SUMMARY_CATEGORIES)
+    label = "COALESCE(subcategory::VARCHAR, category::VARCHAR)"
+    keys = (
+        "DATE_TRUNC('month', date)::DATE, flow_purpose, category, subcategory, "
+        "line_label, asset_id, pass_num, deal_id, entity_id, entity_type"
+    )
+    return f"""
+        WITH incoming AS (
+            SELECT * FROM ({select_sql}) AS rows ({columns})
+        ),
+        line_items AS (
+            SELECT
+                *,
+                CASE
+                    WHEN regexp_matches(item_name, '{TI_ITEM_PATTERN}', 'i')
+                            = regexp_matches({label}, '{TI_ITEM_PATTERN}', 'i')
+                        AND regexp_matches(item_name, '{LC_ITEM_PATTERN}', 'i')
+                            = regexp_matches({label}, '{LC_ITEM_PATTERN}', 'i')
+                    THEN {label}
+                    ELSE item_name
+                END AS line_label
+            FROM incoming
+            WHERE category::VARCHAR IN ({categories})
+        ),
+        summed AS (
+            SELECT
+                DATE_TRUNC('month', date)::DATE AS date,
+                SUM(amount) AS amount,
+                flow_purpose,
+                category,
+                subcategory,
+                line_label AS item_name,
+                asset_id,
+                pass_num,
+                deal_id,
+                entity_id,
+                entity_type
+            FROM line_items
+            GROUP BY {keys}
+        )
+        SELECT
+            uuid() AS transaction_id,
+            date,
+            amount,
+            flow_purpose,
+            category,
+            subcategory,
+            item_name,
+            NULL::UUID AS source_id,
+            asset_id,
+            pass_num,
+            deal_id,
+            entity_id,
+            entity_type
+        FROM summed
+        UNION ALL
+        SELECT * FROM incoming
+        WHERE category::VARCHAR NOT IN ({categories})
+    """
+
+
+def arrow_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert an Arrow result containing ENUM columns to pandas.
+
+    DuckDB exports ENUMs as dictionary arrays with unsigned indices, which
+    pyarrow cannot hand to pandas directly. Only the index type is cast, so
+    the columns still arrive as categoricals without decoding to strings.
+
+    Args:
+        table: Arrow table fetched from the ledger connection
+
+    Returns:
+        DataFrame with ENUM columns as pandas categoricals
+    """
+    fields = [
+        pa.field(field.name, pa.dictionary(pa.int32(), field.type.value_type))
+        if pa.types.is_dictionary(field.type)
+        and pa.types.is_unsigned_integer(field.type.index_type)
+        else field
+        for field in table.schema
+    ]
+    schema = pa.schema(fields)
+    if not schema.equals(table.schema):
+        table = table.cast(schema)
+    return table.to_pandas()
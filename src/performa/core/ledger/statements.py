@@ -0,0 +1,317 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parameterized statements for the ledger query layer.
+
+`LedgerQueries` answers its monthly aggregates with a small set of
+parameterized statements instead of assembling SQL text per call. Arguments
+are bound as `$n` parameters by `execute_statement`, never pasted into the
+SQL. Filters whose argument is NULL are skipped (and folded away by the
+planner), which lets one statement serve every method with the same shape.
+
+Arguments are plain strings, string lists, booleans and UUIDs; they double as
+stable result-cache keys (see `LedgerQueries._statement_to_series`).
+
+Timeline-bound queries (`LedgerQueries(ledger, timeline=...)`) join each
+statement onto a calendar table holding one row per timeline month
+(`calendar_table`), so results come back gap-filled and aligned in SQL.
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Sequence, Tuple
+
+import duckdb
+
+
+@dataclass(frozen=True)
+class ParameterizedStatement:
+    """
+    A parameterized SELECT over a ledger relation.
+
+    Attributes:
+        name: Identifier used in cache keys and query profiles
+        template: SQL with a `{relation}` placeholder and positional
+            parameters `$1`, `$2`, ...
+        parameters: Names of the positional parameters, in order
+    """
+
+    name: str
+    template: str
+    parameters: Tuple[str, ...]
+
+    def sql(self, relation: str) -> str:
+        """Render the statement for one relation."""
+        return self.template.format(relation=relation)
+
+
+# Monthly SUM(amount) with optional filters on the rollup columns
+MONTHLY_SUM = ParameterizedStatement(
+    name="monthly_sum",
+    template="""
+        SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS total
+        FROM {relation}
+        WHERE ($1::VARCHAR[] IS NULL OR list_contains($1, flow_purpose::VARCHAR))
+          AND ($2::VARCHAR[] IS NULL OR NOT list_contains($2, flow_purpose::VARCHAR))
+          AND ($3::VARCHAR[] IS NULL OR list_contains($3, category::VARCHAR))
+          AND ($4::VARCHAR[] IS NULL OR list_contains($4, subcategory::VARCHAR))
+          AND ($5::VARCHAR[] IS NULL OR NOT list_contains($5, subcategory::VARCHAR))
+          AND ($6::BOOLEAN IS NULL OR is_ti = $6)
+          AND ($7::BOOLEAN IS NULL OR is_lc = $7)
+        GROUP BY month
+    """,
+    parameters=(
+        "purposes",
+        "excluded_purposes",
+        "categories",
+        "subcategories",
+        "excluded_subcategories",
+        "is_ti",
+        "is_lc",
+    ),
+)
+
+# Capital expenditures: Capital rows plus Expense/CapEx rows, excluding TI/LC
+MONTHLY_CAPEX = ParameterizedStatement(
+    name="monthly_capex",
+    template="""
+        SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS total
+        FROM {relation}
+        WHERE (
+                category = $1
+                OR (category = $2 AND subcategory = $3)
+            )
+          AND NOT (is_ti OR is_lc)
+          AND NOT list_contains($4, subcategory::VARCHAR)
+        GROUP BY month
+    """,
+    parameters=(
+        "capital_category",
+        "expense_category",
+        "capex_subcategory",
+        "excluded_subcategories",
+    ),
+)
+
+# Monthly totals per subcategory for one flow purpose
+MONTHLY_SUBCATEGORY_SUM = ParameterizedStatement(
+    name="monthly_subcategory_sum",
+    template="""
+        SELECT
+            DATE_TRUNC('month', date) AS month,
+            subcategory::VARCHAR AS subcategory,
+            SUM(amount) AS amount
+        FROM {relation}
+        WHERE flow_purpose = $1
+        GROUP BY month, 2
+        ORDER BY month, subcategory
+    """,
+    parameters=("purpose",),
+)
+
+# Monthly change in outstanding debt
+MONTHLY_DEBT_BALANCE_CHANGE = ParameterizedStatement(
+    name="monthly_debt_balance_change",
+    template="""
+        SELECT
+            DATE_TRUNC('month', date) AS month,
+            SUM(CASE
+                WHEN list_contains($2, subcategory::VARCHAR) THEN amount
+                WHEN list_contains($3, subcategory::VARCHAR) THEN -amount
+                ELSE 0
+            END) AS balance_change
+        FROM {relation}
+        WHERE category = $1
+        GROUP BY month
+        ORDER BY month
+    """,
+    parameters=("category", "increase_subcategories", "decrease_subcategories"),
+)
+
+# Monthly SUM(amount) of partner rows (reads the transactions table)
+MONTHLY_ENTITY_SUM = ParameterizedStatement(
+    name="monthly_entity_sum",
+    template="""
+        SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS total
+        FROM {relation}
+        WHERE ($1::UUID IS NULL OR entity_id = $1)
+          AND ($2::VARCHAR[] IS NULL OR list_contains($2, entity_type::VARCHAR))
+          AND category = $3
+          AND list_contains($4, subcategory::VARCHAR)
+        GROUP BY month
+    """,
+    parameters=("entity_id", "entity_types", "category", "subcategories"),
+)
+
+# Totals per subcategory for one flow purpose, optionally up to a date
+SUBCATEGORY_SUM = ParameterizedStatement(
+    name="subcategory_sum",
+    template="""
+        SELECT subcategory::VARCHAR AS subcategory, SUM(amount) AS total_amount
+        FROM {relation}
+        WHERE flow_purpose = $1
+          AND ($2::DATE IS NULL OR date <= $2)
+        GROUP BY 1
+    """,
+    parameters=("purpose", "as_of_date"),
+)
+
+# Latest valuation recorded in the month of a date
+VALUATION_AT = ParameterizedStatement(
+    name="valuation_at",
+    template="""
+        SELECT amount
+        FROM {relation}
+        WHERE flow_purpose = 'Valuation'
+            AND DATE_TRUNC('month', date) = DATE_TRUNC('month', $1::DATE)
+            AND category = 'Valuation'
+        ORDER BY date DESC
+        LIMIT 1
+    """,
+    parameters=("date",),
+)
+
+
+# Calendar tables created per connection: (first month ordinal, length) -> name
+_calendars: "weakref.WeakKeyDictionary[Any, Dict[Tuple[int, int], str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def execute_statement(
+    con: duckdb.DuckDBPyConnection,
+    statement: ParameterizedStatement,
+    relation: str,
+    arguments: Sequence[Hashable],
+) -> duckdb.DuckDBPyConnection:
+    """
+    Execute a statement with its arguments bound as parameters.
+
+    Arguments never become part of the SQL text, so quoting is left to DuckDB
+    and the statement text for a relation is the same for every call.
+
+    Args:
+        con: DuckDB connection
+        statement: Statement to run
+        relation: Table, view or parenthesized query the statement reads
+        arguments: One value per `statement.parameters` entry
+
+    Returns:
+        The connection, positioned on the statement's result
+
+    Raises:
+        ValueError: If the number of arguments does not match the statement
+    """
+    if len(arguments) != len(statement.parameters):
+        raise ValueError(
+            f"{statement.name} expects {len(statement.parameters)} arguments "
+            f"({', '.join(statement.parameters)}), got {len(arguments)}"
+        )
+    return con.execute(statement.sql(relation), list(arguments))
+
+
+def calendar_table(con: duckdb.DuckDBPyConnection, start: int, length: int) -> str:
+    """
+    Name of a TEMP table listing `length` months from a month ordinal.
+
+    The table has one DATE column, `month` (first day of each month), and is
+    created once per connection and month range. Month ordinals count months
+    since 1970-01 (`pd.Period.ordinal`).
+
+    Args:
+        con: DuckDB connection
+        start: Ordinal of the first month
+        length: Number of months
+
+    Returns:
+        Table name
+    """
+    tables = _calendars.setdefault(con, {})
+    name = tables.get((start, length))
+    if name is None:
+        name = f"ledger_calendar_{start}_{length}".replace("-", "m")
+        con.execute(
+            f"""
+            CREATE OR REPLACE TEMP TABLE {name} AS
+            SELECT CAST(DATE '1970-01-01' + to_months(CAST({start} + i AS INTEGER))
+                        AS DATE) AS month
+            FROM range({length}) AS t(i)
+            """
+        )
+        tables[(start, length)] = name
+    return name
+
+
+def calendar_join_sql(
+    sql: str,
+    calendar: str,
+    values: Sequence[str],
+    keys: Sequence[str] = (),
+    date_col: str = "month",
+) -> str:
+    """
+    Join a monthly query onto a calendar table, zero-filling missing months.
+
+    The result has one row per calendar month (per month and key combination
+    when `keys` are given), ordered by month, with the calendar's `month`
+    column in place of `date_col`.
+
+    Args:
+        sql: Query with a `date_col` month column (any placeholders are kept)
+        calendar: Table from `calendar_table`
+        values: Numeric columns to carry over, NULL-filled as 0.0
+        keys: Grouping columns of the query (e.g. subcategory); every key
+            value found in the result is repeated for every month
+        date_col: Month column of the query
+
+    Returns:
+        SQL text
+    """
+    key_list = "".join(f'k."{key}", ' for key in keys)
+    value_list = ", ".join(
+        f'COALESCE(r."{value}", 0.0) AS "{value}"' for value in values
+    )
+    key_join = "".join(f' AND r."{key}" = k."{key}"' for key in keys)
+    key_order = "".join(f', k."{key}"' for key in keys)
+    key_source = (
+        "CROSS JOIN (SELECT DISTINCT "
+        + ", ".join(f'"{key}"' for key in keys)
+        + " FROM r) AS k"
+        if keys
+        else ""
+    )
+    return (
+        "WITH r AS (" + sql + ")\n"
+        f"SELECT c.month, {key_list}{value_list}\n"
+        f"FROM {calendar} AS c {key_source}\n"
+        f'LEFT JOIN r ON r."{date_col}" = c.month{key_join}\n'
+        f"ORDER BY c.month{key_order}"
+    )
+
+
+def calendar_statement(
+    statement: ParameterizedStatement,
+    calendar: str,
+    values: Sequence[str],
+    keys: Sequence[str] = (),
+) -> ParameterizedStatement:
+    """
+    A statement's result joined onto a calendar table (see `calendar_join_sql`).
+
+    Args:
+        statement: Statement producing a `month` column
+        calendar: Table from `calendar_table`
+        values: Numeric result columns, zero-filled for missing months
+        keys: Grouping columns of the statement
+
+    Returns:
+        Statement with the same parameters, named after the calendar
+    """
+    return ParameterizedStatement(
+        name=f"{statement.name}_on_{calendar}",
+        template=calendar_join_sql(statement.template, calendar, values, keys),
+        parameters=statement.parameters,
+    )
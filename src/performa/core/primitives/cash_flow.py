@@ -48,6 +48,8 @@ class CashFlowModel(Model):
     Notes:
         - ANNUAL frequency: Value divided by 12 and applied evenly each month
         - One-time expenses: Use CapitalItem, or pd.Series/dict with specific timing
+        - multiplicity > 1: One model stands for several identical units; its
+          cash flows are per unit (see CalculationSettings.unit_models)
 
     Reference Field:
         The `reference` field supports three types of calculations:
@@ -84,6 +86,15 @@ class CashFlowModel(Model):
     reference: Optional[ReferenceKey] = None
     settings: GlobalSettings = Field(default_factory=GlobalSettings)
     growth_rate: Optional[PercentageGrowthRate] = None
+    multiplicity: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of identical units this model stands for (e.g. the units of "
+            "a floor plan). Cash flows are computed once per model and scaled, "
+            "or attributed to each unit, when written to the ledger."
+        ),
+    )
 
     @field_validator("value")
     @classmethod
@@ -173,6 +184,10 @@ class CashFlowModel(Model):
             return OrchestrationPass.DEPENDENT_MODELS
         return OrchestrationPass.INDEPENDENT_MODELS
 
+    def unit_name(self, index: int) -> str:
+        """Name of one of the `multiplicity` units this model stands for."""
+        return f"{self.name} #{index + 1}"
+
     def _convert_frequency(
         self, value: Union[float, pd.Series]
     ) -> Union[float, pd.Series]:
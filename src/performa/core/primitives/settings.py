@@ -105,6 +105,21 @@ class CalculationSettings(Model):
             max_dependency_depth=1,
             allow_complex_dependencies=False
         )
+
+        # Compute independent models (leases, expenses) in a process pool
+        calc_settings = CalculationSettings(
+            phase1_executor="process",
+            phase1_max_workers=8
+        )
+
+        # Project residential leases as one rent matrix per unit mix
+        calc_settings = CalculationSettings(lease_engine="cohort")
+
+        # One lease model per floor plan, written as one scaled series each
+        calc_settings = CalculationSettings(
+            unit_models="weighted",
+            weighted_model_granularity="model"
+        )
     """
 
     calculation_frequency: FrequencyEnum = Field(
@@ -137,6 +152,47 @@ class CalculationSettings(Model):
             "with tiered fees, complex waterfalls, or nested percentage calculations."
         ),
     )
+    phase1_executor: Literal["serial", "thread", "process"] = Field(
+        default="serial",
+        description=(
+            "How independent (Phase 1) models are computed: one after another, "
+            "or in a thread or process pool. Ledger writes are always applied "
+            "afterwards in model order, so results do not depend on the executor."
+        ),
+    )
+    phase1_max_workers: Optional[PositiveInt] = Field(
+        default=None,
+        description=(
+            "Worker count for the thread/process Phase 1 executor "
+            "(None uses the concurrent.futures default)."
+        ),
+    )
+    lease_engine: Literal["per_lease", "cohort"] = Field(
+        default="per_lease",
+        description=(
+            "How leases with a rollover profile are projected: one model at a "
+            "time, or (for lease types that provide a cohort engine, such as "
+            "residential leases) as one units x periods rent matrix written "
+            "to the ledger in bulk. Both produce the same ledger rows."
+        ),
+    )
+    unit_models: Literal["per_unit", "weighted"] = Field(
+        default="per_unit",
+        description=(
+            "How unit mixes become models: one lease model per unit, or one "
+            "lease model per unit spec that carries the spec's unit count as "
+            "its multiplicity and is computed once."
+        ),
+    )
+    weighted_model_granularity: Literal["unit", "model"] = Field(
+        default="unit",
+        description=(
+            "How models with a multiplicity above 1 are written to the ledger: "
+            "one series per unit (the rows per-unit models would write, named "
+            "with CashFlowModel.unit_name), or one series per model scaled by "
+            "its multiplicity."
+        ),
+    )
 
 
 class InflationSettings(Model):
@@ -15,6 +15,7 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict
 
+import numpy as np
 import pandas as pd
 
 from performa.core.ledger import SeriesMetadata
@@ -140,10 +141,8 @@ class CashFlowEngine(AnalysisSpecialist):
         Returns:
             pd.Series with total uses by period
         """
-        # Get the current ledger
-        current_ledger = ledger.ledger_df()
-
-        if current_ledger.empty:
+        transaction_count = len(ledger)
+        if transaction_count == 0:
             raise ValueError(
                 "Ledger is empty - CashFlowEngine requires a populated ledger from asset analysis"
             )
@@ -151,44 +150,31 @@ class CashFlowEngine(AnalysisSpecialist):
         # Query for capital uses ONLY - exclude financing service to avoid circular funding
         # Financing service (debt service) should not be treated as uses
         # that require additional funding - this creates circular dependency
-        uses_filter = current_ledger["flow_purpose"].isin([
-            TransactionPurpose.CAPITAL_USE.value,
-        ])
-        uses_transactions = current_ledger[uses_filter]
+        uses_transactions = ledger.select(
+            columns=["date", "amount"],
+            where={"flow_purpose": TransactionPurpose.CAPITAL_USE},
+            output="numpy",
+        )
 
         logger.debug(
-            f"CashFlowEngine: Ledger has {len(current_ledger)} total transactions"
+            f"CashFlowEngine: Ledger has {transaction_count} total transactions"
         )
-        logger.debug(f"CashFlowEngine: Found {len(uses_transactions)} use transactions")
         logger.debug(
-            f"CashFlowEngine: Flow purposes in ledger: {current_ledger['flow_purpose'].unique()}"
+            f"CashFlowEngine: Found {len(uses_transactions['amount'])} use transactions"
         )
 
-        if uses_transactions.empty:
+        if not len(uses_transactions["amount"]):
             logger.warning("CashFlowEngine: No use transactions found")
             return pd.Series(0.0, index=timeline.period_index, name="Total Uses")
 
-        # Take absolute value first, then group by date and sum (all amounts are positive uses)
-        uses_transactions = uses_transactions.copy()
-        uses_transactions["amount"] = uses_transactions["amount"].abs()
-        period_uses = uses_transactions.groupby("date")["amount"].sum()
-
-        # Convert date index to Period index to match timeline
-        if len(period_uses) > 0:
-            # Convert datetime.date or Timestamp index to Period index
-            if hasattr(period_uses.index[0], "to_period"):
-                # Timestamp index
-                period_uses.index = period_uses.index.to_period("M")
-            else:
-                # datetime.date index - convert to Period
-                period_uses.index = pd.PeriodIndex([
-                    pd.Period(date, "M") for date in period_uses.index
-                ])
+        # Take absolute value first, then group by period and sum (all amounts are positive uses)
+        uses = pd.Series(
+            np.abs(uses_transactions["amount"]),
+            index=pd.PeriodIndex(uses_transactions["date"], freq="M"),
+        )
+        period_uses = uses.groupby(level=0).sum()
 
         logger.debug(f"CashFlowEngine: Period uses before reindex: {period_uses.sum()}")
-        logger.debug(
-            f"CashFlowEngine: Period uses index type after conversion: {type(period_uses.index[0]) if len(period_uses) > 0 else 'empty'}"
-        )
 
         # Reindex to full timeline and fill missing with zeros
         result = period_uses.reindex(timeline.period_index, fill_value=0.0)
@@ -542,30 +528,26 @@ class CashFlowEngine(AnalysisSpecialist):
                     # to handle complex equity structures (GP/LP/Pref/Mezz)
 
                     # Get initial capital uses (before interest)
+                    base_uses = 0.0
                     if ledger:
-                        ledger_df = ledger.ledger_df()
-                        if not ledger_df.empty and "flow_purpose" in ledger_df.columns:
-                            capital_uses = ledger_df[
-                                ledger_df["flow_purpose"] == "Capital Use"
-                            ]
-                        else:
-                            capital_uses = pd.DataFrame()
-                    else:
-                        capital_uses = pd.DataFrame()
-
-                    if not capital_uses.empty:
+                        capital_uses = ledger.select(
+                            columns=["subcategory", "amount"],
+                            where={"flow_purpose": TransactionPurpose.CAPITAL_USE},
+                            output="numpy",
+                        )
                         # Sum only the land and hard costs (exclude financing costs)
-                        base_uses = capital_uses[
-                            ~capital_uses["subcategory"].str.contains(
-                                "Financing", na=False
+                        financing = (
+                            np.char.find(
+                                capital_uses["subcategory"].astype(str), "Financing"
                             )
-                        ]["amount"].sum()
-                        base_project_cost = (
-                            abs(base_uses) if base_uses else total_project_cost
+                            >= 0
                         )
-                    else:
-                        # Fallback to total if no breakdown available
-                        base_project_cost = total_project_cost
+                        base_uses = capital_uses["amount"][~financing].sum()
+
+                    # Fallback to total if no breakdown available
+                    base_project_cost = (
+                        abs(base_uses) if base_uses else total_project_cost
+                    )
 
                     # Fixed equity based on LTC ratio (simplified - assumes single loan)
                     equity_target = base_project_cost * (1 - facility.ltc_ratio)
@@ -705,23 +687,15 @@ class CashFlowEngine(AnalysisSpecialist):
             return 0.0
 
         try:
-            # Get current ledger DataFrame and create queries interface
-            current_ledger_df = ledger.ledger_df()
-
-            # Query ledger directly for financing transactions (bypass LedgerQueries due to enum serialization issues)
-            financing_txns = current_ledger_df[
-                current_ledger_df["category"] == CashFlowCategoryEnum.FINANCING
-            ]
-
-            # Get loan proceeds transactions using enum for reliable matching
-            loan_proc_txns = financing_txns[
-                financing_txns["subcategory"] == FinancingSubcategoryEnum.LOAN_PROCEEDS
-            ]
-            loan_proceeds = (
-                loan_proc_txns["amount"]
-                if not loan_proc_txns.empty
-                else pd.Series([], dtype=float)
-            )
+            # Query ledger directly for loan proceeds (bypass LedgerQueries due to enum serialization issues)
+            loan_proceeds = ledger.select(
+                columns=["amount"],
+                where={
+                    "category": CashFlowCategoryEnum.FINANCING,
+                    "subcategory": FinancingSubcategoryEnum.LOAN_PROCEEDS,
+                },
+                output="numpy",
+            )["amount"]
 
             # For construction/development deals, debt facilities write their
             # full loan commitment as proceeds at origination. This represents the total
@@ -733,9 +707,7 @@ class CashFlowEngine(AnalysisSpecialist):
             # available funding capacity.
 
             # Calculate total loan capacity from proceeds
-            total_loan_capacity = (
-                loan_proceeds.sum() if not loan_proceeds.empty else 0.0
-            )
+            total_loan_capacity = float(loan_proceeds.sum())
 
             # Track cumulative draws (initialized in _execute_funding_cascade)
             # TODO: Properly track draws vs capacity per facility for multi-tranche support
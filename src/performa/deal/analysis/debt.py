@@ -347,55 +347,48 @@ class DebtAnalyzer(AnalysisSpecialist):
                 # If payoff_amount is -1, we need to get it from the ledger
                 if payoff_amount == -1.0 and self.context.ledger:
                     # Get actual construction loan amount from ledger (principal + capitalized interest)
-                    ledger_df = self.context.ledger.ledger_df()
+                    construction_flows = self.context.ledger.select(
+                        columns=["subcategory", "amount"],
+                        where={
+                            "subcategory": [
+                                FinancingSubcategoryEnum.LOAN_PROCEEDS,
+                                FinancingSubcategoryEnum.SWEEP_PREPAYMENT,
+                            ]
+                        },
+                        contains={"item_name": "Construction"},
+                        output="numpy",
+                    )
+                    subcategory = construction_flows["subcategory"]
+                    amount = construction_flows["amount"]
 
                     # Get loan proceeds (principal)
-                    const_proceeds = ledger_df[
-                        (ledger_df["item_name"].str.contains("Construction", na=False))
-                        & (
-                            ledger_df["subcategory"]
-                            == FinancingSubcategoryEnum.LOAN_PROCEEDS
-                        )
-                    ]
-                    payoff_amount = (
-                        const_proceeds["amount"].sum()
-                        if not const_proceeds.empty
-                        else 0.0
-                    )
+                    principal = amount[
+                        subcategory == FinancingSubcategoryEnum.LOAN_PROCEEDS.value
+                    ].sum()
+                    payoff_amount = float(principal)
 
                     # Add capitalized interest to payoff amount
                     # Capitalized interest increases the loan balance and must be repaid
-                    cap_interest = ledger_df[
-                        (
-                            ledger_df["item_name"].str.contains(
-                                "Capitalized Interest", na=False
-                            )
-                        )
-                    ]
-                    if not cap_interest.empty:
-                        capitalized_amount = abs(cap_interest["amount"].sum())
-                        payoff_amount += capitalized_amount
-                    else:
-                        capitalized_amount = 0.0
+                    cap_interest = self.context.ledger.select(
+                        columns=["amount"],
+                        contains={"item_name": "Capitalized Interest"},
+                        output="numpy",
+                    )["amount"]
+                    capitalized_amount = abs(cap_interest.sum())
+                    payoff_amount += capitalized_amount
 
                     # CRITICAL: Subtract sweep prepayments from outstanding balance
                     # Prepayments reduce the construction loan balance, so payoff should be lower
-                    sweep_prepayments = ledger_df[
-                        (ledger_df["item_name"].str.contains("Construction", na=False))
-                        & (
-                            ledger_df["subcategory"]
-                            == FinancingSubcategoryEnum.SWEEP_PREPAYMENT
-                        )
-                    ]
-                    prepayment_amount = (
-                        abs(sweep_prepayments["amount"].sum())
-                        if not sweep_prepayments.empty
-                        else 0.0
+                    prepayment_amount = abs(
+                        amount[
+                            subcategory
+                            == FinancingSubcategoryEnum.SWEEP_PREPAYMENT.value
+                        ].sum()
                     )
 
                     if prepayment_amount > 0:
                         logger.info(
-                            f"Construction loan payoff: ${const_proceeds['amount'].sum():,.0f} principal + "
+                            f"Construction loan payoff: ${principal:,.0f} principal + "
                             f"${capitalized_amount:,.0f} capitalized interest - "
                             f"${prepayment_amount:,.0f} sweep prepayments = "
                             f"${payoff_amount - prepayment_amount:,.0f} outstanding balance"
@@ -403,7 +396,7 @@ class DebtAnalyzer(AnalysisSpecialist):
                         payoff_amount -= prepayment_amount
                     else:
                         logger.info(
-                            f"Construction loan payoff: ${const_proceeds['amount'].sum():,.0f} principal + "
+                            f"Construction loan payoff: ${principal:,.0f} principal + "
                             f"${capitalized_amount:,.0f} capitalized interest = "
                             f"${payoff_amount:,.0f} outstanding balance"
                         )
@@ -15,6 +15,7 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from ...core.ledger import SeriesMetadata
@@ -299,29 +300,34 @@ class DispositionAnalyzer(AnalysisSpecialist):
         # in the facility's internal balance tracking
 
         try:
-            ledger_df = ledger.ledger_df()
+            debt_flows = ledger.select(
+                columns=["item_name", "subcategory", "amount"],
+                where={
+                    "subcategory": [
+                        FinancingSubcategoryEnum.REFINANCING_PAYOFF,
+                        FinancingSubcategoryEnum.LOAN_PROCEEDS,
+                        FinancingSubcategoryEnum.REFINANCING_PROCEEDS,
+                        FinancingSubcategoryEnum.INTEREST_PAYMENT,
+                        FinancingSubcategoryEnum.PRINCIPAL_PAYMENT,
+                    ]
+                },
+                contains={"item_name": facility.name},
+                output="numpy",
+            )
+            item_names = debt_flows["item_name"]
+            subcategory = debt_flows["subcategory"]
+            amount = debt_flows["amount"]
 
             # Check if this is a construction/renovation facility that was paid off via refinancing
             # Look for refinancing payoff entries in debt service
             if "Construction" in facility.name or "Renovation" in facility.name:
                 # Check for refinancing payoff
                 refinance_payoff_mask = (
-                    (ledger_df["item_name"].str.contains(facility.name, na=False))
-                    & (
-                        ledger_df["item_name"].str.contains(
-                            "Refinancing Payoff", na=False
-                        )
-                    )
-                    & (
-                        ledger_df["subcategory"]
-                        == FinancingSubcategoryEnum.REFINANCING_PAYOFF
-                    )
-                )
+                    np.char.find(item_names.astype(str), "Refinancing Payoff") >= 0
+                ) & (subcategory == FinancingSubcategoryEnum.REFINANCING_PAYOFF.value)
                 if refinance_payoff_mask.any():
                     # Construction/renovation loan was paid off during refinancing
-                    payoff_amount = abs(
-                        ledger_df[refinance_payoff_mask]["amount"].sum()
-                    )
+                    payoff_amount = abs(amount[refinance_payoff_mask].sum())
                     logger.debug(
                         f"{facility.name} was paid off during refinancing: ${payoff_amount:,.0f}"
                     )
@@ -330,29 +336,24 @@ class DispositionAnalyzer(AnalysisSpecialist):
             # Get loan proceeds for this facility
             # Check for both initial loan proceeds and refinancing proceeds
             # Permanent loans originated via refinancing use REFINANCING_PROCEEDS subcategory
-            proceeds_mask = (
-                ledger_df["item_name"].str.contains(facility.name, na=False)
-            ) & (
-                (ledger_df["subcategory"] == FinancingSubcategoryEnum.LOAN_PROCEEDS)
-                | (
-                    ledger_df["subcategory"]
-                    == FinancingSubcategoryEnum.REFINANCING_PROCEEDS
-                )
+            proceeds_mask = np.isin(
+                subcategory,
+                [
+                    FinancingSubcategoryEnum.LOAN_PROCEEDS.value,
+                    FinancingSubcategoryEnum.REFINANCING_PROCEEDS.value,
+                ],
             )
-            proceeds = ledger_df[proceeds_mask]["amount"].sum()
+            proceeds = amount[proceeds_mask].sum()
 
             # Get all debt service payments using disaggregated I&P approach
-            service_mask = (
-                ledger_df["item_name"].str.contains(facility.name, na=False)
-            ) & (
-                (ledger_df["subcategory"] == FinancingSubcategoryEnum.INTEREST_PAYMENT)
-                | (
-                    ledger_df["subcategory"]
-                    == FinancingSubcategoryEnum.PRINCIPAL_PAYMENT
-                )
+            principal_mask = (
+                subcategory == FinancingSubcategoryEnum.PRINCIPAL_PAYMENT.value
+            )
+            service_mask = principal_mask | (
+                subcategory == FinancingSubcategoryEnum.INTEREST_PAYMENT.value
             )
             # Debt service is negative in ledger
-            total_service = abs(ledger_df[service_mask]["amount"].sum())
+            total_service = abs(amount[service_mask].sum())
 
             # For construction loans paid off via refinancing, proceeds should be 0
             # For permanent loans, proceeds > 0 and we need to check if they're interest-only
@@ -365,13 +366,7 @@ class DispositionAnalyzer(AnalysisSpecialist):
             if "Permanent" in facility.name or hasattr(facility, "amortization_months"):
                 # Calculate remaining balance after principal payments
                 # Get principal payments that have reduced the loan balance
-                principal_mask = (
-                    ledger_df["item_name"].str.contains(facility.name, na=False)
-                ) & (
-                    ledger_df["subcategory"]
-                    == FinancingSubcategoryEnum.PRINCIPAL_PAYMENT
-                )
-                total_principal_paid = abs(ledger_df[principal_mask]["amount"].sum())
+                total_principal_paid = abs(amount[principal_mask].sum())
 
                 # Original loan amount
                 original_loan = (
@@ -48,10 +48,15 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from ...core.ledger.records import SeriesMetadata
-from ...core.primitives import CashFlowCategoryEnum, ValuationSubcategoryEnum
+from ...core.primitives import (
+    CashFlowCategoryEnum,
+    TransactionPurpose,
+    ValuationSubcategoryEnum,
+)
 from .base import AnalysisSpecialist
 
 
@@ -176,13 +181,19 @@ class ValuationEngine(AnalysisSpecialist):
 
         # Get cumulative capital uses for cost accumulation approach
         # Query ledger directly for precise timing control
-        ledger_df = self.context.ledger.to_dataframe()
-        capital_df = ledger_df[ledger_df["flow_purpose"] == "Capital Use"].copy()
+        capital_uses = self.context.ledger.select(
+            columns=["date", "amount"],
+            where={"flow_purpose": TransactionPurpose.CAPITAL_USE},
+            group_by_month=True,
+            output="numpy",
+        )
 
         # Calculate cumulative costs by period
-        if not capital_df.empty:
-            capital_df["period"] = capital_df["date"].dt.to_period("M")
-            period_costs = capital_df.groupby("period")["amount"].sum().abs()
+        if len(capital_uses["date"]):
+            period_costs = pd.Series(
+                np.abs(capital_uses["amount"]),
+                index=pd.PeriodIndex(capital_uses["date"], freq="M"),
+            )
             cumulative_costs = period_costs.cumsum()
             # Convert to datetime index for alignment
             cumulative_costs.index = cumulative_costs.index.to_timestamp()
@@ -72,6 +72,7 @@ def analyze(
     settings: Optional["GlobalSettings"] = None,
     asset_analysis: Optional["AssetAnalysisResult"] = None,
     ledger: Optional["Ledger"] = None,
+    fork: bool = False,
 ) -> "DealResults":
     """
     Analyze a complete real estate deal and return strongly-typed results.
@@ -89,11 +90,19 @@ def analyze(
         asset_analysis: Optional asset-level result to reuse; when present, its
             ledger is used to ensure a single source of truth.
         ledger: Optional ledger instance; used when asset_analysis is not given.
+        fork: When reusing asset_analysis, write the deal passes to a
+            copy-on-write fork of its ledger (see `Ledger.fork()`) instead of
+            the asset ledger itself, so the same asset analysis can back any
+            number of financing or partnership variants.
 
     Returns:
         DealResults with summary, unlevered and levered flows, financing details,
         partner distributions, and deal metrics. All series are derived from the ledger.
 
+    Raises:
+        ValueError: If asset_analysis and ledger are different instances, or
+            fork is requested without an asset_analysis to reuse.
+
     Note:
         If deal has exit_valuation with hold_period_months < timeline duration,
         the timeline is automatically clipped to prevent post-disposition phantom
@@ -131,6 +140,11 @@ def analyze(
     # Determine ledger source with validation (Pass-the-Builder pattern)
     # This supports maximum flexibility while preventing ambiguous cases
 
+    if fork and asset_analysis is None:
+        raise ValueError(
+            "fork=True requires an asset_analysis whose ledger can be forked."
+        )
+
     if asset_analysis is not None and ledger is not None:
         # CASE: Both asset_analysis and ledger provided
         # Validate they're the same instance to prevent confusion
@@ -142,7 +156,7 @@ def analyze(
                 "ledger (for custom ledger), but not both with different instances."
             )
         # Same instance - use it (explicit validation passed)
-        current_ledger = asset_analysis.ledger
+        current_ledger = asset_analysis.ledger.fork() if fork else asset_analysis.ledger
         calculator = DealCalculator(
             deal, effective_timeline, settings, asset_analysis=asset_analysis
         )
@@ -150,7 +164,7 @@ def analyze(
     elif asset_analysis is not None:
         # CASE: Only asset_analysis provided - reuse existing analysis
         # Use the ledger from the pre-computed asset analysis
-        current_ledger = asset_analysis.ledger
+        current_ledger = asset_analysis.ledger.fork() if fork else asset_analysis.ledger
         calculator = DealCalculator(
             deal, effective_timeline, settings, asset_analysis=asset_analysis
         )
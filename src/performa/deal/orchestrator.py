@@ -290,12 +290,14 @@ class DealCalculator:
             # === INITIALIZATION ===
             # Get or compute asset analysis (always needed)
             # TODO: refactor asset analysis to match deal orchestrator
-            asset_result = self.asset_analysis or run(
-                model=self.deal.asset,
-                timeline=self.timeline,
-                settings=self.settings,
-                ledger=ledger,
-            )
+            # Passes are labelled for the ledger profiler (no-op unless profiling)
+            with ledger.analysis_pass("asset"):
+                asset_result = self.asset_analysis or run(
+                    model=self.deal.asset,
+                    timeline=self.timeline,
+                    settings=self.settings,
+                    ledger=ledger,
+                )
 
             # Initialize context that will be progressively enriched
             deal_context = DealContext(
@@ -307,29 +309,35 @@ class DealCalculator:
 
             # === ACQUISITION PASS ===
             # Process acquisition and calculate initial project costs
-            AcquisitionAnalyzer(deal_context).process()
+            with ledger.analysis_pass("acquisition"):
+                AcquisitionAnalyzer(deal_context).process()
             # Context now contains project_costs
 
             # === VALUATION PASS ===
             # Always run - provides critical data for multiple downstream passes
-            ValuationEngine(deal_context).process()
+            with ledger.analysis_pass("valuation"):
+                ValuationEngine(deal_context).process()
             # Context now contains property_value and gross_proceeds
 
             # === DEBT PASS ===
             # Always run - even if no debt, creates empty series for consistency
-            DebtAnalyzer(deal_context).process()
+            with ledger.analysis_pass("debt"):
+                DebtAnalyzer(deal_context).process()
 
             # === DISPOSITION PASS ===
             # Always run - processes exit if applicable
-            DispositionAnalyzer(deal_context).process()
+            with ledger.analysis_pass("disposition"):
+                DispositionAnalyzer(deal_context).process()
 
             # === CASH FLOW PASS ===
             # Always run - core calculation
-            CashFlowEngine(deal_context).process()
+            with ledger.analysis_pass("cash_flow"):
+                CashFlowEngine(deal_context).process()
 
             # === PARTNERSHIP PASS ===
             # Always run - handles single owner or complex waterfall
-            PartnershipAnalyzer(deal_context).process()
+            with ledger.analysis_pass("partnership"):
+                PartnershipAnalyzer(deal_context).process()
 
             # Return clean results that query the ledger
             return DealResults(self.deal, self.timeline, ledger)
@@ -23,6 +23,7 @@ from ..core.ledger import Ledger
 from ..core.ledger.queries import LedgerQueries
 from ..core.primitives import (
     CashFlowCategoryEnum,
+    FinancingSubcategoryEnum,
     Timeline,
     UnleveredAggregateLineKey,
 )
@@ -53,6 +54,8 @@ class DealResults:  # noqa: PLR0904
         self._timeline = timeline
         self._ledger = ledger
         self._queries = LedgerQueries(ledger)
+        # Series on the analysis timeline, gap-filled in SQL
+        self._timeline_queries = LedgerQueries(ledger, timeline=timeline)
 
     # ==========================================================================
     # DIRECT DATA ACCESS
@@ -97,13 +100,25 @@ class DealResults:  # noqa: PLR0904
         """THE primary multiple metric - total returns / total investment."""
         # Use actual equity flows from ledger, not UCF/LCF
         # UCF assumes 100% equity, but we need actual equity invested
-        contributions = self._queries.ledger[
-            self._queries.ledger["subcategory"] == "Equity Contribution"
-        ]["amount"].sum()
+        equity_flows = self._ledger.select(
+            columns=["subcategory", "amount"],
+            where={
+                "subcategory": [
+                    FinancingSubcategoryEnum.EQUITY_CONTRIBUTION,
+                    FinancingSubcategoryEnum.EQUITY_DISTRIBUTION,
+                ]
+            },
+            output="numpy",
+        )
+        subcategory = equity_flows["subcategory"]
+        amount = equity_flows["amount"]
 
-        distributions = self._queries.ledger[
-            self._queries.ledger["subcategory"] == "Equity Distribution"
-        ]["amount"].sum()
+        contributions = amount[
+            subcategory == FinancingSubcategoryEnum.EQUITY_CONTRIBUTION.value
+        ].sum()
+        distributions = amount[
+            subcategory == FinancingSubcategoryEnum.EQUITY_DISTRIBUTION.value
+        ].sum()
 
         if contributions <= 0:
             return None  # No equity investment to measure against
@@ -159,10 +174,8 @@ class DealResults:  # noqa: PLR0904
         # Get equity flows from deal perspective and flip to investor perspective
         # Deal perspective: contributions +, distributions -
         # Investor perspective: contributions -, distributions +
-        deal_flows = self._queries.equity_partner_flows()
-        investor_flows = -1 * deal_flows  # Flip sign for investor perspective
-
-        return self._timeline.align_series(investor_flows, fill_value=0.0)
+        deal_flows = self._timeline_queries.equity_partner_flows()
+        return -1 * deal_flows  # Flip sign for investor perspective
 
     @cached_property
     def equity_cash_flow(self) -> pd.Series:
@@ -208,26 +221,32 @@ class DealResults:  # noqa: PLR0904
 
         This is the standard real estate definition of UCF.
         """
-        flows = self._queries.project_cash_flow()
-        return flows.reindex(self._timeline.period_index, fill_value=0.0)
+        flows = self._unlevered_aggregates[
+            UnleveredAggregateLineKey.UNLEVERED_CASH_FLOW.value
+        ]
+        return flows.rename("Project Cash Flow")
 
     @cached_property
     def noi(self) -> pd.Series:
         """Net Operating Income time series."""
-        flows = self._queries.noi()
-        return flows.reindex(self._timeline.period_index, fill_value=0.0)
+        return self._unlevered_aggregates[
+            UnleveredAggregateLineKey.NET_OPERATING_INCOME.value
+        ].copy()
+
+    @cached_property
+    def _unlevered_aggregates(self) -> pd.DataFrame:
+        """All unlevered aggregate lines from one ledger scan, aligned to the timeline."""
+        return self._timeline_queries.aggregate_bundle()
 
     @cached_property
     def operational_cash_flow(self) -> pd.Series:
         """Pure operational cash flows (NOI minus capex)."""
-        flows = self._queries.operational_cash_flow()
-        return flows.reindex(self._timeline.period_index, fill_value=0.0)
+        return self._timeline_queries.operational_cash_flow()
 
     @cached_property
     def debt_service(self) -> pd.Series:
         """Total debt service series."""
-        flows = self._queries.debt_service()
-        return flows.reindex(self._timeline.period_index, fill_value=0.0)
+        return self._timeline_queries.debt_service()
 
     # REMOVED: asset_value() - ambiguous "latest" concept replaced with explicit methods:
     #   - asset_value_at(date) for specific dates
@@ -385,20 +404,12 @@ class DealResults:  # noqa: PLR0904
         """
         dscr_series = self._calculate_dscr_series()
         noi_series = self.noi
-        debt_service_series = self._queries.recurring_debt_service()
-
-        # Align series to noi_series index (avoid misaligned boolean masking)
-        dscr_aligned = dscr_series.reindex(noi_series.index)
-        debt_service_aligned = debt_service_series.reindex(noi_series.index)
+        # All three series share the timeline index (zero-filled in SQL)
+        debt_service_series = self._timeline_queries.recurring_debt_service()
 
         # Filter to operating periods only (NOI > 0, recurring DS ≠ 0)
-        # NaNs in aligned series are treated as non-operating
-        operating_mask = (
-            (noi_series > 0)
-            & (debt_service_aligned.notna())
-            & (debt_service_aligned != 0)
-        )
-        operating_dscr = dscr_aligned[operating_mask].dropna()
+        operating_mask = (noi_series > 0) & (debt_service_series != 0)
+        operating_dscr = dscr_series[operating_mask].dropna()
 
         if operating_dscr.empty or len(operating_dscr) < 12:
             return None
@@ -420,20 +431,12 @@ class DealResults:  # noqa: PLR0904
         """
         dscr_series = self._calculate_dscr_series()
         noi_series = self.noi
-        debt_service_series = self._queries.recurring_debt_service()
-
-        # Align series to noi_series index (avoid misaligned boolean masking)
-        dscr_aligned = dscr_series.reindex(noi_series.index)
-        debt_service_aligned = debt_service_series.reindex(noi_series.index)
+        # All three series share the timeline index (zero-filled in SQL)
+        debt_service_series = self._timeline_queries.recurring_debt_service()
 
         # Filter to operating periods only
-        # NaNs in aligned series are treated as non-operating
-        operating_mask = (
-            (noi_series > 0)
-            & (debt_service_aligned.notna())
-            & (debt_service_aligned != 0)
-        )
-        operating_dscr = dscr_aligned[operating_mask].dropna()
+        operating_mask = (noi_series > 0) & (debt_service_series != 0)
+        operating_dscr = dscr_series[operating_mask].dropna()
 
         if operating_dscr.empty:
             return None
@@ -454,20 +457,12 @@ class DealResults:  # noqa: PLR0904
         """
         dscr_series = self._calculate_dscr_series()
         noi_series = self.noi
-        debt_service_series = self._queries.recurring_debt_service()
-
-        # Align series to noi_series index (avoid misaligned boolean masking)
-        dscr_aligned = dscr_series.reindex(noi_series.index)
-        debt_service_aligned = debt_service_series.reindex(noi_series.index)
+        # All three series share the timeline index (zero-filled in SQL)
+        debt_service_series = self._timeline_queries.recurring_debt_service()
 
         # Filter to operating periods only
-        # NaNs in aligned series are treated as non-operating
-        operating_mask = (
-            (noi_series > 0)
-            & (debt_service_aligned.notna())
-            & (debt_service_aligned != 0)
-        )
-        operating_dscr = dscr_aligned[operating_mask].dropna()
+        operating_mask = (noi_series > 0) & (debt_service_series != 0)
+        operating_dscr = dscr_series[operating_mask].dropna()
 
         if operating_dscr.empty:
             return None
@@ -524,13 +519,10 @@ class DealResults:  # noqa: PLR0904
         covenant monitoring. Lenders care about NOI coverage of RECURRING
         obligations (I+P), not one-time financing events.
         """
+        # Both series are on the timeline already
         noi_series = self.noi
-        debt_service_series = self._queries.recurring_debt_service()
-
-        # Align indices
+        debt_service_series = self._timeline_queries.recurring_debt_service()
         index = self._timeline.period_index
-        noi_series = noi_series.reindex(index, fill_value=0.0)
-        debt_service_series = debt_service_series.reindex(index, fill_value=0.0)
 
         # Calculate DSCR period by period
         dscr_series = pd.Series(0.0, index=index)
@@ -781,8 +773,8 @@ class DealResults:  # noqa: PLR0904
         """
         Safely retrieves a cash flow series using a type-safe enum key.
 
-        LEDGER-DRIVEN IMPLEMENTATION: Maps UnleveredAggregateLineKey values to
-        corresponding LedgerQueries methods. This provides backward compatibility
+        LEDGER-DRIVEN IMPLEMENTATION: Reads UnleveredAggregateLineKey values from
+        `LedgerQueries.aggregate_bundle()`. This provides backward compatibility
         for existing code that used the old DataFrame-based approach.
 
         Args:
@@ -799,31 +791,16 @@ class DealResults:  # noqa: PLR0904
             ...     timeline
             ... )
         """
-        # Map enum keys to LedgerQueries methods
-        key_mapping = {
-            UnleveredAggregateLineKey.NET_OPERATING_INCOME: self._queries.noi,
-            UnleveredAggregateLineKey.EFFECTIVE_GROSS_INCOME: self._queries.egi,
-            UnleveredAggregateLineKey.POTENTIAL_GROSS_REVENUE: self._queries.pgr,
-            UnleveredAggregateLineKey.RENTAL_ABATEMENT: self._queries.rental_abatement,
-            UnleveredAggregateLineKey.MISCELLANEOUS_INCOME: self._queries.misc_income,
-            UnleveredAggregateLineKey.GENERAL_VACANCY_LOSS: self._queries.vacancy_loss,
-            UnleveredAggregateLineKey.CREDIT_LOSS: self._queries.credit_loss,
-            UnleveredAggregateLineKey.EXPENSE_REIMBURSEMENTS: self._queries.expense_reimbursements,
-            UnleveredAggregateLineKey.TOTAL_OPERATING_EXPENSES: self._queries.opex,
-            UnleveredAggregateLineKey.TOTAL_CAPITAL_EXPENDITURES: self._queries.capex,
-        }
-
-        # Get the query method for this key
-        query_method = key_mapping.get(key)
-
-        if query_method:
-            try:
-                # Call the LedgerQueries method and align to timeline
-                series = query_method()
-                return timeline.align_series(series, fill_value=0.0)
-            except Exception:
-                # Fallback to zero series if query fails
-                pass
+        # All aggregate lines come from a single multi-aggregate ledger scan
+        try:
+            if timeline.period_index.equals(self._timeline.period_index):
+                bundle = self._unlevered_aggregates
+            else:
+                bundle = self._queries.aggregate_bundle(index=timeline.period_index)
+            return bundle[key.value].copy()
+        except Exception:
+            # Fallback to zero series if query fails
+            pass
 
         # If key not found or query failed, return zero-filled series
         return pd.Series(0.0, index=timeline.period_index, name=key.value)
@@ -1027,7 +1004,8 @@ class PartnerMetrics:
         self.ownership_share = ownership_share
         self._ledger = ledger
         self._timeline = timeline
-        self._queries = LedgerQueries(ledger)
+        # Partner flows on the analysis timeline, gap-filled in SQL
+        self._queries = LedgerQueries(ledger, timeline=timeline)
 
     @cached_property
     def irr(self) -> Optional[float]:
@@ -1053,8 +1031,7 @@ class PartnerMetrics:
                 if isinstance(self.partner_id, str)
                 else self.partner_id
             )
-            flows = self._queries.partner_flows(partner_uuid)
-            return flows.reindex(self._timeline.period_index, fill_value=0.0)
+            return self._queries.partner_flows(partner_uuid)
         except:
             # Fallback: filter ledger directly by partner_id
             partner_mask = self._queries.ledger["entity_id"] == self.partner_id
@@ -25,6 +25,7 @@ from ..core.primitives import (
     InterestCalculationMethod,
     SweepMode,
     Timeline,
+    TransactionPurpose,
 )
 from ..core.primitives.settings import DayCountConvention
 from .base import DebtFacilityBase
@@ -399,17 +400,8 @@ class ConstructionFacility(DebtFacilityBase):
             float: Calculated loan commitment amount
         """
         # Get base project costs from ledger or context fallback
-        current_ledger = context.ledger.ledger_df()
-        base_costs = 0.0
-
-        if not current_ledger.empty:
-            # Sum capital uses (negative amounts in ledger) to get total project costs
-            capital_uses = current_ledger[
-                current_ledger["flow_purpose"] == "Capital Use"
-            ]
-            base_costs = (
-                abs(capital_uses["amount"].sum()) if not capital_uses.empty else 0.0
-            )
+        # Sum capital uses (negative amounts in ledger) to get total project costs
+        base_costs = self._total_capital_uses(context)
 
         # Fallback to context.project_costs if ledger has no capital uses yet
         if (
@@ -744,7 +736,7 @@ class ConstructionFacility(DebtFacilityBase):
         4. Post all transactions in batch
 
         Performance:
-        - Single DataFrame materialization (~5ms)
+        - Single filtered capital-use query (pushed down to DuckDB)
         - Single NOI query (~2ms)
         - Loop with O(1) lookups (~2ms for 18-42 periods)
         - Total: ~10-15ms (within 20ms budget)
@@ -767,9 +759,16 @@ class ConstructionFacility(DebtFacilityBase):
 
         # === CRITICAL PERFORMANCE: Batch queries ONCE ===
 
-        # Query 1: Extract capital uses (single DataFrame materialization)
-        ledger_df = context.ledger.to_dataframe()  # ← ONLY to_dataframe() call
-        capital_uses_by_period = self._extract_capital_uses_by_period(ledger_df)
+        # Query 1: Extract capital uses by month (filter pushed into DuckDB)
+        capital_uses = context.ledger.select(
+            columns=["date", "amount"],
+            where={"flow_purpose": TransactionPurpose.CAPITAL_USE},
+            group_by_month=True,
+            output="numpy",
+        )
+        capital_uses_by_period = self._extract_capital_uses_by_period(
+            pd.DataFrame(capital_uses)
+        )
 
         # Query 2: Extract NOI series (single SQL query)
         noi_series = LedgerQueries(context.ledger).noi()
@@ -954,14 +953,7 @@ class ConstructionFacility(DebtFacilityBase):
             loan_amount: Total loan commitment including interest
         """
         # Calculate the interest component
-        current_ledger = context.ledger.ledger_df()
-        if current_ledger.empty:
-            return
-
-        capital_uses = current_ledger[current_ledger["flow_purpose"] == "Capital Use"]
-        base_costs = (
-            abs(capital_uses["amount"].sum()) if not capital_uses.empty else 0.0
-        )
+        base_costs = self._total_capital_uses(context)
 
         if base_costs == 0:
             return
@@ -1000,6 +992,26 @@ class ConstructionFacility(DebtFacilityBase):
                 )
                 context.ledger.add_series(interest_series, interest_metadata)
 
+    def _total_capital_uses(self, context: "DealContext") -> float:
+        """
+        Total project costs posted to the ledger as Capital Use.
+
+        Only the matching `amount` values are read from DuckDB; the ledger is
+        not materialized.
+
+        Args:
+            context: Deal context with ledger access
+
+        Returns:
+            Absolute sum of Capital Use amounts (0.0 when none are posted)
+        """
+        capital_uses = context.ledger.select(
+            columns=["amount"],
+            where={"flow_purpose": TransactionPurpose.CAPITAL_USE},
+            output="numpy",
+        )
+        return float(abs(capital_uses["amount"].sum()))
+
     def _extract_capital_uses_by_period(
         self, ledger_df: pd.DataFrame
     ) -> Dict[pd.Period, float]:
@@ -1010,18 +1022,28 @@ class ConstructionFacility(DebtFacilityBase):
         This eliminates repeated DataFrame filtering (18-42 queries → 1).
 
         Args:
-            ledger_df: Full ledger as DataFrame (from single to_dataframe() call)
+            ledger_df: Ledger rows with `date` and `amount` columns. Rows are
+                filtered to Capital Use when a `flow_purpose` column is present;
+                without one they are assumed to be pre-filtered.
 
         Returns:
             Dict mapping period (pd.Period) → debt-funded capital use amount
 
         Example:
-            >>> ledger_df = context.ledger.to_dataframe()
-            >>> capital_uses = facility._extract_capital_uses_by_period(ledger_df)
+            >>> rows = context.ledger.select(
+            ...     columns=["date", "amount"],
+            ...     where={"flow_purpose": TransactionPurpose.CAPITAL_USE},
+            ...     group_by_month=True,
+            ...     output="numpy",
+            ... )
+            >>> capital_uses = facility._extract_capital_uses_by_period(pd.DataFrame(rows))
             >>> month_1_draw = capital_uses.get(period, 0.0)  # O(1) lookup
         """
         # Filter to Capital Use transactions
-        capital_uses = ledger_df[ledger_df["flow_purpose"] == "Capital Use"]
+        if "flow_purpose" in ledger_df.columns:
+            capital_uses = ledger_df[ledger_df["flow_purpose"] == "Capital Use"]
+        else:
+            capital_uses = ledger_df
 
         if capital_uses.empty:
             return {}
@@ -354,35 +354,28 @@ class CashSweep(Model):
         Returns:
             Series of debt service amounts indexed by Period[M] (negative = outflow)
         """
-        # Query ledger once
-        ledger_df = context.ledger.to_dataframe()
-
-        # Filter for this facility's debt service
-        facility_ds = ledger_df[
-            (ledger_df["item_name"].str.contains(facility_name, na=False))
-            & (ledger_df["category"] == "Financing")
-            & (ledger_df["subcategory"].isin(["Interest Payment", "Principal Payment"]))
-        ]
-
-        if facility_ds.empty:
-            return pd.Series(dtype="float64", name=f"{facility_name} Debt Service")
-
-        # Convert dates to PeriodIndex and group by period
-        # Handle both datetime and Period types (for test compatibility)
-        date_col = facility_ds["date"]
-        if isinstance(date_col.dtype, pd.PeriodDtype):
-            periods = date_col
-        else:
-            periods = pd.to_datetime(date_col).dt.to_period("M")
-
-        # Group by period and sum
-        facility_ds = facility_ds.copy()
-        facility_ds["period"] = periods
-        grouped = facility_ds.groupby("period")["amount"].sum()
+        # Query ledger once for this facility's monthly debt service
+        facility_ds = context.ledger.select(
+            columns=["date", "amount"],
+            where={
+                "category": CashFlowCategoryEnum.FINANCING,
+                "subcategory": [
+                    FinancingSubcategoryEnum.INTEREST_PAYMENT,
+                    FinancingSubcategoryEnum.PRINCIPAL_PAYMENT,
+                ],
+            },
+            contains={"item_name": facility_name},
+            group_by_month=True,
+            output="numpy",
+        )
 
         # Return Series with PeriodIndex
-        grouped.name = f"{facility_name} Debt Service"
-        return grouped
+        return pd.Series(
+            facility_ds["amount"],
+            index=pd.PeriodIndex(facility_ds["date"], freq="M"),
+            dtype="float64",
+            name=f"{facility_name} Debt Service",
+        )
 
     def _post_sweep_deposit(
         self,
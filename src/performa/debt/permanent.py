@@ -630,11 +630,12 @@ class PermanentFacility(DebtFacilityBase):
 
         For permanent loans, this needs to account for amortization.
         Interest-only loans will have full balance outstanding until maturity.
-        Amortizing loans will have declining balance based on payments made.
+        Amortizing loans are not yet reduced by principal paid and also report
+        the full loan amount.
 
         Args:
             date: Date for balance calculation
-            ledger: Optional ledger to query for actual payments made
+            ledger: Optional ledger (not yet used; kept for interface parity)
 
         Returns:
             Outstanding loan balance
@@ -649,27 +650,8 @@ class PermanentFacility(DebtFacilityBase):
         ):
             return self.loan_amount
 
-        # For amortizing loans, need to calculate remaining balance
-        # This is a simplified calculation - ideally would use amortization schedule
-        if ledger:
-            try:
-                # Query ledger for actual principal payments
-                ledger_df = ledger.ledger_df()
-
-                # Get debt service for this facility
-                service_mask = (
-                    ledger_df["item_name"].str.contains(self.name, na=False)
-                ) & (ledger_df["subcategory"] == "DEBT_SERVICE")
-
-                # For now, assume interest-only so no principal reduction
-                # This is conservative and ensures debt is fully paid at exit
-                return self.loan_amount
-
-            except Exception as e:
-                logger.warning(f"Could not query ledger for {self.name}: {e}")
-                return self.loan_amount
-
-        # Default: return full loan amount (conservative)
+        # Default: return full loan amount (conservative - ensures the debt is
+        # fully paid at exit; ideally would use the amortization schedule)
         return self.loan_amount
 
     # ====================================================================
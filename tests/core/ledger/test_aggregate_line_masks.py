@@ -0,0 +1,103 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+LedgerQueries.aggregate_line_masks() must select the rows the SQL aggregate
+expressions sum, for every accumulable line.
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.queries import ACCUMULABLE_AGGREGATE_LINES
+from performa.core.primitives import (
+    CapitalSubcategoryEnum,
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    FinancingSubcategoryEnum,
+    GlobalSettings,
+    UnleveredAggregateLineKey,
+)
+from performa.deal import analyze
+from performa.patterns import ValueAddAcquisitionPattern
+
+
+@pytest.fixture(scope="module")
+def deal_ledger() -> Ledger:
+    """Operating, capital, financing and valuation rows of a levered deal."""
+    pattern = ValueAddAcquisitionPattern(
+        property_name="Mask Value-Add",
+        acquisition_date=date(2024, 1, 1),
+        acquisition_price=10_000_000,
+        renovation_budget=1_500_000,
+        current_avg_rent=1400,
+        target_avg_rent=1750,
+        hold_period_years=5,
+        ltv_ratio=0.65,
+    )
+    ledger = Ledger()
+    analyze(pattern.create(), pattern.get_timeline(), GlobalSettings(), ledger=ledger)
+    return ledger
+
+
+def _replay(ledger: Ledger, index: pd.PeriodIndex) -> pd.DataFrame:
+    """Sum every ledger row into the lines its masks select."""
+    df = ledger.to_dataframe()
+    months = pd.PeriodIndex(pd.to_datetime(df["date"]), freq="M")
+    positions = index.get_indexer(months)
+    totals = {key: np.zeros(len(index)) for key in ACCUMULABLE_AGGREGATE_LINES}
+    for (category, subcategory), rows in df.groupby([
+        df["category"].astype(str),
+        df["subcategory"].astype(str),
+    ]).groups.items():
+        row_positions = df.index.get_indexer(rows)
+        amounts = df["amount"].to_numpy()[row_positions]
+        masks = LedgerQueries.aggregate_line_masks(category, subcategory, amounts)
+        for key, mask in masks.items():
+            np.add.at(totals[key], positions[row_positions][mask], amounts[mask])
+    return pd.DataFrame({key.value: total for key, total in totals.items()}, index)
+
+
+def test_masks_match_aggregate_bundle(deal_ledger):
+    df = deal_ledger.to_dataframe()
+    dates = pd.to_datetime(df["date"])
+    index = pd.period_range(dates.min(), dates.max(), freq="M")
+    assert set(df["flow_purpose"].astype(str)) > {"Operating"}
+
+    bundle = LedgerQueries(deal_ledger).aggregate_bundle(
+        ACCUMULABLE_AGGREGATE_LINES, index=index
+    )
+    replayed = _replay(deal_ledger, index)
+    pd.testing.assert_frame_equal(
+        replayed[bundle.columns], bundle, check_exact=False, rtol=1e-9
+    )
+
+
+def test_masks_follow_the_flow_purpose():
+    keys = UnleveredAggregateLineKey
+    opex = LedgerQueries.aggregate_line_masks(
+        CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, np.array([-1.0])
+    )
+    assert set(opex) == {
+        keys.TOTAL_OPERATING_EXPENSES,
+        keys.NET_OPERATING_INCOME,
+        keys.UNLEVERED_CASH_FLOW,
+    }
+
+    # Capital uses count toward unlevered cash flow; loan proceeds never do
+    capital = LedgerQueries.aggregate_line_masks(
+        CashFlowCategoryEnum.CAPITAL,
+        CapitalSubcategoryEnum.PURCHASE_PRICE,
+        np.array([-1.0, 1.0]),
+    )
+    assert set(capital) == {keys.UNLEVERED_CASH_FLOW}
+    assert capital[keys.UNLEVERED_CASH_FLOW].tolist() == [True, True]
+    assert not LedgerQueries.aggregate_line_masks(
+        CashFlowCategoryEnum.FINANCING,
+        FinancingSubcategoryEnum.LOAN_PROCEEDS,
+        np.array([-1.0, 1.0]),
+    )
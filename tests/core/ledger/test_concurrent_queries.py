@@ -0,0 +1,130 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Stress tests for concurrent LedgerQueries on per-thread cursors.
+"""
+
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    FinancingSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+INDEX = pd.period_range("2024-01", periods=60, freq="M")
+METHODS = ("noi", "egi", "opex", "pgr", "debt_service", "capex", "project_cash_flow")
+THREADS = 8
+CALLS = 400
+
+
+def _add_line(ledger: Ledger, category, subcategory, amount: float) -> None:
+    ledger.add_series(
+        pd.Series(amount, index=INDEX),
+        SeriesMetadata(
+            category=category,
+            subcategory=subcategory,
+            item_name="Line",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+        ),
+    )
+
+
+def _finished_ledger(**kwargs) -> Ledger:
+    ledger = Ledger(**kwargs)
+    with ledger.transaction():
+        for i in range(50):
+            _add_line(ledger, CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 100.0 + i)
+            _add_line(ledger, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -20.0 - i)
+        _add_line(
+            ledger,
+            CashFlowCategoryEnum.FINANCING,
+            FinancingSubcategoryEnum.INTEREST_PAYMENT,
+            -500.0,
+        )
+    return ledger
+
+
+class TestConcurrentQueries:
+    """Many threads query one ledger through their own cursors."""
+
+    def test_each_thread_gets_its_own_cursor(self):
+        ledger = _finished_ledger()
+        main_cursor, table = ledger.get_query_connection(thread_local=True)
+        assert main_cursor is not ledger.con
+        assert ledger.get_query_connection(thread_local=True)[0] is main_cursor
+
+        cursors = []
+        worker = threading.Thread(
+            target=lambda: cursors.append(ledger.get_query_connection(thread_local=True)[0])
+        )
+        worker.start()
+        worker.join()
+        assert cursors[0] is not main_cursor
+        assert main_cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 101 * 60
+
+    @pytest.mark.parametrize("shared", [True, False], ids=["shared", "per-thread"])
+    def test_concurrent_queries_match_serial_results(self, shared):
+        # No result cache, so every call runs on a cursor
+        ledger = _finished_ledger(query_cache_size=0)
+        expected = {method: getattr(LedgerQueries(ledger), method)() for method in METHODS}
+        shared_queries = ledger.get_queries(thread_local=True)
+
+        def call(i: int):
+            queries = shared_queries if shared else LedgerQueries(ledger, thread_local=True)
+            method = METHODS[i % len(METHODS)]
+            return method, getattr(queries, method)()
+
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            results = list(pool.map(call, range(CALLS)))
+
+        for method, series in results:
+            pd.testing.assert_series_equal(series, expected[method], obj=method)
+
+    def test_concurrent_arrays(self):
+        ledger = _finished_ledger(query_cache_size=0)
+        queries = ledger.get_queries(thread_local=True)
+        expected = queries.array("noi", INDEX)
+
+        def call(i: int):
+            index = INDEX[i % 12 :]
+            return i % 12, queries.array("noi", index)
+
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            for offset, values in pool.map(call, range(CALLS)):
+                assert (values == expected[offset:]).all()
+
+    def test_readers_see_writes_after_flush(self):
+        ledger = _finished_ledger(query_cache_size=0)
+        queries = ledger.get_queries(thread_local=True)
+        before = queries.noi().sum()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pool.submit(queries.noi).result()
+            _add_line(ledger, CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.MISC, 10.0)
+            after = pool.submit(lambda: queries.noi().sum()).result()
+        assert after == pytest.approx(before + 600.0)
+
+    def test_forks_use_the_shared_connection(self):
+        child = _finished_ledger().fork()
+        with pytest.raises(ValueError, match="Forks cannot hand out per-thread cursors"):
+            child.get_query_connection(thread_local=True)
+
+    def test_close_closes_thread_cursors(self):
+        ledger = _finished_ledger()
+        cursor, table = ledger.get_query_connection(thread_local=True)
+        ledger.close()
+        with pytest.raises(duckdb.ConnectionException, match="already closed"):
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
@@ -0,0 +1,125 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for deferred transaction ids.
+
+`Ledger(transaction_ids="deferred")` stores surrogate BIGINT ids from a DuckDB
+sequence; readers still see a UUID `transaction_id` column.
+"""
+
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+INDEX = pd.period_range("2024-01", periods=6, freq="M")
+
+
+def _add_line(ledger: Ledger, category, subcategory, amount: float) -> None:
+    ledger.add_series(
+        pd.Series(amount, index=INDEX),
+        SeriesMetadata(
+            category=category,
+            subcategory=subcategory,
+            item_name="Line",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+        ),
+    )
+
+
+def _populate(ledger: Ledger) -> None:
+    _add_line(
+        ledger, CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 1000.0
+    )
+    _add_line(ledger, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -300.0)
+
+
+def _column_types(ledger: Ledger, table: str) -> dict:
+    return {
+        name: data_type
+        for name, data_type, *_ in ledger.con.execute(f"DESCRIBE {table}").fetchall()
+    }
+
+
+class TestDeferredTransactionIds:
+    """Surrogate ids are stored; UUIDs are rendered on read."""
+
+    @pytest.mark.parametrize("layout", ["wide", "normalized"])
+    def test_public_schema_is_unchanged(self, layout):
+        eager = Ledger(layout=layout)
+        deferred = Ledger(layout=layout, transaction_ids="deferred")
+        _populate(eager)
+        _populate(deferred)
+
+        assert _column_types(deferred, deferred._storage_table)["transaction_id"] == (
+            "BIGINT"
+        )
+        assert _column_types(deferred, deferred.table_name) == _column_types(
+            eager, eager.table_name
+        )
+        pd.testing.assert_series_equal(
+            LedgerQueries(deferred).noi(), LedgerQueries(eager).noi()
+        )
+
+        df = deferred.to_dataframe()
+        assert df["transaction_id"].is_unique
+        assert all(uuid.UUID(value) for value in df["transaction_id"])
+
+    def test_ids_are_stable_across_reads(self):
+        ledger = Ledger(transaction_ids="deferred")
+        _populate(ledger)
+        first = set(ledger.to_dataframe()["transaction_id"])
+        ledger._bump_version()  # drop the cached DataFrame
+        assert set(ledger.to_dataframe()["transaction_id"]) == first
+
+    def test_ids_stay_unique_across_forks_and_ledgers(self):
+        parent = Ledger(transaction_ids="deferred")
+        _populate(parent)
+        child = parent.fork()
+        _populate(child)
+        other = Ledger(transaction_ids="deferred")
+        _populate(other)
+
+        parent_ids = set(parent.to_dataframe()["transaction_id"])
+        child_ids = set(child.to_dataframe()["transaction_id"])
+        assert parent_ids < child_ids
+        assert len(child_ids) == len(child)
+        assert not parent_ids & set(other.to_dataframe()["transaction_id"])
+
+    def test_reopen_keeps_mode_and_ids(self, tmp_path):
+        path = tmp_path / "deferred.duckdb"
+        ledger = Ledger(path=path, transaction_ids="deferred")
+        _populate(ledger)
+        ids = set(ledger.to_dataframe()["transaction_id"])
+        ledger.close()
+
+        reopened = Ledger.open(path)
+        assert reopened._deferred_ids
+        assert set(reopened.to_dataframe()["transaction_id"]) == ids
+        _populate(reopened)
+        assert reopened.to_dataframe()["transaction_id"].is_unique
+
+    def test_parquet_export_renders_uuids(self, tmp_path):
+        ledger = Ledger(transaction_ids="deferred")
+        _populate(ledger)
+        ledger.to_parquet(tmp_path / "ledger.parquet", partition_by=None)
+
+        restored = Ledger.from_parquet(tmp_path / "ledger.parquet")
+        assert set(restored.to_dataframe()["transaction_id"]) == set(
+            ledger.to_dataframe()["transaction_id"]
+        )
+
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError, match="transaction_ids"):
+            Ledger(transaction_ids="lazy")
@@ -10,13 +10,18 @@ and functional parity with the original pandas-based implementation.
 
 import uuid
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from performa.core.ledger import Ledger
 from performa.core.ledger.records import SeriesMetadata
 from performa.core.primitives.enums import (
+    CapitalSubcategoryEnum,
     CashFlowCategoryEnum,
     RevenueSubcategoryEnum,
+    TransactionPurpose,
 )
 
 
@@ -273,3 +278,145 @@ class TestLedger:
 
         assert len(ledger) == 4
         assert ledger.series_count() == 2
+
+    def test_classification_columns_are_enums(self):
+        """Classification columns use ENUM types and materialize as categoricals."""
+        ledger = Ledger()
+        dates = pd.date_range("2024-01-01", periods=3, freq="M")
+        metadata = SeriesMetadata(
+            category=CashFlowCategoryEnum.REVENUE,
+            subcategory=RevenueSubcategoryEnum.LEASE,
+            item_name="Base Rent",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+        )
+        ledger.add_series(pd.Series([1000.0, 1000.0, 1000.0], index=dates), metadata)
+
+        con, table_name = ledger.get_query_connection()
+        column_types = dict(
+            con.execute(
+                "SELECT column_name, data_type FROM duckdb_columns() "
+                "WHERE table_name = ?",
+                [table_name],
+            ).fetchall()
+        )
+        for column in ("flow_purpose", "category", "subcategory", "entity_type"):
+            assert column_types[column].startswith("ENUM")
+
+        df = ledger.to_dataframe()
+        assert isinstance(df["category"].dtype, pd.CategoricalDtype)
+        assert list(df["category"].cat.categories) == ["Revenue"]
+        assert list(df["flow_purpose"].cat.categories) == ["Operating"]
+
+    def test_custom_subcategory_widens_enum(self):
+        """Values outside the built-in enums are accepted and remain queryable."""
+        ledger = Ledger()
+        dates = pd.date_range("2024-01-01", periods=2, freq="M")
+        standard = SeriesMetadata(
+            category=CashFlowCategoryEnum.REVENUE,
+            subcategory=RevenueSubcategoryEnum.LEASE,
+            item_name="Base Rent",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+        )
+        custom = SeriesMetadata(
+            category=CashFlowCategoryEnum.REVENUE,
+            subcategory="Rooftop Antenna",
+            item_name="Antenna License",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+            entity_type="Tenant's Affiliate",
+        )
+        ledger.add_series(pd.Series([1000.0, 1000.0], index=dates), standard)
+        ledger.add_series(pd.Series([250.0, 250.0], index=dates), custom)
+
+        con, table_name = ledger.get_query_connection()
+        total = con.execute(
+            f"SELECT SUM(amount) FROM {table_name} "
+            "WHERE subcategory = 'Rooftop Antenna' "
+            "AND entity_type = 'Tenant''s Affiliate'"
+        ).fetchone()[0]
+        assert total == 500.0
+        assert len(ledger) == 4
+
+        df = ledger.to_dataframe()
+        assert set(df["subcategory"].cat.categories) == {"Lease", "Rooftop Antenna"}
+
+    def test_select_pushes_filters_and_projection(self):
+        """select() returns only matching rows of the requested columns."""
+        ledger = Ledger()
+        dates = pd.date_range("2024-01-01", periods=3, freq="MS")
+        for subcategory, item_name, amount in [
+            (CapitalSubcategoryEnum.HARD_COSTS, "Building", -1000.0),
+            (CapitalSubcategoryEnum.SOFT_COSTS, "Design Fees", -200.0),
+        ]:
+            ledger.add_series(
+                pd.Series([amount] * 3, index=dates),
+                SeriesMetadata(
+                    category=CashFlowCategoryEnum.CAPITAL,
+                    subcategory=subcategory,
+                    item_name=item_name,
+                    source_id=uuid.uuid4(),
+                    asset_id=uuid.uuid4(),
+                    pass_num=1,
+                ),
+            )
+        ledger.add_series(
+            pd.Series([500.0] * 3, index=dates),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory=RevenueSubcategoryEnum.LEASE,
+                item_name="Base Rent",
+                source_id=uuid.uuid4(),
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+
+        table = ledger.select(
+            columns=["subcategory", "amount"],
+            where={"flow_purpose": TransactionPurpose.CAPITAL_USE},
+        )
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ["subcategory", "amount"]
+        assert table.num_rows == 6
+
+        rows = ledger.select(
+            columns=["date", "amount"],
+            where={
+                "subcategory": [
+                    CapitalSubcategoryEnum.HARD_COSTS,
+                    CapitalSubcategoryEnum.SOFT_COSTS,
+                ]
+            },
+            group_by_month=True,
+            output="numpy",
+        )
+        assert list(rows["amount"]) == [-1200.0, -1200.0, -1200.0]
+        assert rows["date"].dtype == np.dtype("datetime64[D]")
+
+        by_subcategory = ledger.select(
+            columns=["subcategory", "amount"],
+            where={"category": CashFlowCategoryEnum.CAPITAL},
+            contains={"item_name": "Fees"},
+            group_by_month=True,
+            output="numpy",
+        )
+        assert list(by_subcategory["subcategory"]) == ["Soft Costs"]
+        assert list(by_subcategory["amount"]) == [-600.0]
+
+        assert len(ledger.select(where={"entity_type": None})) == 9
+        assert (
+            ledger.select(columns=["amount"], where={"subcategory": []}).num_rows == 0
+        )
+
+    def test_select_rejects_unknown_columns(self):
+        """Column names are validated before building SQL."""
+        ledger = Ledger()
+        with pytest.raises(ValueError, match="Unknown ledger column"):
+            ledger.select(columns=["amount; DROP TABLE transactions"])
+        with pytest.raises(ValueError, match="Unknown output format"):
+            ledger.select(output="pandas")
@@ -0,0 +1,160 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for Ledger.fingerprint() and Ledger.diff().
+"""
+
+import uuid
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+from performa.deal import analyze
+from performa.patterns import StabilizedOfficePattern
+
+INDEX = pd.period_range("2024-01", periods=6, freq="M")
+
+LINES = [
+    ("Rent", CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 100.0),
+    ("Parking", CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.MISC, 12.5),
+    ("Taxes", CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -40.0),
+    (None, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -3.0),
+]
+
+
+def _write(ledger: Ledger, lines=LINES, shift: float = 0.0) -> Ledger:
+    for name, category, subcategory, amount in lines:
+        ledger.add_series(
+            pd.Series(amount + shift, index=INDEX),
+            SeriesMetadata(
+                category=category,
+                subcategory=subcategory,
+                item_name=name,
+                source_id=uuid.uuid4(),
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+    return ledger
+
+
+class TestLedgerFingerprint:
+    """Fingerprints identify ledger contents, ignoring ids and row order."""
+
+    def test_same_contents_same_fingerprint(self):
+        reference = _write(Ledger()).fingerprint()
+        assert len(reference) == 32
+        assert _write(Ledger(), LINES[::-1]).fingerprint() == reference
+        assert (
+            _write(Ledger(layout="normalized", transaction_ids="deferred")).fingerprint()
+            == reference
+        )
+        assert _write(Ledger().fork()).fingerprint() == reference
+
+    def test_changes_change_the_fingerprint(self):
+        reference = _write(Ledger()).fingerprint()
+        assert _write(Ledger(), shift=0.5).fingerprint() != reference
+        assert _write(Ledger(), LINES[:-1]).fingerprint() != reference
+        assert Ledger().fingerprint() != reference
+
+        renamed = [("Base Rent", *LINES[0][1:]), *LINES[1:]]
+        assert _write(Ledger(), renamed).fingerprint() != reference
+
+    def test_tolerance(self):
+        ledger, shifted = _write(Ledger()), _write(Ledger(), shift=0.004)
+        assert shifted.fingerprint() == ledger.fingerprint()
+        assert shifted.fingerprint(tolerance=0.001) != ledger.fingerprint(
+            tolerance=0.001
+        )
+        with pytest.raises(ValueError, match="tolerance must be positive"):
+            ledger.fingerprint(tolerance=0)
+
+    def test_fingerprint_follows_writes(self):
+        ledger = _write(Ledger())
+        before = ledger.fingerprint()
+        assert ledger.fingerprint() == before
+        _write(ledger, LINES[:1])
+        assert ledger.fingerprint() != before
+
+    def test_repeated_deal_runs_match(self):
+        pattern = StabilizedOfficePattern(
+            property_name="Fingerprint Office",
+            acquisition_date=date(2024, 1, 1),
+            acquisition_price=10_000_000,
+            net_rentable_area=40_000,
+            current_rent_psf=20.0,
+            occupancy_rate=0.95,
+            hold_period_years=5,
+            exit_cap_rate=0.06,
+            ltv_ratio=0.65,
+        )
+        first, second = Ledger(), Ledger()
+        analyze(pattern.create(), pattern.get_timeline(), ledger=first)
+        analyze(pattern.create(), pattern.get_timeline(), ledger=second)
+
+        assert first.fingerprint() == second.fingerprint()
+        assert first.diff(second).empty
+
+
+class TestLedgerDiff:
+    """Diffs list only the differing groups."""
+
+    def test_identical_ledgers(self):
+        ledger = _write(Ledger())
+        diff = ledger.diff(_write(Ledger(layout="normalized")))
+        assert diff.empty
+        assert list(diff.columns) == [
+            "date",
+            "flow_purpose",
+            "category",
+            "subcategory",
+            "item_name",
+            "amount",
+            "other_amount",
+            "difference",
+        ]
+
+    def test_changed_and_missing_groups(self):
+        ledger = _write(Ledger())
+        other = _write(Ledger(), [LINES[0], LINES[2], LINES[3]])
+        other.add_series(
+            pd.Series(1.0, index=INDEX[:1]),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory=RevenueSubcategoryEnum.LEASE,
+                item_name="Rent",
+                source_id=uuid.uuid4(),
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+
+        diff = ledger.diff(other)
+        parking = diff[diff["item_name"] == "Parking"]
+        assert len(parking) == len(INDEX)
+        assert parking["other_amount"].isna().all()
+        assert (parking["difference"] == -12.5).all()
+
+        rent = diff[diff["item_name"] == "Rent"]
+        assert rent[["amount", "other_amount", "difference"]].values.tolist() == [
+            [100.0, 101.0, 1.0]
+        ]
+        assert len(diff) == len(INDEX) + 1
+
+    def test_tolerance_and_null_item_names(self):
+        ledger = _write(Ledger())
+        assert ledger.diff(_write(Ledger(), shift=0.004)).empty
+        assert len(ledger.diff(_write(Ledger(), shift=0.004), tolerance=0.001)) == (
+            len(LINES) * len(INDEX)
+        )
+        # Rows without an item name still match each other
+        assert ledger.diff(_write(Ledger(), LINES[3:])).item_name.notna().all()
@@ -0,0 +1,109 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for copy-on-write ledger forks.
+
+`Ledger.fork()` shares the parent's committed rows through a view and sends
+the fork's writes to its own overlay table, isolating both sides.
+"""
+
+import gc
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+INDEX = pd.period_range("2024-01", periods=3, freq="M")
+
+
+def _add_line(ledger: Ledger, category, subcategory, amount: float) -> None:
+    metadata = SeriesMetadata(
+        category=category,
+        subcategory=subcategory,
+        item_name="Line",
+        source_id=uuid.uuid4(),
+        asset_id=uuid.uuid4(),
+        pass_num=1,
+    )
+    ledger.add_series(pd.Series([amount] * len(INDEX), index=INDEX), metadata)
+
+
+def _asset_ledger() -> Ledger:
+    ledger = Ledger()
+    _add_line(
+        ledger, CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 1000.0
+    )
+    return ledger
+
+
+def _add_opex(ledger: Ledger, amount: float) -> None:
+    _add_line(ledger, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, amount)
+
+
+class TestLedgerFork:
+    """Reads see the shared base rows; writes stay on their own side."""
+
+    def test_fork_shares_rows_and_isolates_writes(self):
+        parent = _asset_ledger()
+        first, second = parent.fork(), parent.fork()
+        assert len(first) == len(parent) == 3
+
+        _add_opex(first, -400.0)
+        _add_opex(second, -100.0)
+        _add_opex(parent, -50.0)  # after the fork: invisible to the forks
+
+        assert (LedgerQueries(first).noi() == 600.0).all()
+        assert (LedgerQueries(second).noi() == 900.0).all()
+        assert (LedgerQueries(parent).noi() == 950.0).all()
+        assert len(first) == len(second) == len(parent) == 6
+
+    def test_fork_keeps_enum_columns_after_widening(self):
+        parent = _asset_ledger()
+        child = parent.fork()
+        _add_line(child, CashFlowCategoryEnum.REVENUE, "Rooftop Antenna", 50.0)
+        _add_line(parent, CashFlowCategoryEnum.REVENUE, "Parking", 25.0)
+
+        df = child.to_dataframe()
+        assert isinstance(df["subcategory"].dtype, pd.CategoricalDtype)
+        assert set(df["subcategory"].astype(str)) == {"Lease", "Rooftop Antenna"}
+        assert "Parking" not in set(child.to_dataframe()["subcategory"].astype(str))
+        assert "Rooftop Antenna" not in set(parent.to_dataframe()["subcategory"])
+
+    def test_nested_fork_reads_every_ancestor(self):
+        parent = _asset_ledger()
+        child = parent.fork()
+        _add_opex(child, -400.0)
+        grandchild = child.fork()
+        _add_opex(grandchild, -100.0)
+        _add_opex(child, -1.0)
+
+        assert (LedgerQueries(grandchild).noi() == 500.0).all()
+        assert len(grandchild) == 9
+        assert len(parent) == 3
+
+    def test_clear_and_close(self):
+        parent = _asset_ledger()
+        child = parent.fork()
+        _add_opex(child, -400.0)
+
+        with pytest.raises(RuntimeError, match="live forks"):
+            parent.clear()
+
+        child.clear()
+        assert len(child) == 0
+        assert len(parent) == 3
+
+        child.close()
+        del child
+        gc.collect()
+        parent.clear()
+        assert len(parent) == 0
@@ -0,0 +1,128 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the bounded ledger pool.
+
+`LedgerPool` hands out initialized ledgers and resets them on release, so a
+reused ledger must look exactly like a new one to its next caller.
+"""
+
+import threading
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerPool, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+INDEX = pd.period_range("2024-01", periods=3, freq="M")
+
+
+def _add_rent(ledger: Ledger, amount: float = 1000.0, subcategory=None) -> None:
+    metadata = SeriesMetadata(
+        category=CashFlowCategoryEnum.REVENUE,
+        subcategory=subcategory or RevenueSubcategoryEnum.LEASE,
+        item_name="Rent",
+        source_id=uuid.uuid4(),
+        asset_id=uuid.uuid4(),
+        pass_num=1,
+    )
+    ledger.add_series(pd.Series([amount] * len(INDEX), index=INDEX), metadata)
+
+
+class TestLedgerPool:
+    """Reuse, reset and bounding of pooled ledgers."""
+
+    def test_released_ledger_is_reused_empty(self):
+        pool = LedgerPool(size=1)
+        with pool.ledger() as first:
+            _add_rent(first)
+            assert LedgerQueries(first).pgr().sum() == pytest.approx(3000.0)
+            version = first.get_version()
+
+        with pool.ledger() as second:
+            assert second is first
+            assert len(second) == 0
+            assert second.series_count() == 0
+            assert second.get_version() > version
+            assert LedgerQueries(second).pgr().empty
+
+        assert pool.stats()["created"] == 1
+        assert pool.stats()["reuses"] == 1
+
+    def test_reset_discards_cached_query_results(self):
+        pool = LedgerPool(size=1)
+        with pool.ledger() as ledger:
+            _add_rent(ledger, 1000.0)
+            queries = ledger.get_queries()
+            assert queries.pgr().sum() == pytest.approx(3000.0)
+
+        with pool.ledger() as ledger:
+            _add_rent(ledger, 250.0)
+            assert ledger.get_queries().pgr().sum() == pytest.approx(750.0)
+
+    def test_reset_keeps_widened_enum_and_closes_forks(self):
+        pool = LedgerPool(size=1)
+        with pool.ledger() as ledger:
+            _add_rent(ledger, subcategory="Parking Income")
+            ledger.fork()
+
+        with pool.ledger() as ledger:
+            assert len(ledger._forks) == 0
+            _add_rent(ledger, subcategory="Parking Income")
+            assert len(ledger) == 3
+
+    def test_reset_inside_open_transaction(self):
+        pool = LedgerPool(size=1)
+        with pool.ledger() as ledger:
+            ledger._in_transaction = True
+            _add_rent(ledger)
+            assert ledger.has_buffered_data()
+
+        with pool.ledger() as ledger:
+            assert not ledger.has_buffered_data()
+            _add_rent(ledger)
+            assert len(ledger) == 3
+
+    def test_pool_is_bounded(self):
+        pool = LedgerPool(size=2)
+        first, second = pool.acquire(), pool.acquire()
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        waiter.start()
+        pool.release(first)
+        waiter.join(timeout=5)
+
+        assert acquired == [first]
+        assert pool.stats()["created"] == 2
+        pool.release(second)
+        pool.release(acquired[0])
+
+    def test_release_rejects_foreign_ledger(self):
+        pool = LedgerPool(size=1)
+        with pytest.raises(ValueError, match="not acquired"):
+            pool.release(Ledger())
+
+    def test_closed_pool_refuses_acquire(self):
+        pool = LedgerPool(size=1)
+        ledger = pool.acquire()
+        pool.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.acquire()
+        pool.release(ledger)
+        assert pool.stats()["idle"] == 0
+
+    def test_rejects_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            LedgerPool(size=0)
+        with pytest.raises(ValueError, match="in-memory"):
+            LedgerPool(path="pooled.duckdb")
@@ -0,0 +1,142 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for ledger query/insert profiling (LedgerProfiler).
+"""
+
+import uuid
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerProfiler, LedgerQueries
+from performa.core.ledger.query_analyzer import ANALYSIS_PASSES
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+from performa.deal import analyze
+from performa.patterns import StabilizedOfficePattern
+
+INDEX = pd.period_range("2024-01", periods=12, freq="M")
+
+
+def _add_line(ledger: Ledger, category, subcategory, amount: float) -> None:
+    ledger.add_series(
+        pd.Series(amount, index=INDEX),
+        SeriesMetadata(
+            category=category,
+            subcategory=subcategory,
+            item_name="Line",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+        ),
+    )
+
+
+def _write(ledger: Ledger) -> Ledger:
+    _add_line(ledger, CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 100.0)
+    _add_line(ledger, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -40.0)
+    return ledger
+
+
+class TestLedgerProfiler:
+    """Queries and inserts are recorded with timing, rows and cache outcome."""
+
+    def test_records_inserts_and_queries(self):
+        ledger = _write(Ledger(profile=True))
+        queries = LedgerQueries(ledger)
+        queries.noi()
+        queries.noi()
+
+        records = ledger.profiler.records()
+        assert list(records.columns) == list(LedgerProfiler.COLUMNS)
+        inserts = records[records["kind"] == "insert"]
+        assert inserts["rows"].sum() == 2 * len(INDEX)
+        assert set(inserts["method"]) == {"Ledger.add_series"}
+
+        noi = records[records["method"] == "LedgerQueries.noi"]
+        assert noi["cache"].tolist() == ["miss", "hit"]
+        assert noi["statement"].iloc[0] == "monthly_sum"
+        assert noi["rows"].tolist() == [len(INDEX), len(INDEX)]
+        assert noi["rows_scanned"].iloc[0] > 0
+        assert pd.isna(noi["rows_scanned"].iloc[1])
+        assert (records["wall_ms"] >= 0).all()
+        assert noi["caller"].iloc[0].endswith("test_records_inserts_and_queries")
+
+    def test_select_and_to_dataframe(self):
+        ledger = _write(Ledger(profile=True))
+        ledger.select(["date", "amount"], group_by_month=True)
+        ledger.to_dataframe()
+        ledger.to_dataframe()
+
+        records = ledger.profiler.records().set_index("method")
+        assert records.loc["Ledger.select", "rows"] == len(INDEX)
+        assert records.loc["Ledger.select", "rows_scanned"] == 2 * len(INDEX)
+        assert records.loc["Ledger.to_dataframe", "cache"].tolist() == ["miss", "hit"]
+
+    def test_report(self):
+        ledger = _write(Ledger(profile=True))
+        with ledger.analysis_pass("valuation"):
+            LedgerQueries(ledger).egi()
+        report = ledger.profiler.report()
+        assert report.index.names == ["analysis_pass", "method"]
+        assert report.loc[("valuation", "LedgerQueries.egi"), "cache_misses"] == 1
+        assert report["total_ms"].is_monotonic_decreasing
+
+        by_kind = ledger.profiler.report(by="kind")
+        assert by_kind["calls"].sum() == len(ledger.profiler.records())
+        with pytest.raises(ValueError, match="Unknown profile column"):
+            ledger.profiler.report(by=("phase",))
+
+        ledger.profiler.reset()
+        assert ledger.profiler.records().empty
+
+    def test_profiling_off_by_default(self):
+        ledger = _write(Ledger())
+        LedgerQueries(ledger).noi()
+        assert ledger.profiler is None
+        with ledger.analysis_pass("debt"):
+            LedgerQueries(ledger).egi()
+
+    def test_profiling_block_and_forks(self):
+        ledger = _write(Ledger())
+        with ledger.profiling() as profiler:
+            child = _write(ledger.fork())
+            LedgerQueries(child).noi()
+            with ledger.profiling() as nested:
+                assert nested is profiler
+        assert ledger.profiler is None
+        LedgerQueries(ledger).egi()
+
+        methods = set(profiler.records()["method"])
+        assert {"Ledger.add_series", "LedgerQueries.noi"} <= methods
+        assert "LedgerQueries.egi" not in methods
+
+    def test_deal_passes(self):
+        pattern = StabilizedOfficePattern(
+            property_name="Profiled Office",
+            acquisition_date=date(2024, 1, 1),
+            acquisition_price=10_000_000,
+            net_rentable_area=40_000,
+            current_rent_psf=20.0,
+            occupancy_rate=0.95,
+            hold_period_years=5,
+            exit_cap_rate=0.06,
+            ltv_ratio=0.65,
+        )
+        ledger = Ledger()
+        with ledger.profiling() as profiler:
+            results = analyze(pattern.create(), pattern.get_timeline(), ledger=ledger)
+            assert results.levered_irr is not None
+
+        by_pass = profiler.report(by="analysis_pass")
+        assert {"asset", "valuation", "debt", "partnership"} <= set(by_pass.index)
+        assert set(by_pass.index.dropna()) <= set(ANALYSIS_PASSES)
+        # Metrics queried after analyze() belong to no pass
+        assert by_pass.index.isna().any()
@@ -0,0 +1,118 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for FlowPurposeMapper vectorized classification.
+
+The vectorized API must agree exactly with the scalar
+`determine_purpose_with_subcategory` rules for every category/subcategory
+pair and amount sign.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from performa.core.ledger.mapper import FlowPurposeMapper
+from performa.core.primitives.enums import (
+    CapExCategoryEnum,
+    CapitalSubcategoryEnum,
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    FinancingSubcategoryEnum,
+    RevenueSubcategoryEnum,
+    ValuationSubcategoryEnum,
+)
+
+AMOUNTS = np.array([-1_250_000.0, -0.01, 0.0, 0.01, 42.0, 3_000_000.0, np.nan])
+
+CLASSIFIED_CATEGORIES = [
+    CashFlowCategoryEnum.CAPITAL,
+    CashFlowCategoryEnum.EXPENSE,
+    CashFlowCategoryEnum.REVENUE,
+    CashFlowCategoryEnum.FINANCING,
+    CashFlowCategoryEnum.VALUATION,
+]
+
+ALL_SUBCATEGORIES = list(
+    itertools.chain(
+        CapitalSubcategoryEnum,
+        CapExCategoryEnum,
+        ExpenseSubcategoryEnum,
+        FinancingSubcategoryEnum,
+        RevenueSubcategoryEnum,
+        ValuationSubcategoryEnum,
+    )
+) + ["Sale Proceeds"]
+
+
+def _scalar_purposes(category, subcategory, amounts):
+    return [
+        FlowPurposeMapper.determine_purpose_with_subcategory(
+            category, subcategory, amount
+        ).value
+        for amount in amounts
+    ]
+
+
+@pytest.mark.parametrize("category", CLASSIFIED_CATEGORIES, ids=lambda c: c.value)
+def test_vectorized_matches_scalar_mapper(category):
+    """Every category/subcategory pair classifies identically to the scalar path."""
+    for subcategory in ALL_SUBCATEGORIES:
+        vectorized = FlowPurposeMapper.determine_purpose_array(
+            category, subcategory, AMOUNTS
+        )
+        assert list(vectorized) == _scalar_purposes(category, subcategory, AMOUNTS), (
+            f"{category.value} / {subcategory}"
+        )
+
+
+def test_string_inputs_match_enum_inputs():
+    """Ledger stores plain strings; they must classify like their enums."""
+    pairs = [
+        (CashFlowCategoryEnum.FINANCING, FinancingSubcategoryEnum.CASH_SWEEP_RELEASE),
+        (CashFlowCategoryEnum.FINANCING, FinancingSubcategoryEnum.INTEREST_PAYMENT),
+        (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.SALE),
+        (CashFlowCategoryEnum.CAPITAL, CapitalSubcategoryEnum.HARD_COSTS),
+    ]
+    for category, subcategory in pairs:
+        assert list(
+            FlowPurposeMapper.determine_purpose_array(
+                category.value, subcategory.value, AMOUNTS
+            )
+        ) == _scalar_purposes(category, subcategory, AMOUNTS)
+
+
+def test_mixed_rows_match_scalar_mapper():
+    """Heterogeneous rows are grouped by pair and keep their original order."""
+    rng = np.random.default_rng(7)
+    pairs = [
+        (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE),
+        (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX),
+        (CashFlowCategoryEnum.CAPITAL, CapitalSubcategoryEnum.OTHER),
+        (CashFlowCategoryEnum.FINANCING, FinancingSubcategoryEnum.LOAN_PROCEEDS),
+        (CashFlowCategoryEnum.FINANCING, FinancingSubcategoryEnum.EQUITY_CONTRIBUTION),
+    ]
+    picks = rng.integers(0, len(pairs), size=500)
+    categories = [pairs[i][0] for i in picks]
+    subcategories = [pairs[i][1] for i in picks]
+    amounts = rng.normal(0.0, 1_000.0, size=500)
+
+    vectorized = FlowPurposeMapper.determine_purpose_arrays(
+        categories, subcategories, amounts
+    )
+
+    expected = [
+        FlowPurposeMapper.determine_purpose_with_subcategory(c, s, a).value
+        for c, s, a in zip(categories, subcategories, amounts)
+    ]
+    assert list(vectorized) == expected
+
+
+def test_unknown_category_raises_like_scalar():
+    """Unclassifiable categories still raise instead of defaulting silently."""
+    with pytest.raises(ValueError):
+        FlowPurposeMapper.determine_purpose_array(
+            CashFlowCategoryEnum.OTHER, "Unknown", np.array([1.0])
+        )
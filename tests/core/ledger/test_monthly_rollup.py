@@ -0,0 +1,174 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the ledger's incrementally maintained monthly rollup.
+
+Every insert adds its monthly totals to `Ledger.rollup_table`; the monthly
+aggregate queries read the rollup and must match the transactions table.
+"""
+
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.ledger import ROLLUP_COMPACT_MIN_ROWS
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CapitalSubcategoryEnum,
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+    UnleveredAggregateLineKey,
+)
+
+INDEX = pd.period_range("2024-01", periods=12, freq="M")
+
+LINES = [
+    (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, "Rent", 1000.0),
+    (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.VACANCY_LOSS, "Vacancy", -50.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, "Taxes", -250.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.CAPEX, "Roof", -80.0),
+    (CashFlowCategoryEnum.CAPITAL, CapitalSubcategoryEnum.HARD_COSTS, "TI - Suite 100", -40.0),
+    (CashFlowCategoryEnum.CAPITAL, CapitalSubcategoryEnum.HARD_COSTS, "Leasing Commission", -30.0),
+    (CashFlowCategoryEnum.CAPITAL, CapitalSubcategoryEnum.HARD_COSTS, None, -20.0),
+    (CashFlowCategoryEnum.CAPITAL, CapitalSubcategoryEnum.PURCHASE_PRICE, "Purchase", -9000.0),
+]
+
+METHODS = ("pgr", "gpr", "vacancy_loss", "egi", "opex", "noi", "capex", "ti", "lc")
+
+
+def _add_lines(ledger: Ledger, scale: float = 1.0) -> None:
+    with ledger.transaction():
+        for category, subcategory, name, amount in LINES:
+            ledger.add_series(
+                pd.Series([scale * amount * (1 + m / 10) for m in range(12)], index=INDEX),
+                SeriesMetadata(
+                    category=category,
+                    subcategory=subcategory,
+                    item_name=name,
+                    source_id=uuid.uuid4(),
+                    asset_id=uuid.uuid4(),
+                    pass_num=1,
+                ),
+            )
+
+
+def _rollup_rows(ledger: Ledger) -> int:
+    return ledger.con.execute(f"SELECT COUNT(*) FROM {ledger.rollup_table}").fetchone()[0]
+
+
+def _scan_queries(ledger: Ledger) -> LedgerQueries:
+    """Queries that roll up the transactions table at query time."""
+
+    class _Unrolled:
+        query_cache = None
+
+        def get_query_connection(self):
+            return ledger.get_query_connection()
+
+        def get_version(self):
+            return ledger.get_version()
+
+    return LedgerQueries(_Unrolled())
+
+
+def _assert_matches_scan(ledger: Ledger) -> None:
+    rolled, scanned = LedgerQueries(ledger), _scan_queries(ledger)
+    for method in METHODS:
+        pd.testing.assert_series_equal(
+            getattr(rolled, method)(), getattr(scanned, method)(), obj=method
+        )
+
+
+class TestMonthlyRollup:
+    """The rollup tracks every insert and answers the monthly aggregates."""
+
+    def test_queries_read_rollup_and_match_transactions(self):
+        ledger = Ledger()
+        _add_lines(ledger)
+        _add_lines(ledger, scale=2.0)
+
+        queries = LedgerQueries(ledger)
+        assert queries.rollup_table == ledger.rollup_table
+        _assert_matches_scan(ledger)
+
+        df = ledger.to_dataframe()
+        expected_noi = df[df["flow_purpose"] == "Operating"]["amount"].sum()
+        assert queries.noi().sum() == pytest.approx(expected_noi)
+        assert queries.ti().sum() == pytest.approx(-40.0 * 3 * 18.6)
+        assert queries.lc().sum() == pytest.approx(-30.0 * 3 * 18.6)
+        # Roof only: TI, LC, unnamed and purchase rows are excluded
+        assert queries.capex().sum() == pytest.approx(-80.0 * 3 * 18.6)
+
+        bundle = queries.aggregate_bundle(index=INDEX)
+        pd.testing.assert_series_equal(
+            bundle[UnleveredAggregateLineKey.NET_OPERATING_INCOME.value],
+            queries.noi().reindex(INDEX, fill_value=0.0),
+            check_names=False,
+        )
+
+    def test_rollup_size_is_independent_of_transaction_count(self):
+        ledger = Ledger()
+        for _ in range(40):
+            _add_lines(ledger)
+
+        ledger._compact_rollup()
+        assert len(ledger) == 40 * len(LINES) * 12
+        assert _rollup_rows(ledger) == len(LINES) * 12
+        _assert_matches_scan(ledger)
+
+    def test_partial_rows_are_compacted(self):
+        ledger = Ledger()
+        batches = 0
+        while ledger._rollup_compacted_rows == 0:
+            _add_lines(ledger)
+            batches += 1
+        assert batches * len(LINES) * 12 >= 2 * ROLLUP_COMPACT_MIN_ROWS
+        assert _rollup_rows(ledger) == ledger._rollup_rows < 2 * ROLLUP_COMPACT_MIN_ROWS
+        _assert_matches_scan(ledger)
+
+    def test_fork_keeps_its_own_rollup(self):
+        parent = Ledger()
+        _add_lines(parent)
+        parent_noi = LedgerQueries(parent).noi()
+        child = parent.fork()
+        _add_lines(child)
+
+        pd.testing.assert_series_equal(LedgerQueries(parent).noi(), parent_noi)
+        assert LedgerQueries(child).noi().sum() == pytest.approx(2 * parent_noi.sum())
+        _assert_matches_scan(child)
+
+        rollup = child.rollup_table
+        child.close()
+        assert not parent.con.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?", [rollup]
+        ).fetchone()[0]
+
+    def test_clear_empties_rollup(self):
+        ledger = Ledger()
+        _add_lines(ledger)
+        ledger.clear()
+        assert _rollup_rows(ledger) == 0
+        assert LedgerQueries(ledger).noi().empty
+
+    @pytest.mark.parametrize("layout", ["wide", "normalized"])
+    def test_rollup_with_layouts_and_deferred_ids(self, layout):
+        ledger = Ledger(layout=layout, transaction_ids="deferred")
+        _add_lines(ledger)
+        _assert_matches_scan(ledger)
+
+    def test_reopen_rebuilds_missing_rollup(self, tmp_path):
+        path = tmp_path / "rollup.duckdb"
+        ledger = Ledger(path=path)
+        _add_lines(ledger)
+        expected = LedgerQueries(ledger).noi()
+        ledger.con.execute(f"DROP TABLE {ledger.rollup_table}")
+        ledger.close()
+
+        reopened = Ledger.open(path)
+        pd.testing.assert_series_equal(LedgerQueries(reopened).noi(), expected)
+        _add_lines(reopened)
+        _assert_matches_scan(reopened)
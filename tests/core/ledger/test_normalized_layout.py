@@ -0,0 +1,196 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the normalized ledger layout.
+
+`Ledger(layout="normalized")` stores series metadata once in a dimension
+table and only (series_key, date, amount, flow_purpose) per transaction; the
+`transactions` view must read exactly like the wide table.
+"""
+
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata, TransactionRecord
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    FinancingSubcategoryEnum,
+    RevenueSubcategoryEnum,
+    TransactionPurpose,
+)
+
+INDEX = pd.period_range("2024-01", periods=12, freq="M")
+ASSET_ID = uuid.uuid4()
+DEAL_ID = uuid.uuid4()
+PARTNER_ID = uuid.uuid4()
+
+
+def _populate(ledger: Ledger) -> None:
+    lines = [
+        (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, "Rent", 1000.0),
+        (CashFlowCategoryEnum.REVENUE, "Rooftop Antenna", "Antenna", 50.0),
+        (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, "Taxes", -250.0),
+        (
+            CashFlowCategoryEnum.FINANCING,
+            FinancingSubcategoryEnum.INTEREST_PAYMENT,
+            "Interest",
+            -400.0,
+        ),
+    ]
+    with ledger.transaction():
+        for i, (category, subcategory, name, amount) in enumerate(lines):
+            ledger.add_series(
+                pd.Series([amount * (1 + m / 100) for m in range(12)], index=INDEX),
+                SeriesMetadata(
+                    category=category,
+                    subcategory=subcategory,
+                    item_name=name,
+                    source_id=uuid.UUID(int=i + 1),
+                    asset_id=ASSET_ID,
+                    pass_num=1 if i < 3 else 2,
+                    deal_id=DEAL_ID if i == 3 else None,
+                ),
+            )
+    ledger.add_records([
+        TransactionRecord(
+            date=INDEX[0].to_timestamp().date(),
+            amount=-5000.0,
+            flow_purpose=TransactionPurpose.CAPITAL_SOURCE,
+            category=CashFlowCategoryEnum.FINANCING,
+            subcategory=FinancingSubcategoryEnum.EQUITY_CONTRIBUTION,
+            item_name="Partner Equity",
+            source_id=uuid.UUID(int=99),
+            asset_id=ASSET_ID,
+            pass_num=2,
+            deal_id=DEAL_ID,
+            entity_id=PARTNER_ID,
+            entity_type="GP",
+        )
+    ])
+
+
+def _comparable(df: pd.DataFrame) -> pd.DataFrame:
+    columns = [c for c in df.columns if c != "transaction_id"]
+    df = df[columns].astype({c: str for c in columns if c not in ("date", "amount")})
+    return df.sort_values(["date", "item_name", "amount"]).reset_index(drop=True)
+
+
+class TestNormalizedLayout:
+    """Storage is split; reads match the wide layout."""
+
+    def test_dataframe_and_queries_match_wide_layout(self):
+        wide, normalized = Ledger(), Ledger(layout="normalized")
+        _populate(wide)
+        _populate(normalized)
+
+        pd.testing.assert_frame_equal(
+            _comparable(normalized.to_dataframe()), _comparable(wide.to_dataframe())
+        )
+        assert list(normalized.to_dataframe().columns) == list(
+            wide.to_dataframe().columns
+        )
+
+        wide_queries, normalized_queries = LedgerQueries(wide), LedgerQueries(normalized)
+        for method in ("pgr", "egi", "opex", "noi", "debt_service", "equity_contributions"):
+            pd.testing.assert_series_equal(
+                getattr(normalized_queries, method)(), getattr(wide_queries, method)()
+            )
+        pd.testing.assert_series_equal(
+            normalized_queries.partner_flows(PARTNER_ID),
+            wide_queries.partner_flows(PARTNER_ID),
+        )
+
+    def test_series_metadata_is_stored_once(self):
+        ledger = Ledger(layout="normalized")
+        _populate(ledger)
+
+        series_rows = ledger.con.execute(
+            f"SELECT COUNT(*) FROM {ledger._series_table}"
+        ).fetchone()[0]
+        fact_columns = [
+            row[0]
+            for row in ledger.con.execute(
+                f"DESCRIBE {ledger._storage_table}"
+            ).fetchall()
+        ]
+        assert series_rows == 5
+        assert len(ledger) == 4 * 12 + 1
+        assert fact_columns == [
+            "transaction_id",
+            "date",
+            "amount",
+            "flow_purpose",
+            "series_key",
+        ]
+
+    def test_series_keys_continue_across_batches_and_reset_on_clear(self):
+        ledger = Ledger(layout="normalized")
+        _populate(ledger)
+        _populate(ledger)
+        keys = ledger.con.execute(
+            f"SELECT COUNT(DISTINCT series_key), MAX(series_key) FROM {ledger._series_table}"
+        ).fetchone()
+        assert keys == (10, 10)
+
+        ledger.clear()
+        assert len(ledger) == 0
+        _populate(ledger)
+        assert ledger.con.execute(
+            f"SELECT MAX(series_key) FROM {ledger._series_table}"
+        ).fetchone()[0] == 5
+
+    def test_fork_of_normalized_ledger(self):
+        parent = Ledger(layout="normalized")
+        _populate(parent)
+        child = parent.fork()
+        child.add_series(
+            pd.Series(-75.0, index=INDEX),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.EXPENSE,
+                subcategory=ExpenseSubcategoryEnum.OPEX,
+                item_name="Assessment",
+                source_id=uuid.uuid4(),
+                asset_id=ASSET_ID,
+                pass_num=2,
+            ),
+        )
+
+        assert len(parent) == 49
+        assert len(child) == 61
+        assert LedgerQueries(child).opex().sum() == pytest.approx(
+            LedgerQueries(parent).opex().sum() - 75.0 * 12
+        )
+
+    def test_reopen_keeps_layout(self, tmp_path):
+        path = tmp_path / "normalized.duckdb"
+        ledger = Ledger(path=path, layout="normalized")
+        _populate(ledger)
+        expected = _comparable(ledger.to_dataframe())
+        ledger.close()
+
+        reopened = Ledger.open(path)
+        assert reopened._layout == "normalized"
+        pd.testing.assert_frame_equal(_comparable(reopened.to_dataframe()), expected)
+        _populate(reopened)
+        assert reopened.con.execute(
+            f"SELECT COUNT(DISTINCT series_key) FROM {reopened._series_table}"
+        ).fetchone()[0] == 10
+
+    def test_parquet_round_trip_into_normalized_layout(self, tmp_path):
+        wide = Ledger()
+        _populate(wide)
+        wide.to_parquet(tmp_path / "export", partition_by=None)
+
+        loaded = Ledger.from_parquet(tmp_path / "export", layout="normalized")
+        pd.testing.assert_frame_equal(
+            _comparable(loaded.to_dataframe()), _comparable(wide.to_dataframe())
+        )
+
+    def test_rejects_unknown_layout(self):
+        with pytest.raises(ValueError, match="Unknown ledger layout"):
+            Ledger(layout="columnar")
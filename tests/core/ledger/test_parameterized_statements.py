@@ -0,0 +1,116 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the parameterized statements behind LedgerQueries.
+"""
+
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.ledger.statements import MONTHLY_SUM, execute_statement
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+    TransactionPurpose,
+)
+
+INDEX = pd.period_range("2024-01", periods=6, freq="M")
+
+
+def _add_line(ledger: Ledger, category, subcategory, amount: float) -> None:
+    ledger.add_series(
+        pd.Series(amount, index=INDEX),
+        SeriesMetadata(
+            category=category,
+            subcategory=subcategory,
+            item_name="Line",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+        ),
+    )
+
+
+@pytest.fixture
+def ledger() -> Ledger:
+    ledger = Ledger()
+    _add_line(ledger, CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 100.0)
+    _add_line(ledger, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -40.0)
+    return ledger
+
+
+class TestParameterizedStatements:
+    """Statements bind their arguments and key the result cache."""
+
+    def test_statement_runs_with_bound_arguments(self, ledger):
+        arguments = (["Operating"], None, None, None, None, None, None)
+        rows = execute_statement(
+            ledger.con, MONTHLY_SUM, ledger.rollup_table, arguments
+        ).fetchall()
+        assert len(rows) == 6
+        assert all(total == pytest.approx(60.0) for _, total in rows)
+
+    def test_equivalent_arguments_share_cache_entry(self, ledger):
+        queries = LedgerQueries(ledger)
+        noi = queries.noi()
+        hits = ledger.query_cache.hits
+
+        by_string = queries._monthly_sum("Net Operating Income", purposes=["Operating"])
+        assert ledger.query_cache.hits == hits + 1
+        pd.testing.assert_series_equal(by_string, noi)
+
+    def test_quoted_values_are_bound_safely(self, ledger):
+        _add_line(ledger, CashFlowCategoryEnum.REVENUE, "Owner's Parking", 7.0)
+        series = LedgerQueries(ledger)._monthly_sum(
+            "Parking",
+            purposes=[TransactionPurpose.OPERATING],
+            subcategories=["Owner's Parking"],
+        )
+        assert series.sum() == pytest.approx(42.0)
+
+        # An argument that would change the SQL if pasted in matches nothing
+        injected = LedgerQueries(ledger)._monthly_sum(
+            "Injected",
+            purposes=[TransactionPurpose.OPERATING],
+            subcategories=["x', 'Lease"],
+        )
+        assert injected.sum() == pytest.approx(0.0)
+
+    def test_argument_count_is_checked(self, ledger):
+        with pytest.raises(ValueError, match="monthly_sum expects 7 arguments"):
+            execute_statement(ledger.con, MONTHLY_SUM, ledger.rollup_table, ())
+
+    def test_fork_queries_leave_parent_usable_after_close(self, ledger):
+        child = ledger.fork()
+        assert LedgerQueries(child).noi().sum() == pytest.approx(360.0)
+
+        child.close()
+        assert LedgerQueries(ledger).noi().sum() == pytest.approx(360.0)
+
+    def test_results_follow_writes(self, ledger):
+        # Plans may depend on table statistics (e.g. the date range), so a
+        # result computed before a write must not be returned after it
+        queries = LedgerQueries(ledger)
+        assert queries.noi().sum() == pytest.approx(360.0)
+
+        later = pd.period_range("2030-01", periods=3, freq="M")
+        ledger.add_series(
+            pd.Series(10.0, index=later),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory=RevenueSubcategoryEnum.MISC,
+                item_name="Parking",
+                source_id=uuid.uuid4(),
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+        noi = queries.noi()
+        assert noi.sum() == pytest.approx(390.0)
+        assert noi.index[-1] == later[-1]
@@ -0,0 +1,140 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for Parquet export and import of ledgers.
+
+`Ledger.to_parquet()` writes zstd-compressed Parquet (optionally hive
+partitioned by deal and asset) and `Ledger.from_parquet()` restores a ledger
+with UUID and ENUM column types intact.
+"""
+
+import uuid
+
+import duckdb
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+INDEX = pd.period_range("2024-01", periods=4, freq="M")
+DEAL_ID = uuid.uuid4()
+ASSET_IDS = [uuid.uuid4(), uuid.uuid4()]
+
+
+def _make_ledger() -> Ledger:
+    ledger = Ledger()
+    with ledger.transaction():
+        for asset_id in ASSET_IDS:
+            ledger.add_series(
+                pd.Series(1000.0, index=INDEX),
+                SeriesMetadata(
+                    category=CashFlowCategoryEnum.REVENUE,
+                    subcategory=RevenueSubcategoryEnum.LEASE,
+                    item_name="Base Rent",
+                    source_id=uuid.uuid4(),
+                    asset_id=asset_id,
+                    deal_id=DEAL_ID,
+                    pass_num=1,
+                ),
+            )
+            ledger.add_series(
+                pd.Series(-300.0, index=INDEX),
+                SeriesMetadata(
+                    category=CashFlowCategoryEnum.EXPENSE,
+                    subcategory=ExpenseSubcategoryEnum.OPEX,
+                    item_name="Taxes",
+                    source_id=uuid.uuid4(),
+                    asset_id=asset_id,
+                    pass_num=1,
+                ),
+            )
+        ledger.add_series(
+            pd.Series(25.0, index=INDEX),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory="Rooftop Antenna",
+                item_name="Antenna License",
+                source_id=uuid.uuid4(),
+                asset_id=ASSET_IDS[0],
+                deal_id=DEAL_ID,
+                entity_type="GP",
+                pass_num=1,
+            ),
+        )
+    return ledger
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    return df.sort_values(["transaction_id"]).reset_index(drop=True)
+
+
+def _column_types(ledger: Ledger) -> dict:
+    return {
+        name: data_type
+        for name, data_type, *_ in ledger.con.execute(
+            f"DESCRIBE {ledger.table_name}"
+        ).fetchall()
+    }
+
+
+class TestLedgerParquet:
+    """Round trips through partitioned and single-file Parquet exports."""
+
+    @pytest.mark.parametrize("partition_by", [("deal_id", "asset_id"), None])
+    def test_round_trip_preserves_rows_and_types(self, tmp_path, partition_by):
+        ledger = _make_ledger()
+        target = tmp_path / ("archive" if partition_by else "ledger.parquet")
+        ledger.to_parquet(target, partition_by=partition_by)
+
+        restored = Ledger.from_parquet(target)
+
+        assert len(restored) == len(ledger)
+        assert restored.series_count() == ledger.series_count()
+        assert _column_types(restored) == _column_types(ledger)
+        pd.testing.assert_frame_equal(
+            _sorted(restored.to_dataframe()),
+            _sorted(ledger.to_dataframe()),
+            check_categorical=False,
+        )
+        pd.testing.assert_series_equal(
+            LedgerQueries(restored).noi(), LedgerQueries(ledger).noi()
+        )
+
+    def test_partitioned_layout_is_queryable_with_duckdb(self, tmp_path):
+        ledger = _make_ledger()
+        archive = tmp_path / "archive"
+        ledger.to_parquet(archive)
+
+        partitions = {
+            path.parent.relative_to(archive).as_posix()
+            for path in archive.rglob("*.parquet")
+        }
+        assert f"deal_id={DEAL_ID}/asset_id={ASSET_IDS[0]}" in partitions
+        assert f"deal_id=NULL/asset_id={ASSET_IDS[1]}" in partitions
+
+        total = duckdb.sql(
+            f"SELECT SUM(amount) FROM read_parquet('{archive}/**/*.parquet', "
+            f"hive_partitioning = true) WHERE asset_id = '{ASSET_IDS[0]}'"
+        ).fetchone()[0]
+        assert total == pytest.approx((1000.0 - 300.0 + 25.0) * len(INDEX))
+
+    def test_existing_output_requires_overwrite(self, tmp_path):
+        ledger = _make_ledger()
+        archive = tmp_path / "archive"
+        ledger.to_parquet(archive)
+
+        with pytest.raises(duckdb.IOException):
+            ledger.to_parquet(archive)
+        ledger.to_parquet(archive, overwrite=True)
+        assert len(Ledger.from_parquet(archive)) == len(ledger)
+
+    def test_unknown_partition_column_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown ledger column"):
+            _make_ledger().to_parquet(tmp_path / "x", partition_by=("portfolio",))
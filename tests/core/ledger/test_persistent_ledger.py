@@ -0,0 +1,190 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the file-backed ledger mode.
+
+A ledger created with `Ledger(path=...)` stores its transactions and metadata
+in a DuckDB file and can be reopened, including from a separate process.
+"""
+
+import subprocess
+import sys
+import textwrap
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.ledger import METADATA_TABLE
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+INDEX = pd.period_range("2024-01", periods=6, freq="M")
+
+
+def _populate(ledger: Ledger) -> None:
+    with ledger.transaction():
+        ledger.add_series(
+            pd.Series(1000.0, index=INDEX),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory=RevenueSubcategoryEnum.LEASE,
+                item_name="Base Rent",
+                source_id=uuid.uuid4(),
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+        ledger.add_series(
+            pd.Series(-250.0, index=INDEX),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.EXPENSE,
+                subcategory=ExpenseSubcategoryEnum.OPEX,
+                item_name="Taxes",
+                source_id="taxes-model",  # non-UUID id mapped via the namespace
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+        ledger.add_series(
+            pd.Series(50.0, index=INDEX),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory="Rooftop Antenna",  # widens the subcategory ENUM
+                item_name="Antenna License",
+                source_id=uuid.uuid4(),
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+
+
+class TestPersistentLedger:
+    """File-backed ledgers survive closing and reopening."""
+
+    def test_reopen_restores_records_and_metadata(self, tmp_path):
+        path = tmp_path / "ledger.duckdb"
+        ledger = Ledger(path=path)
+        _populate(ledger)
+        expected_df = ledger.to_dataframe().copy()
+        expected_noi = LedgerQueries(ledger).noi()
+        version, series_count = ledger.get_version(), ledger.series_count()
+        ledger.close()
+
+        reopened = Ledger.open(path)
+        assert len(reopened) == len(expected_df)
+        assert reopened.get_version() == version
+        assert reopened.series_count() == series_count
+        pd.testing.assert_series_equal(LedgerQueries(reopened).noi(), expected_noi)
+        pd.testing.assert_frame_equal(
+            reopened.to_dataframe().sort_values(["item_name", "date"]),
+            expected_df.sort_values(["item_name", "date"]),
+            check_categorical=False,
+        )
+        assert reopened._normalize_id("taxes-model") in set(
+            reopened.to_dataframe()["source_id"]
+        )
+        reopened.close()
+
+    def test_reopened_ledger_accepts_new_records(self, tmp_path):
+        path = tmp_path / "ledger.duckdb"
+        ledger = Ledger(path=path)
+        _populate(ledger)
+        ledger.close()
+
+        reopened = Ledger.open(path)
+        reopened.add_series(
+            pd.Series(10.0, index=INDEX),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory="Billboard",  # second widening after reopen
+                item_name="Billboard Lease",
+                source_id=uuid.uuid4(),
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+        reopened.close()
+
+        final = Ledger.open(path)
+        assert len(final) == 4 * len(INDEX)
+        subcategories = set(final.to_dataframe()["subcategory"])
+        assert {"Rooftop Antenna", "Billboard"} <= subcategories
+        final.close()
+
+    def test_metadata_is_written_on_commit_and_close(self, tmp_path):
+        def stored_version(ledger: Ledger) -> int:
+            return int(
+                ledger.con.execute(
+                    f"SELECT value FROM {METADATA_TABLE} WHERE key = 'version'"
+                ).fetchone()[0]
+            )
+
+        path = tmp_path / "ledger.duckdb"
+        ledger = Ledger(path=path)
+        _populate(ledger)
+        assert stored_version(ledger) == ledger.get_version()
+
+        # Writes outside a transaction leave the table alone until close()
+        committed = ledger.get_version()
+        ledger.add_series(
+            pd.Series(5.0, index=INDEX),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory=RevenueSubcategoryEnum.MISC,
+                item_name="Parking",
+                source_id=uuid.uuid4(),
+                asset_id=uuid.uuid4(),
+                pass_num=1,
+            ),
+        )
+        assert ledger.get_version() > committed
+        assert stored_version(ledger) == committed
+        version, series_count = ledger.get_version(), ledger.series_count()
+        ledger.close()
+
+        reopened = Ledger.open(path)
+        assert reopened.get_version() == version
+        assert reopened.series_count() == series_count
+        reopened.close()
+
+    def test_reopen_in_new_process(self, tmp_path):
+        path = tmp_path / "ledger.duckdb"
+        ledger = Ledger(path=path)
+        _populate(ledger)
+        expected = float(LedgerQueries(ledger).noi().sum())
+        ledger.close()
+
+        script = textwrap.dedent(
+            f"""
+            from performa.core.ledger import Ledger, LedgerQueries
+            ledger = Ledger.open({str(path)!r})
+            print(float(LedgerQueries(ledger).noi().sum()))
+            """
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert float(result.stdout.strip().splitlines()[-1]) == expected
+
+    def test_open_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            Ledger.open(tmp_path / "missing.duckdb")
+
+    def test_memory_limit_and_spill_directory(self, tmp_path):
+        spill = tmp_path / "spill"
+        ledger = Ledger(memory_limit="256MB", temp_directory=spill)
+        memory_limit, temp_directory = ledger.con.execute(
+            "SELECT current_setting('memory_limit'), current_setting('temp_directory')"
+        ).fetchone()
+        assert memory_limit.startswith("244")  # 256MB reported in MiB
+        assert temp_directory == str(spill)
@@ -16,10 +16,12 @@ import pandas as pd
 from performa.core.ledger import Ledger, LedgerQueries
 from performa.core.ledger.records import SeriesMetadata
 from performa.core.primitives.enums import (
+    CapitalSubcategoryEnum,
     CashFlowCategoryEnum,
     ExpenseSubcategoryEnum,
     FinancingSubcategoryEnum,
     RevenueSubcategoryEnum,
+    UnleveredAggregateLineKey,
     ValuationSubcategoryEnum,
 )
 
@@ -512,3 +514,164 @@ class TestLedgerQueries:
         # Test partner_flows with UUID
         partner_flows = queries.partner_flows(uuid.uuid4())
         assert isinstance(partner_flows, pd.Series)
+
+
+class TestAggregateBundle:
+    """aggregate_bundle() must match the single-line query methods."""
+
+    LINES = [
+        (
+            CashFlowCategoryEnum.REVENUE,
+            RevenueSubcategoryEnum.LEASE,
+            "Base Rent",
+            1000.0,
+        ),
+        (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.MISC, "Parking", 50.0),
+        (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.RECOVERY, "CAM", 80.0),
+        (
+            CashFlowCategoryEnum.REVENUE,
+            RevenueSubcategoryEnum.VACANCY_LOSS,
+            "Vacancy",
+            -60.0,
+        ),
+        (
+            CashFlowCategoryEnum.REVENUE,
+            RevenueSubcategoryEnum.CREDIT_LOSS,
+            "Bad Debt",
+            -10.0,
+        ),
+        (
+            CashFlowCategoryEnum.REVENUE,
+            RevenueSubcategoryEnum.ABATEMENT,
+            "Free Rent",
+            -25.0,
+        ),
+        (
+            CashFlowCategoryEnum.REVENUE,
+            RevenueSubcategoryEnum.SALE,
+            "Exit Sale",
+            5000.0,
+        ),
+        (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, "Taxes", -300.0),
+        (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.CAPEX, "Roof", -120.0),
+        (
+            CashFlowCategoryEnum.EXPENSE,
+            ExpenseSubcategoryEnum.CAPEX,
+            "Suite 100 - TI",
+            -90.0,
+        ),
+        (
+            CashFlowCategoryEnum.EXPENSE,
+            ExpenseSubcategoryEnum.CAPEX,
+            "Leasing Commission",
+            -40.0,
+        ),
+        (
+            CashFlowCategoryEnum.CAPITAL,
+            CapitalSubcategoryEnum.HARD_COSTS,
+            "Hard Costs",
+            -700.0,
+        ),
+        (
+            CashFlowCategoryEnum.CAPITAL,
+            CapitalSubcategoryEnum.PURCHASE_PRICE,
+            "Acquisition",
+            -9000.0,
+        ),
+        (
+            CashFlowCategoryEnum.FINANCING,
+            FinancingSubcategoryEnum.LOAN_PROCEEDS,
+            "Loan",
+            6000.0,
+        ),
+        (
+            CashFlowCategoryEnum.FINANCING,
+            FinancingSubcategoryEnum.INTEREST_PAYMENT,
+            "Interest",
+            -200.0,
+        ),
+    ]
+
+    def create_ledger(self) -> Ledger:
+        """Ledger with every aggregate line populated over staggered months."""
+        ledger = Ledger()
+        asset_id = uuid.uuid4()
+        for offset, (category, subcategory, name, amount) in enumerate(self.LINES):
+            # Stagger start months so each line covers a different range with gaps
+            index = pd.period_range(f"2024-{1 + offset % 6:02d}", periods=4, freq="M")
+            values = [amount * (1 + 0.1 * i) if i != 2 else 0.0 for i in range(4)]
+            ledger.add_series(
+                pd.Series(values, index=index),
+                SeriesMetadata(
+                    category=category,
+                    subcategory=subcategory,
+                    item_name=name,
+                    source_id=uuid.uuid4(),
+                    asset_id=asset_id,
+                    pass_num=1,
+                ),
+            )
+        return ledger
+
+    def test_bundle_matches_single_queries(self):
+        """Every bundled column equals the corresponding single-line query."""
+        queries = LedgerQueries(self.create_ledger())
+        index = pd.period_range("2023-12", "2024-12", freq="M")
+        keys = UnleveredAggregateLineKey
+        single_queries = {
+            keys.GROSS_POTENTIAL_RENT: queries.gpr,
+            keys.POTENTIAL_GROSS_REVENUE: queries.pgr,
+            keys.TENANT_REVENUE: queries.tenant_revenue,
+            keys.GENERAL_VACANCY_LOSS: queries.vacancy_loss,
+            keys.MISCELLANEOUS_INCOME: queries.misc_income,
+            keys.RENTAL_ABATEMENT: queries.rental_abatement,
+            keys.CREDIT_LOSS: queries.credit_loss,
+            keys.EXPENSE_REIMBURSEMENTS: queries.expense_reimbursements,
+            keys.EFFECTIVE_GROSS_INCOME: queries.egi,
+            keys.TOTAL_OPERATING_EXPENSES: queries.opex,
+            keys.NET_OPERATING_INCOME: queries.noi,
+            keys.TOTAL_CAPITAL_EXPENDITURES: queries.capex,
+            keys.TOTAL_TENANT_IMPROVEMENTS: queries.ti,
+            keys.TOTAL_LEASING_COMMISSIONS: queries.lc,
+            keys.UNLEVERED_CASH_FLOW: queries.project_cash_flow,
+        }
+
+        bundle = queries.aggregate_bundle(list(single_queries), index=index)
+
+        assert list(bundle.columns) == [key.value for key in single_queries]
+        assert bundle.index.equals(index)
+        for key, query in single_queries.items():
+            expected = query().reindex(index, fill_value=0.0)
+            assert expected.abs().sum() > 0, f"{key.value} not exercised"
+            pd.testing.assert_series_equal(
+                bundle[key.value], expected, check_names=False
+            )
+
+    def test_untracked_keys_and_default_index(self):
+        """Untracked lines are zero; default index spans the ledger's months."""
+        queries = LedgerQueries(self.create_ledger())
+
+        bundle = queries.aggregate_bundle([
+            UnleveredAggregateLineKey.NET_OPERATING_INCOME,
+            UnleveredAggregateLineKey.DOWNTIME_VACANCY_LOSS,
+        ])
+
+        assert bundle.index.equals(pd.period_range("2024-01", "2024-09", freq="M"))
+        assert (
+            bundle[UnleveredAggregateLineKey.DOWNTIME_VACANCY_LOSS.value] == 0.0
+        ).all()
+        pd.testing.assert_series_equal(
+            bundle[UnleveredAggregateLineKey.NET_OPERATING_INCOME.value],
+            queries.noi(),
+            check_names=False,
+        )
+
+    def test_empty_ledger(self):
+        """An empty ledger yields zeros on the requested index."""
+        queries = LedgerQueries(Ledger())
+        index = pd.period_range("2024-01", periods=3, freq="M")
+
+        bundle = queries.aggregate_bundle(index=index)
+
+        assert bundle.shape == (3, len(UnleveredAggregateLineKey))
+        assert (bundle == 0.0).all().all()
@@ -0,0 +1,104 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the NumPy array results of LedgerQueries.
+"""
+
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives import Timeline
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+
+def _add_line(ledger: Ledger, category, subcategory, series: pd.Series) -> None:
+    ledger.add_series(
+        series,
+        SeriesMetadata(
+            category=category,
+            subcategory=subcategory,
+            item_name="Line",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+        ),
+    )
+
+
+@pytest.fixture
+def ledger() -> Ledger:
+    ledger = Ledger()
+    rent = pd.Series(
+        [100.0, 110.0, 0.0, 130.0],
+        index=pd.period_range("2024-03", periods=4, freq="M"),
+    )
+    opex = pd.Series(-40.0, index=pd.period_range("2024-02", periods=4, freq="M"))
+    _add_line(ledger, CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, rent)
+    _add_line(ledger, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, opex)
+    return ledger
+
+
+class TestQueryArrays:
+    """Arrays match the Series methods aligned to the same timeline."""
+
+    def test_arrays_match_aligned_series(self, ledger):
+        timeline = Timeline.from_dates("2024-01-01", "2024-12-31")
+        queries = LedgerQueries(ledger)
+
+        arrays = queries.arrays(["noi", "opex", "pgr", "debt_service"], timeline)
+
+        for metric, values in arrays.items():
+            expected = timeline.align_series(getattr(queries, metric)())
+            assert values.dtype == np.float64
+            np.testing.assert_array_equal(values, expected.to_numpy())
+        assert arrays["noi"][2] == pytest.approx(60.0)
+        assert not arrays["debt_service"].any()
+
+    def test_index_window_clips_months(self, ledger):
+        index = pd.period_range("2024-04", periods=2, freq="M")
+        noi = LedgerQueries(ledger).array("noi", index)
+        np.testing.assert_array_equal(noi, [70.0, -40.0])
+
+    def test_arrays_are_cached_read_only_views(self, ledger):
+        queries = LedgerQueries(ledger)
+        index = pd.period_range("2024-01", periods=12, freq="M")
+        first = queries.array("noi", index)
+        assert queries.array("noi", index) is first
+        with pytest.raises(ValueError):
+            first[0] = 1.0
+
+        # A new ledger version gives a fresh result
+        _add_line(
+            ledger,
+            CashFlowCategoryEnum.REVENUE,
+            RevenueSubcategoryEnum.MISC,
+            pd.Series(5.0, index=index),
+        )
+        assert queries.array("noi", index).sum() == pytest.approx(first.sum() + 60.0)
+
+    def test_series_methods_unaffected(self, ledger):
+        queries = LedgerQueries(ledger)
+        queries.array("noi", pd.period_range("2024-01", periods=3, freq="M"))
+        noi = queries.noi()
+        assert isinstance(noi, pd.Series)
+        assert noi.index[0] == pd.Period("2024-02", "M")
+
+    def test_invalid_requests(self, ledger):
+        queries = LedgerQueries(ledger)
+        index = pd.period_range("2024-01", periods=3, freq="M")
+        with pytest.raises(ValueError, match="not available as arrays"):
+            queries.arrays(["project_cash_flow"], index)
+        with pytest.raises(ValueError, match="contiguous"):
+            queries.array("noi", index[[0, 2]])
+        with pytest.raises(ValueError, match="monthly PeriodIndex"):
+            queries.array("noi", pd.date_range("2024-01-01", periods=3, freq="MS"))
@@ -0,0 +1,138 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the ledger-level shared query result cache.
+
+Results are cached on the `Ledger` keyed by normalized SQL plus ledger version,
+so separate `LedgerQueries` instances share them and any write invalidates them.
+"""
+
+import uuid
+
+import pandas as pd
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.cache import QueryResultCache, normalize_sql
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+INDEX = pd.period_range("2024-01", periods=3, freq="M")
+
+
+def _add_line(ledger: Ledger, category, subcategory, amount: float) -> None:
+    metadata = SeriesMetadata(
+        category=category,
+        subcategory=subcategory,
+        item_name=f"{subcategory.value} line",
+        source_id=uuid.uuid4(),
+        asset_id=uuid.uuid4(),
+        pass_num=1,
+    )
+    ledger.add_series(pd.Series([amount] * len(INDEX), index=INDEX), metadata)
+
+
+def _make_ledger(**kwargs) -> Ledger:
+    ledger = Ledger(**kwargs)
+    _add_line(
+        ledger, CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 1000.0
+    )
+    _add_line(ledger, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -400.0)
+    return ledger
+
+
+class TestQueryResultCache:
+    """LRU behaviour and counters of the cache container."""
+
+    def test_normalize_sql_collapses_whitespace(self):
+        assert normalize_sql("SELECT  1\n   FROM\tt ") == "SELECT 1 FROM t"
+        assert QueryResultCache.make_key("SELECT 1\nFROM t", 3) == (
+            QueryResultCache.make_key("SELECT 1 FROM t", 3)
+        )
+        assert QueryResultCache.make_key("SELECT 1", 3) != (
+            QueryResultCache.make_key("SELECT 1", 4)
+        )
+
+    def test_lru_eviction_and_counters(self):
+        cache = QueryResultCache(maxsize=2)
+        keys = [QueryResultCache.make_key(f"SELECT {i}", 0) for i in range(3)]
+
+        cache.put(keys[0], "a")
+        cache.put(keys[1], "b")
+        assert cache.get(keys[0]) == "a"  # keys[1] is now least recently used
+        cache.put(keys[2], "c")
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == "a"
+        assert cache.get(keys[2]) == "c"
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+        assert stats["hit_rate"] == 0.75
+
+    def test_zero_size_disables_caching(self):
+        cache = QueryResultCache(maxsize=0)
+        key = QueryResultCache.make_key("SELECT 1", 0)
+        cache.put(key, "a")
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+
+class TestLedgerSharedQueryCache:
+    """Query consumers on the same ledger share one cache."""
+
+    def test_results_shared_across_query_instances(self):
+        ledger = _make_ledger()
+        first, second = LedgerQueries(ledger), LedgerQueries(ledger)
+
+        noi = first.noi()
+        assert ledger.query_cache_stats()["misses"] == 1
+
+        pd.testing.assert_series_equal(second.noi(), noi)
+        pd.testing.assert_frame_equal(
+            second.aggregate_bundle(), first.aggregate_bundle()
+        )
+        stats = ledger.query_cache_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+
+    def test_cached_results_are_copies(self):
+        ledger = _make_ledger()
+        queries = LedgerQueries(ledger)
+
+        noi = queries.noi()
+        noi.iloc[:] = 0.0
+        assert (LedgerQueries(ledger).noi() == 600.0).all()
+
+    def test_writes_invalidate_shared_results(self):
+        ledger = _make_ledger()
+        queries = LedgerQueries(ledger)
+        assert (queries.noi() == 600.0).all()
+        assert len(ledger.query_cache) == 1
+
+        _add_line(
+            ledger, CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -100.0
+        )
+        assert len(ledger.query_cache) == 0
+        assert (LedgerQueries(ledger).noi() == 500.0).all()
+
+        ledger.clear()
+        assert queries.noi().empty
+
+    def test_cache_size_is_bounded(self):
+        ledger = _make_ledger(query_cache_size=2)
+        queries = LedgerQueries(ledger)
+
+        queries.noi()
+        queries.opex()
+        queries.egi()
+        stats = ledger.query_cache_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        assert stats["maxsize"] == 2
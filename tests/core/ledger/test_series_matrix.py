@@ -0,0 +1,101 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for Ledger.add_series_matrix().
+"""
+
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import CashFlowCategoryEnum, RevenueSubcategoryEnum
+
+INDEX = pd.period_range("2024-01", periods=6, freq="M")
+ASSET_ID = uuid.uuid4()
+VALUES = np.array([
+    [100.0, 100.0, 0.0, 0.0, 110.0, 110.0],
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [95.5, 95.5, 95.5, 0.0, 0.0, -20.0],
+])
+NAMES = ["Unit 1 - base_rent", "Unit 2 - base_rent", "Unit 3 - base_rent"]
+SOURCE_IDS = [uuid.uuid4() for _ in NAMES]
+
+
+def _metadata(item_name: str, source_id) -> SeriesMetadata:
+    return SeriesMetadata(
+        category=CashFlowCategoryEnum.REVENUE,
+        subcategory=RevenueSubcategoryEnum.LEASE,
+        item_name=item_name,
+        source_id=source_id,
+        asset_id=ASSET_ID,
+        pass_num=1,
+    )
+
+
+def _per_row(ledger: Ledger) -> Ledger:
+    for row, name, source_id in zip(VALUES, NAMES, SOURCE_IDS):
+        ledger.add_series(pd.Series(row, index=INDEX), _metadata(name, source_id))
+    return ledger
+
+
+def _matrix(ledger: Ledger) -> Ledger:
+    ledger.add_series_matrix(
+        VALUES, INDEX, _metadata(NAMES[0], SOURCE_IDS[0]), NAMES, SOURCE_IDS
+    )
+    return ledger
+
+
+COLUMNS = [
+    "date",
+    "amount",
+    "flow_purpose",
+    "category",
+    "subcategory",
+    "item_name",
+    "source_id",
+    "asset_id",
+    "pass_num",
+]
+
+
+class TestAddSeriesMatrix:
+    """One matrix write stages the rows of one add_series call per row."""
+
+    @pytest.mark.parametrize("in_transaction", [False, True])
+    def test_matches_add_series_per_row(self, in_transaction):
+        expected, ledger = _per_row(Ledger()), Ledger()
+        if in_transaction:
+            with ledger.transaction():
+                _matrix(ledger)
+                assert ledger.has_buffered_data()
+        else:
+            _matrix(ledger)
+
+        pd.testing.assert_frame_equal(
+            ledger.to_dataframe()[COLUMNS], expected.to_dataframe()[COLUMNS]
+        )
+        assert ledger.record_count() == np.count_nonzero(VALUES)
+        assert ledger.series_count() == expected.series_count() == len(VALUES)
+        assert ledger.fingerprint() == expected.fingerprint()
+
+    def test_summary_granularity(self):
+        summary = _matrix(Ledger(granularity="summary"))
+        expected = _per_row(Ledger(granularity="summary"))
+        assert summary.fingerprint() == expected.fingerprint()
+
+    def test_all_zero_matrix(self):
+        ledger = Ledger()
+        ledger.add_series_matrix(
+            np.zeros((2, len(INDEX))),
+            INDEX,
+            _metadata("Unit", SOURCE_IDS[0]),
+            NAMES[:2],
+            SOURCE_IDS[:2],
+        )
+        assert ledger.record_count() == 0
+        assert ledger.series_count() == 2
@@ -0,0 +1,130 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for summary-granularity ledgers.
+
+`Ledger(granularity="summary")` sums per-line-item revenue and expense rows
+on insert; every query must match a full ledger holding the same writes.
+"""
+
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives.enums import (
+    CapitalSubcategoryEnum,
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    FinancingSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+INDEX = pd.period_range("2024-01", periods=12, freq="M")
+ASSET_ID = uuid.uuid4()
+
+LINES = [
+    (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, "Rent - Suite 100", 1000.0),
+    (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, "Rent - Suite 200", 800.0),
+    (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, "Rent - Suite 300", 600.0),
+    (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.VACANCY_LOSS, "Vacancy", -90.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, "Taxes", -250.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, "Insurance", -50.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.CAPEX, "Roof", -80.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.CAPEX, "TI - Suite 100", -40.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.CAPEX, None, -10.0),
+    (CashFlowCategoryEnum.CAPITAL, CapitalSubcategoryEnum.HARD_COSTS, "Leasing Commission", -30.0),
+    (CashFlowCategoryEnum.FINANCING, FinancingSubcategoryEnum.INTEREST_PAYMENT, "Senior Loan", -120.0),
+]
+
+METHODS = (
+    "pgr", "gpr", "vacancy_loss", "egi", "opex", "noi", "capex", "ti", "lc",
+    "debt_service", "operational_cash_flow", "project_cash_flow",
+)
+
+
+def _write(ledger: Ledger) -> Ledger:
+    with ledger.transaction():
+        for category, subcategory, name, amount in LINES:
+            ledger.add_series(
+                pd.Series([amount * (1 + m / 10) for m in range(12)], index=INDEX),
+                SeriesMetadata(
+                    category=category,
+                    subcategory=subcategory,
+                    item_name=name,
+                    source_id=uuid.uuid4(),
+                    asset_id=ASSET_ID,
+                    pass_num=1,
+                ),
+            )
+    return ledger
+
+
+def _assert_same_queries(full: Ledger, summary: Ledger) -> None:
+    full_queries, summary_queries = LedgerQueries(full), LedgerQueries(summary)
+    for method in METHODS:
+        pd.testing.assert_series_equal(
+            getattr(summary_queries, method)(), getattr(full_queries, method)(), obj=method
+        )
+    assert not full_queries.ti().empty and not full_queries.lc().empty
+
+
+class TestSummaryGranularity:
+    """Line items are summed on insert without changing query results."""
+
+    def test_queries_match_full_ledger(self):
+        full, summary = _write(Ledger()), _write(Ledger(granularity="summary"))
+        _assert_same_queries(full, summary)
+
+        # 3 rent lines -> 1, 2 opex lines -> 1, roof + unnamed stay apart from TI
+        assert full.record_count() == len(LINES) * 12
+        assert summary.record_count() == (len(LINES) - 3) * 12
+        assert summary.con.execute(
+            f"SELECT COUNT(*) FROM {summary.table_name}"
+        ).fetchone()[0] == summary.record_count()
+
+    def test_line_items_take_subcategory_label(self):
+        ledger = _write(Ledger(granularity="summary"))
+        df = ledger.to_dataframe()
+        rent = df[df["subcategory"] == "Lease"]
+        assert set(rent["item_name"]) == {"Lease"}
+        assert rent["amount"].iloc[0] == pytest.approx(2400.0)
+        assert ledger.con.execute(
+            f"SELECT COUNT(source_id) FROM {ledger.table_name} "
+            "WHERE subcategory = 'Lease'"
+        ).fetchone()[0] == 0
+
+        # Names that carry a TI/LC classification or a facility are kept
+        names = set(df["item_name"].dropna())
+        assert {"TI - Suite 100", "Leasing Commission", "Senior Loan"} <= names
+        assert df["item_name"].isna().sum() == 12
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"layout": "normalized"}, {"transaction_ids": "deferred"}],
+    )
+    def test_other_storage_options(self, options):
+        full = _write(Ledger(**options))
+        summary = _write(Ledger(granularity="summary", **options))
+        _assert_same_queries(full, summary)
+        assert summary.to_dataframe()["transaction_id"].is_unique
+
+    def test_forks_and_reopened_ledgers_keep_granularity(self, tmp_path):
+        parent = Ledger(granularity="summary")
+        child = _write(parent.fork())
+        _assert_same_queries(_write(Ledger()), child)
+
+        path = tmp_path / "summary.duckdb"
+        _write(Ledger(path=path, granularity="summary")).close()
+        reopened = Ledger.open(path)
+        count = reopened.record_count()
+        _write(reopened)
+        assert reopened.record_count() == 2 * count
+        reopened.close()
+
+    def test_unknown_granularity(self):
+        with pytest.raises(ValueError, match="Unknown ledger granularity"):
+            Ledger(granularity="monthly")
@@ -0,0 +1,157 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for timeline-bound LedgerQueries (calendar joins in SQL).
+"""
+
+import uuid
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger, LedgerQueries
+from performa.core.ledger.queries import ARRAY_METRICS
+from performa.core.ledger.records import SeriesMetadata
+from performa.core.primitives import Timeline
+from performa.core.primitives.enums import (
+    CapitalSubcategoryEnum,
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    FinancingSubcategoryEnum,
+    RevenueSubcategoryEnum,
+    ValuationSubcategoryEnum,
+)
+
+# Timeline starts before and ends after the recorded months
+TIMELINE = Timeline.from_dates("2024-01-01", "2025-12-31")
+
+SERIES_METHODS = sorted(ARRAY_METRICS) + ["asset_valuations", "project_cash_flow"]
+
+
+def _add_line(ledger: Ledger, category, subcategory, series: pd.Series) -> None:
+    ledger.add_series(
+        series,
+        SeriesMetadata(
+            category=category,
+            subcategory=subcategory,
+            item_name="Line",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=1,
+        ),
+    )
+
+
+@pytest.fixture
+def ledger() -> Ledger:
+    ledger = Ledger()
+    months = pd.period_range("2024-03", periods=12, freq="M")
+    every_other = months[::2]
+    _add_line(
+        ledger,
+        CashFlowCategoryEnum.REVENUE,
+        RevenueSubcategoryEnum.LEASE,
+        pd.Series(100.0, index=months),
+    )
+    _add_line(
+        ledger,
+        CashFlowCategoryEnum.EXPENSE,
+        ExpenseSubcategoryEnum.OPEX,
+        pd.Series(-40.0, index=every_other),
+    )
+    _add_line(
+        ledger,
+        CashFlowCategoryEnum.CAPITAL,
+        CapitalSubcategoryEnum.HARD_COSTS,
+        pd.Series(-500.0, index=months[:3]),
+    )
+    _add_line(
+        ledger,
+        CashFlowCategoryEnum.FINANCING,
+        FinancingSubcategoryEnum.LOAN_PROCEEDS,
+        pd.Series(800.0, index=months[:1]),
+    )
+    _add_line(
+        ledger,
+        CashFlowCategoryEnum.FINANCING,
+        FinancingSubcategoryEnum.PRINCIPAL_PAYMENT,
+        pd.Series(-10.0, index=every_other[1:]),
+    )
+    _add_line(
+        ledger,
+        CashFlowCategoryEnum.VALUATION,
+        ValuationSubcategoryEnum.ASSET_VALUATION,
+        pd.Series(9_000.0, index=months[-1:]),
+    )
+    return ledger
+
+
+class TestTimelineQueries:
+    """Timeline-bound results equal the unbound results aligned in pandas."""
+
+    @pytest.mark.parametrize("method", SERIES_METHODS)
+    def test_series_match_aligned_results(self, ledger, method):
+        expected = TIMELINE.align_series(getattr(LedgerQueries(ledger), method)())
+        result = getattr(LedgerQueries(ledger, timeline=TIMELINE), method)()
+
+        assert result.index.equals(TIMELINE.period_index)
+        pd.testing.assert_series_equal(result, expected, check_freq=False)
+
+    def test_months_outside_the_timeline_are_dropped(self, ledger):
+        index = pd.period_range("2024-06", periods=3, freq="M")
+        noi = LedgerQueries(ledger, timeline=index).noi()
+        assert noi.index.equals(index)
+        assert noi.tolist() == [100.0, 60.0, 100.0]
+
+    def test_aggregate_bundle_and_breakdowns(self, ledger):
+        unbound = LedgerQueries(ledger)
+        queries = LedgerQueries(ledger, timeline=TIMELINE)
+        index = TIMELINE.period_index
+
+        pd.testing.assert_frame_equal(
+            queries.aggregate_bundle(), unbound.aggregate_bundle(index=index)
+        )
+        for method in ("uses_breakdown", "sources_breakdown"):
+            result = getattr(queries, method)()
+            expected = getattr(unbound, method)().reindex(index, fill_value=0.0)
+            pd.testing.assert_frame_equal(result, expected, check_names=False)
+
+    def test_debt_balance_carries_across_gaps(self, ledger):
+        balance = LedgerQueries(ledger, timeline=TIMELINE).debt_balance()
+        # The unbound balance only has rows for months with debt activity
+        expected = (
+            LedgerQueries(ledger)
+            .debt_balance()
+            .reindex(TIMELINE.period_index)
+            .ffill()
+            .fillna(0.0)
+        )
+        assert balance["2024-04"] == balance["2024-03"] == 800.0
+        pd.testing.assert_series_equal(balance, expected, check_freq=False)
+
+    def test_empty_ledger_returns_zeros(self):
+        noi = LedgerQueries(Ledger(), timeline=TIMELINE).noi()
+        assert noi.index.equals(TIMELINE.period_index)
+        assert (noi == 0.0).all()
+
+    def test_calendar_is_created_once_per_connection(self, ledger):
+        LedgerQueries(ledger, timeline=TIMELINE).noi()
+        LedgerQueries(ledger, timeline=TIMELINE).egi()
+        tables = ledger.con.execute(
+            "SELECT table_name FROM duckdb_tables() "
+            "WHERE temporary AND table_name LIKE 'ledger_calendar_%'"
+        ).fetchall()
+        start, length = TIMELINE.period_index[0].ordinal, len(TIMELINE.period_index)
+        assert tables == [(f"ledger_calendar_{start}_{length}",)]
+
+    def test_arrays_on_a_bound_instance(self, ledger):
+        queries = LedgerQueries(ledger, timeline=TIMELINE)
+        index = pd.period_range("2024-04", periods=2, freq="M")
+        assert queries.array("noi", index).tolist() == [100.0, 60.0]
+        assert len(queries.noi()) == len(TIMELINE.period_index)
+
+    def test_timeline_must_be_contiguous_monthly(self, ledger):
+        gappy = pd.PeriodIndex(["2024-01", "2024-03"], freq="M")
+        with pytest.raises(ValueError, match="contiguous"):
+            LedgerQueries(ledger, timeline=gappy)
@@ -416,8 +416,8 @@ class TestTransactionPerformanceCharacteristics:
             pass_num=1,
         )
 
-        # Mock the _bulk_insert_raw_data method to count calls (used by add_series optimized path)
-        with patch.object(ledger, "_bulk_insert_raw_data") as mock_insert:
+        # Mock the _flush_append_buffer method to count calls (used by add_series optimized path)
+        with patch.object(ledger, "_flush_append_buffer") as mock_insert:
             with ledger.transaction():
                 # Add multiple series - should buffer without inserting
                 for i in range(5):
@@ -0,0 +1,128 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parity of the per-lease and cohort lease engines.
+
+`CalculationSettings(lease_engine="cohort")` projects residential leases as one
+rent matrix and writes them with `Ledger.add_series_matrix`; the ledger must
+match a per-lease run row for row.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from performa.analysis import run
+from performa.asset.residential import ResidentialLease
+from performa.core.ledger import Ledger
+from performa.core.primitives import CalculationSettings, GlobalSettings, SweepMode
+from performa.deal import analyze
+from performa.patterns import ResidentialDevelopmentPattern, ValueAddAcquisitionPattern
+
+
+def _settings(lease_engine: str, **calculation) -> GlobalSettings:
+    return GlobalSettings(
+        calculation=CalculationSettings(lease_engine=lease_engine, **calculation)
+    )
+
+
+def _assert_same_writes(cohort: Ledger, per_lease: Ledger) -> None:
+    assert cohort.fingerprint() == per_lease.fingerprint()
+    assert cohort.series_count() == per_lease.series_count()
+    # Same rows in the same order (model uids are regenerated per run)
+    columns = ["date", "amount", "category", "subcategory", "item_name"]
+    pd.testing.assert_frame_equal(
+        cohort.to_dataframe()[columns].reset_index(drop=True),
+        per_lease.to_dataframe()[columns].reset_index(drop=True),
+    )
+
+
+PATTERNS = [
+    # In-place leases roll over or are REABSORBed into post-renovation leases
+    ValueAddAcquisitionPattern(
+        property_name="Cohort Value-Add",
+        acquisition_date=date(2024, 1, 1),
+        acquisition_price=10_000_000,
+        renovation_budget=1_500_000,
+        current_avg_rent=1400,
+        target_avg_rent=1750,
+        hold_period_years=5,
+        ltv_ratio=0.65,
+    ),
+    # Absorption cohorts lease up over time
+    ResidentialDevelopmentPattern(
+        project_name="Cohort Development",
+        acquisition_date="2024-01-01",
+        land_cost=3_000_000,
+        total_units=100,
+        construction_cost_per_unit=180_000,
+        unit_mix=[
+            {"unit_type": "1BR", "count": 50, "avg_sf": 650, "target_rent": 2_000},
+            {"unit_type": "2BR", "count": 50, "avg_sf": 950, "target_rent": 2_800},
+        ],
+        construction_duration_months=18,
+        leasing_start_months=18,
+        absorption_pace_units_per_month=10,
+        construction_interest_rate=0.08,
+        construction_ltc_ratio=0.65,
+        permanent_interest_rate=0.06,
+        permanent_ltv_ratio=0.70,
+        permanent_loan_term_years=10,
+        permanent_amortization_years=30,
+        construction_sweep_mode=SweepMode.TRAP,
+        hold_period_years=7,
+        exit_cap_rate=0.055,
+    ),
+]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS, ids=lambda p: type(p).__name__)
+def test_deal_matches_per_lease(pattern):
+    deal, timeline = pattern.create(), pattern.get_timeline()
+    per_lease_ledger, cohort_ledger = Ledger(), Ledger()
+    per_lease = analyze(deal, timeline, _settings("per_lease"), ledger=per_lease_ledger)
+    cohort = analyze(deal, timeline, _settings("cohort"), ledger=cohort_ledger)
+
+    pd.testing.assert_series_equal(
+        cohort.levered_cash_flow, per_lease.levered_cash_flow
+    )
+    assert cohort.levered_irr == per_lease.levered_irr
+    _assert_same_writes(cohort_ledger, per_lease_ledger)
+
+
+def test_asset_matches_per_lease_with_a_thread_pool():
+    pattern = PATTERNS[0]
+    deal, timeline = pattern.create(), pattern.get_timeline()
+    per_lease_ledger, cohort_ledger = Ledger(), Ledger()
+    per_lease = run(
+        deal.asset, timeline, _settings("per_lease"), ledger=per_lease_ledger
+    )
+    cohort = run(
+        deal.asset,
+        timeline,
+        _settings("cohort", phase1_executor="thread", phase1_max_workers=2),
+        ledger=cohort_ledger,
+    )
+
+    pd.testing.assert_frame_equal(cohort.summary_df, per_lease.summary_df)
+    _assert_same_writes(cohort_ledger, per_lease_ledger)
+
+    # Lease results are recorded as the same per-lease component dicts
+    expected, actual = (result.scenario._orchestrator for result in (per_lease, cohort))
+    leases = 0
+    for expected_model, model in zip(expected.models, actual.models):
+        assert model.name == expected_model.name
+        if isinstance(model, ResidentialLease):
+            leases += 1
+            pd.testing.assert_series_equal(
+                actual.context.resolved_lookups[model.uid]["base_rent"],
+                expected.context.resolved_lookups[expected_model.uid]["base_rent"],
+            )
+    assert leases > 0
+
+
+def test_unknown_lease_engine():
+    with pytest.raises(ValueError):
+        CalculationSettings(lease_engine="gpu")
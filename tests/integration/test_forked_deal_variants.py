@@ -0,0 +1,67 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Evaluating several capital structures against one asset analysis.
+
+With `analyze(..., asset_analysis=..., fork=True)` each deal variant writes to
+a copy-on-write fork of the asset ledger, so the unlevered analysis runs once
+and every variant matches a fresh end-to-end run.
+"""
+
+from datetime import date
+
+import pytest
+
+from performa.analysis import run
+from performa.core.primitives import GlobalSettings
+from performa.deal import analyze
+from performa.patterns import StabilizedOfficePattern
+
+
+def _pattern(ltv_ratio: float) -> StabilizedOfficePattern:
+    return StabilizedOfficePattern(
+        property_name="Forked Ledger Office",
+        acquisition_date=date(2024, 1, 1),
+        acquisition_price=10_000_000,
+        net_rentable_area=40_000,
+        current_rent_psf=20.0,
+        occupancy_rate=0.95,
+        hold_period_years=5,
+        exit_cap_rate=0.06,
+        ltv_ratio=ltv_ratio,
+    )
+
+
+def test_capital_structures_share_one_asset_analysis():
+    pattern = _pattern(ltv_ratio=0.65)
+    timeline = pattern.get_timeline()
+    base_deal = pattern.create()
+    variants = [
+        base_deal,
+        base_deal.model_copy(
+            update={"financing": _pattern(ltv_ratio=0.50).create().financing}
+        ),
+    ]
+    fresh = [analyze(deal, timeline) for deal in variants]
+
+    asset_result = run(
+        model=base_deal.asset,
+        timeline=fresh[0].timeline,
+        settings=GlobalSettings(analysis_start_date=date(2024, 1, 1)),
+    )
+    asset_rows = len(asset_result.ledger)
+
+    forked = [
+        analyze(deal, timeline, asset_analysis=asset_result, fork=True)
+        for deal in variants
+    ]
+
+    assert len(asset_result.ledger) == asset_rows
+    assert forked[0].levered_irr != pytest.approx(forked[1].levered_irr)
+    for expected, actual in zip(fresh, forked):
+        assert actual.levered_irr == pytest.approx(expected.levered_irr)
+        assert actual.equity_multiple == pytest.approx(expected.equity_multiple)
+        assert actual.unlevered_cash_flow.sum() == pytest.approx(
+            expected.unlevered_cash_flow.sum()
+        )
@@ -0,0 +1,173 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parity of serial and pooled Phase 1 execution.
+
+`CalculationSettings(phase1_executor="thread" | "process")` computes the
+independent models concurrently and applies their ledger writes afterwards in
+model order; the ledger must match a serial run row for row.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from performa.analysis import run
+from performa.asset.office import (
+    ExpensePool,
+    OfficeCreditLoss,
+    OfficeExpenses,
+    OfficeGeneralVacancyLoss,
+    OfficeLeaseSpec,
+    OfficeLosses,
+    OfficeOpExItem,
+    OfficeProperty,
+    OfficeRecoveryMethod,
+    OfficeRentRoll,
+    OfficeRolloverLeaseTerms,
+    OfficeRolloverLeasingCommission,
+    OfficeRolloverProfile,
+    OfficeRolloverTenantImprovement,
+    Recovery,
+)
+from performa.core.ledger import Ledger
+from performa.core.primitives import (
+    CalculationSettings,
+    GlobalSettings,
+    PropertyAttributeKey,
+    Timeline,
+    UponExpirationEnum,
+)
+from performa.deal import analyze
+from performa.patterns import ValueAddAcquisitionPattern
+
+TIMELINE = Timeline.from_dates(date(2024, 1, 1), end_date=date(2028, 12, 31))
+
+
+def _office_property() -> OfficeProperty:
+    """Leases with recoveries (read expense results) and rollover TI/LC."""
+    cam = OfficeOpExItem(
+        name="CAM",
+        timeline=TIMELINE,
+        value=5.0,
+        reference=PropertyAttributeKey.NET_RENTABLE_AREA,
+        frequency="annual",
+        variable_ratio=0.5,
+        recoverable_ratio=1.0,
+    )
+    taxes = OfficeOpExItem(
+        name="Taxes", timeline=TIMELINE, value=150_000.0, frequency="annual"
+    )
+    recovery_method = OfficeRecoveryMethod(
+        name="Net Recovery",
+        gross_up=True,
+        gross_up_percent=0.95,
+        recoveries=[
+            Recovery(
+                expenses=ExpensePool(name="OpEx", expenses=[cam, taxes]),
+                structure="net",
+            )
+        ],
+    )
+    rollover_profile = OfficeRolloverProfile(
+        name="Rollover",
+        term_months=60,
+        renewal_probability=0.6,
+        downtime_months=3,
+        market_terms=OfficeRolloverLeaseTerms(
+            market_rent=65.0,
+            term_months=60,
+            ti_allowance=OfficeRolloverTenantImprovement(
+                value=25.0, reference=PropertyAttributeKey.NET_RENTABLE_AREA
+            ),
+            leasing_commission=OfficeRolloverLeasingCommission(tiers=[0.04]),
+        ),
+        renewal_terms=OfficeRolloverLeaseTerms(market_rent=60.0, term_months=60),
+    )
+    leases = [
+        OfficeLeaseSpec(
+            tenant_name=f"Tenant {i}",
+            suite=str(100 * (i + 1)),
+            floor=str(i + 1),
+            area=5_000,
+            use_type="office",
+            start_date=date(2021, 1 + i, 1),
+            term_months=36 + 6 * i,
+            base_rent_value=55.0 + i,
+            base_rent_reference=PropertyAttributeKey.NET_RENTABLE_AREA,
+            base_rent_frequency="annual",
+            upon_expiration=UponExpirationEnum.MARKET,
+            rollover_profile=rollover_profile,
+            recovery_method=recovery_method if i % 2 == 0 else None,
+        )
+        for i in range(6)
+    ]
+    return OfficeProperty(
+        name="Parallel Tower",
+        property_type="office",
+        net_rentable_area=30_000,
+        gross_area=33_000,
+        rent_roll=OfficeRentRoll(leases=leases, vacant_suites=[]),
+        expenses=OfficeExpenses(operating_expenses=[cam, taxes]),
+        losses=OfficeLosses(
+            general_vacancy=OfficeGeneralVacancyLoss(rate=0.05),
+            credit_loss=OfficeCreditLoss(rate=0.01),
+        ),
+    )
+
+
+def _settings(executor: str) -> GlobalSettings:
+    return GlobalSettings(
+        calculation=CalculationSettings(phase1_executor=executor, phase1_max_workers=2)
+    )
+
+
+def _assert_same_writes(pooled: Ledger, serial: Ledger) -> None:
+    assert pooled.fingerprint() == serial.fingerprint()
+    # Same rows in the same order (model uids are regenerated per run)
+    columns = ["date", "amount", "category", "subcategory", "item_name"]
+    pd.testing.assert_frame_equal(
+        pooled.to_dataframe()[columns].reset_index(drop=True),
+        serial.to_dataframe()[columns].reset_index(drop=True),
+    )
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_office_asset_matches_serial(executor):
+    model = _office_property()
+    serial_ledger, pooled_ledger = Ledger(), Ledger()
+    serial = run(model, TIMELINE, _settings("serial"), ledger=serial_ledger)
+    pooled = run(model, TIMELINE, _settings(executor), ledger=pooled_ledger)
+
+    pd.testing.assert_frame_equal(pooled.summary_df, serial.summary_df)
+    assert (serial.summary_df["Expense Reimbursements"] != 0).any()
+    _assert_same_writes(pooled_ledger, serial_ledger)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_value_add_deal_matches_serial(executor):
+    pattern = ValueAddAcquisitionPattern(
+        property_name="Parallel Value-Add",
+        acquisition_date=date(2024, 1, 1),
+        acquisition_price=10_000_000,
+        renovation_budget=1_500_000,
+        current_avg_rent=1400,
+        target_avg_rent=1750,
+        hold_period_years=5,
+        ltv_ratio=0.65,
+    )
+    deal, timeline = pattern.create(), pattern.get_timeline()
+    serial_ledger, pooled_ledger = Ledger(), Ledger()
+    serial = analyze(deal, timeline, _settings("serial"), ledger=serial_ledger)
+    pooled = analyze(deal, timeline, _settings(executor), ledger=pooled_ledger)
+
+    pd.testing.assert_series_equal(pooled.levered_cash_flow, serial.levered_cash_flow)
+    assert pooled.levered_irr == serial.levered_irr
+    _assert_same_writes(pooled_ledger, serial_ledger)
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        CalculationSettings(phase1_executor="gpu")
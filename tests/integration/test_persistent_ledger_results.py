@@ -0,0 +1,58 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Rebuilding results objects from a reopened file-backed ledger.
+
+A deal analyzed into `Ledger(path=...)` can be reopened later and wrapped in
+`DealResults` / `AssetAnalysisResult` without re-running the analysis.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from performa.analysis.results import AssetAnalysisResult
+from performa.core.ledger import Ledger
+from performa.deal import DealResults, analyze
+from performa.patterns import StabilizedOfficePattern
+
+
+def test_results_rebuilt_from_reopened_ledger(tmp_path):
+    pattern = StabilizedOfficePattern(
+        property_name="Persistent Ledger Office",
+        acquisition_date=date(2024, 1, 1),
+        acquisition_price=10_000_000,
+        net_rentable_area=40_000,
+        current_rent_psf=20.0,
+        occupancy_rate=0.95,
+        hold_period_years=5,
+        exit_cap_rate=0.06,
+        ltv_ratio=0.65,
+    )
+    deal = pattern.create()
+    path = tmp_path / "deal.duckdb"
+
+    ledger = Ledger(path=path)
+    original = analyze(deal, pattern.get_timeline(), ledger=ledger)
+    expected_irr = original.levered_irr
+    expected_multiple = original.equity_multiple
+    expected_ucf = original.unlevered_cash_flow
+    expected_noi = original.noi
+    timeline = original.timeline
+    ledger.close()
+
+    reopened = Ledger.open(path)
+    rebuilt = DealResults(deal, timeline, reopened)
+    assert rebuilt.levered_irr == pytest.approx(expected_irr)
+    assert rebuilt.equity_multiple == pytest.approx(expected_multiple)
+    pd.testing.assert_series_equal(rebuilt.unlevered_cash_flow, expected_ucf)
+
+    asset_result = AssetAnalysisResult.from_ledger(reopened, deal.asset, timeline)
+    pd.testing.assert_series_equal(
+        asset_result.noi.reindex(expected_noi.index, fill_value=0.0),
+        expected_noi,
+        check_names=False,
+    )
+    reopened.close()
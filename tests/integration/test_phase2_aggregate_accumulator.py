@@ -0,0 +1,210 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parity of in-memory and ledger-queried aggregates for Phase 2 models.
+
+Dependent models (losses, %-of-EGI fees) read aggregates that include the
+dependent models computed before them. The orchestrator keeps those lines in an
+`AggregateAccumulator`; results must match re-querying the ledger after every
+dependent model, which remains the path for lines that cannot be accumulated.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import performa.analysis.orchestrator as orchestrator_module
+from performa.analysis import CashFlowOrchestrator, run
+from performa.asset.office import (
+    OfficeCreditLoss,
+    OfficeExpenses,
+    OfficeGeneralVacancyLoss,
+    OfficeLeaseSpec,
+    OfficeLosses,
+    OfficeOpExItem,
+    OfficeProperty,
+    OfficeRentRoll,
+)
+from performa.asset.residential import (
+    ResidentialCreditLoss,
+    ResidentialExpenses,
+    ResidentialGeneralVacancyLoss,
+    ResidentialLosses,
+    ResidentialOpExItem,
+    ResidentialProperty,
+    ResidentialRentRoll,
+    ResidentialRolloverLeaseTerms,
+    ResidentialRolloverProfile,
+    ResidentialUnitSpec,
+)
+from performa.core.base import CreditLossModel, VacancyLossModel
+from performa.core.ledger import Ledger
+from performa.core.primitives import (
+    GlobalSettings,
+    PropertyAttributeKey,
+    Timeline,
+    UnleveredAggregateLineKey,
+    UponExpirationEnum,
+)
+
+TIMELINE = Timeline(start_date=date(2024, 1, 1), duration_months=60)
+KEYS = UnleveredAggregateLineKey
+
+
+def _property(fee_references) -> ResidentialProperty:
+    profile = ResidentialRolloverProfile(
+        name="Standard",
+        term_months=12,
+        renewal_probability=0.6,
+        downtime_months=1,
+        market_terms=ResidentialRolloverLeaseTerms(market_rent=2000.0),
+        renewal_terms=ResidentialRolloverLeaseTerms(market_rent=1950.0),
+    )
+    fees = [
+        ResidentialOpExItem(
+            name=f"Fee {i} ({reference.value})",
+            timeline=TIMELINE,
+            value=0.01,
+            reference=reference,
+        )
+        for i, reference in enumerate(fee_references)
+    ]
+    return ResidentialProperty(
+        name="Accumulator Apartments",
+        gross_area=30_000.0,
+        net_rentable_area=24_000.0,
+        unit_mix=ResidentialRentRoll(
+            unit_specs=[
+                ResidentialUnitSpec(
+                    unit_type_name=f"Plan {i}",
+                    unit_count=10,
+                    avg_area_sf=800.0,
+                    current_avg_monthly_rent=1800.0,
+                    rollover_profile=profile,
+                )
+                for i in range(3)
+            ]
+        ),
+        losses=ResidentialLosses(
+            general_vacancy=ResidentialGeneralVacancyLoss(rate=0.05),
+            credit_loss=ResidentialCreditLoss(rate=0.01),
+        ),
+        expenses=ResidentialExpenses(operating_expenses=fees),
+    )
+
+
+def _counting_refreshes(monkeypatch) -> list:
+    refreshes = []
+    refresh = CashFlowOrchestrator._refresh_aggregates_from_ledger
+
+    def counting(self, model):
+        refreshes.append(model.name)
+        return refresh(self, model)
+
+    monkeypatch.setattr(
+        CashFlowOrchestrator, "_refresh_aggregates_from_ledger", counting
+    )
+    return refreshes
+
+
+FEES = [KEYS.EFFECTIVE_GROSS_INCOME, KEYS.TOTAL_OPERATING_EXPENSES] * 5
+
+
+@pytest.mark.parametrize(
+    "fee_references, accumulated",
+    [
+        (FEES, True),
+        (FEES + [KEYS.NET_OPERATING_INCOME, KEYS.UNLEVERED_CASH_FLOW], True),
+        # Capital expenditures depend on item names: queried from the ledger
+        (FEES + [KEYS.TOTAL_CAPITAL_EXPENDITURES], False),
+    ],
+    ids=["operating", "noi-ucf", "capex"],
+)
+def test_matches_ledger_refresh(monkeypatch, fee_references, accumulated):
+    prop = _property(fee_references)
+
+    refreshes = _counting_refreshes(monkeypatch)
+    ledger = Ledger()
+    result = run(prop, TIMELINE, GlobalSettings(), ledger=ledger)
+    assert bool(refreshes) != accumulated
+
+    # Reference: re-query the ledger after every dependent model
+    monkeypatch.setattr(orchestrator_module, "ACCUMULABLE_AGGREGATE_LINES", frozenset())
+    refreshes.clear()
+    expected_ledger = Ledger()
+    expected = run(prop, TIMELINE, GlobalSettings(), ledger=expected_ledger)
+    assert len(refreshes) >= len(fee_references)
+
+    pd.testing.assert_frame_equal(result.summary_df, expected.summary_df)
+    assert ledger.fingerprint() == expected_ledger.fingerprint()
+
+    # Later fees see the fees computed before them
+    lookups = result.scenario._orchestrator.context.resolved_lookups
+    fee_results = [
+        lookups[model.uid].abs()
+        for model in result.scenario._orchestrator.models
+        if model.name.startswith("Fee ") and "Operating Expenses" in model.name
+    ]
+    assert fee_results[-1].iloc[0] > fee_results[0].iloc[0]
+
+
+def test_office_losses_and_management_fee(monkeypatch):
+    """Vacancy and credit losses reduce the EGI the management fee reads."""
+    leases = [
+        OfficeLeaseSpec(
+            tenant_name=f"Tenant {i}",
+            suite=str(100 * (i + 1)),
+            floor=str(i + 1),
+            area=5_000,
+            use_type="office",
+            start_date=date(2022, 1 + i, 1),
+            term_months=36 + 6 * i,
+            base_rent_value=55.0 + i,
+            base_rent_reference=PropertyAttributeKey.NET_RENTABLE_AREA,
+            base_rent_frequency="annual",
+            upon_expiration=UponExpirationEnum.VACATE,
+        )
+        for i in range(4)
+    ]
+    prop = OfficeProperty(
+        name="Accumulator Tower",
+        property_type="office",
+        net_rentable_area=20_000,
+        gross_area=22_000,
+        rent_roll=OfficeRentRoll(leases=leases, vacant_suites=[]),
+        expenses=OfficeExpenses(
+            operating_expenses=[
+                OfficeOpExItem(
+                    name="Management Fee",
+                    timeline=TIMELINE,
+                    value=0.03,
+                    reference=KEYS.EFFECTIVE_GROSS_INCOME,
+                )
+            ]
+        ),
+        losses=OfficeLosses(
+            general_vacancy=OfficeGeneralVacancyLoss(rate=0.05),
+            credit_loss=OfficeCreditLoss(rate=0.01),
+        ),
+    )
+
+    refreshes = _counting_refreshes(monkeypatch)
+    ledger = Ledger()
+    result = run(prop, TIMELINE, GlobalSettings(), ledger=ledger)
+    assert not refreshes
+    dependent = {
+        type(model)
+        for model in result.scenario._orchestrator.models
+        if model.reference in set(KEYS)
+    }
+    assert {VacancyLossModel, CreditLossModel, OfficeOpExItem} <= dependent
+
+    monkeypatch.setattr(orchestrator_module, "ACCUMULABLE_AGGREGATE_LINES", frozenset())
+    expected_ledger = Ledger()
+    expected = run(prop, TIMELINE, GlobalSettings(), ledger=expected_ledger)
+    assert refreshes
+
+    pd.testing.assert_frame_equal(result.summary_df, expected.summary_df)
+    assert ledger.fingerprint() == expected_ledger.fingerprint()
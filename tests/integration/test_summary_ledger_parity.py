@@ -0,0 +1,117 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parity of full and summary-granularity ledgers on complete deals.
+
+Screening runs analyze into `Ledger(granularity="summary")`, which keeps only
+monthly totals of the per-lease revenue and expense rows. Deal metrics must be
+identical to an analysis into a full ledger.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from performa.core.ledger import Ledger
+from performa.core.primitives import SweepMode
+from performa.deal import analyze
+from performa.patterns import ResidentialDevelopmentPattern, StabilizedOfficePattern
+
+SERIES_METRICS = (
+    "levered_cash_flow",
+    "unlevered_cash_flow",
+    "equity_cash_flow",
+    "noi",
+    "operational_cash_flow",
+    "debt_service",
+)
+SCALAR_METRICS = (
+    "levered_irr",
+    "unlevered_irr",
+    "equity_multiple",
+    "net_profit",
+    "stabilized_dscr",
+    "minimum_operating_dscr",
+)
+QUERY_METHODS = (
+    "pgr",
+    "egi",
+    "opex",
+    "capex",
+    "ti",
+    "lc",
+    "total_uses",
+    "total_sources",
+    "equity_partner_flows",
+    "project_cash_flow",
+)
+
+
+PATTERNS = [
+    StabilizedOfficePattern(
+        property_name="Summary Parity Office",
+        acquisition_date=date(2024, 1, 1),
+        acquisition_price=10_000_000,
+        net_rentable_area=40_000,
+        current_rent_psf=20.0,
+        occupancy_rate=0.95,
+        hold_period_years=5,
+        exit_cap_rate=0.06,
+        ltv_ratio=0.65,
+    ),
+    ResidentialDevelopmentPattern(
+        project_name="Summary Parity Residential",
+        acquisition_date="2024-01-01",
+        land_cost=3_000_000,
+        total_units=100,
+        construction_cost_per_unit=180_000,
+        unit_mix=[
+            {"unit_type": "1BR", "count": 50, "avg_sf": 650, "target_rent": 2_000},
+            {"unit_type": "2BR", "count": 50, "avg_sf": 950, "target_rent": 2_800},
+        ],
+        construction_duration_months=18,
+        leasing_start_months=18,
+        absorption_pace_units_per_month=10,
+        construction_interest_rate=0.08,
+        construction_ltc_ratio=0.65,
+        permanent_interest_rate=0.06,
+        permanent_ltv_ratio=0.70,
+        permanent_loan_term_years=10,
+        permanent_amortization_years=30,
+        construction_sweep_mode=SweepMode.TRAP,
+        hold_period_years=7,
+        exit_cap_rate=0.055,
+    ),
+]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS, ids=lambda p: type(p).__name__)
+def test_summary_ledger_matches_full_ledger(pattern):
+    deal = pattern.create()
+    timeline = pattern.get_timeline()
+
+    full_ledger = Ledger()
+    summary_ledger = Ledger(granularity="summary")
+    full = analyze(deal, timeline, ledger=full_ledger)
+    summary = analyze(deal, timeline, ledger=summary_ledger)
+
+    assert summary_ledger.record_count() <= full_ledger.record_count()
+    for metric in SERIES_METRICS:
+        pd.testing.assert_series_equal(
+            getattr(summary, metric), getattr(full, metric), obj=metric
+        )
+    for metric in SCALAR_METRICS:
+        assert getattr(summary, metric) == pytest.approx(getattr(full, metric)), metric
+    for method in QUERY_METHODS:
+        pd.testing.assert_series_equal(
+            getattr(summary.queries, method)(),
+            getattr(full.queries, method)(),
+            obj=method,
+        )
+    for partner_id, metrics in full.partners.items():
+        assert summary.partners[partner_id].irr == pytest.approx(metrics.irr)
+        assert summary.partners[partner_id].equity_multiple == pytest.approx(
+            metrics.equity_multiple
+        )
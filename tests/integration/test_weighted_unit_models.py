@@ -0,0 +1,178 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parity of per-unit and weighted residential lease models.
+
+`CalculationSettings(unit_models="weighted")` builds one lease per unit spec
+carrying the spec's unit count as `multiplicity`. Results must match one lease
+per unit; the ledger holds either one row per unit ("unit" granularity) or one
+scaled row per model ("model" granularity).
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from performa.analysis import run
+from performa.asset.residential import (
+    ResidentialCreditLoss,
+    ResidentialExpenses,
+    ResidentialGeneralVacancyLoss,
+    ResidentialLease,
+    ResidentialLosses,
+    ResidentialProperty,
+    ResidentialRentRoll,
+    ResidentialRolloverLeaseTerms,
+    ResidentialRolloverProfile,
+    ResidentialUnitSpec,
+)
+from performa.core.ledger import Ledger
+from performa.core.primitives import (
+    CalculationSettings,
+    GlobalSettings,
+    PercentageGrowthRate,
+    Timeline,
+)
+from performa.deal import analyze
+from performa.patterns import ValueAddAcquisitionPattern
+
+TIMELINE = Timeline(start_date=date(2024, 1, 1), duration_months=60)
+FLOOR_PLANS = [("Studio", 500.0, 1450.0), ("1BR", 700.0, 1800.0),
+               ("2BR", 950.0, 2400.0), ("3BR", 1200.0, 3000.0),
+               ("PH", 1600.0, 4200.0)]  # fmt: skip
+
+
+def _property(units_per_plan: int = 100) -> ResidentialProperty:
+    profile = ResidentialRolloverProfile(
+        name="Standard",
+        term_months=12,
+        renewal_probability=0.6,
+        downtime_months=1,
+        market_terms=ResidentialRolloverLeaseTerms(
+            market_rent=2000.0,
+            market_rent_growth=PercentageGrowthRate(name="Market", value=0.03),
+        ),
+        renewal_terms=ResidentialRolloverLeaseTerms(
+            market_rent=1950.0,
+            market_rent_growth=PercentageGrowthRate(name="Renewal", value=0.03),
+        ),
+    )
+    specs = [
+        ResidentialUnitSpec(
+            unit_type_name=name,
+            unit_count=units_per_plan,
+            avg_area_sf=area,
+            current_avg_monthly_rent=rent,
+            rollover_profile=profile,
+        )
+        for name, area, rent in FLOOR_PLANS
+    ]
+    area = sum(spec.total_area for spec in specs)
+    return ResidentialProperty(
+        name="Weighted Tower",
+        gross_area=area * 1.15,
+        net_rentable_area=area,
+        unit_mix=ResidentialRentRoll(unit_specs=specs),
+        losses=ResidentialLosses(
+            general_vacancy=ResidentialGeneralVacancyLoss(rate=0.05),
+            credit_loss=ResidentialCreditLoss(rate=0.01),
+        ),
+        expenses=ResidentialExpenses(),
+    )
+
+
+def _settings(unit_models: str = "per_unit", **calculation) -> GlobalSettings:
+    return GlobalSettings(
+        calculation=CalculationSettings(unit_models=unit_models, **calculation)
+    )
+
+
+def _leases(result) -> list:
+    models = result.scenario._orchestrator.models
+    return [model for model in models if isinstance(model, ResidentialLease)]
+
+
+def _totals(ledger: Ledger) -> pd.Series:
+    df = ledger.to_dataframe()
+    keys = [df["date"], df["category"].astype(str), df["subcategory"].astype(str)]
+    return df.groupby(keys)["amount"].sum()
+
+
+@pytest.mark.parametrize("granularity", ["unit", "model"])
+@pytest.mark.parametrize("lease_engine", ["per_lease", "cohort"])
+def test_weighted_models_match_per_unit_models(granularity, lease_engine):
+    prop = _property()
+    per_unit_ledger, weighted_ledger = Ledger(), Ledger()
+    per_unit = run(prop, TIMELINE, _settings(), ledger=per_unit_ledger)
+    weighted = run(
+        prop,
+        TIMELINE,
+        _settings(
+            "weighted",
+            weighted_model_granularity=granularity,
+            lease_engine=lease_engine,
+        ),
+        ledger=weighted_ledger,
+    )
+
+    # 500 units in 5 floor plans: 5 lease models instead of 500
+    assert len(_leases(per_unit)) == 500
+    assert [lease.multiplicity for lease in _leases(weighted)] == [100] * 5
+
+    pd.testing.assert_frame_equal(weighted.summary_df, per_unit.summary_df)
+    pd.testing.assert_series_equal(
+        _totals(weighted_ledger), _totals(per_unit_ledger), check_exact=False
+    )
+    occupancy = [
+        result.scenario._orchestrator.context.occupancy
+        for result in (weighted, per_unit)
+    ]
+    pd.testing.assert_frame_equal(occupancy[0].by_status(), occupancy[1].by_status())
+    if granularity == "unit":
+        assert weighted_ledger.record_count() == per_unit_ledger.record_count()
+        assert weighted_ledger.series_count() == per_unit_ledger.series_count()
+        names = set(weighted_ledger.to_dataframe()["item_name"])
+        assert {f"Resident Studio #{i} - base_rent" for i in (1, 100)} <= names
+    else:
+        assert weighted_ledger.record_count() < per_unit_ledger.record_count() / 50
+
+
+def test_weighted_value_add_deal_matches_per_unit():
+    pattern = ValueAddAcquisitionPattern(
+        property_name="Weighted Value-Add",
+        acquisition_date=date(2024, 1, 1),
+        acquisition_price=10_000_000,
+        renovation_budget=1_500_000,
+        current_avg_rent=1400,
+        target_avg_rent=1750,
+        hold_period_years=5,
+        ltv_ratio=0.65,
+    )
+    deal, timeline = pattern.create(), pattern.get_timeline()
+    per_unit = analyze(deal, timeline, _settings())
+    weighted = analyze(
+        deal, timeline, _settings("weighted", weighted_model_granularity="model")
+    )
+
+    pd.testing.assert_series_equal(
+        weighted.levered_cash_flow, per_unit.levered_cash_flow, check_exact=False
+    )
+    assert weighted.levered_irr == pytest.approx(per_unit.levered_irr)
+
+
+def test_single_unit_specs_are_not_weighted():
+    prop = _property(units_per_plan=1)
+    result = run(prop, TIMELINE, _settings("weighted"))
+    leases = _leases(result)
+    assert len(leases) == 5
+    assert all(lease.multiplicity == 1 for lease in leases)
+    assert leases[0].suite == "Studio_001"
+
+
+def test_invalid_unit_model_settings():
+    with pytest.raises(ValueError):
+        CalculationSettings(unit_models="grouped")
+    with pytest.raises(ValueError):
+        CalculationSettings(weighted_model_granularity="floor")
@@ -15,10 +15,11 @@ import time
 from datetime import date
 from uuid import uuid4
 
+import pandas as pd
 import psutil
 import pytest
 
-from performa.analysis import run
+from performa.analysis import OccupancyProfile, run
 from performa.asset.residential import (
     ResidentialAbsorptionPlan,
     ResidentialExpenses,
@@ -31,10 +32,12 @@ from performa.asset.residential import (
     ResidentialUnitSpec,
 )
 from performa.asset.residential.absorption import ResidentialDirectLeaseTerms
-from performa.core.base import Address
+from performa.core.base import Address, LeaseBase
 from performa.core.base.absorption import FixedQuantityPace
 from performa.core.capital import CapitalItem, CapitalPlan
+from performa.core.ledger import Ledger
 from performa.core.primitives import (
+    CalculationSettings,
     GlobalSettings,
     PropertyAttributeKey,
     StartDateAnchorEnum,
@@ -46,8 +49,14 @@ from performa.core.primitives import (
 class TestLargeScaleRollingRenovation:
     """Test rolling renovation at various scales."""
 
-    def _create_value_add_property(self, unit_count: int, name_suffix: str = ""):
-        """Create a value-add property with specified unit count."""
+    def _create_value_add_property(
+        self, unit_count: int, name_suffix: str = "", floor_plans: bool = False
+    ):
+        """
+        Create a value-add property with specified unit count.
+
+        With `floor_plans`, units sharing a lease start date form one unit spec.
+        """
 
         # Create absorption plan for post-renovation
         plan_id = uuid4()
@@ -97,6 +106,13 @@ class TestLargeScaleRollingRenovation:
             if month_offset >= 12:
                 start_date = date(2024, 1 + (month_offset % 12), 1)
 
+            same_plan = unit_specs and unit_specs[-1].lease_start_date == start_date
+            if floor_plans and same_plan:
+                unit_specs[-1] = unit_specs[-1].model_copy(
+                    update={"unit_count": unit_specs[-1].unit_count + 1}
+                )
+                continue
+
             unit_spec = ResidentialUnitSpec(
                 unit_type_name=f"Unit-{i + 1}",
                 unit_count=1,
@@ -262,6 +278,154 @@ class TestLargeScaleRollingRenovation:
         except Exception as e:
             pytest.fail(f"Unexpected error with {unit_count} units: {e}")
 
+    def test_parallel_phase1_scaling(self):
+        """Phase 1 in thread/process pools on 1000 units, vs. a serial run."""
+
+        unit_count = 1000
+        property_model = self._create_value_add_property(unit_count, "Parallel")
+        timeline = Timeline(start_date=date(2024, 1, 1), duration_months=48)
+
+        print(f"\n PARALLEL PHASE 1 - {unit_count} Units ({os.cpu_count()} CPUs):")
+        reference = None
+        for executor, workers in [
+            ("serial", None),
+            ("thread", 4),
+            ("process", 1),
+            ("process", 2),
+            ("process", 4),
+        ]:
+            settings = GlobalSettings(
+                calculation=CalculationSettings(
+                    phase1_executor=executor, phase1_max_workers=workers
+                )
+            )
+            ledger = Ledger()
+            start = time.perf_counter()
+            scenario = run(
+                model=property_model, timeline=timeline, settings=settings, ledger=ledger
+            )
+            elapsed = time.perf_counter() - start
+
+            if reference is None:
+                reference = (scenario.summary_df, ledger.fingerprint(), elapsed)
+            else:
+                # Pooled runs write exactly what the serial run writes
+                pd.testing.assert_frame_equal(scenario.summary_df, reference[0])
+                assert ledger.fingerprint() == reference[1]
+            label = executor if workers is None else f"{executor} x{workers}"
+            print(
+                f"   {label:<12} {elapsed:6.2f}s  "
+                f"({reference[2] / elapsed:.2f}x serial)"
+            )
+
+    def test_cohort_lease_engine_scaling(self):
+        """Per-lease vs. cohort lease projection on 1000 units."""
+
+        unit_count = 1000
+        property_model = self._create_value_add_property(unit_count, "Cohort")
+        timeline = Timeline(start_date=date(2024, 1, 1), duration_months=48)
+
+        print(f"\n COHORT LEASE ENGINE - {unit_count} Units:")
+        reference = None
+        for lease_engine in ["per_lease", "cohort"]:
+            settings = GlobalSettings(
+                calculation=CalculationSettings(lease_engine=lease_engine)
+            )
+            ledger = Ledger()
+            start = time.perf_counter()
+            scenario = run(
+                model=property_model, timeline=timeline, settings=settings, ledger=ledger
+            )
+            elapsed = time.perf_counter() - start
+
+            if reference is None:
+                reference = (scenario.summary_df, ledger.fingerprint(), elapsed)
+            else:
+                # The cohort engine writes exactly what the per-lease path writes
+                pd.testing.assert_frame_equal(scenario.summary_df, reference[0])
+                assert ledger.fingerprint() == reference[1]
+            print(
+                f"   {lease_engine:<12} {elapsed:6.2f}s  "
+                f"({reference[2] / elapsed:.2f}x per-lease)"
+            )
+
+    def test_weighted_unit_models_scaling(self):
+        """Per-unit vs. weighted lease models on 1000 units in 24 floor plans."""
+
+        unit_count = 1000
+        property_model = self._create_value_add_property(
+            unit_count, "Weighted", floor_plans=True
+        )
+        timeline = Timeline(start_date=date(2024, 1, 1), duration_months=48)
+
+        print(f"\n WEIGHTED UNIT MODELS - {unit_count} Units:")
+        reference = None
+        for unit_models, granularity in [
+            ("per_unit", "unit"),
+            ("weighted", "unit"),
+            ("weighted", "model"),
+        ]:
+            settings = GlobalSettings(
+                calculation=CalculationSettings(
+                    unit_models=unit_models, weighted_model_granularity=granularity
+                )
+            )
+            ledger = Ledger()
+            start = time.perf_counter()
+            scenario = run(
+                model=property_model, timeline=timeline, settings=settings, ledger=ledger
+            )
+            elapsed = time.perf_counter() - start
+
+            if reference is None:
+                reference = (scenario.summary_df, elapsed)
+            else:
+                pd.testing.assert_frame_equal(
+                    scenario.summary_df, reference[0], check_exact=False
+                )
+            models = len(scenario.scenario._orchestrator.models)
+            print(
+                f"   {unit_models:<9} {granularity:<6} {models:5d} models  "
+                f"{ledger.record_count():7d} rows  {elapsed:6.2f}s  "
+                f"({reference[1] / elapsed:.2f}x per-unit)"
+            )
+
+    def test_occupancy_profile_scaling(self):
+        """Per-lease pandas fold vs. interval sweep for occupancy on 2000 units."""
+
+        unit_count = 2000
+        property_model = self._create_value_add_property(unit_count, "Occupancy")
+        timeline = Timeline(start_date=date(2024, 1, 1), duration_months=48)
+        scenario = run(
+            model=property_model, timeline=timeline, settings=GlobalSettings()
+        )
+        orchestrator = scenario.scenario._orchestrator
+        leases = [m for m in orchestrator.models if isinstance(m, LeaseBase)]
+
+        start = time.perf_counter()
+        occupied = pd.Series(0.0, index=timeline.period_index)
+        for lease in leases:
+            occupied = occupied.add(
+                pd.Series(lease.area, index=lease.timeline.period_index),
+                fill_value=0.0,
+            )
+        fold_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        profile = OccupancyProfile.from_leases(
+            leases, timeline.period_index, property_model.net_rentable_area
+        )
+        sweep_time = time.perf_counter() - start
+
+        pd.testing.assert_series_equal(
+            profile.occupied_area_series(),
+            occupied.reindex(timeline.period_index),
+            check_names=False,
+        )
+        print(f"\n OCCUPANCY PROFILE - {len(leases)} Leases:")
+        print(f"   pandas fold    {fold_time:6.3f}s")
+        print(f"   interval sweep {sweep_time:6.3f}s  ({fold_time / sweep_time:.0f}x)")
+
     def test_rolling_completion_rate_at_scale(self):
         """Test that rolling renovation completes properly at scale."""
 
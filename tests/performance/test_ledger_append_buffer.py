@@ -0,0 +1,145 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ledger Append Buffer Performance Test
+
+Compares insert throughput of the columnar append buffer used by
+`Ledger.add_series()` against the previous per-series path, which built a
+DataFrame for every series and ran a register/INSERT round trip per call.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, SeriesMetadata
+from performa.core.primitives import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+SERIES_COUNT = 10_000
+# The legacy path costs a register/INSERT round trip per series, so its rate is
+# measured on a sample to keep the suite fast (throughput is per-series bound).
+LEGACY_SAMPLE = 1_000
+PERIODS = 12
+
+
+def _make_workload(count: int = SERIES_COUNT):
+    """Build `count` monthly series with alternating revenue/expense metadata."""
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+    rng = np.random.default_rng(42)
+    asset_id = uuid.uuid4()
+    workload = []
+    for i in range(count):
+        is_revenue = i % 2 == 0
+        metadata = SeriesMetadata(
+            category=(
+                CashFlowCategoryEnum.REVENUE
+                if is_revenue
+                else CashFlowCategoryEnum.EXPENSE
+            ),
+            subcategory=(
+                RevenueSubcategoryEnum.LEASE
+                if is_revenue
+                else ExpenseSubcategoryEnum.OPEX
+            ),
+            item_name=f"Item {i}",
+            source_id=uuid.uuid4(),
+            asset_id=asset_id,
+            pass_num=1,
+        )
+        values = rng.uniform(100.0, 1_000.0, PERIODS)
+        workload.append((
+            pd.Series(values if is_revenue else -values, index=index),
+            metadata,
+        ))
+    return workload
+
+
+def _legacy_insert(ledger: Ledger, series: pd.Series, metadata: SeriesMetadata) -> None:
+    """Per-series DataFrame + register/INSERT path that the append buffer replaced."""
+    series = series[series != 0]
+    dates = series.index.to_timestamp()
+    df = pd.DataFrame({
+        "transaction_id": [str(uuid.uuid4()) for _ in range(len(series))],
+        "date": dates,
+        "amount": series.values,
+        "flow_purpose": "Operating",
+        "category": metadata.category.value,
+        "subcategory": metadata.subcategory.value,
+        "item_name": metadata.item_name,
+        "source_id": str(metadata.source_id),
+        "asset_id": str(metadata.asset_id),
+        "pass_num": metadata.pass_num,
+    })
+    ledger.con.register("temp_df_view", df)
+    ledger.con.execute(
+        f"""
+        INSERT INTO {ledger.table_name}
+            (transaction_id, date, amount, flow_purpose, category, subcategory,
+             item_name, source_id, asset_id, pass_num)
+        SELECT transaction_id::UUID, date::DATE, amount, flow_purpose, category,
+               subcategory, item_name, source_id::UUID, asset_id::UUID, pass_num
+        FROM temp_df_view
+        """
+    )
+    ledger.con.unregister("temp_df_view")
+
+
+class TestLedgerAppendBufferPerformance:
+    """Insert throughput of the columnar append buffer vs. per-series inserts."""
+
+    def test_append_buffer_outperforms_per_series_inserts(self):
+        """10k series inserted within a transaction should beat the legacy path."""
+        workload = _make_workload()
+        expected_rows = SERIES_COUNT * PERIODS
+
+        legacy_ledger = Ledger()
+        start = time.perf_counter()
+        for series, metadata in workload[:LEGACY_SAMPLE]:
+            _legacy_insert(legacy_ledger, series, metadata)
+        legacy_seconds = time.perf_counter() - start
+
+        buffered_ledger = Ledger()
+        start = time.perf_counter()
+        with buffered_ledger.transaction():
+            for series, metadata in workload:
+                buffered_ledger.add_series(series, metadata)
+        buffered_seconds = time.perf_counter() - start
+
+        legacy_rate = LEGACY_SAMPLE * PERIODS / legacy_seconds
+        buffered_rate = expected_rows / buffered_seconds
+        print(
+            f"\n{SERIES_COUNT:,} series / {expected_rows:,} rows: "
+            f"legacy {legacy_rate:,.0f} rows/s (sampled {LEGACY_SAMPLE:,} series), "
+            f"append buffer {buffered_rate:,.0f} rows/s ({buffered_seconds:.2f}s), "
+            f"speedup {buffered_rate / legacy_rate:.1f}x"
+        )
+
+        count_sql = f"SELECT COUNT(*) FROM {buffered_ledger.table_name}"
+        assert buffered_ledger.con.execute(count_sql).fetchone()[0] == expected_rows
+        assert (
+            legacy_ledger.con.execute(count_sql).fetchone()[0]
+            == LEGACY_SAMPLE * PERIODS
+        )
+        assert buffered_ledger.series_count() == SERIES_COUNT
+        assert buffered_rate > legacy_rate
+
+    def test_threshold_flush_inside_transaction(self):
+        """Reaching flush_threshold inserts buffered rows before the transaction ends."""
+        workload = _make_workload(20)
+        ledger = Ledger(flush_threshold=5 * PERIODS)
+
+        with ledger.transaction():
+            for series, metadata in workload:
+                ledger.add_series(series, metadata)
+            count_sql = f"SELECT COUNT(*) FROM {ledger.table_name}"
+            assert ledger.con.execute(count_sql).fetchone()[0] == 20 * PERIODS
+            assert not ledger.has_buffered_data()
+
+        assert len(ledger) == 20 * PERIODS
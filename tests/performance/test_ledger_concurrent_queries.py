@@ -0,0 +1,74 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Concurrent Ledger Query Throughput
+
+Throughput of uncached transaction-table queries (`equity_partner_flows`,
+which scans the full ledger) issued from one thread versus a thread pool in
+which every thread queries through its own cursor.
+"""
+
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, SeriesMetadata
+from performa.core.primitives import CashFlowCategoryEnum, FinancingSubcategoryEnum
+
+SERIES_COUNT = 2_000
+PERIODS = 120
+CALLS = 64
+THREADS = 8
+
+
+def _finished_ledger() -> Ledger:
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+    rng = np.random.default_rng(5)
+    ledger = Ledger(query_cache_size=0)
+    with ledger.transaction():
+        for i in range(SERIES_COUNT):
+            ledger.add_series(
+                pd.Series(rng.uniform(-1_000.0, 1_000.0, PERIODS), index=index),
+                SeriesMetadata(
+                    category=CashFlowCategoryEnum.FINANCING,
+                    subcategory=FinancingSubcategoryEnum.EQUITY_DISTRIBUTION,
+                    item_name=f"Distribution {i}",
+                    source_id=uuid.uuid4(),
+                    asset_id=uuid.uuid4(),
+                    pass_num=2,
+                ),
+            )
+    return ledger
+
+
+class TestLedgerConcurrentQueryPerformance:
+    """Serial vs. per-thread-cursor query throughput."""
+
+    def test_concurrent_query_throughput(self):
+        ledger = _finished_ledger()
+        queries = ledger.get_queries(thread_local=True)
+        expected = queries.equity_partner_flows()
+
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            queries.equity_partner_flows()
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            results = list(
+                pool.map(lambda _: queries.equity_partner_flows(), range(CALLS))
+            )
+        threaded = time.perf_counter() - start
+
+        for result in results:
+            pd.testing.assert_series_equal(result, expected)
+        print(
+            f"\n{CALLS} queries over {SERIES_COUNT * PERIODS:,} rows: "
+            f"serial {serial:.2f}s, {THREADS} threads {threaded:.2f}s "
+            f"({serial / threaded:.1f}x)"
+        )
@@ -0,0 +1,81 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ledger Deferred Transaction Id Performance Test
+
+Compares random UUID transaction ids generated on insert against surrogate
+BIGINT ids from a DuckDB sequence (`transaction_ids="deferred"`): insert
+time and DuckDB memory of the stored rows.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, SeriesMetadata
+from performa.core.primitives import CashFlowCategoryEnum, RevenueSubcategoryEnum
+
+SERIES_COUNT = 2_000
+PERIODS = 120
+
+
+def _make_workload():
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+    rng = np.random.default_rng(5)
+    asset_id = uuid.uuid4()
+    return [
+        (
+            pd.Series(rng.uniform(500.0, 1_500.0, PERIODS), index=index),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory=RevenueSubcategoryEnum.LEASE,
+                item_name=f"Lease {i}",
+                source_id=uuid.uuid4(),
+                asset_id=asset_id,
+                pass_num=1,
+            ),
+        )
+        for i in range(SERIES_COUNT)
+    ]
+
+
+def _load(workload, **ledger_kwargs):
+    ledger = Ledger(**ledger_kwargs)
+    start = time.perf_counter()
+    with ledger.transaction():
+        for series, metadata in workload:
+            ledger.add_series(series, metadata)
+    seconds = time.perf_counter() - start
+    ledger.con.execute("CHECKPOINT")
+    memory = ledger.con.execute(
+        "SELECT SUM(memory_usage_bytes) FROM duckdb_memory()"
+    ).fetchone()[0]
+    return ledger, seconds, memory
+
+
+class TestLedgerDeferredIdsPerformance:
+    """Insert cost and footprint of eager vs. deferred transaction ids."""
+
+    def test_deferred_ids_reduce_memory(self):
+        workload = _make_workload()
+        lines = []
+        for layout in ("wide", "normalized"):
+            eager, eager_seconds, eager_bytes = _load(workload, layout=layout)
+            deferred, deferred_seconds, deferred_bytes = _load(
+                workload, layout=layout, transaction_ids="deferred"
+            )
+            lines.append(
+                f"{layout}: eager {eager_seconds:.2f}s / {eager_bytes / 1e6:.1f} MB, "
+                f"deferred {deferred_seconds:.2f}s / {deferred_bytes / 1e6:.1f} MB"
+            )
+
+            assert len(deferred) == len(eager) == SERIES_COUNT * PERIODS
+            pd.testing.assert_series_equal(
+                deferred.get_queries().pgr(), eager.get_queries().pgr()
+            )
+            assert deferred_bytes < eager_bytes
+
+        print(f"\n{SERIES_COUNT:,} series x {PERIODS} periods: " + "; ".join(lines))
@@ -0,0 +1,149 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ledger ENUM Schema Performance Test
+
+Compares the dictionary-encoded (ENUM) classification columns of the ledger
+against the previous VARCHAR schema on a large ledger: memory of the
+materialized result and latency of typical filtered monthly aggregations.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, SeriesMetadata
+from performa.core.ledger.schema import arrow_to_pandas
+from performa.core.primitives import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    FinancingSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+SERIES_COUNT = 2_000
+PERIODS = 120
+QUERY_REPEATS = 20
+CLASSIFICATION_COLUMNS = ["flow_purpose", "category", "subcategory", "entity_type"]
+
+LINE_ITEMS = [
+    (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 1.0),
+    (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.MISC, 1.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -1.0),
+    (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.CAPEX, -1.0),
+    (CashFlowCategoryEnum.FINANCING, FinancingSubcategoryEnum.INTEREST_PAYMENT, -1.0),
+]
+
+QUERIES = {
+    "noi": """
+        SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS amount
+        FROM {table}
+        WHERE flow_purpose = 'Operating' AND category IN ('Revenue', 'Expense')
+        GROUP BY month ORDER BY month
+    """,
+    "opex": """
+        SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS amount
+        FROM {table}
+        WHERE category = 'Expense' AND subcategory = 'OpEx'
+        GROUP BY month ORDER BY month
+    """,
+    "by_subcategory": """
+        SELECT subcategory::VARCHAR AS subcategory, SUM(amount) AS amount
+        FROM {table}
+        GROUP BY 1 ORDER BY 1
+    """,
+}
+
+
+def _build_large_ledger() -> Ledger:
+    """Populate a ledger with SERIES_COUNT monthly series over PERIODS months."""
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+    rng = np.random.default_rng(3)
+    asset_id = uuid.uuid4()
+    ledger = Ledger()
+    with ledger.transaction():
+        for i in range(SERIES_COUNT):
+            category, subcategory, sign = LINE_ITEMS[i % len(LINE_ITEMS)]
+            metadata = SeriesMetadata(
+                category=category,
+                subcategory=subcategory,
+                item_name=f"Line {i}",
+                source_id=uuid.uuid4(),
+                asset_id=asset_id,
+                pass_num=1,
+            )
+            values = sign * rng.uniform(100.0, 1_000.0, PERIODS)
+            ledger.add_series(pd.Series(values, index=index), metadata)
+    return ledger
+
+
+def _time_query(con, sql: str) -> float:
+    start = time.perf_counter()
+    for _ in range(QUERY_REPEATS):
+        con.execute(sql).fetchall()
+    return (time.perf_counter() - start) / QUERY_REPEATS
+
+
+class TestLedgerEnumSchemaPerformance:
+    """Memory and latency of ENUM vs. VARCHAR classification columns."""
+
+    def test_enum_schema_vs_varchar_schema(self):
+        """ENUM columns materialize smaller and answer the same queries."""
+        ledger = _build_large_ledger()
+        con, table = ledger.get_query_connection()
+
+        # Reproduce the previous VARCHAR schema from the same rows
+        con.execute(
+            f"""
+            CREATE TABLE transactions_varchar AS
+            SELECT * REPLACE (
+                flow_purpose::VARCHAR AS flow_purpose,
+                category::VARCHAR AS category,
+                subcategory::VARCHAR AS subcategory,
+                entity_type::VARCHAR AS entity_type
+            )
+            FROM {table}
+            """
+        )
+
+        select_cols = ", ".join(CLASSIFICATION_COLUMNS)
+
+        # Memory: Arrow transfer and pandas materialization of the columns
+        enum_arrow = con.execute(f"SELECT {select_cols} FROM {table}").arrow()
+        enum_arrow = enum_arrow.read_all()
+        varchar_arrow = con.execute(
+            f"SELECT {select_cols} FROM transactions_varchar"
+        ).arrow()
+        varchar_arrow = varchar_arrow.read_all()
+        enum_df = arrow_to_pandas(enum_arrow)
+        # Previous path: decode strings, then convert to categoricals
+        varchar_df = varchar_arrow.to_pandas().astype("category")
+        enum_pandas_bytes = enum_df.memory_usage(deep=True).sum()
+        varchar_object_bytes = varchar_arrow.to_pandas().memory_usage(deep=True).sum()
+
+        print(
+            f"\n{ledger.record_count():,} rows | Arrow bytes: "
+            f"ENUM {enum_arrow.nbytes / 1e6:.1f} MB vs VARCHAR "
+            f"{varchar_arrow.nbytes / 1e6:.1f} MB | pandas: ENUM categoricals "
+            f"{enum_pandas_bytes / 1e6:.1f} MB vs VARCHAR objects "
+            f"{varchar_object_bytes / 1e6:.1f} MB"
+        )
+
+        for name, sql in QUERIES.items():
+            enum_sql = sql.format(table=table)
+            varchar_sql = sql.format(table="transactions_varchar")
+            assert (
+                con.execute(enum_sql).fetchall() == con.execute(varchar_sql).fetchall()
+            )
+            enum_ms = _time_query(con, enum_sql) * 1000
+            varchar_ms = _time_query(con, varchar_sql) * 1000
+            print(f"  {name}: ENUM {enum_ms:.2f} ms vs VARCHAR {varchar_ms:.2f} ms")
+
+        pd.testing.assert_frame_equal(
+            enum_df.astype(str), varchar_df.astype(str), check_dtype=False
+        )
+        assert enum_arrow.nbytes < varchar_arrow.nbytes
+        assert enum_pandas_bytes < varchar_object_bytes
@@ -0,0 +1,108 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ledger Monthly Rollup Performance Test
+
+Mimics Phase 2 of the orchestrator: a batch of rows is flushed, then the
+monthly aggregates are re-queried, over and over as the ledger grows. Compares
+the latency of those queries against the incrementally maintained rollup with
+the same queries rolled up from the transactions table at query time.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, LedgerQueries, SeriesMetadata
+from performa.core.primitives import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+ROUNDS = 20
+SERIES_PER_ROUND = 500
+PERIODS = 120
+
+
+class _ScanOnly:
+    """Ledger facade without a rollup: queries aggregate the transactions table."""
+
+    query_cache = None
+
+    def __init__(self, ledger: Ledger):
+        self._ledger = ledger
+
+    def get_query_connection(self):
+        return self._ledger.get_query_connection()
+
+    def get_version(self):
+        return self._ledger.get_version()
+
+
+def _add_round(ledger: Ledger, rng: np.random.Generator, index: pd.PeriodIndex):
+    with ledger.transaction():
+        for unit in range(SERIES_PER_ROUND):
+            category, subcategory, sign = (
+                (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 1.0)
+                if unit % 2 == 0
+                else (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -1.0)
+            )
+            ledger.add_series(
+                pd.Series(sign * rng.uniform(100.0, 2_000.0, PERIODS), index=index),
+                SeriesMetadata(
+                    category=category,
+                    subcategory=subcategory,
+                    item_name=f"Unit {unit:04d}",
+                    source_id=uuid.uuid4(),
+                    asset_id=uuid.uuid4(),
+                    pass_num=2,
+                ),
+            )
+
+
+def _query_seconds(queries: LedgerQueries) -> float:
+    start = time.perf_counter()
+    queries._cache.invalidate()
+    queries.pgr()
+    queries.egi()
+    queries.opex()
+    queries.noi()
+    queries.capex()
+    return time.perf_counter() - start
+
+
+class TestLedgerMonthlyRollupPerformance:
+    """Aggregate query latency as the ledger grows."""
+
+    def test_rollup_queries_do_not_grow_with_ledger(self):
+        index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+        rng = np.random.default_rng(13)
+        ledger = Ledger()
+        rolled = LedgerQueries(ledger)
+        scanned = LedgerQueries(_ScanOnly(ledger))
+
+        rolled_times, scanned_times = [], []
+        insert_seconds = 0.0
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            _add_round(ledger, rng, index)
+            insert_seconds += time.perf_counter() - start
+            rolled_times.append(_query_seconds(rolled))
+            scanned_times.append(_query_seconds(scanned))
+
+        print(
+            f"\n{ROUNDS} rounds to {len(ledger):,} transactions "
+            f"(inserts {insert_seconds:.2f}s): "
+            f"rollup queries first {rolled_times[0] * 1e3:.1f} ms / "
+            f"last {rolled_times[-1] * 1e3:.1f} ms / total {sum(rolled_times):.2f}s, "
+            f"table scan first {scanned_times[0] * 1e3:.1f} ms / "
+            f"last {scanned_times[-1] * 1e3:.1f} ms / total {sum(scanned_times):.2f}s"
+        )
+
+        pd.testing.assert_series_equal(rolled.noi(), scanned.noi())
+        assert len(ledger) == ROUNDS * SERIES_PER_ROUND * PERIODS
+        assert sum(rolled_times) < sum(scanned_times)
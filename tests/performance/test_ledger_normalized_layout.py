@@ -0,0 +1,102 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ledger Normalized Layout Performance Test
+
+Compares the wide transactions table against the normalized layout (series
+dimension table plus slim fact table) on a 1,000-unit property with 120
+monthly periods: DuckDB memory of the stored rows and latency of the usual
+filtered monthly aggregations through `LedgerQueries`.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, SeriesMetadata
+from performa.core.primitives import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+UNIT_COUNT = 1_000
+PERIODS = 120
+QUERY_REPEATS = 10
+
+
+def _make_property_series():
+    """Rent and a unit-level expense line for every unit of one property."""
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+    rng = np.random.default_rng(11)
+    asset_id = uuid.uuid4()
+    workload = []
+    for unit in range(UNIT_COUNT):
+        for category, subcategory, sign in (
+            (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE, 1.0),
+            (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX, -1.0),
+        ):
+            workload.append((
+                pd.Series(sign * rng.uniform(100.0, 2_000.0, PERIODS), index=index),
+                SeriesMetadata(
+                    category=category,
+                    subcategory=subcategory,
+                    item_name=f"Unit {unit:04d} {subcategory.value}",
+                    source_id=uuid.uuid4(),
+                    asset_id=asset_id,
+                    pass_num=1,
+                ),
+            ))
+    return workload
+
+
+def _memory_bytes(ledger: Ledger) -> int:
+    ledger.con.execute("CHECKPOINT")
+    return ledger.con.execute(
+        "SELECT SUM(memory_usage_bytes) FROM duckdb_memory()"
+    ).fetchone()[0]
+
+
+def _query_seconds(ledger: Ledger) -> float:
+    queries = ledger.get_queries()
+    start = time.perf_counter()
+    for _ in range(QUERY_REPEATS):
+        ledger.query_cache.invalidate()
+        queries.pgr()
+        queries.opex()
+        queries.noi()
+    return time.perf_counter() - start
+
+
+class TestLedgerNormalizedLayoutPerformance:
+    """Storage footprint and scan latency of the two ledger layouts."""
+
+    def test_normalized_layout_reduces_memory(self):
+        workload = _make_property_series()
+        results = {}
+        for layout in ("wide", "normalized"):
+            ledger = Ledger(layout=layout)
+            with ledger.transaction():
+                for series, metadata in workload:
+                    ledger.add_series(series, metadata)
+            results[layout] = (
+                _memory_bytes(ledger),
+                _query_seconds(ledger),
+                ledger.get_queries().noi(),
+            )
+
+        wide_bytes, wide_seconds, wide_noi = results["wide"]
+        normalized_bytes, normalized_seconds, normalized_noi = results["normalized"]
+        print(
+            f"\n{UNIT_COUNT:,} units x {PERIODS} periods: "
+            f"wide {wide_bytes / 1e6:.1f} MB / {wide_seconds:.2f}s queries, "
+            f"normalized {normalized_bytes / 1e6:.1f} MB / "
+            f"{normalized_seconds:.2f}s queries, "
+            f"memory ratio {wide_bytes / normalized_bytes:.1f}x"
+        )
+
+        pd.testing.assert_series_equal(normalized_noi, wide_noi)
+        assert normalized_bytes < wide_bytes
@@ -0,0 +1,140 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ledger Parameterized Query Micro-Benchmark
+
+Per-query latency of the monthly aggregates on a loaded ledger when writes
+and reads alternate, as they do while an analysis computes dependent models:
+each round adds one series (which invalidates the result cache) and then
+reads the aggregate, either through the bound-parameter statements used by
+`LedgerQueries` or as literal SQL text.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, SeriesMetadata
+from performa.core.primitives import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+)
+
+SERIES_COUNT = 400
+PERIODS = 120
+REPEATS = 100
+
+LITERAL_SQL = {
+    "noi": """
+        SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS total
+        FROM {relation}
+        WHERE flow_purpose = 'Operating'
+        GROUP BY month
+    """,
+    "pgr": """
+        SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS total
+        FROM {relation}
+        WHERE flow_purpose = 'Operating'
+            AND category = 'Revenue'
+            AND subcategory IN ('Lease', 'Miscellaneous', 'Recovery')
+        GROUP BY month
+    """,
+    "opex": """
+        SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS total
+        FROM {relation}
+        WHERE category = 'Expense'
+            AND subcategory = 'OpEx'
+            AND flow_purpose != 'Valuation'
+        GROUP BY month
+    """,
+}
+
+
+def _warm_ledger() -> Ledger:
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+    rng = np.random.default_rng(17)
+    ledger = Ledger()
+    with ledger.transaction():
+        for i in range(SERIES_COUNT):
+            category, subcategory = (
+                (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE)
+                if i % 2 == 0
+                else (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX)
+            )
+            ledger.add_series(
+                pd.Series(rng.uniform(100.0, 2_000.0, PERIODS), index=index),
+                SeriesMetadata(
+                    category=category,
+                    subcategory=subcategory,
+                    item_name=f"Line {i}",
+                    source_id=uuid.uuid4(),
+                    asset_id=uuid.uuid4(),
+                    pass_num=1,
+                ),
+            )
+    return ledger
+
+
+def _write(ledger: Ledger, index: pd.PeriodIndex) -> None:
+    """Add one operating expense line, as a dependent model would."""
+    ledger.add_series(
+        pd.Series(-50.0, index=index),
+        SeriesMetadata(
+            category=CashFlowCategoryEnum.EXPENSE,
+            subcategory=ExpenseSubcategoryEnum.OPEX,
+            item_name="Dependent",
+            source_id=uuid.uuid4(),
+            asset_id=uuid.uuid4(),
+            pass_num=2,
+        ),
+    )
+
+
+def _microseconds(ledger: Ledger, call) -> float:
+    """Mean time of `call` when each call follows a write."""
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+    call()
+    elapsed = 0.0
+    for _ in range(REPEATS):
+        _write(ledger, index)
+        start = time.perf_counter()
+        call()
+        elapsed += time.perf_counter() - start
+    return elapsed / REPEATS * 1e6
+
+
+class TestLedgerParameterizedQueryPerformance:
+    """Per-call latency of parameterized vs. literal-SQL aggregate queries."""
+
+    def test_parameterized_query_latency(self):
+        ledger = _warm_ledger()
+        queries = ledger.get_queries()
+
+        lines = []
+        for method, template in LITERAL_SQL.items():
+            sql = template.format(relation=ledger.rollup_table)
+
+            def statement(method=method):
+                return getattr(queries, method)()
+
+            def literal(method=method, sql=sql):
+                return queries._execute_query_to_series(sql, "month", "total", method)
+
+            hits = ledger.query_cache.hits
+            statement_us = _microseconds(ledger, statement)
+            literal_us = _microseconds(ledger, literal)
+            # Every timed read followed a write, so none came from the cache
+            assert ledger.query_cache.hits == hits
+            lines.append(
+                f"{method}: statement {statement_us:.0f} us, "
+                f"literal SQL {literal_us:.0f} us"
+            )
+            pd.testing.assert_series_equal(statement(), literal(), check_names=False)
+        print(
+            f"\n{SERIES_COUNT * PERIODS:,} transactions, write before every read: "
+            + "; ".join(lines)
+        )
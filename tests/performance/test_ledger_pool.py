@@ -0,0 +1,87 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ledger Pool Performance Test
+
+Measures per-deal ledger overhead for a loop of small deals, comparing a new
+`Ledger()` per deal (connection, table, settings and indexes each time)
+against a `LedgerPool` that resets a pooled ledger between deals.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, LedgerPool, SeriesMetadata
+from performa.core.primitives import CashFlowCategoryEnum, RevenueSubcategoryEnum
+
+DEAL_COUNT = 100
+SERIES_PER_DEAL = 5
+PERIODS = 60
+
+
+def _make_deal_series():
+    """Build the series one small deal writes to its ledger."""
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")
+    rng = np.random.default_rng(7)
+    asset_id = uuid.uuid4()
+    return [
+        (
+            pd.Series(rng.uniform(1_000.0, 2_000.0, PERIODS), index=index),
+            SeriesMetadata(
+                category=CashFlowCategoryEnum.REVENUE,
+                subcategory=RevenueSubcategoryEnum.LEASE,
+                item_name=f"Lease {i}",
+                source_id=uuid.uuid4(),
+                asset_id=asset_id,
+                pass_num=1,
+            ),
+        )
+        for i in range(SERIES_PER_DEAL)
+    ]
+
+
+def _run_deal(ledger: Ledger, workload) -> float:
+    """Write one deal's series and read back a total, like a tiny analysis."""
+    with ledger.transaction():
+        for series, metadata in workload:
+            ledger.add_series(series, metadata)
+    return ledger.get_queries().pgr().sum()
+
+
+class TestLedgerPoolPerformance:
+    """Per-deal overhead with and without ledger pooling."""
+
+    def test_pool_reduces_per_deal_overhead(self):
+        workload = _make_deal_series()
+        expected_total = sum(series.sum() for series, _ in workload)
+
+        start = time.perf_counter()
+        for _ in range(DEAL_COUNT):
+            ledger = Ledger()
+            assert np.isclose(_run_deal(ledger, workload), expected_total)
+            ledger.close()
+        fresh_seconds = time.perf_counter() - start
+
+        pool = LedgerPool(size=2)
+        start = time.perf_counter()
+        for _ in range(DEAL_COUNT):
+            with pool.ledger() as ledger:
+                assert np.isclose(_run_deal(ledger, workload), expected_total)
+        pooled_seconds = time.perf_counter() - start
+        pool.close()
+
+        fresh_ms = fresh_seconds / DEAL_COUNT * 1000
+        pooled_ms = pooled_seconds / DEAL_COUNT * 1000
+        print(
+            f"\n{DEAL_COUNT} deals x {SERIES_PER_DEAL} series: "
+            f"new Ledger {fresh_ms:.2f} ms/deal, "
+            f"LedgerPool {pooled_ms:.2f} ms/deal, "
+            f"speedup {fresh_ms / pooled_ms:.1f}x"
+        )
+
+        assert pool.stats()["created"] == 1
+        assert pooled_seconds < fresh_seconds
@@ -0,0 +1,97 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ledger Timeline Query Micro-Benchmark
+
+Per-query latency of timeline-aligned monthly aggregates on a warm ledger
+(result cache cleared before every call): a timeline-bound `LedgerQueries`,
+which zero-fills against a calendar table in SQL, against the unbound query
+followed by the pandas reindexes `DealResults` used to apply.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from performa.core.ledger import Ledger, LedgerQueries, SeriesMetadata
+from performa.core.primitives import (
+    CashFlowCategoryEnum,
+    ExpenseSubcategoryEnum,
+    RevenueSubcategoryEnum,
+    Timeline,
+)
+
+SERIES_COUNT = 400
+PERIODS = 120
+REPEATS = 300
+METHODS = ("noi", "pgr", "opex", "debt_service")
+
+
+def _warm_ledger() -> Ledger:
+    # Sparse lines, so the monthly results have gaps to fill
+    index = pd.period_range("2024-01", periods=PERIODS, freq="M")[::3]
+    rng = np.random.default_rng(18)
+    ledger = Ledger()
+    with ledger.transaction():
+        for i in range(SERIES_COUNT):
+            category, subcategory = (
+                (CashFlowCategoryEnum.REVENUE, RevenueSubcategoryEnum.LEASE)
+                if i % 2 == 0
+                else (CashFlowCategoryEnum.EXPENSE, ExpenseSubcategoryEnum.OPEX)
+            )
+            ledger.add_series(
+                pd.Series(rng.uniform(100.0, 2_000.0, len(index)), index=index),
+                SeriesMetadata(
+                    category=category,
+                    subcategory=subcategory,
+                    item_name=f"Line {i}",
+                    source_id=uuid.uuid4(),
+                    asset_id=uuid.uuid4(),
+                    pass_num=1,
+                ),
+            )
+    return ledger
+
+
+def _microseconds(call) -> float:
+    call()  # first call prepares the statement
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        call()
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+class TestLedgerTimelineQueryPerformance:
+    """Per-call latency of SQL gap-filling vs. pandas reindexing."""
+
+    def test_timeline_query_latency(self):
+        ledger = _warm_ledger()
+        timeline = Timeline.from_dates("2023-07-01", "2034-06-30")
+        unbound = LedgerQueries(ledger)
+        bound = LedgerQueries(ledger, timeline=timeline)
+
+        lines = []
+        for method in METHODS:
+
+            def in_sql():
+                ledger.query_cache.invalidate()
+                return getattr(bound, method)()
+
+            def in_pandas():
+                ledger.query_cache.invalidate()
+                return timeline.align_series(getattr(unbound, method)())
+
+            sql_us = _microseconds(in_sql)
+            pandas_us = _microseconds(in_pandas)
+            lines.append(
+                f"{method}: calendar join {sql_us:.0f} us, reindex {pandas_us:.0f} us"
+            )
+            pd.testing.assert_series_equal(in_sql(), in_pandas(), check_freq=False)
+
+        print(
+            f"\n{len(timeline.period_index)}-month timeline, warm ledger: "
+            + "; ".join(lines)
+        )
@@ -0,0 +1,104 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Phase 2 Aggregate Benchmark
+
+Time of a property with many dependent fees (%-of-EGI / %-of-OpEx) when the
+aggregates they read are kept in memory by the orchestrator, against flushing
+and re-querying the ledger after every dependent model.
+"""
+
+import time
+from datetime import date
+
+import pandas as pd
+
+import performa.analysis.orchestrator as orchestrator_module
+from performa.analysis import run
+from performa.asset.residential import (
+    ResidentialExpenses,
+    ResidentialOpExItem,
+    ResidentialProperty,
+    ResidentialRentRoll,
+    ResidentialRolloverLeaseTerms,
+    ResidentialRolloverProfile,
+    ResidentialUnitSpec,
+)
+from performa.core.ledger import Ledger
+from performa.core.primitives import GlobalSettings, Timeline, UnleveredAggregateLineKey
+
+FEE_COUNT = 200
+TIMELINE = Timeline(start_date=date(2024, 1, 1), duration_months=120)
+
+
+def _property() -> ResidentialProperty:
+    profile = ResidentialRolloverProfile(
+        name="Standard",
+        term_months=12,
+        renewal_probability=0.6,
+        downtime_months=1,
+        market_terms=ResidentialRolloverLeaseTerms(market_rent=2000.0),
+        renewal_terms=ResidentialRolloverLeaseTerms(market_rent=1950.0),
+    )
+    references = [
+        UnleveredAggregateLineKey.EFFECTIVE_GROSS_INCOME,
+        UnleveredAggregateLineKey.POTENTIAL_GROSS_REVENUE,
+        UnleveredAggregateLineKey.TOTAL_OPERATING_EXPENSES,
+    ]
+    fees = [
+        ResidentialOpExItem(
+            name=f"Fee {i}",
+            timeline=TIMELINE,
+            value=0.001,
+            reference=references[i % len(references)],
+        )
+        for i in range(FEE_COUNT)
+    ]
+    return ResidentialProperty(
+        name="Fee Heavy Apartments",
+        gross_area=60_000.0,
+        net_rentable_area=48_000.0,
+        unit_mix=ResidentialRentRoll(
+            unit_specs=[
+                ResidentialUnitSpec(
+                    unit_type_name=f"Plan {i}",
+                    unit_count=10,
+                    avg_area_sf=800.0,
+                    current_avg_monthly_rent=1800.0,
+                    rollover_profile=profile,
+                )
+                for i in range(6)
+            ]
+        ),
+        expenses=ResidentialExpenses(operating_expenses=fees),
+    )
+
+
+def test_phase2_aggregate_accumulator(monkeypatch):
+    prop = _property()
+    timings = {}
+    results = {}
+    for mode in ["ledger refresh", "accumulator"]:
+        with monkeypatch.context() as patch:
+            if mode == "ledger refresh":
+                patch.setattr(
+                    orchestrator_module, "ACCUMULABLE_AGGREGATE_LINES", frozenset()
+                )
+            ledger = Ledger()
+            start = time.perf_counter()
+            result = run(prop, TIMELINE, GlobalSettings(), ledger=ledger)
+            timings[mode] = time.perf_counter() - start
+            results[mode] = (result.summary_df, ledger.fingerprint())
+
+    pd.testing.assert_frame_equal(
+        results["accumulator"][0], results["ledger refresh"][0]
+    )
+    assert results["accumulator"][1] == results["ledger refresh"][1]
+
+    print(f"\n PHASE 2 AGGREGATES - {FEE_COUNT} dependent fees:")
+    for mode, elapsed in timings.items():
+        print(
+            f"   {mode:<15} {elapsed:6.2f}s  "
+            f"({timings['ledger refresh'] / elapsed:.1f}x ledger refresh)"
+        )
@@ -0,0 +1,122 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for OccupancyProfile.
+
+The difference-array sweep must match summing one area series per lease.
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from performa.analysis import OccupancyProfile
+from performa.asset.residential import ResidentialLease
+from performa.core.primitives import (
+    FrequencyEnum,
+    LeaseStatusEnum,
+    Timeline,
+    UponExpirationEnum,
+)
+
+ANALYSIS = Timeline(start_date=date(2024, 1, 1), duration_months=36)
+NRA = 20_000.0
+
+
+def _lease(start: date, months: int, area: float, status, multiplicity: int = 1):
+    return ResidentialLease(
+        name=f"Resident {start:%Y%m}",
+        timeline=Timeline(start_date=start, duration_months=months),
+        status=status,
+        area=area,
+        suite="101",
+        floor="1",
+        upon_expiration=UponExpirationEnum.MARKET,
+        monthly_rent=1800.0,
+        value=1800.0,
+        frequency=FrequencyEnum.MONTHLY,
+        multiplicity=multiplicity,
+    )
+
+
+def _reference(leases, status=None) -> pd.Series:
+    """Occupied area the way the orchestrator used to compute it."""
+    total = pd.Series(0.0, index=ANALYSIS.period_index)
+    for lease in leases:
+        if status is None or lease.status == status:
+            area = pd.Series(
+                lease.area * lease.multiplicity, index=lease.timeline.period_index
+            )
+            total = total.add(area, fill_value=0.0)
+    return total.reindex(ANALYSIS.period_index)
+
+
+@pytest.fixture
+def leases():
+    rng = np.random.default_rng(7)
+    statuses = [LeaseStatusEnum.CONTRACT, LeaseStatusEnum.SPECULATIVE]
+    return [
+        _lease(
+            date(int(year), int(month), 1),
+            int(rng.integers(1, 30)),
+            round(float(rng.uniform(400, 1200)), 2),
+            statuses[i % 3 == 0],
+            multiplicity=int(rng.integers(1, 4)),
+        )
+        for i, (year, month) in enumerate(
+            zip(rng.integers(2022, 2028, 200), rng.integers(1, 13, 200))
+        )
+    ]
+
+
+def test_matches_per_lease_series(leases):
+    profile = OccupancyProfile.from_leases(leases, ANALYSIS.period_index, NRA)
+
+    pd.testing.assert_series_equal(
+        profile.occupied_area_series(), _reference(leases), check_names=False
+    )
+    pd.testing.assert_series_equal(
+        profile.occupancy_rate(), _reference(leases) / NRA, check_names=False
+    )
+    by_status = profile.by_status()
+    assert set(profile.statuses) == set(LeaseStatusEnum)
+    for status in LeaseStatusEnum:
+        pd.testing.assert_series_equal(
+            by_status[status], _reference(leases, status), check_names=False
+        )
+    pd.testing.assert_series_equal(
+        by_status.sum(axis=1), profile.occupied_area_series(), check_names=False
+    )
+    pd.testing.assert_frame_equal(profile.by_status(rates=True), by_status / NRA)
+
+
+def test_leases_outside_the_analysis_and_vacant_periods():
+    leases = [
+        _lease(date(2020, 1, 1), 12, 700.1, LeaseStatusEnum.CONTRACT),
+        _lease(date(2023, 7, 1), 9, 650.3, LeaseStatusEnum.CONTRACT),
+        _lease(date(2024, 2, 1), 3, 0.7, LeaseStatusEnum.CONTRACT, multiplicity=3),
+        _lease(date(2030, 1, 1), 12, 800.0, LeaseStatusEnum.CONTRACT),
+    ]
+    profile = OccupancyProfile.from_leases(leases, ANALYSIS.period_index, NRA)
+    occupied = profile.occupied_area_series()
+
+    assert occupied.iloc[0] == 650.3
+    assert occupied.iloc[1:3].tolist() == pytest.approx([650.3 + 2.1] * 2)
+    # Exactly zero (no floating residue) once every lease has ended
+    assert (occupied.iloc[4:] == 0.0).all()
+    assert (profile.vacancy_rate().iloc[4:] == 1.0).all()
+
+
+def test_no_leases_and_no_area():
+    empty = OccupancyProfile.from_leases([], ANALYSIS.period_index, NRA)
+    assert (empty.occupancy_rate() == 0.0).all()
+    assert empty.statuses == []
+    assert empty.by_status().empty
+
+    lease = _lease(date(2024, 1, 1), 12, 700.0, LeaseStatusEnum.CONTRACT)
+    no_nra = OccupancyProfile.from_leases([lease], ANALYSIS.period_index, 0.0)
+    assert (no_nra.occupancy_rate() == 0.0).all()
+    assert no_nra.occupied_area_series().iloc[0] == 700.0
@@ -0,0 +1,209 @@
+# Copyright 2024-2025 David Gordon Nix
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+ResidentialLeaseCohort must reproduce ResidentialLease.project_future_cash_flows
+row by row, for every expiration action.
+"""
+
+from __future__ import annotations
+
+import itertools
+from datetime import date
+
+import numpy as np
+import pytest
+
+from performa.analysis import AnalysisContext
+from performa.asset.residential import (
+    ResidentialCreditLoss,
+    ResidentialExpenses,
+    ResidentialGeneralVacancyLoss,
+    ResidentialLease,
+    ResidentialLosses,
+    ResidentialProperty,
+    ResidentialRentRoll,
+    ResidentialRolloverLeaseTerms,
+    ResidentialRolloverProfile,
+    ResidentialUnitSpec,
+)
+from performa.asset.residential.cohort import MAX_RENEWALS, ResidentialLeaseCohort
+from performa.core.ledger import Ledger
+from performa.core.primitives import (
+    FrequencyEnum,
+    GlobalSettings,
+    LeaseStatusEnum,
+    PercentageGrowthRate,
+    Timeline,
+    UponExpirationEnum,
+)
+
+ACTIONS = [
+    UponExpirationEnum.RENEW,
+    UponExpirationEnum.VACATE,
+    UponExpirationEnum.MARKET,
+    UponExpirationEnum.OPTION,
+    UponExpirationEnum.REABSORB,
+]
+# Before, at and after the analysis start, and expiring after it ends
+LEASE_STARTS = [date(2022, 6, 1), date(2023, 3, 1), date(2024, 1, 1), date(2028, 11, 1)]
+
+
+def _profile(downtime: int, market_term=None, renewal_term=None, term=12):
+    return ResidentialRolloverProfile(
+        name=f"Profile {downtime}/{market_term}/{renewal_term}/{term}",
+        term_months=term,
+        renewal_probability=0.65,
+        downtime_months=downtime,
+        market_terms=ResidentialRolloverLeaseTerms(
+            market_rent=2200.0,
+            term_months=market_term,
+            market_rent_growth=PercentageGrowthRate(name="Market", value=0.03),
+        ),
+        renewal_terms=ResidentialRolloverLeaseTerms(
+            market_rent=2050.0,
+            term_months=renewal_term,
+            market_rent_growth=PercentageGrowthRate(name="Renewal", value=0.025),
+        ),
+    )
+
+
+PROFILES = [
+    _profile(downtime=0),
+    _profile(downtime=2, market_term=9, renewal_term=18),
+    _profile(downtime=1, renewal_term=24),
+]
+
+
+def _lease(profile, action, start: date, term: int = 12, rent: float = 1950.0):
+    return ResidentialLease(
+        name=f"Resident {action.value} {start:%Y%m}",
+        timeline=Timeline(start_date=start, duration_months=term),
+        status=LeaseStatusEnum.CONTRACT,
+        area=750.0,
+        suite="101",
+        floor="1",
+        upon_expiration=action,
+        monthly_rent=rent,
+        value=rent,
+        frequency=FrequencyEnum.MONTHLY,
+        rollover_profile=profile,
+    )
+
+
+@pytest.fixture
+def context() -> AnalysisContext:
+    profile = PROFILES[0]
+    property_data = ResidentialProperty(
+        name="Cohort Property",
+        gross_area=900.0,
+        net_rentable_area=750.0,
+        unit_mix=ResidentialRentRoll(
+            unit_specs=[
+                ResidentialUnitSpec(
+                    unit_type_name="1BR",
+                    unit_count=1,
+                    avg_area_sf=750.0,
+                    current_avg_monthly_rent=2000.0,
+                    rollover_profile=profile,
+                )
+            ]
+        ),
+        losses=ResidentialLosses(
+            general_vacancy=ResidentialGeneralVacancyLoss(rate=0.05),
+            credit_loss=ResidentialCreditLoss(rate=0.02),
+        ),
+        expenses=ResidentialExpenses(),
+    )
+    return AnalysisContext(
+        timeline=Timeline(start_date=date(2024, 1, 1), duration_months=60),
+        settings=GlobalSettings(analysis_start_date=date(2024, 1, 1)),
+        property_data=property_data,
+        ledger=Ledger(),
+    )
+
+
+def _assert_matches_per_lease(leases, context) -> np.ndarray:
+    rents = ResidentialLeaseCohort(leases).project(context)
+    assert rents.shape == (len(leases), len(context.timeline.period_index))
+    for lease, row in zip(leases, rents):
+        expected = lease.project_future_cash_flows(context)["base_rent"].to_numpy()
+        np.testing.assert_array_equal(row, expected, err_msg=lease.name)
+    return rents
+
+
+def test_matches_per_lease_projection(context):
+    leases = [
+        _lease(profile, action, start)
+        for profile, action, start in itertools.product(PROFILES, ACTIONS, LEASE_STARTS)
+    ]
+    rents = _assert_matches_per_lease(leases, context)
+
+    # REABSORB leases stop at their current expiration
+    for i, lease in enumerate(leases):
+        if lease.upon_expiration == UponExpirationEnum.REABSORB:
+            expected_months = 2 if lease.name.endswith("202811") else 0
+            assert (rents[i, -2:] > 0).sum() == expected_months
+
+
+def test_renewal_limit_and_short_terms(context):
+    monthly = _profile(downtime=0, term=1)
+    leases = [
+        _lease(monthly, UponExpirationEnum.RENEW, date(2024, 1, 1), term=1),
+        _lease(PROFILES[1], UponExpirationEnum.VACATE, date(2024, 1, 1), term=3),
+    ]
+    rents = _assert_matches_per_lease(leases, context)
+    # Current month plus MAX_RENEWALS one-month renewals
+    assert (rents[0] > 0).sum() == 1 + MAX_RENEWALS
+
+
+def test_identical_units_share_rent_calculations(context, monkeypatch):
+    calls = []
+    calculate_rent = ResidentialRolloverProfile._calculate_rent
+
+    def counting(self, terms, as_of_date, global_settings=None):
+        calls.append(as_of_date)
+        return calculate_rent(self, terms, as_of_date, global_settings)
+
+    monkeypatch.setattr(ResidentialRolloverProfile, "_calculate_rent", counting)
+    leases = [
+        _lease(PROFILES[0], UponExpirationEnum.MARKET, date(2023, 7, 1))
+        for _ in range(100)
+    ]
+    rents = ResidentialLeaseCohort(leases).project(context)
+
+    assert (rents == rents[0]).all()
+    # One calculation per rollover, not per unit
+    assert len(calls) == len(set(calls)) == 5
+
+
+def test_failed_rollovers_keep_projected_segments(context, monkeypatch):
+    calculate_rent = ResidentialRolloverProfile._calculate_rent
+
+    def failing(self, terms, as_of_date, global_settings=None):
+        if as_of_date >= date(2026, 1, 1):
+            raise ValueError("no market data")
+        return calculate_rent(self, terms, as_of_date, global_settings)
+
+    monkeypatch.setattr(ResidentialRolloverProfile, "_calculate_rent", failing)
+    leases = [
+        _lease(profile, UponExpirationEnum.MARKET, start)
+        for profile, start in itertools.product(PROFILES, LEASE_STARTS)
+    ]
+    rents = _assert_matches_per_lease(leases, context)
+    assert rents[:, 24:].sum() < rents[:, :24].sum()
+
+
+def test_accepts_plain_residential_leases_with_a_profile():
+    class CustomLease(ResidentialLease):
+        pass
+
+    lease = _lease(PROFILES[0], UponExpirationEnum.MARKET, date(2024, 1, 1))
+    assert ResidentialLease.cohort_engine() is ResidentialLeaseCohort
+    assert ResidentialLeaseCohort.accepts(lease)
+    assert not ResidentialLeaseCohort.accepts(
+        lease.model_copy(update={"rollover_profile": None})
+    )
+    assert not ResidentialLeaseCohort.accepts(
+        CustomLease(**{k: getattr(lease, k) for k in type(lease).model_fields})
+    )
@@ -25,12 +25,40 @@ from performa.core.primitives import (
     SweepMode,
     Timeline,
 )
+from performa.core.primitives.enums import enum_to_string
 from performa.deal.orchestrator import DealContext
 from performa.debt.construction import ConstructionFacility
 from performa.debt.covenants import CashSweep
 from performa.debt.rates import FixedRate, InterestRate
 
 
+def frame_select(ledger_df):
+    """
+    Stand-in for `Ledger.select` that filters a DataFrame of ledger rows.
+
+    Supports the equality, membership and substring filters and the monthly
+    grouping used by CashSweep, with `output="numpy"`.
+    """
+
+    def select(columns, where=None, contains=None, group_by_month=False, output=""):
+        rows = ledger_df
+        for column, value in (where or {}).items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            rows = rows[rows[column].isin([enum_to_string(v) for v in values])]
+        for column, substring in (contains or {}).items():
+            rows = rows[rows[column].astype(str).str.contains(substring, regex=False)]
+        dates = rows["date"]
+        if isinstance(dates.dtype, pd.PeriodDtype):
+            dates = dates.dt.to_timestamp()
+        rows = rows.assign(date=pd.to_datetime(dates).dt.to_period("M"))
+        if group_by_month:
+            rows = rows.groupby("date", as_index=False)["amount"].sum()
+            rows["date"] = rows["date"].dt.to_timestamp()
+        return {column: rows[column].to_numpy() for column in columns}
+
+    return select
+
+
 def create_mock_context(timeline, noi_series, ledger_df, facility_name="Test Facility"):
     """
     Helper to create a properly mocked context for testing CashSweep.
@@ -38,7 +66,7 @@ def create_mock_context(timeline, noi_series, ledger_df, facility_name="Test Fac
     Args:
         timeline: Timeline object
         noi_series: NOI series for queries
-        ledger_df: DataFrame for ledger.to_dataframe()
+        ledger_df: DataFrame of ledger rows served by ledger.select()
         facility_name: Name of the facility to create
 
     Returns:
@@ -57,7 +85,7 @@ def create_mock_context(timeline, noi_series, ledger_df, facility_name="Test Fac
         else:
             # For empty dataframes, define the column with correct dtype
             ledger_df["item_name"] = pd.Series([], dtype=str)
-    ledger.to_dataframe.return_value = ledger_df
+    ledger.select.side_effect = frame_select(ledger_df)
     # Mock get_query_connection() to return (connection, table_name) tuple
     # The connection will be used by LedgerQueries to execute SQL
     mock_connection = Mock()